@@ -1,5 +1,6 @@
 #config.py
-from pydantic_settings import BaseSettings
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 
 
@@ -14,22 +15,102 @@ class Settings(BaseSettings):
         "http://localhost:5173"
     ]
 
+    # 세션 저장소 (output_id별 단계 결과, api/services/session_manager.py)
+    # SESSION_DIR 지정 시 세션을 파일로도 저장 (워커 간 공유 / 재시작 후 복구)
     SESSION_TIMEOUT: int = 3600
     MAX_SESSIONS: int = 100
+    SESSION_DIR: str = ""
 
-    # 🔥 여기가 핵심
-    OPENAI_API_KEY: str
-    GEMINI_API_KEY: str
+    # Provider 모드
+    # - live: 실제 OpenAI / Gemini / Cloudinary (아래 키 필수)
+    # - fake: 가짜 서버 (python -m fake_providers), 키 생략 가능
+    # - replay: 녹화된 Provider 응답 재생 (REPLAY_CAPTURE), 키 / 네트워크 불필요
+    PROVIDER_MODE: str = "live"
+    FAKE_PROVIDER_URL: str = "http://127.0.0.1:8900"
+    REPLAY_CAPTURE: str = "Test/captures"
 
-    CLOUDINARY_CLOUD_NAME: str
-    CLOUDINARY_API_KEY: str
-    CLOUDINARY_API_SECRET: str
+    # 🔥 여기가 핵심 (live 모드 필수)
+    OPENAI_API_KEY: str = ""
+    GEMINI_API_KEY: str = ""
+
+    CLOUDINARY_CLOUD_NAME: str = ""
+    CLOUDINARY_API_KEY: str = ""
+    CLOUDINARY_API_SECRET: str = ""
 
     ENABLE_DB: bool = False
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # output_id 발급 방식
+    # - counter: 잠금 카운터 파일 기반 순번 (output_01, output_02, ...), 단일 호스트 다중 워커 안전
+    # - time: 시간순 정렬 가능한 고유 ID (output_<ms hex><random>), 다중 호스트 안전
+    OUTPUT_ID_MODE: str = "counter"
+    OUTPUTS_DIR: str = "Test/outputs"
+
+    # 동일 요청 병합 (Singleflight)
+    # SINGLEFLIGHT_DIR 지정 시 워커 간에도 병합 (공유 디렉토리)
+    SINGLEFLIGHT_ENABLED: bool = True
+    SINGLEFLIGHT_DIR: str = ""
+    SINGLEFLIGHT_RESULT_TTL: float = 10
+    SINGLEFLIGHT_LOCK_TIMEOUT: float = 600
+    # 다른 워커의 실행 결과 대기 상한 (초과 시 직접 실행)
+    SINGLEFLIGHT_WAIT_TIMEOUT: float = 300
+
+    # 단계 분류별 동시 실행 제한 (Bulkhead, api/services/bulkhead.py)
+    # text: Step 1~4, image: Step 5 - 워커 프로세스별 동시 실행 수 / 대기열 크기, 대기열 초과 시 429 + Retry-After
+    BULKHEAD_ENABLED: bool = True
+    BULKHEAD_TEXT_CONCURRENCY: int = 32
+    BULKHEAD_TEXT_QUEUE: int = 64
+    BULKHEAD_IMAGE_CONCURRENCY: int = 4
+    BULKHEAD_IMAGE_QUEUE: int = 8
+
+    # 답변 사전 검증 (questions.json / marketing.json의 required / question_type / options 기준)
+    # 실패 시 LLM 호출 없이 422 - 카탈로그 질문 id가 없는 레거시 자유 형식은 검사하지 않음
+    ANSWER_VALIDATION_ENABLED: bool = True
+
+    # 응답 압축 (Accept-Encoding 협상, api/services/compression.py)
+    # COMPRESSION_MIN_SIZE(bytes) 이상인 응답만 압축, brotli 미설치 시 gzip만 사용
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # 비동기 작업 (POST /brands/logo?async=true → GET /jobs/{id})
+    # 워커 프로세스마다 JOB_WORKERS개 동시 실행, 상태는 JOB_DB_PATH(SQLite)에 저장
+    JOB_DB_PATH: str = "Test/jobs.sqlite"
+    JOB_WORKERS: int = 2
+    JOB_MAX_PENDING: int = 100
+    JOB_TTL: int = 24 * 3600
+
+    # 트래픽 녹화 (/brands/* 요청 + Provider 응답을 JSONL로 기록, python -m benchmarks.replay 로 재생)
+    # 워커별 파일 (capture-<pid>.jsonl), CAPTURE_MAX_BYTES 초과 시 회전
+    CAPTURE_ENABLED: bool = False
+    CAPTURE_DIR: str = "Test/captures"
+    CAPTURE_MAX_BYTES: int = 50 * 1024 * 1024
+    CAPTURE_BACKUP_COUNT: int = 5
+    CAPTURE_REDACT_KEYS: List[str] = [
+        "api_key", "apikey", "token", "password", "secret", "authorization",
+        "email", "phone", "이메일", "전화", "연락처"
+    ]
+
+    @model_validator(mode="after")
+    def check_provider_keys(self):
+        mode = self.PROVIDER_MODE.lower()
+        if mode not in ("live", "fake", "replay"):
+            raise ValueError(f"지원하지 않는 PROVIDER_MODE: {self.PROVIDER_MODE}")
+        if mode == "live":
+            missing = [
+                name for name in (
+                    "OPENAI_API_KEY", "GEMINI_API_KEY",
+                    "CLOUDINARY_CLOUD_NAME", "CLOUDINARY_API_KEY", "CLOUDINARY_API_SECRET"
+                )
+                if not getattr(self, name)
+            ]
+            if missing:
+                raise ValueError(f"PROVIDER_MODE=live 에서는 필수 설정입니다: {', '.join(missing)}")
+        return self
+
+    # .env에는 langgraph_system 실행 설정(LOG_LEVEL, CHECKPOINTER, METRICS_ENABLED, RATE_LIMIT_* 등)도 함께 둠
+    # → 여기 없는 키는 무시 (langgraph_system/__init__.py가 .env를 환경 변수로 로드해 각 모듈이 읽음)
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
 
 settings = Settings()
\ No newline at end of file
@@ -1,13 +1,50 @@
 #main.py
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from api.config import settings
-from api.routers import brand
+from api.routers import brand, health, jobs, questions
+from langgraph_system.providers import provider_registry
+from langgraph_system.ratelimit import rate_limiter
+from langgraph_system.resilience import resilience
+from langgraph_system.executor import shutdown_node_executor, executor_stats
+from langgraph_system.cache import diagnosis_cache
+from langgraph_system.questions import question_catalog
+from langgraph_system.metrics import render_metrics
+from langgraph_system.log import shutdown_logging
+from langgraph_system.checkpoint import get_checkpointer, close_checkpointer
+from api.services.singleflight import singleflight
+from api.services.session_manager import session_manager
+from api.services.jobs import job_manager
+from api.services.bulkhead import BulkheadMiddleware, bulkheads, bulkhead_stats
+from api.services.capture import CaptureMiddleware, CaptureWriter
+from api.services.compression import CompressionMiddleware
+from api.services.fastjson import OrjsonResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버 수명주기
+    - 시작: Provider 클라이언트(커넥션 풀) 미리 생성, 질문 카탈로그 로드, 이전 실행에서 중단된 작업 정리
+    - 종료: 실행 중인 작업 취소, 커넥션 풀 및 노드 스레드 풀 정리, 남은 체크포인트 저장, 남은 로그 출력
+    """
+    provider_registry.startup()
+    question_catalog.refresh()
+    job_manager.startup()
+    yield
+    await job_manager.shutdown()
+    await provider_registry.shutdown()
+    shutdown_node_executor(wait=False)
+    close_checkpointer()
+    shutdown_logging()
 
 
 # FastAPI 앱 생성
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
     title=settings.API_TITLE,
     version=settings.API_VERSION,
     description="""
@@ -27,6 +64,10 @@ app = FastAPI(
     """
 )
 
+# 단계 분류별 동시 실행 제한 (CORS 안쪽에 두어 429 응답에도 CORS 헤더 적용)
+if settings.BULKHEAD_ENABLED:
+    app.add_middleware(BulkheadMiddleware, bulkheads=bulkheads)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -34,13 +75,89 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After", "ETag"],
 )
 
+# 트래픽 녹화 (opt-in, CAPTURE_ENABLED=true)
+if settings.CAPTURE_ENABLED:
+    app.add_middleware(CaptureMiddleware, writer=CaptureWriter())
+
+# 응답 압축 (가장 바깥 - 녹화 / CORS 처리는 압축 전 본문 기준)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 # 라우터 등록
 app.include_router(brand.router)
+app.include_router(health.router)
+app.include_router(jobs.router)
+app.include_router(questions.router)
 @app.get("/")
 async def root():
     return {
         "message": "AI Brand Consulting API is Running",
         "docs": "/docs"
     }
+
+
+@app.get("/providers/stats")
+async def provider_stats():
+    """Provider(OpenAI/Gemini) 커넥션 풀 사용 현황"""
+    return provider_registry.stats()
+
+
+@app.get("/ratelimits/stats")
+async def ratelimit_stats():
+    """Provider + 모델별 호출 한도 버킷 (RPM / TPM 잔량, 429 일시 정지), 대기 / 429 횟수"""
+    return rate_limiter.stats()
+
+
+@app.get("/resilience/stats")
+async def resilience_stats():
+    """Provider 호출 재시도 / Hedging 횟수, Circuit 상태, 호출 종류별 p95 지연"""
+    return resilience.stats()
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """LLM 응답 캐시 적중/미스 및 동일 요청 병합 현황"""
+    return {
+        "diagnosis": diagnosis_cache.stats(),
+        "singleflight": singleflight.stats()
+    }
+
+
+@app.get("/sessions/stats")
+async def session_stats():
+    """세션 저장소 현황 (활성 세션 수, 적중/미스, LRU 제거, 만료)"""
+    return session_manager.stats()
+
+
+@app.get("/bulkheads/stats")
+async def bulkheads_stats():
+    """단계 분류(text / image)별 동시 실행 / 대기열 / 거절 현황과 스레드 풀 대기 작업 수"""
+    return {
+        "admission": bulkhead_stats(),
+        "executors": executor_stats()
+    }
+
+
+@app.get("/checkpoints/stats")
+async def checkpoint_stats():
+    """LangGraph 체크포인터 현황 (메모리 thread 수, 배치 저장 / 로드 / TTL 정리)"""
+    checkpointer = get_checkpointer()
+    return checkpointer.stats() if checkpointer else {"backend": "none"}
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 메트릭 (단계별 노드 / GPT / 이미지 / 업로드 지연, 토큰 수, 캐시, 에러)"""
+    body, content_type = render_metrics()
+    if body is None:
+        return Response("metrics disabled (prometheus_client 미설치 또는 METRICS_ENABLED=false)\n",
+                        status_code=503, media_type=content_type)
+    return Response(body, media_type=content_type)
@@ -1,50 +1,238 @@
 """
 Brand Consulting API Router
-FE 요청을 받아 LangGraph를 실행하고 result + state_context 형식으로 응답
+FE 요청을 받아 LangGraph를 실행(ainvoke, 이벤트 루프 비차단)하고 result + state_context 형식으로 응답
 Response: 3개 후보 + 각 후보 상세 정보
 Request: FE가 선택한 후보 상세 정보를 context에 포함하여 전달
+         (또는 output_id + 선택한 후보 id만 전달 - 이전 단계 결과는 세션에서 복원)
+Stream: /brands/{step}/stream - 토큰/후보/로고 URL을 SSE 이벤트로 즉시 전달하고 마지막에 동일한 응답(result 이벤트) 전송
+Job: /brands/logo?async=true - 작업 id를 즉시 반환하고 백그라운드 실행, GET /jobs/{id}로 진행 상황 / 결과 조회
 """
-from fastapi import APIRouter, HTTPException
+import json
+from contextlib import nullcontext
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
 from api.schemas.request import (
-    DiagnosisRequest, NamingRequest, ConceptRequest, StoryRequest, LogoRequest
+    ContextRequest, DiagnosisRequest, NamingRequest, ConceptRequest, StoryRequest, LogoRequest
 )
 from api.schemas.response import (
     DiagnosisResponse, NamingResponse, ConceptResponse, StoryResponse, LogoResponse
 )
 from langgraph_system.state import BrandConsultingState
 from langgraph_system.graph import create_info_graph
-import os
+from langgraph_system.streaming import STREAM_CONFIG_KEY
+from api.services.output_id import output_id_allocator
+from api.services.singleflight import singleflight, request_key
+from api.services.session_manager import session_manager, SessionNotFoundError
+from api.services.jobs import job_manager, JobProgress, JobQueueFullError
+from api.services.bulkhead import bulkhead_for_step
+from api.services.fastjson import OrjsonRoute, model_response
+from api.config import settings
+from langgraph_system.questions import question_catalog
+from langgraph_system.log import get_logger
+
+logger = get_logger("api.brand")
 
-router = APIRouter()
+# 요청 본문은 orjson으로 파싱 (미설치 시 표준 json)
+router = APIRouter(route_class=OrjsonRoute)
 
 # LangGraph 초기화
-print("\n[System] LangGraph Workflow Loading...")
+logger.info("[System] LangGraph Workflow Loading")
 workflow_app = create_info_graph()
-print("[System] LangGraph Workflow Loaded Successfully.\n")
+logger.info("[System] LangGraph Workflow Loaded Successfully.")
 
 # output_id 생성 함수
 def get_next_output_id():
-    """Test/outputs/ 폴더에서 다음 output 번호를 찾아 반환"""
-    outputs_dir = os.path.join("Test", "outputs")
-    os.makedirs(outputs_dir, exist_ok=True)
-    
-    # 기존 output 폴더들 찾기
-    existing_outputs = []
-    for folder in os.listdir(outputs_dir):
-        if folder.startswith("output_") and os.path.isdir(os.path.join(outputs_dir, folder)):
-            try:
-                num = int(folder.split("_")[1])
-                existing_outputs.append(num)
-            except:
-                pass
-    
-    # 다음 번호 결정
-    next_num = max(existing_outputs) + 1 if existing_outputs else 1
-    return f"output_{next_num:02d}"  # output_01, output_02, ...
+    """다음 output_id 발급 (O(1), 다중 요청/워커 안전 - api/services/output_id.py)"""
+    return output_id_allocator.allocate()
+
+# 답변 사전 검증 함수
+def validate_user_input(step_num: int, user_input: Dict[str, Any]) -> None:
+    """
+    질문 카탈로그 기준 답변 검증 (세션 복원 / LLM 호출 전)
+    필수 답변 누락, 잘못된 선택지, 형식 오류가 있으면 422 (FastAPI 검증 오류와 같은 형식)
+    """
+    if not settings.ANSWER_VALIDATION_ENABLED:
+        return
+    errors = question_catalog.validate(step_num, user_input)
+    if errors:
+        raise RequestValidationError([
+            {**error, "loc": ["body", "user_input", *error["loc"]]} for error in errors
+        ])
+
+# 세션 기반 context 복원 함수
+async def resolve_request_context(request: ContextRequest, keys: Tuple[str, ...]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    요청 context의 빈 항목 / 후보 id 참조를 세션(output_id)에 저장된 이전 단계 결과로 채움
+
+    Returns:
+        (output_id, context) - 세션이 만료되어 복원할 수 없으면 404
+    """
+    interview = request.context.interview
+    output_id = request.output_id or (interview.output_id if interview else None)
+    try:
+        return output_id, await session_manager.aresolve_context(output_id, request.context_dict(), keys)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+# LangGraph 실행 함수
+def prepare_run(state: BrandConsultingState, stream: bool = False):
+    """
+    실행 입력 / config 준비 (thread_id = output_id)
+    - 빈 context는 입력에서 제외 → 체크포인트에 저장된 이전 단계 값 사용
+    - 이전 실행의 에러 상태는 초기화
+    """
+    if not state.get("output_id"):
+        state["output_id"] = get_next_output_id()
+    run_input = {k: v for k, v in state.items() if v or not k.endswith("_context")}
+    run_input.update(error_occurred=False, error_message=None)
+    configurable = {"thread_id": state["output_id"]}
+    if stream:
+        configurable[STREAM_CONFIG_KEY] = True
+    return run_input, {"configurable": configurable}
+
+async def invoke_workflow(state: BrandConsultingState):
+    """
+    LangGraph 비동기 실행 (동일 요청 병합)
+    같은 output_id + step + context + user_input 요청(중복 제출 / 재시도)이 동시에 들어오면 1회만 실행하고 결과 공유
+    output_id가 없는 요청(Step 1)은 요청마다 먼저 발급 → 다른 사용자와 세션 / 체크포인트 / 로고 폴더를 공유하지 않음
+    (같은 답변의 Step 1 GPT 호출은 진단 노드에서 병합 - nodes/diagnosis_node.py)
+    """
+    if not state.get("output_id"):
+        state["output_id"] = get_next_output_id()
+    key = request_key(state)
+
+    async def run():
+        run_input, config = prepare_run(state)
+        return await workflow_app.ainvoke(run_input, config)
+
+    return await singleflight.do(key, run)
+
+# SSE 스트리밍 실행 함수
+STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"  # 프록시(nginx) 버퍼링 비활성화
+}
+
+def sse_event(event: str, data) -> str:
+    """SSE 이벤트 1건 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+def stream_workflow(state: BrandConsultingState, build_response, error_label: str):
+    """
+    LangGraph 스트리밍 실행 (SSE)
+    노드가 보내는 token / candidate / logo 이벤트를 그대로 전달하고,
+    완료 시 일반 엔드포인트와 동일한 응답을 result 이벤트로 전송
+    (토큰 단위 전송이므로 동일 요청 병합은 적용하지 않음)
+    """
+    run_input, config = prepare_run(state, stream=True)
+
+    async def events():
+        yield sse_event("start", {"step": state["current_step"], "output_id": state["output_id"]})
+        try:
+            result_state = None
+            async for mode, chunk in workflow_app.astream(run_input, config, stream_mode=["custom", "values"]):
+                if mode == "custom":
+                    yield sse_event(chunk["event"], chunk["data"])
+                else:
+                    result_state = chunk
+
+            if result_state is None or result_state.get("error_occurred"):
+                detail = result_state.get("error_message") if result_state else "결과 없음"
+                yield sse_event("error", {"detail": f"{error_label}: {detail}"})
+                return
+
+            yield sse_event("result", (await build_response(result_state)).model_dump(exclude_unset=True))
+        except Exception as e:
+            yield sse_event("error", {"detail": f"{error_label}: {str(e)}"})
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=STREAM_HEADERS)
+
+# 비동기 작업 실행 함수
+async def submit_job(kind: str, state: BrandConsultingState, build_response, error_label: str) -> JSONResponse:
+    """
+    LangGraph를 백그라운드 작업으로 실행하고 작업 id 즉시 반환 (202)
+    SSE와 같은 이벤트를 받아 완성된 후보(candidates) / 업로드된 로고(logos)를 작업의 부분 결과로 기록
+    """
+    run_input, config = prepare_run(state, stream=True)
+
+    async def run(progress: JobProgress):
+        result_state = None
+        # 등록 요청은 Bulkhead를 거치지 않으므로 실행 시 같은 분류의 슬롯을 기다림 (거절 없음, BULKHEAD_ENABLED일 때만)
+        slot = bulkhead_for_step(kind).acquire(reject=False) if settings.BULKHEAD_ENABLED else nullcontext()
+        async with slot:
+            async for mode, chunk in workflow_app.astream(run_input, config, stream_mode=["custom", "values"]):
+                if mode == "values":
+                    result_state = chunk
+                elif chunk["event"] == "candidate":
+                    await progress.update("generating", candidates={chunk["data"]["id"]: chunk["data"]["candidate"]})
+                elif chunk["event"] == "logo":
+                    await progress.update("rendering", logos={chunk["data"]["id"]: chunk["data"]["logo_image_url"]})
+
+        if result_state is None or result_state.get("error_occurred"):
+            detail = result_state.get("error_message") if result_state else "결과 없음"
+            raise RuntimeError(f"{error_label}: {detail}")
+        return (await build_response(result_state)).model_dump(mode="json", exclude_unset=True)
+
+    try:
+        job = await job_manager.submit(kind, state["output_id"], run)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    return JSONResponse(status_code=202, content={
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "output_id": job["output_id"],
+        "status_url": f"/jobs/{job['job_id']}"
+    })
 
 # =================================================================
 # [Step 1] 진단 (Diagnosis)
 # =================================================================
+async def build_diagnosis_state(request: DiagnosisRequest) -> BrandConsultingState:
+    validate_user_input(1, request.user_input)
+    return BrandConsultingState(
+        current_step=1,
+        step_1_qa=request.user_input,
+        use_cache=request.use_cache
+    )
+
+async def build_diagnosis_response(result_state: BrandConsultingState) -> DiagnosisResponse:
+    output_id = result_state.get("output_id")
+    
+    diagnosis_result = result_state.get("diagnosis_result", {})
+    analysis = diagnosis_result.get("analysis", {})
+    diagnosis_context = result_state.get("diagnosis_context", {})
+    
+    # result: 사용자 표시용 (DB 저장)
+    result = {
+        "summary": analysis.get("summary", ""),
+        "analysis": "브랜드 방향성 분석 완료",
+        "key_insights": f"핵심 키워드: {', '.join(analysis.get('keywords', [])[:3])}"
+    }
+    
+    # state_context: Step 2 전달용 (진단 상세 정보)
+    # FE는 이 output_id를 저장했다가 Step 2 요청 시 보내주어야 함
+    state_context = {
+        "output_id": output_id,
+        "brand_direction": analysis.get("summary", "")[:100],
+        "tone": diagnosis_context.get("emotional_core", ""),
+        "keywords": analysis.get("keywords", []),
+        "perspectives": analysis.get("perspectives", {}),
+        "brand_essence": diagnosis_context.get("brand_essence", ""),
+        "emotional_core": diagnosis_context.get("emotional_core", ""),
+        "differentiation_point": diagnosis_context.get("differentiation_point", ""),
+        "target_persona": analysis.get("persona", ""),
+        "diagnosis_summary": analysis.get("summary", "")
+    }
+    
+    # 응답 모델 검증이 끝난 뒤 세션 저장 (검증 실패 시 클라이언트가 받지 못한 결과가 세션에 남지 않도록)
+    response = DiagnosisResponse(result=result, state_context=state_context)
+    await session_manager.asave_context(output_id, response.state_context.model_dump())
+    return response
+
 @router.post("/brands/interview", response_model=DiagnosisResponse)
 async def create_diagnosis(request: DiagnosisRequest):
     """
@@ -52,185 +240,185 @@ async def create_diagnosis(request: DiagnosisRequest):
     Input: Q&A 답변
     Output: 진단 요약 (result) + 진단 상세 정보 (state_context)
     """
-    output_id = get_next_output_id()
-    
-    state = BrandConsultingState(
-        output_id=output_id,
-        current_step=1,
-        step_1_qa=request.user_input
-    )
+    state = await build_diagnosis_state(request)
     
     try:
-        result_state = workflow_app.invoke(state)
+        result_state = await invoke_workflow(state)
         
         if result_state.get("error_occurred"):
             raise HTTPException(status_code=500, detail=result_state.get("error_message"))
         
-        diagnosis_result = result_state.get("diagnosis_result", {})
-        analysis = diagnosis_result.get("analysis", {})
-        diagnosis_context = result_state.get("diagnosis_context", {})
-        
-        # result: 사용자 표시용 (DB 저장)
-        result = {
-            "summary": analysis.get("summary", ""),
-            "analysis": "브랜드 방향성 분석 완료",
-            "key_insights": f"핵심 키워드: {', '.join(analysis.get('keywords', [])[:3])}"
-        }
-        
-        # state_context: Step 2 전달용 (진단 상세 정보)
-        # FE는 이 output_id를 저장했다가 Step 2 요청 시 보내주어야 함
-        state_context = {
-            "output_id": output_id,
-            "brand_direction": analysis.get("summary", "")[:100],
-            "tone": diagnosis_context.get("emotional_core", ""),
-            "keywords": analysis.get("keywords", []),
-            "perspectives": analysis.get("perspectives", {}),
-            "brand_essence": diagnosis_context.get("brand_essence", ""),
-            "emotional_core": diagnosis_context.get("emotional_core", ""),
-            "differentiation_point": diagnosis_context.get("differentiation_point", ""),
-            "target_persona": analysis.get("persona", ""),
-            "diagnosis_summary": analysis.get("summary", "")
-        }
-        
-        return DiagnosisResponse(result=result, state_context=state_context)
+        return model_response(await build_diagnosis_response(result_state))
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"진단 실패: {str(e)}")
 
+@router.post("/brands/interview/stream")
+async def stream_diagnosis(request: DiagnosisRequest):
+    """Step 1: 진단 (SSE) - token 이벤트 후 result 이벤트"""
+    return stream_workflow(await build_diagnosis_state(request), build_diagnosis_response, "진단 실패")
+
 # =================================================================
 # [Step 2] 네이밍 (Naming)
 # =================================================================
-@router.post("/brands/naming", response_model=NamingResponse)
-async def create_naming(request: NamingRequest):
-    """
-    Step 2: 네이밍 (Backend Path: /brands/naming)
-    Input: Q&A 답변 + Step 1 진단 정보
-    Output: 3개 네이밍 후보 (result) + 각 후보 상세 정보 (state_context)
-    """
-    interview_context = request.context.get("interview", {})
+async def build_naming_state(request: NamingRequest) -> BrandConsultingState:
+    validate_user_input(2, request.user_input)
+    output_id, context = await resolve_request_context(request, ("interview",))
+    interview_context = context.get("interview", {})
     
     # [변경] Context에서 output_id 확인 (없으면 새로 생성)
-    output_id = interview_context.get("output_id") or get_next_output_id()
+    output_id = output_id or get_next_output_id()
     
-    state = BrandConsultingState(
+    return BrandConsultingState(
         output_id=output_id,
         current_step=2,
         diagnosis_context=interview_context,
         step_2_qa=request.user_input
     )
+
+async def build_naming_response(result_state: BrandConsultingState) -> NamingResponse:
+    candidates_data = result_state.get("naming_candidates", [])
+    
+    # result: 사용자 표시용 (name1, name2, name3)
+    result_data = {}
+    for i, cand in enumerate(candidates_data[:3]):
+        result_data[f"name{i+1}"] = cand["output"]["brand_name"]
+    
+    # state_context: 각 후보의 상세 정보
+    candidates_full = []
+    for i, cand in enumerate(candidates_data[:3]):
+        output = cand["output"]
+        candidates_full.append({
+            "id": i,
+            "brand_name": output.get("brand_name", ""),
+            "name_rationale": output.get("name_rationale", ""),
+            "qa_analysis_summary": output.get("qa_analysis_summary", ""),
+            "qa_keywords": output.get("qa_keywords", [])
+        })
+    
+    state_context = {
+        "candidates": candidates_full
+    }
+    response = NamingResponse(result=result_data, state_context=state_context)
+    await session_manager.asave_candidates(
+        result_state.get("output_id"), "naming", [c.model_dump() for c in response.state_context.candidates]
+    )
+    return response
+
+@router.post("/brands/naming", response_model=NamingResponse)
+async def create_naming(request: NamingRequest):
+    """
+    Step 2: 네이밍 (Backend Path: /brands/naming)
+    Input: Q&A 답변 + Step 1 진단 정보
+    Output: 3개 네이밍 후보 (result) + 각 후보 상세 정보 (state_context)
+    """
+    state = await build_naming_state(request)
     
     try:
-        result_state = workflow_app.invoke(state)
+        result_state = await invoke_workflow(state)
         
         if result_state.get("error_occurred"):
             raise HTTPException(status_code=500, detail=result_state.get("error_message"))
         
-        candidates_data = result_state.get("naming_candidates", [])
-        
-        # result: 사용자 표시용 (name1, name2, name3)
-        result_data = {}
-        for i, cand in enumerate(candidates_data[:3]):
-            result_data[f"name{i+1}"] = cand["output"]["brand_name"]
-        
-        # state_context: 각 후보의 상세 정보
-        candidates_full = []
-        for i, cand in enumerate(candidates_data[:3]):
-            output = cand["output"]
-            candidates_full.append({
-                "id": i,
-                "brand_name": output.get("brand_name", ""),
-                "name_rationale": output.get("name_rationale", ""),
-                "qa_analysis_summary": output.get("qa_analysis_summary", ""),
-                "qa_keywords": output.get("qa_keywords", [])
-            })
-        
-        state_context = {
-            "candidates": candidates_full
-        }
-        
-        return NamingResponse(result=result_data, state_context=state_context)
+        return model_response(await build_naming_response(result_state))
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"네이밍 생성 실패: {str(e)}")
 
+@router.post("/brands/naming/stream")
+async def stream_naming(request: NamingRequest):
+    """Step 2: 네이밍 (SSE) - brand_name 후보가 완성되는 즉시 candidate 이벤트"""
+    return stream_workflow(await build_naming_state(request), build_naming_response, "네이밍 생성 실패")
+
 # =================================================================
 # [Step 3] 컨셉 (Concept)
 # =================================================================
-@router.post("/brands/concept", response_model=ConceptResponse)
-async def create_concept(request: ConceptRequest):
-    """
-    Step 3: 컨셉 (Backend Path: /brands/concept)
-    Input: Q&A 답변 + Step 1 진단 정보 + 선택된 네이밍 상세 정보
-    Output: 3개 컨셉 후보 (result) + 각 후보 상세 정보 (state_context)
-    """
-    interview_context = request.context.get("interview", {})
-    naming_context = request.context.get("naming", {})  # FE가 선택한 네이밍 상세 정보
+async def build_concept_state(request: ConceptRequest) -> BrandConsultingState:
+    validate_user_input(3, request.user_input)
+    output_id, context = await resolve_request_context(request, ("interview", "naming"))
+    interview_context = context.get("interview", {})
+    naming_context = context.get("naming", {})  # FE가 선택한 네이밍 상세 정보
     
     # [변경] Context에서 output_id 추출
-    output_id = interview_context.get("output_id") or get_next_output_id()
+    output_id = output_id or get_next_output_id()
     
-    state = BrandConsultingState(
+    return BrandConsultingState(
         output_id=output_id,
         current_step=3,
         diagnosis_context=interview_context,
         naming_context=naming_context,
         step_3_qa=request.user_input
     )
+
+async def build_concept_response(result_state: BrandConsultingState) -> ConceptResponse:
+    candidates_data = result_state.get("concept_candidates", [])
+    
+    # result: 사용자 표시용
+    result = {}
+    for i, cand in enumerate(candidates_data[:3]):
+        result[f"concept{i+1}"] = cand["output"]["concept_statement"]
+    
+    # state_context: 각 후보의 상세 정보
+    candidates_full = []
+    for i, cand in enumerate(candidates_data[:3]):
+        output = cand["output"]
+        candidates_full.append({
+            "id": i,
+            "concept_statement": output.get("concept_statement", ""),
+            "concept_rationale": output.get("concept_rationale", ""),
+            "qa_analysis_summary": output.get("qa_analysis_summary", ""),
+            "qa_keywords": output.get("qa_keywords", []),
+            "brand_values": output.get("brand_values", [])
+        })
+    
+    state_context = {
+        "candidates": candidates_full
+    }
+    response = ConceptResponse(result=result, state_context=state_context)
+    await session_manager.asave_candidates(
+        result_state.get("output_id"), "concept", [c.model_dump() for c in response.state_context.candidates]
+    )
+    return response
+
+@router.post("/brands/concept", response_model=ConceptResponse)
+async def create_concept(request: ConceptRequest):
+    """
+    Step 3: 컨셉 (Backend Path: /brands/concept)
+    Input: Q&A 답변 + Step 1 진단 정보 + 선택된 네이밍 상세 정보
+    Output: 3개 컨셉 후보 (result) + 각 후보 상세 정보 (state_context)
+    """
+    state = await build_concept_state(request)
     
     try:
-        config = {"configurable": {"thread_id": output_id}}
-        result_state = workflow_app.invoke(state, config)
+        result_state = await invoke_workflow(state)
         
         if result_state.get("error_occurred"):
             raise HTTPException(status_code=500, detail=result_state.get("error_message"))
         
-        candidates_data = result_state.get("concept_candidates", [])
-        
-        # result: 사용자 표시용
-        result = {}
-        for i, cand in enumerate(candidates_data[:3]):
-            result[f"concept{i+1}"] = cand["output"]["concept_statement"]
-        
-        # state_context: 각 후보의 상세 정보
-        candidates_full = []
-        for i, cand in enumerate(candidates_data[:3]):
-            output = cand["output"]
-            candidates_full.append({
-                "id": i,
-                "concept_statement": output.get("concept_statement", ""),
-                "concept_rationale": output.get("concept_rationale", ""),
-                "qa_analysis_summary": output.get("qa_analysis_summary", ""),
-                "qa_keywords": output.get("qa_keywords", []),
-                "brand_values": output.get("brand_values", [])
-            })
-        
-        state_context = {
-            "candidates": candidates_full
-        }
-        
-        return ConceptResponse(result=result, state_context=state_context)
+        return model_response(await build_concept_response(result_state))
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"컨셉 생성 실패: {str(e)}")
 
+@router.post("/brands/concept/stream")
+async def stream_concept(request: ConceptRequest):
+    """Step 3: 컨셉 (SSE) - concept_statement 후보가 완성되는 즉시 candidate 이벤트"""
+    return stream_workflow(await build_concept_state(request), build_concept_response, "컨셉 생성 실패")
+
 # =================================================================
 # [Step 4] 스토리 (Story)
 # =================================================================
-@router.post("/brands/story", response_model=StoryResponse)
-async def create_story(request: StoryRequest):
-    """
-    Step 4: 스토리 (Backend Path: /brands/story)
-    Input: Q&A 답변 + Step 1-3 누적 정보 (선택된 후보들만)
-    Output: 3개 스토리 후보 (result) + 각 후보 상세 정보 (state_context)
-    """
-    interview_context = request.context.get("interview", {})
-    naming_context = request.context.get("naming", {})
-    concept_context = request.context.get("concept", {})
+async def build_story_state(request: StoryRequest) -> BrandConsultingState:
+    validate_user_input(4, request.user_input)
+    output_id, context = await resolve_request_context(request, ("interview", "naming", "concept"))
+    interview_context = context.get("interview", {})
+    naming_context = context.get("naming", {})
+    concept_context = context.get("concept", {})
     
     # [변경] Context에서 output_id 추출
-    output_id = interview_context.get("output_id") or get_next_output_id()
+    output_id = output_id or get_next_output_id()
     
-    state = BrandConsultingState(
+    return BrandConsultingState(
         output_id=output_id,
         current_step=4,
         diagnosis_context=interview_context,
@@ -238,62 +426,77 @@ async def create_story(request: StoryRequest):
         concept_context=concept_context,
         step_4_qa=request.user_input
     )
+
+async def build_story_response(result_state: BrandConsultingState) -> StoryResponse:
+    candidates_data = result_state.get("story_candidates", [])
+    
+    # result: 사용자 표시용
+    result = {}
+    for i, cand in enumerate(candidates_data[:3]):
+        result[f"story{i+1}"] = cand["output"]["brand_story"]
+    
+    # state_context: 각 후보의 상세 정보
+    candidates_full = []
+    for i, cand in enumerate(candidates_data[:3]):
+        output = cand["output"]
+        candidates_full.append({
+            "id": i,
+            "brand_story": output.get("brand_story", ""),
+            "story_rationale": output.get("story_rationale", ""),
+            "qa_analysis_summary": output.get("qa_analysis_summary", ""),
+            "qa_keywords": output.get("qa_keywords", []),
+            "emotional_arc": output.get("emotional_arc", "")
+        })
+    
+    state_context = {
+        "candidates": candidates_full
+    }
+    response = StoryResponse(result=result, state_context=state_context)
+    await session_manager.asave_candidates(
+        result_state.get("output_id"), "story", [c.model_dump() for c in response.state_context.candidates]
+    )
+    return response
+
+@router.post("/brands/story", response_model=StoryResponse)
+async def create_story(request: StoryRequest):
+    """
+    Step 4: 스토리 (Backend Path: /brands/story)
+    Input: Q&A 답변 + Step 1-3 누적 정보 (선택된 후보들만)
+    Output: 3개 스토리 후보 (result) + 각 후보 상세 정보 (state_context)
+    """
+    state = await build_story_state(request)
     
     try:
-        config = {"configurable": {"thread_id": output_id}}
-        result_state = workflow_app.invoke(state, config)
+        result_state = await invoke_workflow(state)
         
         if result_state.get("error_occurred"):
             raise HTTPException(status_code=500, detail=result_state.get("error_message"))
         
-        candidates_data = result_state.get("story_candidates", [])
-        
-        # result: 사용자 표시용
-        result = {}
-        for i, cand in enumerate(candidates_data[:3]):
-            result[f"story{i+1}"] = cand["output"]["brand_story"]
-        
-        # state_context: 각 후보의 상세 정보
-        candidates_full = []
-        for i, cand in enumerate(candidates_data[:3]):
-            output = cand["output"]
-            candidates_full.append({
-                "id": i,
-                "brand_story": output.get("brand_story", ""),
-                "story_rationale": output.get("story_rationale", ""),
-                "qa_analysis_summary": output.get("qa_analysis_summary", ""),
-                "qa_keywords": output.get("qa_keywords", []),
-                "emotional_arc": output.get("emotional_arc", "")
-            })
-        
-        state_context = {
-            "candidates": candidates_full
-        }
-        
-        return StoryResponse(result=result, state_context=state_context)
+        return model_response(await build_story_response(result_state))
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"스토리 생성 실패: {str(e)}")
 
+@router.post("/brands/story/stream")
+async def stream_story(request: StoryRequest):
+    """Step 4: 스토리 (SSE) - brand_story 후보가 완성되는 즉시 candidate 이벤트"""
+    return stream_workflow(await build_story_state(request), build_story_response, "스토리 생성 실패")
+
 # =================================================================
 # [Step 5] 로고 (Logo)
 # =================================================================
-@router.post("/brands/logo", response_model=LogoResponse)
-async def create_logo(request: LogoRequest):
-    """
-    Step 5: 로고 (최종 단계)
-    Input: Q&A 답변 + Step 1-4 누적 정보 (선택된 후보들만)
-    Output: 3개 로고 URL (result) + 각 후보 상세 정보 (state_context)
-    """
-    interview_context = request.context.get("interview", {})
-    naming_context = request.context.get("naming", {})
-    concept_context = request.context.get("concept", {})
-    story_context = request.context.get("story", {})
+async def build_logo_state(request: LogoRequest) -> BrandConsultingState:
+    validate_user_input(5, request.user_input)
+    output_id, context = await resolve_request_context(request, ("interview", "naming", "concept", "story"))
+    interview_context = context.get("interview", {})
+    naming_context = context.get("naming", {})
+    concept_context = context.get("concept", {})
+    story_context = context.get("story", {})
     
     # [변경] Context에서 output_id 추출
-    output_id = interview_context.get("output_id") or get_next_output_id()
+    output_id = output_id or get_next_output_id()
     
-    state = BrandConsultingState(
+    return BrandConsultingState(
         output_id=output_id,
         current_step=5,
         diagnosis_context=interview_context,
@@ -302,40 +505,62 @@ async def create_logo(request: LogoRequest):
         story_context=story_context,
         step_5_qa=request.user_input
     )
+
+async def build_logo_response(result_state: BrandConsultingState) -> LogoResponse:
+    candidates_data = result_state.get("logo_candidates", [])
+    
+    # result: 사용자 표시용 (logo URL만)
+    result = {}
+    for i, cand in enumerate(candidates_data[:3]):
+        result[f"logo{i+1}_url"] = cand["output"]["logo_image_url"]
+    
+    # state_context: 각 후보의 상세 정보
+    candidates_full = []
+    for i, cand in enumerate(candidates_data[:3]):
+        output = cand["output"]
+        candidates_full.append({
+            "id": i,
+            "logo_image_url": output.get("logo_image_url"),
+            "logo_concept": output.get("logo_concept", ""),
+            "logo_rationale": output.get("logo_rationale", ""),
+            "qa_analysis_summary": output.get("qa_analysis_summary", ""),
+            "qa_keywords": output.get("qa_keywords", []),
+            "color_palette": output.get("color_palette", [])
+        })
+    
+    state_context = {
+        "candidates": candidates_full
+    }
+    response = LogoResponse(result=result, state_context=state_context)
+    await session_manager.asave_candidates(
+        result_state.get("output_id"), "logo", [c.model_dump() for c in response.state_context.candidates]
+    )
+    return response
+
+@router.post("/brands/logo", response_model=LogoResponse)
+async def create_logo(request: LogoRequest, run_async: bool = Query(False, alias="async")):
+    """
+    Step 5: 로고 (최종 단계)
+    Input: Q&A 답변 + Step 1-4 누적 정보 (선택된 후보들만)
+    Output: 3개 로고 URL (result) + 각 후보 상세 정보 (state_context)
+    async=true: 202 + job_id 즉시 반환 (GET /jobs/{job_id}로 진행 상황 / 결과 조회)
+    """
+    state = await build_logo_state(request)
+    if run_async:
+        return await submit_job("logo", state, build_logo_response, "로고 생성 실패")
     
     try:
-        config = {"configurable": {"thread_id": output_id}}
-        result_state = workflow_app.invoke(state, config)
+        result_state = await invoke_workflow(state)
         
         if result_state.get("error_occurred"):
             raise HTTPException(status_code=500, detail=result_state.get("error_message"))
         
-        candidates_data = result_state.get("logo_candidates", [])
-        
-        # result: 사용자 표시용 (logo URL만)
-        result = {}
-        for i, cand in enumerate(candidates_data[:3]):
-            result[f"logo{i+1}_url"] = cand["output"]["logo_image_url"]
-        
-        # state_context: 각 후보의 상세 정보
-        candidates_full = []
-        for i, cand in enumerate(candidates_data[:3]):
-            output = cand["output"]
-            candidates_full.append({
-                "id": i,
-                "logo_image_url": output.get("logo_image_url", ""),
-                "logo_concept": output.get("logo_concept", ""),
-                "logo_rationale": output.get("logo_rationale", ""),
-                "qa_analysis_summary": output.get("qa_analysis_summary", ""),
-                "qa_keywords": output.get("qa_keywords", []),
-                "color_palette": output.get("color_palette", [])
-            })
-        
-        state_context = {
-            "candidates": candidates_full
-        }
-        
-        return LogoResponse(result=result, state_context=state_context)
+        return model_response(await build_logo_response(result_state))
     
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"로고 생성 실패: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"로고 생성 실패: {str(e)}")
+
+@router.post("/brands/logo/stream")
+async def stream_logo(request: LogoRequest):
+    """Step 5: 로고 (SSE) - 로고 컨셉은 candidate, 업로드가 끝난 이미지 URL은 logo 이벤트"""
+    return stream_workflow(await build_logo_state(request), build_logo_response, "로고 생성 실패")
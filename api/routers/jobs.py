@@ -0,0 +1,27 @@
+#jobs.py
+from fastapi import APIRouter, HTTPException
+from api.services.jobs import job_manager
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get("/stats")
+async def job_stats():
+    """비동기 작업 실행 현황 (이 워커 기준)"""
+    return job_manager.stats()
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """
+    비동기 작업 조회
+
+    Returns:
+        status (queued / running / succeeded / failed), progress.phase,
+        partial (완성된 후보 candidates / 업로드된 로고 logos, 후보 id별),
+        result (완료 시 동기 API와 같은 응답), error (실패 시)
+    """
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return job
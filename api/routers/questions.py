@@ -0,0 +1,31 @@
+#questions.py
+from fastapi import APIRouter, HTTPException, Request, Response
+from langgraph_system.questions import question_catalog
+
+router = APIRouter(prefix="/questions", tags=["Questions"])
+
+
+@router.get("/stats")
+async def question_stats():
+    """질문 카탈로그 현황 (버전 해시, 단계 / 질문 수, 재로드 횟수)"""
+    return question_catalog.stats()
+
+
+@router.get("/{step}")
+async def get_questions(step: int, request: Request):
+    """
+    단계별 질문 조회 (1~5단계: questions.json, 6~9단계: marketing.json)
+
+    Returns:
+        {"step", "data"} - ETag 헤더 포함, If-None-Match가 일치하면 304 (본문 없음)
+    """
+    payload = question_catalog.payload(step)
+    if payload is None:
+        raise HTTPException(status_code=404, detail=f"질문이 없는 단계입니다: {step}")
+
+    body, etag = payload
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    client_tags = [tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")]
+    if etag in client_tags or "*" in client_tags:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
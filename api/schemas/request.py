@@ -2,82 +2,199 @@
 FastAPI Request DTOs
 FE -> BE -> AI 흐름에서 사용되는 요청 데이터 구조 정의
 구조: user_input (해당 단계 Q&A) + context (이전 단계 누적 정보) + selected_candidate (FE가 선택한 후보 상세 정보)
+Step 2-5는 output_id + 선택한 후보 id만 보내도 됨 (이전 단계 결과는 서버 세션에서 복원 - api/services/session_manager.py)
 """
-from pydantic import BaseModel, Field, root_validator
-from typing import Dict, Any, Optional
-import json
-
-# 공통 Validator: 백엔드에서 보낸 JSON String Context를 Dict로 변환 & Flattened Input 처리
-def parse_context_validator(cls, values):
-    # 1. user_input이 없는 경우 (Legacy Flattened Payload)
-    if 'user_input' not in values:
-        if 'qa_answers' in values:
-            # 1-1. qa_answers 호환
-            values['user_input'] = values['qa_answers']
-        else:
-            # 1-2. RootFields -> user_input 매핑 (Context 제외한 나머지 필드)
-            # context 키를 제외한 모든 데이터를 user_input으로 간주
-            input_data = {k: v for k, v in values.items() if k != 'context'}
-            # 빈 데이터가 아니면 할당
-            if input_data:
-                values['user_input'] = input_data
-    
-    # 2. Context String Parsing & Key Normalization (Lowercase)
-    if 'context' in values:
-        ctx = values.get('context', {})
-        new_ctx = {}
-        
-        if isinstance(ctx, dict):
-            for k, v in ctx.items():
-                # Key Normalization: (e.g. "NAMING" -> "naming")
-                norm_key = k.lower()
-                
-                # Value Parsing (JSON String -> Dict/List)
-                parsed_v = v
-                if isinstance(v, str):
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import Dict, Any, List, Optional, Union
+from api.services.fastjson import loads
+
+# 레거시 평면 요청에서 user_input으로 보지 않는 키
+REQUEST_KEYS = ("context", "use_cache", "output_id")
+
+# =================================================================
+# [Context] 이전 단계 상세 정보 (모르는 필드도 그대로 보존)
+# API가 정하는 필드(output_id, id, candidates)만 타입 검사
+# 나머지는 이전 응답의 LLM 출력을 되돌려 보내는 값이라 형식 제한 없음 (e.g. 객체 페르소나, 문자열 키워드)
+# =================================================================
+class InterviewContext(BaseModel):
+    """Step 1 진단 상세 정보 (DiagnosisResponse.state_context)"""
+    model_config = ConfigDict(extra="allow")
+
+    output_id: Optional[str] = None
+    brand_direction: Any = None
+    tone: Any = None
+    keywords: Any = None
+    perspectives: Any = None
+    brand_essence: Any = None
+    emotional_core: Any = None
+    differentiation_point: Any = None
+    target_persona: Any = None
+    diagnosis_summary: Any = None
+
+class CandidateContext(BaseModel):
+    """선택된 후보 상세 정보 / 선택 전 후보 목록 (candidates - flatten_context가 선택)"""
+    model_config = ConfigDict(extra="allow")
+
+    id: Optional[Union[int, str]] = None
+    candidates: Optional[List[Dict[str, Any]]] = None
+    qa_analysis_summary: Any = None
+    qa_keywords: Any = None
+
+class NamingContext(CandidateContext):
+    brand_name: Any = None
+    name_rationale: Any = None
+
+class ConceptContext(CandidateContext):
+    concept_statement: Any = None
+    concept_rationale: Any = None
+    brand_values: Any = None
+
+class StoryContext(CandidateContext):
+    brand_story: Any = None
+    story_rationale: Any = None
+    emotional_arc: Any = None
+
+class StepContext(BaseModel):
+    """
+    이전 단계 누적 정보
+    각 후보 단계 값은 후보 상세 정보 또는 후보 id 참조 (1, "1", {"id": 1} - 세션에서 복원)
+    """
+    model_config = ConfigDict(extra="allow")
+
+    interview: Optional[InterviewContext] = Field(
+        None,
+        description="Step 1 진단 상세 정보 (DiagnosisResponse.state_context, output_id만 보내면 세션에서 복원)"
+    )
+    naming: Optional[Union[NamingContext, int, str]] = Field(
+        None,
+        union_mode="left_to_right",
+        description="선택된 네이밍 후보 상세 정보 (id, brand_name, name_rationale, qa_analysis_summary, qa_keywords) 또는 후보 id"
+    )
+    concept: Optional[Union[ConceptContext, int, str]] = Field(
+        None,
+        union_mode="left_to_right",
+        description="선택된 컨셉 후보 상세 정보 (id, concept_statement, concept_rationale, qa_analysis_summary, qa_keywords, brand_values) 또는 후보 id"
+    )
+    story: Optional[Union[StoryContext, int, str]] = Field(
+        None,
+        union_mode="left_to_right",
+        description="선택된 스토리 후보 상세 정보 (id, brand_story, story_rationale, qa_analysis_summary, qa_keywords, emotional_arc) 또는 후보 id"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def normalize(cls, data: Any) -> Any:
+        """
+        백엔드에서 보낸 context 정규화
+        - 키 소문자 변환 (e.g. "NAMING" -> "naming")
+        - JSON 문자열 값은 dict / list로 파싱, 빈 문자열은 값 없음(None)
+        """
+        if not isinstance(data, dict):
+            return data
+        normalized = {}
+        for key, value in data.items():
+            if isinstance(value, str):
+                stripped = value.strip()
+                if not stripped:
+                    value = None
+                elif stripped[0] in "{[":
                     try:
-                        if v.strip().startswith('{') or v.strip().startswith('['):
-                            parsed_v = json.loads(v)
-                    except (json.JSONDecodeError, TypeError):
+                        value = loads(stripped)
+                    except ValueError:
                         pass
-                
-                new_ctx[norm_key] = parsed_v
-                
-            values['context'] = new_ctx
-    return values
+            normalized[key.lower() if isinstance(key, str) else key] = value
+        return normalized
+
+def _as_dict(value: Any) -> Any:
+    """모델 → 요청에 있던 필드 + 추가 필드 dict (얕은 변환), 모델이 아니면 그대로"""
+    if not isinstance(value, BaseModel):
+        return value
+    fields_set = value.model_fields_set
+    data = {key: field for key, field in value.__dict__.items() if key in fields_set}
+    data.update(value.model_extra or {})
+    return data
+
+# =================================================================
+# [Base] 공통 요청
+# =================================================================
+class StepRequest(BaseModel):
+    """user_input이 없는 레거시 평면 요청 호환 (qa_answers 또는 나머지 필드 → user_input)"""
+
+    @model_validator(mode="before")
+    @classmethod
+    def map_legacy_input(cls, data: Any) -> Any:
+        if not isinstance(data, dict) or "user_input" in data:
+            return data
+        if "qa_answers" in data:
+            return {**data, "user_input": data["qa_answers"]}
+        # RootFields -> user_input 매핑 (context, use_cache, output_id를 제외한 모든 데이터)
+        input_data = {k: v for k, v in data.items() if k not in REQUEST_KEYS}
+        return {**data, "user_input": input_data} if input_data else data
+
+class ContextRequest(StepRequest):
+    """Step 2-5 공통: output_id + context"""
+    output_id: Optional[str] = Field(
+        None,
+        description="Step 1 응답의 output_id (세션에 저장된 이전 단계 결과 사용, context.interview.output_id로도 전달 가능)"
+    )
+    context: StepContext = Field(default_factory=StepContext, description="이전 단계 누적 정보 (선택된 후보들만)")
+
+    @field_validator("context", mode="before")
+    @classmethod
+    def empty_context(cls, value: Any) -> Any:
+        """null / 빈 문자열 context는 빈 context로, JSON 문자열은 파싱"""
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return {}
+        if isinstance(value, (str, bytes)):
+            try:
+                return loads(value)
+            except ValueError:
+                return value
+        return value
+
+    def context_dict(self) -> Dict[str, Any]:
+        """
+        context를 dict로 변환 (요청에 있던 키만 - 세션 복원 / flatten_context 입력)
+        검증된 값을 그대로 옮기는 얕은 변환 (model_dump는 후보 목록 전체를 다시 직렬화하므로 사용하지 않음)
+        """
+        return {key: _as_dict(value) for key, value in _as_dict(self.context).items()}
 
 # =================================================================
 # [Step 1] 진단 (Diagnosis) Request
 # =================================================================
-class DiagnosisRequest(BaseModel):
+class DiagnosisRequest(StepRequest):
     """
     Step 1: 진단 요청
     user_input: answers.json의 step_1 Q&A 답변
     """
     user_input: Dict[str, Any] = Field(
-        ..., 
+        ...,
         description="Step 1 Q&A 답변 (answers.json의 step_1 내용)"
     )
-    _validator = root_validator(pre=True, allow_reuse=True)(parse_context_validator)
+    use_cache: bool = Field(
+        True,
+        description="False이면 진단 캐시를 사용하지 않고 항상 새로 분석"
+    )
 
 # =================================================================
 # [Step 2] 네이밍 (Naming) Request
 # =================================================================
-class NamingRequest(BaseModel):
+class NamingRequest(ContextRequest):
     """
     Step 2: 네이밍 요청
     user_input: Step 2 Q&A 답변
-    context: Step 1 진단 상세 정보
+    context: Step 1 진단 상세 정보 {"interview": {...}}
     """
     user_input: Dict[str, Any] = Field(
-        ..., 
+        ...,
         description="Step 2 Q&A 답변 (answers.json의 step_2 내용)"
     )
-    context: Dict[str, Any] = Field(
-        ..., 
+    context: StepContext = Field(
+        default_factory=StepContext,
         description="""Step 1 진단 상세 정보
         {
           "interview": {
+            "output_id": "...",
             "brand_direction": "...",
             "tone": "...",
             "keywords": [...],
@@ -88,29 +205,29 @@ class NamingRequest(BaseModel):
             "target_persona": "...",
             "diagnosis_summary": "..."
           }
-        }"""
+        }
+        output_id를 보내면 {"interview": {"output_id": "..."}} 만으로도 세션에서 복원"""
     )
-    _validator = root_validator(pre=True, allow_reuse=True)(parse_context_validator)
 
 # =================================================================
 # [Step 3] 컨셉 (Concept) Request
 # =================================================================
-class ConceptRequest(BaseModel):
+class ConceptRequest(ContextRequest):
     """
     Step 3: 컨셉 요청
     user_input: Step 3 Q&A 답변
-    context: Step 1 진단 정보 + 선택된 네이밍 상세 정보
+    context: Step 1 진단 정보 + 선택된 네이밍 상세 정보 {"interview": {...}, "naming": {...} 또는 후보 id}
     """
     user_input: Dict[str, Any] = Field(
-        ..., 
+        ...,
         description="Step 3 Q&A 답변 (answers.json의 step_3 내용)"
     )
-    context: Dict[str, Any] = Field(
-        ..., 
+    context: StepContext = Field(
+        default_factory=StepContext,
         description="""Step 1 진단 + 선택된 네이밍 상세 정보
         {
           "interview": {...},  // Step 1 진단 정보
-          "naming": {          // FE가 선택한 네이밍 후보 상세 정보
+          "naming": {          // FE가 선택한 네이밍 후보 상세 정보 (또는 후보 id: 0)
             "id": 0,
             "brand_name": "...",
             "name_rationale": "...",
@@ -119,34 +236,33 @@ class ConceptRequest(BaseModel):
           }
         }"""
     )
-    _validator = root_validator(pre=True, allow_reuse=True)(parse_context_validator)
 
 # =================================================================
 # [Step 4] 스토리 (Story) Request
 # =================================================================
-class StoryRequest(BaseModel):
+class StoryRequest(ContextRequest):
     """
     Step 4: 스토리 요청
     user_input: Step 4 Q&A 답변
-    context: Step 1 진단 + 선택된 네이밍 + 선택된 컨셉 상세 정보
+    context: Step 1 진단 + 선택된 네이밍 + 선택된 컨셉 상세 정보 (선택된 후보들만)
     """
     user_input: Dict[str, Any] = Field(
-        ..., 
+        ...,
         description="Step 4 Q&A 답변 (answers.json의 step_4 내용)"
     )
-    context: Dict[str, Any] = Field(
-        ..., 
+    context: StepContext = Field(
+        default_factory=StepContext,
         description="""Step 1-3 누적 정보 (선택된 후보들만)
         {
           "interview": {...},  // Step 1 진단 정보
-          "naming": {          // 선택된 네이밍 상세 정보
+          "naming": {          // 선택된 네이밍 상세 정보 (또는 후보 id)
             "id": 0,
             "brand_name": "...",
             "name_rationale": "...",
             "qa_analysis_summary": "...",
             "qa_keywords": [...]
           },
-          "concept": {         // 선택된 컨셉 상세 정보
+          "concept": {         // 선택된 컨셉 상세 정보 (또는 후보 id)
             "id": 1,
             "concept_statement": "...",
             "concept_rationale": "...",
@@ -156,29 +272,28 @@ class StoryRequest(BaseModel):
           }
         }"""
     )
-    _validator = root_validator(pre=True, allow_reuse=True)(parse_context_validator)
 
 # =================================================================
 # [Step 5] 로고 (Logo) Request
 # =================================================================
-class LogoRequest(BaseModel):
+class LogoRequest(ContextRequest):
     """
     Step 5: 로고 요청
     user_input: Step 5 Q&A 답변
     context: Step 1-4 누적 정보 (선택된 후보들만)
     """
     user_input: Dict[str, Any] = Field(
-        ..., 
+        ...,
         description="Step 5 Q&A 답변 (answers.json의 step_5 내용)"
     )
-    context: Dict[str, Any] = Field(
-        ..., 
+    context: StepContext = Field(
+        default_factory=StepContext,
         description="""Step 1-4 누적 정보 (선택된 후보들만)
         {
           "interview": {...},  // Step 1 진단 정보
-          "naming": {...},     // 선택된 네이밍 상세 정보
-          "concept": {...},    // 선택된 컨셉 상세 정보
-          "story": {           // 선택된 스토리 상세 정보
+          "naming": {...},     // 선택된 네이밍 상세 정보 (또는 후보 id)
+          "concept": {...},    // 선택된 컨셉 상세 정보 (또는 후보 id)
+          "story": {           // 선택된 스토리 상세 정보 (또는 후보 id)
             "id": 2,
             "brand_story": "...",
             "story_rationale": "...",
@@ -188,4 +303,3 @@ class LogoRequest(BaseModel):
           }
         }"""
     )
-    _validator = root_validator(pre=True, allow_reuse=True)(parse_context_validator)
\ No newline at end of file
@@ -2,156 +2,199 @@
 FastAPI Response DTOs
 AI -> BE -> FE 흐름에서 반환되는 응답 데이터 구조 정의
 구조: result (사용자 표시용 3개 후보, DB 저장용) + state_context (다음 단계 전달용, 각 후보 상세 정보 포함)
+필드 타입이 정해져 있어 직렬화는 pydantic-core가 바로 처리 (model_dump_json, api/services/fastjson.py의 model_response)
+후보가 3개보다 적으면 result의 나머지 키는 응답에서 빠짐 (exclude_unset)
 """
-from pydantic import BaseModel, Field
-from typing import Dict, Any, List
+import json
+
+from pydantic import BaseModel, BeforeValidator, Field
+from typing import Annotated, Dict, Any, List, Optional
+
+
+def _to_text(value: Any) -> str:
+    """
+    LLM 출력이 문자열이 아닌 경우 문자열로 보정 (스키마와 다른 출력으로 생성 결과를 500으로 버리지 않도록)
+    None → "", 객체 / 리스트 → JSON 문자열 (e.g. 페르소나 객체, {"hex": ...} 색상), 그 외 → str
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+def _to_list(value: Any) -> list:
+    """None → [], 리스트가 아닌 단일 값 → [값]"""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _to_dict(value: Any) -> dict:
+    """객체가 아닌 값(None / 리스트 / 문자열) → {}"""
+    return value if isinstance(value, dict) else {}
+
+
+# LLM이 만든 문자열 필드
+Text = Annotated[str, BeforeValidator(_to_text)]
+# LLM이 만든 목록 / 구조 필드 - 항목은 출력 그대로 전달 (e.g. 색상 {"hex": ...}, 페르소나 객체)
+ValueList = Annotated[List[Any], BeforeValidator(_to_list)]
+# LLM이 만든 객체 필드 (e.g. perspectives)
+ValueDict = Annotated[Dict[str, Any], BeforeValidator(_to_dict)]
 
 # =================================================================
 # [Step 1] 진단 (Diagnosis) Response
 # =================================================================
+class DiagnosisResult(BaseModel):
+    """사용자 표시용 진단 결과 - DB 저장"""
+    summary: Text = ""
+    analysis: Text = ""
+    key_insights: Text = ""
+
+class DiagnosisStateContext(BaseModel):
+    """Step 2 전달용 진단 상세 정보 (FE는 output_id를 저장했다가 Step 2 요청 시 전달)"""
+    output_id: Optional[str] = None
+    brand_direction: Text = ""
+    tone: Text = ""
+    keywords: ValueList = []
+    perspectives: ValueDict = {}
+    brand_essence: Text = ""
+    emotional_core: Text = ""
+    differentiation_point: Text = ""
+    target_persona: Any = ""
+    diagnosis_summary: Text = ""
+
 class DiagnosisResponse(BaseModel):
     """
     Step 1: 진단 결과
     result: 사용자 표시용 진단 요약 (DB 저장)
     state_context: Step 2 전달용 진단 상세 정보
     """
-    result: Dict[str, Any] = Field(
-        ..., 
+    result: DiagnosisResult = Field(
+        ...,
         description="사용자 표시용 진단 결과 (summary, analysis, key_insights) - DB 저장"
     )
-    state_context: Dict[str, Any] = Field(
-        ..., 
+    state_context: DiagnosisStateContext = Field(
+        ...,
         description="Step 2 전달용 진단 상세 정보 (brand_direction, tone, keywords, perspectives, brand_essence, emotional_core, differentiation_point, target_persona, diagnosis_summary)"
     )
 
+# =================================================================
+# [공통] 후보 상세 정보
+# =================================================================
+class CandidateDetail(BaseModel):
+    """후보 1개의 상세 정보 (FE가 선택 후 해당 후보를 다음 단계로 전달)"""
+    id: int
+    qa_analysis_summary: Text = ""
+    qa_keywords: ValueList = []
+
 # =================================================================
 # [Step 2] 네이밍 (Naming) Response
 # =================================================================
+class NamingResult(BaseModel):
+    """예시: {"name1": "Wanderly", "name2": "Voyara", "name3": "Tripwise"}"""
+    name1: Optional[Text] = None
+    name2: Optional[Text] = None
+    name3: Optional[Text] = None
+
+class NamingCandidate(CandidateDetail):
+    brand_name: Text = ""
+    name_rationale: Text = ""
+
+class NamingStateContext(BaseModel):
+    candidates: List[NamingCandidate]
+
 class NamingResponse(BaseModel):
     """
     Step 2: 네이밍 결과
     result: 사용자 표시용 3개 후보 (DB 저장)
     state_context: 각 후보의 상세 정보 (FE가 선택 후 해당 후보 정보를 Step 3 Request에 포함)
     """
-    result: Dict[str, Any] = Field(
-        ..., 
-        description="""사용자 표시용 3개 네이밍 후보 - DB 저장
-        예시: {"name1": "Wanderly", "name2": "Voyara", "name3": "Tripwise"}"""
-    )
-    state_context: Dict[str, Any] = Field(
-        ..., 
-        description="""각 후보의 상세 정보 (FE가 선택 후 해당 후보를 다음 단계로 전달)
-        {
-          "candidates": [
-            {
-              "id": 0,
-              "brand_name": "...",
-              "name_rationale": "...",
-              "qa_analysis_summary": "...",
-              "qa_keywords": [...]
-            },
-            {"id": 1, ...},
-            {"id": 2, ...}
-          ]
-        }"""
+    result: NamingResult = Field(..., description="사용자 표시용 3개 네이밍 후보 - DB 저장")
+    state_context: NamingStateContext = Field(
+        ...,
+        description="각 후보의 상세 정보 (FE가 선택 후 해당 후보를 다음 단계로 전달)"
     )
 
 # =================================================================
 # [Step 3] 컨셉 (Concept) Response
 # =================================================================
+class ConceptResult(BaseModel):
+    """예시: {"concept1": "당신만의 여행", "concept2": "자유로운 탐험", "concept3": "완벽한 순간"}"""
+    concept1: Optional[Text] = None
+    concept2: Optional[Text] = None
+    concept3: Optional[Text] = None
+
+class ConceptCandidate(CandidateDetail):
+    concept_statement: Text = ""
+    concept_rationale: Text = ""
+    brand_values: ValueList = []
+
+class ConceptStateContext(BaseModel):
+    candidates: List[ConceptCandidate]
+
 class ConceptResponse(BaseModel):
     """
     Step 3: 컨셉 결과
     result: 사용자 표시용 3개 후보 (DB 저장)
     state_context: 각 후보의 상세 정보
     """
-    result: Dict[str, Any] = Field(
-        ..., 
-        description="""사용자 표시용 3개 컨셉 후보 - DB 저장
-        예시: {"concept1": "당신만의 여행", "concept2": "자유로운 탐험", "concept3": "완벽한 순간"}"""
-    )
-    state_context: Dict[str, Any] = Field(
-        ..., 
-        description="""각 후보의 상세 정보
-        {
-          "candidates": [
-            {
-              "id": 0,
-              "concept_statement": "...",
-              "concept_rationale": "...",
-              "qa_analysis_summary": "...",
-              "qa_keywords": [...],
-              "brand_values": [...]
-            },
-            {"id": 1, ...},
-            {"id": 2, ...}
-          ]
-        }"""
-    )
+    result: ConceptResult = Field(..., description="사용자 표시용 3개 컨셉 후보 - DB 저장")
+    state_context: ConceptStateContext = Field(..., description="각 후보의 상세 정보")
 
 # =================================================================
 # [Step 4] 스토리 (Story) Response
 # =================================================================
+class StoryResult(BaseModel):
+    """예시: {"story1": "우리는...", "story2": "여행은...", "story3": "당신의..."}"""
+    story1: Optional[Text] = None
+    story2: Optional[Text] = None
+    story3: Optional[Text] = None
+
+class StoryCandidate(CandidateDetail):
+    brand_story: Text = ""
+    story_rationale: Text = ""
+    emotional_arc: Text = ""
+
+class StoryStateContext(BaseModel):
+    candidates: List[StoryCandidate]
+
 class StoryResponse(BaseModel):
     """
     Step 4: 스토리 결과
     result: 사용자 표시용 3개 후보 (DB 저장)
     state_context: 각 후보의 상세 정보
     """
-    result: Dict[str, Any] = Field(
-        ..., 
-        description="""사용자 표시용 3개 스토리 후보 - DB 저장
-        예시: {"story1": "우리는...", "story2": "여행은...", "story3": "당신의..."}"""
-    )
-    state_context: Dict[str, Any] = Field(
-        ..., 
-        description="""각 후보의 상세 정보
-        {
-          "candidates": [
-            {
-              "id": 0,
-              "brand_story": "...",
-              "story_rationale": "...",
-              "qa_analysis_summary": "...",
-              "qa_keywords": [...],
-              "emotional_arc": "..."
-            },
-            {"id": 1, ...},
-            {"id": 2, ...}
-          ]
-        }"""
-    )
+    result: StoryResult = Field(..., description="사용자 표시용 3개 스토리 후보 - DB 저장")
+    state_context: StoryStateContext = Field(..., description="각 후보의 상세 정보")
 
 # =================================================================
 # [Step 5] 로고 (Logo) Response
 # =================================================================
+class LogoResult(BaseModel):
+    """예시: {"logo1_url": "https://...", "logo2_url": "https://...", "logo3_url": "https://..."}"""
+    logo1_url: Optional[Text] = None
+    logo2_url: Optional[Text] = None
+    logo3_url: Optional[Text] = None
+
+class LogoCandidate(CandidateDetail):
+    logo_image_url: Optional[Text] = None  # 이미지 생성 실패 시 null (result.logoN_url과 동일)
+    logo_concept: Text = ""
+    logo_rationale: Text = ""
+    color_palette: ValueList = []
+
+class LogoStateContext(BaseModel):
+    candidates: List[LogoCandidate]
+
 class LogoResponse(BaseModel):
     """
     Step 5: 로고 결과 (최종 단계)
     result: 사용자 표시용 3개 후보 (DB 저장)
     state_context: 각 후보의 상세 정보
     """
-    result: Dict[str, Any] = Field(
-        ..., 
-        description="""사용자 표시용 3개 로고 URL - DB 저장
-        예시: {"logo1_url": "https://...", "logo2_url": "https://...", "logo3_url": "https://..."}"""
-    )
-    state_context: Dict[str, Any] = Field(
-        ..., 
-        description="""각 후보의 상세 정보
-        {
-          "candidates": [
-            {
-              "id": 0,
-              "logo_image_url": "...",
-              "logo_concept": "...",
-              "logo_rationale": "...",
-              "qa_analysis_summary": "...",
-              "qa_keywords": [...],
-              "color_palette": [...]
-            },
-            {"id": 1, ...},
-            {"id": 2, ...}
-          ]
-        }"""
-    )
\ No newline at end of file
+    result: LogoResult = Field(..., description="사용자 표시용 3개 로고 URL - DB 저장")
+    state_context: LogoStateContext = Field(..., description="각 후보의 상세 정보")
@@ -0,0 +1,3 @@
+"""
+Services 패키지 초기화
+"""
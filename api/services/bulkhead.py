@@ -0,0 +1,208 @@
+"""
+단계 분류별 동시 실행 제한 (Bulkhead)
+Step 5(로고: GPT + Gemini 이미지 3장)는 Step 1~4보다 수십 배 오래 걸리므로
+같은 자원을 공유하면 로고 요청이 몰릴 때 짧은 텍스트 단계까지 대기열에 묶임
+→ text / image 분류마다 동시 실행 수와 대기열 크기를 따로 두고, 대기열이 가득 차면 즉시 429 + Retry-After
+
+- 동시 실행: BULKHEAD_<TEXT|IMAGE>_CONCURRENCY (워커 프로세스별)
+- 대기열: BULKHEAD_<TEXT|IMAGE>_QUEUE (0이면 대기 없이 바로 거절)
+- 스트리밍 응답은 마지막 이벤트 전송까지 슬롯 유지
+- 비동기 작업(?async=true)은 등록 요청을 제한하지 않고, 작업 실행 시 슬롯을 기다림 (거절 없음)
+- 실행 스레드 풀도 같은 분류로 분리됨 (langgraph_system/executor.py)
+"""
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+from urllib.parse import parse_qs
+
+from starlette.responses import JSONResponse
+
+from api.config import settings
+from langgraph_system.executor import TEXT_POOL, IMAGE_POOL, pool_for_step
+from langgraph_system.metrics import BULKHEAD_ACTIVE, BULKHEAD_QUEUED, BULKHEAD_REJECTED
+
+# URL 경로(/brands/<route>) → 노드(step) 이름
+ROUTE_STEPS = {
+    "interview": "diagnosis",
+    "naming": "naming",
+    "concept": "concept",
+    "story": "story",
+    "logo": "logo"
+}
+
+# Retry-After 추정용 초기 처리 시간 (초, 이후 실제 처리 시간의 지수 이동 평균)
+INITIAL_SECONDS = {TEXT_POOL: 10.0, IMAGE_POOL: 60.0}
+MAX_RETRY_AFTER = 120
+EWMA_ALPHA = 0.2
+
+
+class BulkheadFullError(RuntimeError):
+    """대기열이 가득 차 요청을 거절함"""
+
+    def __init__(self, pool: str, retry_after: int):
+        super().__init__(f"{pool} 단계 요청이 많아 처리할 수 없습니다. {retry_after}초 후 다시 시도해주세요")
+        self.pool = pool
+        self.retry_after = retry_after
+
+
+class Bulkhead:
+    """
+    동시 실행 수 + 대기열 크기 제한 (FIFO, 이벤트 루프 1개 기준)
+    대기 중인 요청은 슬롯이 비는 순서대로 넘겨받음
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int,
+                 expected_seconds: Optional[float] = None):
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._avg_seconds = expected_seconds or INITIAL_SECONDS.get(name, 10.0)
+        self.admitted = 0
+        self.rejected = 0
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """대기열에 자리가 날 때까지 예상 시간 (초)"""
+        return min(MAX_RETRY_AFTER, max(1, math.ceil(self._avg_seconds / self.max_concurrent)))
+
+    async def enter(self, reject: bool = True) -> float:
+        """
+        슬롯 획득 (없으면 대기열에서 대기)
+
+        Args:
+            reject: False면 대기열 크기와 무관하게 대기 (백그라운드 작업용)
+
+        Returns:
+            획득 시각 (exit()에 전달)
+
+        Raises:
+            BulkheadFullError: 실행 슬롯과 대기열이 모두 찬 경우
+        """
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+        else:
+            if reject and len(self._waiters) >= self.max_queue:
+                self.rejected += 1
+                BULKHEAD_REJECTED.labels(pool=self.name).inc()
+                raise BulkheadFullError(self.name, self.retry_after())
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            BULKHEAD_QUEUED.labels(pool=self.name).inc()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()  # 슬롯을 넘겨받은 직후 취소됨 → 다음 대기자에게 전달
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+            finally:
+                BULKHEAD_QUEUED.labels(pool=self.name).dec()
+
+        self.admitted += 1
+        BULKHEAD_ACTIVE.labels(pool=self.name).inc()
+        return time.perf_counter()
+
+    def exit(self, started: float):
+        """슬롯 반환 + 처리 시간 기록"""
+        elapsed = time.perf_counter() - started
+        self._avg_seconds += EWMA_ALPHA * (elapsed - self._avg_seconds)
+        BULKHEAD_ACTIVE.labels(pool=self.name).dec()
+        self._release()
+
+    @asynccontextmanager
+    async def acquire(self, reject: bool = True) -> AsyncIterator[None]:
+        started = await self.enter(reject)
+        try:
+            yield
+        finally:
+            self.exit(started)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "avg_seconds": round(self._avg_seconds, 2),
+            "retry_after": self.retry_after()
+        }
+
+    def _release(self):
+        # 대기자가 있으면 슬롯을 그대로 넘김 (active 유지), 없으면 반환
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+def _is_async_job(scope) -> bool:
+    values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("async", [])
+    return any(value.lower() in ("1", "true", "yes", "on") for value in values)
+
+
+class BulkheadMiddleware:
+    """
+    /brands/<step>[/stream] 요청을 단계 분류별 Bulkhead로 제한하는 ASGI 미들웨어
+    대기열 초과 시 엔드포인트를 실행하지 않고 429 + Retry-After 반환
+    """
+
+    def __init__(self, app, bulkheads: Dict[str, Bulkhead], path_prefix: str = "/brands/"):
+        self.app = app
+        self.bulkheads = bulkheads
+        self.path_prefix = path_prefix
+
+    def classify(self, scope) -> Optional[Bulkhead]:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            return None
+        route = scope["path"][len(self.path_prefix):].split("/", 1)[0]
+        if route not in ROUTE_STEPS or _is_async_job(scope):
+            return None
+        return self.bulkheads.get(pool_for_step(ROUTE_STEPS[route]))
+
+    async def __call__(self, scope, receive, send):
+        bulkhead = self.classify(scope)
+        if bulkhead is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            started = await bulkhead.enter()
+        except BulkheadFullError as e:
+            response = JSONResponse(status_code=429, content={"detail": str(e)},
+                                    headers={"Retry-After": str(e.retry_after)})
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            bulkhead.exit(started)
+
+
+def bulkhead_for_step(step: str) -> Bulkhead:
+    return bulkheads[pool_for_step(step)]
+
+
+def bulkhead_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: bulkhead.stats() for name, bulkhead in bulkheads.items()}
+
+
+# 전역 인스턴스 (워커 프로세스별)
+bulkheads: Dict[str, Bulkhead] = {
+    TEXT_POOL: Bulkhead(TEXT_POOL, settings.BULKHEAD_TEXT_CONCURRENCY, settings.BULKHEAD_TEXT_QUEUE),
+    IMAGE_POOL: Bulkhead(IMAGE_POOL, settings.BULKHEAD_IMAGE_CONCURRENCY, settings.BULKHEAD_IMAGE_QUEUE)
+}
@@ -0,0 +1,140 @@
+"""
+트래픽 녹화 미들웨어 (CAPTURE_ENABLED=true 일 때만 등록)
+/brands/* 요청마다 1줄씩 회전 JSONL 파일에 기록하여 실제 부하를 재현할 수 있게 함
+- 요청 본문: 민감 키 / 이메일 / 전화번호 마스킹 후 저장
+- 타이밍: 전체 소요 시간, 첫 응답 바이트까지 시간 (ms)
+- Provider 호출: 요청 처리 중 발생한 GPT / Gemini 응답 (langgraph_system/recording.py)
+재생: python -m benchmarks.replay --capture Test/captures
+"""
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List
+
+from api.config import settings
+from langgraph_system.recording import start_recording, stop_recording
+
+REDACTED = "[REDACTED]"
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+PHONE_PATTERN = re.compile(r"\+?\d{2,4}[-.\s]?\d{3,4}[-.\s]?\d{4}")
+# 응답의 output_id (Step 1 state_context / SSE start 이벤트) - 재생 시 여정(journey)별 output_id 치환용
+OUTPUT_ID_PATTERN = re.compile(rb'"output_id":\s*"([^"]+)"')
+
+
+def redact(value: Any, keys: List[str] = settings.CAPTURE_REDACT_KEYS) -> Any:
+    """민감 키의 값은 통째로, 문자열 속 이메일 / 전화번호는 부분 마스킹 (재귀)"""
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if any(key in str(k).lower() for key in keys) else redact(v, keys)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(v, keys) for v in value]
+    if isinstance(value, str):
+        return PHONE_PATTERN.sub(REDACTED, EMAIL_PATTERN.sub(REDACTED, value))
+    return value
+
+
+class CaptureWriter:
+    """
+    워커(프로세스)별 회전 JSONL 기록기
+    여러 워커가 같은 파일을 회전하면 기록이 유실되므로 파일명에 pid 포함
+    """
+
+    def __init__(self, directory: str = settings.CAPTURE_DIR,
+                 max_bytes: int = settings.CAPTURE_MAX_BYTES,
+                 backup_count: int = settings.CAPTURE_BACKUP_COUNT):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"capture-{os.getpid()}.jsonl")
+        self._logger = logging.getLogger(f"brand_api.capture.{os.getpid()}")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        if not self._logger.handlers:
+            handler = RotatingFileHandler(self.path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger.addHandler(handler)
+        self.written = 0
+
+    def write(self, record: Dict[str, Any]):
+        self._logger.info(json.dumps(record, ensure_ascii=False, default=str))
+        self.written += 1
+
+    def close(self):
+        for handler in list(self._logger.handlers):
+            handler.close()
+            self._logger.removeHandler(handler)
+
+
+class CaptureMiddleware:
+    """
+    ASGI 미들웨어 (StreamingResponse 포함, 응답을 버퍼링하지 않음)
+    Provider 호출 녹화는 요청 단위 contextvar로 묶이므로 엔드포인트와 같은 컨텍스트에서 시작
+    """
+
+    def __init__(self, app, writer: CaptureWriter, path_prefix: str = "/brands/"):
+        self.app = app
+        self.writer = writer
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.time()
+        started = time.perf_counter()
+        body_parts: List[bytes] = []
+        response = {"status": None, "ttfb_ms": None, "bytes": 0, "output_id": None}
+
+        async def capture_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                body_parts.append(message.get("body", b""))
+            return message
+
+        async def capture_send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                if response["ttfb_ms"] is None:
+                    response["ttfb_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                chunk = message.get("body", b"")
+                if response["output_id"] is None and response["bytes"] < 4096:
+                    match = OUTPUT_ID_PATTERN.search(chunk[:4096])
+                    if match:
+                        response["output_id"] = match.group(1).decode("utf-8", "replace")
+                response["bytes"] += len(chunk)
+            await send(message)
+
+        token = start_recording()
+        try:
+            await self.app(scope, capture_receive, capture_send)
+        finally:
+            provider_calls = stop_recording(token)
+            self.writer.write(self._record(scope, b"".join(body_parts), response, started_at, started, provider_calls))
+
+    def _record(self, scope, body: bytes, response: Dict[str, Any], started_at: float, started: float,
+                provider_calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            payload = redact(json.loads(body)) if body else None
+        except ValueError:
+            payload = None
+
+        return {
+            "id": uuid.uuid4().hex,
+            "ts": started_at,
+            "method": scope["method"],
+            "path": scope["path"],
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "body": payload,
+            "status": response["status"],
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "ttfb_ms": response["ttfb_ms"],
+            "response_bytes": response["bytes"],
+            "output_id": response["output_id"],
+            "provider_calls": provider_calls
+        }
@@ -0,0 +1,146 @@
+"""
+응답 압축 (gzip / brotli)
+Step 2-5 응답은 후보 3개의 상세 정보(state_context)를 모두 담아 수 KB~수십 KB - 한글 텍스트 위주라 압축률이 높음
+
+- Accept-Encoding 협상: q 값이 높은 쪽, 같으면 br > gzip (brotli 미설치 시 gzip만)
+- COMPRESSION_MIN_SIZE 미만 본문은 압축하지 않음 (작은 응답은 압축 비용 > 전송 절약)
+- 본문이 한 번에 전송되는 응답만 압축 - 스트리밍(SSE, text/event-stream)은 이벤트 단위 전송을 막지 않도록 그대로 전달
+- 이미 Content-Encoding이 있는 응답, 압축 효과가 없는 content-type(이미지 등)은 그대로 전달
+"""
+import gzip
+from typing import Dict, List, Optional, Tuple
+
+from api.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+SKIP_TYPES = ("text/event-stream",)
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """서버가 지원하는 인코딩 (선호 순서)"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, supported: Tuple[str, ...]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더 → 사용할 인코딩 (없으면 None)
+    e.g. "gzip, deflate, br" → "br", "br;q=0.5, gzip" → "gzip", "gzip;q=0" → None
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding에 따라 응답 본문을 gzip / brotli로 압축하는 ASGI 미들웨어
+    Content-Length를 압축 후 크기로 바꾸고 Vary: Accept-Encoding 추가
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.supported = supported_encodings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = _header(scope.get("headers", []), b"accept-encoding")
+        encoding = negotiate_encoding(accept.decode("latin-1"), self.supported) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                # 본문을 보기 전까지 보류 (압축 여부에 따라 헤더가 바뀜)
+                start = message
+                headers = message.get("headers", [])
+                content_type = (_header(headers, b"content-type") or b"").decode("latin-1").lower()
+                passthrough = (
+                    _header(headers, b"content-encoding") is not None
+                    or content_type.startswith(SKIP_TYPES)
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                )
+                if passthrough:
+                    await send(start)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                # 스트리밍 응답 / 작은 본문은 그대로 (Vary만 추가 - 캐시가 인코딩별로 구분하도록)
+                passthrough = True
+                start["headers"] = _with_vary(start.get("headers", []))
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding, self.gzip_level, self.brotli_quality)
+            headers = [(key, value) for key, value in start.get("headers", [])
+                       if key.lower() != b"content-length"]
+            headers += [
+                (b"content-encoding", encoding.encode("latin-1")),
+                (b"content-length", str(len(compressed)).encode("latin-1"))
+            ]
+            start["headers"] = _with_vary(headers)
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _with_vary(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    """Vary 헤더에 Accept-Encoding 추가 (이미 있으면 그대로)"""
+    vary = _header(headers, b"vary")
+    if vary is None:
+        return list(headers) + [(b"vary", b"Accept-Encoding")]
+    if b"accept-encoding" in vary.lower():
+        return list(headers)
+    return [(key, value + b", Accept-Encoding" if key.lower() == b"vary" else value) for key, value in headers]
@@ -0,0 +1,66 @@
+"""
+빠른 JSON 파싱 / 직렬화
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 동작 (결과는 동일)
+
+- loads: 요청 context의 JSON 문자열 파싱 등
+- OrjsonRoute: 요청 본문을 orjson으로 파싱하는 APIRoute (router = APIRouter(route_class=OrjsonRoute))
+- OrjsonResponse: 앱 기본 응답 클래스 (FastAPI(default_response_class=OrjsonResponse))
+- model_response: 타입이 정해진 응답 모델을 pydantic-core로 바로 직렬화 (FastAPI 재검증 / jsonable_encoder 생략)
+"""
+import json
+from typing import Any, Callable, Union
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """JSON 파싱 (실패 시 json.JSONDecodeError - orjson.JSONDecodeError도 그 하위 클래스)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 직렬화 (UTF-8 그대로, 공백 없음 - 한글을 \\uXXXX로 늘리지 않음)"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """응답 모델 → JSON 응답 (요청에 있던 필드만, 값이 없는 result 키 제외)"""
+    return Response(model.model_dump_json(exclude_unset=True), status_code=status_code, media_type="application/json")
+
+
+class OrjsonRequest(Request):
+    """request.json()을 orjson으로 파싱 (FastAPI 본문 파싱이 이 메서드를 사용)"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = loads(await self.body())
+        return self._json
+
+
+class OrjsonRoute(APIRoute):
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request):
+            return await handler(OrjsonRequest(request.scope, request.receive))
+
+        return route_handler
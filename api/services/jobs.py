@@ -0,0 +1,285 @@
+"""
+비동기 작업(Job) 서비스
+오래 걸리는 단계(로고: GPT 1회 + 이미지 3장 생성 / 업로드)를 요청 연결과 분리하여 백그라운드에서 실행하고,
+FE는 GET /jobs/{id}로 진행 상황과 완료된 후보별 결과를 조회
+
+- 실행: 프로세스 내 asyncio Task, 동시 실행 JOB_WORKERS개 (나머지는 대기), 대기 포함 JOB_MAX_PENDING개 초과 시 거절
+- 저장: SQLite (JOB_DB_PATH) - 재시작 후에도 완료된 결과 유지, 같은 호스트의 다른 워커에서도 조회 가능
+  진행 중이던 작업은 재시작 시 실패(interrupted)로 기록
+- 완료 / 실패한 작업은 JOB_TTL 초 후 삭제
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from api.config import settings
+from langgraph_system.executor import run_in_executor
+from langgraph_system.log import get_logger, log_context
+
+logger = get_logger("api.jobs")
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+# 만료 작업 정리 최소 간격 (초)
+PRUNE_INTERVAL = 60
+
+
+class JobQueueFullError(RuntimeError):
+    """대기 중인 작업이 JOB_MAX_PENDING개를 넘음"""
+
+
+class JobStore:
+    """작업 상태 저장소 (SQLite, 작업 1건 = 1행)"""
+
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")  # 워커 간 읽기 / 쓰기 동시 진행
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, pid INTEGER NOT NULL, "
+            "data TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def save(self, job: Dict[str, Any]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, status, pid, data, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job["job_id"], job["status"], os.getpid(),
+                 json.dumps(job, ensure_ascii=False, default=str), job["updated_at"])
+            )
+            self._conn.commit()
+
+    def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def interrupted(self):
+        """종료된 프로세스가 남긴 미완료 작업 (queued / running)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT pid, data FROM jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)
+            ).fetchall()
+        return [json.loads(data) for pid, data in rows if not _pid_alive(pid)]
+
+    def delete_finished_before(self, cutoff: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?", (*FINISHED_STATUSES, cutoff)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return False  # 이 프로세스는 방금 시작됨 → 이전 실행(같은 pid 재사용)이 남긴 작업
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+
+
+class JobProgress:
+    """실행 중인 작업의 진행 상황 기록 (Job 실행 함수에 전달)"""
+
+    def __init__(self, manager: "JobManager", job: Dict[str, Any]):
+        self._manager = manager
+        self._job = job
+
+    async def update(self, phase: Optional[str] = None, **partial: Any):
+        """
+        진행 단계 / 부분 결과 갱신
+
+        Args:
+            phase: 진행 단계 이름 (예: generating, rendering)
+            partial: 부분 결과 (dict 값은 병합 - 예: logos={0: {...}})
+        """
+        if phase:
+            self._job["progress"]["phase"] = phase
+        for key, value in partial.items():
+            current = self._job["partial"].get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                current.update({str(k): v for k, v in value.items()})
+            else:
+                self._job["partial"][key] = {str(k): v for k, v in value.items()} if isinstance(value, dict) else value
+        await self._manager._persist(self._job)
+
+
+JobFunc = Callable[[JobProgress], Awaitable[Dict[str, Any]]]
+
+
+class JobManager:
+    """백그라운드 작업 실행 / 조회"""
+
+    def __init__(self, db_path: str, workers: int = 2, max_pending: int = 100, ttl: float = 86400):
+        self.db_path = db_path
+        self.workers = workers
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self._store: Optional[JobStore] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._last_prune = 0.0
+        self.submitted = 0
+        self.rejected = 0
+
+    @property
+    def store(self) -> JobStore:
+        if self._store is None:
+            self._store = JobStore(self.db_path)
+        return self._store
+
+    def startup(self):
+        """이전 실행에서 중단된 작업을 실패로 기록"""
+        for job in self.store.interrupted():
+            job.update(status=FAILED, error="서버 재시작으로 작업이 중단되었습니다", updated_at=time.time())
+            self.store.save(job)
+            logger.warning("[Job] 중단된 작업 실패 처리: %s", job["job_id"])
+        self._prune()
+
+    async def shutdown(self):
+        """실행 / 대기 중인 작업 취소 (실패로 기록)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    async def submit(self, kind: str, output_id: Optional[str], func: JobFunc) -> Dict[str, Any]:
+        """
+        작업 등록 후 즉시 반환 (실행은 백그라운드)
+
+        Raises:
+            JobQueueFullError: 대기 포함 작업 수가 max_pending 이상
+        """
+        if len(self._tasks) >= self.max_pending:
+            self.rejected += 1
+            raise JobQueueFullError(f"대기 중인 작업이 너무 많습니다 (최대 {self.max_pending}건)")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+
+        now = time.time()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "kind": kind,
+            "output_id": output_id,
+            "status": QUEUED,
+            "progress": {"phase": QUEUED},
+            "partial": {},
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        self._jobs[job["job_id"]] = job
+        await self._persist(job)
+        self.submitted += 1
+
+        task = asyncio.ensure_future(self._run(job, func))
+        self._tasks[job["job_id"]] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job["job_id"], None))
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (이 워커에서 실행 중이면 메모리, 아니면 저장소)"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        return await run_in_executor(self.store.load, job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        running = sum(1 for job in self._jobs.values() if job["status"] == RUNNING)
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "running": running,
+            "queued": len(self._tasks) - running,
+            "submitted": self.submitted,
+            "rejected": self.rejected
+        }
+
+    # ---------- 내부 ----------
+    async def _run(self, job: Dict[str, Any], func: JobFunc):
+        with log_context(job["output_id"]):
+            try:
+                async with self._semaphore:
+                    job["status"] = RUNNING
+                    job["progress"]["phase"] = RUNNING
+                    job["started_at"] = time.time()
+                    await self._persist(job)
+                    job["result"] = await func(JobProgress(self, job))
+                job["status"] = SUCCEEDED
+                job["progress"]["phase"] = "done"
+            except asyncio.CancelledError:
+                job.update(status=FAILED, error="서버 종료로 작업이 중단되었습니다")
+            except Exception as e:
+                logger.error("[Job] %s 실패: %s", job["job_id"], e)
+                job.update(status=FAILED, error=str(e))
+            finally:
+                job["finished_at"] = time.time()
+                try:
+                    await self._persist(job)
+                finally:
+                    self._jobs.pop(job["job_id"], None)
+                    await self._aprune()
+
+    async def _persist(self, job: Dict[str, Any]):
+        job["updated_at"] = time.time()
+        await run_in_executor(self.store.save, job)
+
+    def _prune_due(self) -> bool:
+        now = time.time()
+        if now - self._last_prune < PRUNE_INTERVAL:
+            return False
+        self._last_prune = now
+        return True
+
+    def _prune(self):
+        if self._prune_due():
+            self._delete_expired()
+
+    async def _aprune(self):
+        """_prune (DB 삭제는 이벤트 루프 밖에서)"""
+        if self._prune_due():
+            await run_in_executor(self._delete_expired)
+
+    def _delete_expired(self):
+        try:
+            self.store.delete_finished_before(time.time() - self.ttl)
+        except sqlite3.Error as e:
+            logger.warning("[Job] 만료 작업 정리 실패: %s", e)
+
+
+# 전역 인스턴스
+job_manager = JobManager(
+    db_path=settings.JOB_DB_PATH,
+    workers=settings.JOB_WORKERS,
+    max_pending=settings.JOB_MAX_PENDING,
+    ttl=settings.JOB_TTL
+)
@@ -0,0 +1,113 @@
+"""
+output_id 발급 서비스
+Test/outputs/ 폴더 스캔 없이 O(1)로 output_id를 발급하며,
+다중 요청 / 다중 워커 환경에서도 중복 발급되지 않도록 보장
+"""
+import os
+import secrets
+import threading
+import time
+
+from api.config import settings
+
+try:
+    import fcntl
+
+    def _lock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock(f):
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK은 약 10초 후 실패하므로 재시도
+                continue
+
+    def _unlock(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+COUNTER_FILENAME = ".output_id_counter"
+LOCK_FILENAME = ".output_id_counter.lock"
+
+
+def _scan_max_output_number(outputs_dir: str) -> int:
+    """기존 output_XX 폴더 중 최대 번호 (카운터 파일 최초 생성 시 1회만 사용)"""
+    max_num = 0
+    for folder in os.listdir(outputs_dir):
+        if folder.startswith("output_") and os.path.isdir(os.path.join(outputs_dir, folder)):
+            try:
+                max_num = max(max_num, int(folder.split("_")[1]))
+            except ValueError:
+                pass
+    return max_num
+
+
+class OutputIdAllocator:
+    """
+    output_id 발급기
+
+    - counter 모드: 파일 잠금으로 보호되는 카운터 (프로세스/워커 간 안전, output_XX 형식 유지)
+    - time 모드: 밀리초 타임스탬프 + 난수 (호스트 간 안전, 시간순 정렬 가능)
+    """
+
+    def __init__(self, outputs_dir: str = "Test/outputs", mode: str = "counter"):
+        if mode not in ("counter", "time"):
+            raise ValueError(f"지원하지 않는 OUTPUT_ID_MODE: {mode}")
+        self.outputs_dir = outputs_dir
+        self.mode = mode
+        self._thread_lock = threading.Lock()
+        self._counter_path = os.path.join(outputs_dir, COUNTER_FILENAME)
+        self._lock_path = os.path.join(outputs_dir, LOCK_FILENAME)
+        os.makedirs(outputs_dir, exist_ok=True)
+
+    def allocate(self) -> str:
+        """다음 output_id 발급"""
+        if self.mode == "time":
+            return self._allocate_time_id()
+        return f"output_{self._allocate_counter():02d}"  # output_01, output_02, ...
+
+    def _allocate_time_id(self) -> str:
+        millis = time.time_ns() // 1_000_000
+        return f"output_{millis:011x}{secrets.token_hex(4)}"
+
+    def _allocate_counter(self) -> int:
+        # 같은 프로세스 내 스레드는 threading.Lock, 다른 프로세스는 파일 잠금으로 직렬화
+        with self._thread_lock, open(self._lock_path, "a+b") as lock_file:
+            _lock(lock_file)
+            try:
+                current = self._read_counter()
+                next_num = current + 1
+                self._write_counter(next_num)
+                return next_num
+            finally:
+                _unlock(lock_file)
+
+    def _read_counter(self) -> int:
+        try:
+            with open(self._counter_path, "r", encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except FileNotFoundError:
+            # 기존 output_XX 폴더와 번호가 겹치지 않도록 최초 1회 스캔
+            return _scan_max_output_number(self.outputs_dir)
+
+    def _write_counter(self, value: int):
+        # 임시 파일에 쓴 뒤 교체하여 중간 상태가 남지 않도록 처리
+        tmp_path = f"{self._counter_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(str(value))
+        os.replace(tmp_path, self._counter_path)
+
+
+# 전역 발급기 인스턴스
+output_id_allocator = OutputIdAllocator(settings.OUTPUTS_DIR, settings.OUTPUT_ID_MODE)
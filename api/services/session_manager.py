@@ -0,0 +1,327 @@
+"""
+세션 저장소 (output_id 단위)
+각 단계 결과(Step 1 진단 context, Step 2-5 후보 목록 + 선택)를 서버에 보관하여
+FE가 누적 context 전체를 다시 보내지 않고 output_id + 선택한 후보 id만 보내도 되도록 함
+
+- 메모리: LRU + TTL (MAX_SESSIONS 초과 시 가장 오래 사용하지 않은 세션부터 제거, SESSION_TIMEOUT 초 미사용 시 만료)
+- 영속 (선택, SESSION_DIR 지정 시): 세션별 JSON 파일 (워커 간 공유 / 재시작 후 복구, 메모리에서 밀려난 세션도 조회 가능)
+  만료는 파일 mtime 기준 - 메모리에서 조회해도 mtime을 갱신하여 다른 워커에서 만료로 보지 않도록 함
+- 기존 방식(context에 전체 정보 포함)도 그대로 동작 - context 값이 있으면 세션보다 우선
+- 비동기 경로(라우터)는 a* 메서드 사용: SESSION_DIR 지정 시 파일 읽기 / 쓰기를 스레드 풀에서 실행 (이벤트 루프 비차단)
+"""
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from api.config import settings
+from langgraph_system.executor import run_in_executor
+from langgraph_system.log import get_logger
+
+logger = get_logger("api.session")
+
+# 후보 목록을 보관하는 단계 (Step 2-5)
+CANDIDATE_STEPS = ("naming", "concept", "story", "logo")
+
+# 파일명으로 사용할 수 있는 output_id만 영속 저장
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]{1,128}$")
+
+# 만료 파일 정리 최소 간격 (초)
+SWEEP_INTERVAL = 60
+
+
+class SessionNotFoundError(LookupError):
+    """output_id의 세션이 없거나 만료됨 (또는 참조한 후보가 없음)"""
+
+
+def candidate_ref(value: Any) -> Optional[int]:
+    """
+    context 값이 후보 id 참조인지 판별
+
+    Returns:
+        후보 id (1, "1", {"id": 1}) - 후보 상세 정보 전체이거나 비어 있으면 None
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    if isinstance(value, dict) and set(value) == {"id"}:
+        return candidate_ref(value["id"])
+    return None
+
+
+class SessionManager:
+    """output_id → 세션 (LRU + TTL, 선택적 파일 영속)"""
+
+    def __init__(self, max_sessions: int = 100, timeout: float = 3600, shared_dir: str = ""):
+        self.max_sessions = max_sessions
+        self.timeout = timeout
+        self.shared_dir = shared_dir
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.expired = 0
+
+        if self.shared_dir:
+            os.makedirs(self.shared_dir, exist_ok=True)
+
+    # ---------- 조회 / 저장 ----------
+    def get_session(self, output_id: str) -> Optional[Dict[str, Any]]:
+        """세션 조회 (조회 시 만료 시간 연장), 없거나 만료되면 None"""
+        if not output_id:
+            return None
+        now = time.time()
+        with self._lock:
+            session = self._sessions.get(output_id)
+            if session is not None and now - session["updated_at"] > self.timeout:
+                del self._sessions[output_id]
+                self.expired += 1
+                session = None
+            if session is None:
+                session = self._read(output_id)
+                if session is None:
+                    self.misses += 1
+                    return None
+                self._sessions[output_id] = session
+                self._evict()
+            session["updated_at"] = now
+            self._sessions.move_to_end(output_id)
+            self.hits += 1
+        self._touch(output_id, now)
+        return session
+
+    def update_session(self, output_id: str, **fields: Any) -> Dict[str, Any]:
+        """세션 필드 갱신 (없으면 생성)"""
+        now = time.time()
+        with self._lock:
+            session = self._sessions.get(output_id)
+            if session is None or now - session["updated_at"] > self.timeout:
+                session = self._read(output_id) or {"output_id": output_id, "created_at": now}
+                self._sessions[output_id] = session
+            session.update(fields)
+            session["updated_at"] = now
+            self._sessions.move_to_end(output_id)
+            self._evict()
+            self._write(output_id, session)
+        # 만료 파일 정리는 잠금 밖에서 (디렉토리 전체 조회 동안 다른 세션 조회 / 저장이 멈추지 않도록)
+        self._sweep_expired()
+        return session
+
+    def save_context(self, output_id: str, context: Dict[str, Any]):
+        """Step 1 진단 context 저장"""
+        if output_id:
+            self.update_session(output_id, interview=context)
+
+    def save_candidates(self, output_id: str, step: str, candidates: list):
+        """Step 2-5 후보 목록 저장 (새 후보가 생성되면 이전 선택은 초기화)"""
+        if output_id:
+            self.update_session(output_id, **{step: {"candidates": candidates, "selected": None}})
+
+    def select(self, output_id: str, step: str, candidate_id: int):
+        """FE가 선택한 후보 기록 (다음 단계 요청에서 생략 가능)"""
+        session = self.get_session(output_id)
+        entry = (session or {}).get(step)
+        if entry and entry.get("selected") != candidate_id:
+            self.update_session(output_id, **{step: {**entry, "selected": candidate_id}})
+
+    # ---------- 비동기 (라우터용) ----------
+    async def aresolve_context(self, output_id: Optional[str], context: Dict[str, Any],
+                               keys: Iterable[str]) -> Dict[str, Any]:
+        """resolve_context (SESSION_DIR 지정 시 파일 I/O가 있으므로 스레드 풀에서 실행)"""
+        if not self.shared_dir:
+            return self.resolve_context(output_id, context, keys)
+        return await run_in_executor(self.resolve_context, output_id, context, keys)
+
+    async def asave_context(self, output_id: str, context: Dict[str, Any]):
+        if not self.shared_dir:
+            return self.save_context(output_id, context)
+        await run_in_executor(self.save_context, output_id, context)
+
+    async def asave_candidates(self, output_id: str, step: str, candidates: list):
+        if not self.shared_dir:
+            return self.save_candidates(output_id, step, candidates)
+        await run_in_executor(self.save_candidates, output_id, step, candidates)
+
+    def delete_session(self, output_id: str):
+        with self._lock:
+            self._sessions.pop(output_id, None)
+            path = self._path(output_id)
+            if path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    # ---------- context 복원 ----------
+    def resolve_context(self, output_id: Optional[str], context: Dict[str, Any],
+                        keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        요청 context의 빈 항목 / 후보 id 참조를 세션 정보로 채움
+
+        Args:
+            output_id: 세션 키 (없으면 context를 그대로 반환)
+            context: 요청 context (예: {"naming": 1} 또는 {"naming": {...후보 상세...}})
+            keys: 이 단계에 필요한 context 키 (interview, naming, ...)
+
+        Returns:
+            후보 id가 후보 상세 정보로 치환된 context
+            (선택 없이 후보 목록만 있는 단계는 {"candidates": [...]} - flatten_context가 선택)
+
+        Raises:
+            SessionNotFoundError: 후보 id를 참조했는데 세션 / 후보가 없음, 또는 interview 없이 세션도 없음
+        """
+        if not output_id:
+            return context
+
+        resolved = dict(context)
+        session = self.get_session(output_id)
+
+        for key in keys:
+            value = resolved.get(key)
+            if key == "interview" and isinstance(value, dict) and set(value) <= {"output_id"}:
+                value = None
+            ref = candidate_ref(value) if key in CANDIDATE_STEPS else None
+
+            if value and ref is None:
+                # 상세 정보를 직접 보낸 경우 (기존 방식) - 진단 context / 선택만 기록
+                if key == "interview" and isinstance(value, dict) and not (session or {}).get("interview"):
+                    session = self.update_session(output_id, interview=value)
+                elif key in CANDIDATE_STEPS and isinstance(value, dict) and candidate_ref(value.get("id")) is not None:
+                    self.select(output_id, key, candidate_ref(value["id"]))
+                continue
+
+            if session is None:
+                if ref is None and key != "interview":
+                    continue
+                raise SessionNotFoundError(
+                    f"세션이 없거나 만료되었습니다 (output_id: {output_id}) - context 전체를 다시 보내주세요"
+                )
+
+            if key == "interview":
+                resolved[key] = {**session.get("interview", {}), "output_id": output_id}
+                continue
+
+            entry = session.get(key) or {}
+            candidates = entry.get("candidates") or []
+            if ref is None:
+                ref = entry.get("selected")
+            if ref is None:
+                if candidates:
+                    resolved[key] = {"candidates": candidates}
+                continue
+
+            selected = next((c for c in candidates if c.get("id") == ref), None)
+            if selected is None:
+                raise SessionNotFoundError(f"{key} 후보 {ref}를 찾을 수 없습니다 (output_id: {output_id})")
+            resolved[key] = selected
+            self.select(output_id, key, ref)
+
+        return resolved
+
+    # ---------- 상태 ----------
+    def get_session_count(self) -> int:
+        """메모리에 있는 활성 세션 수 (만료 세션 정리 후)"""
+        self.cleanup_expired()
+        return len(self._sessions)
+
+    def cleanup_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [k for k, s in self._sessions.items() if now - s["updated_at"] > self.timeout]
+            for output_id in expired:
+                del self._sessions[output_id]
+            self.expired += len(expired)
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self.get_session_count(),
+            "max_sessions": self.max_sessions,
+            "timeout": self.timeout,
+            "durable": bool(self.shared_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+            "expired": self.expired
+        }
+
+    # ---------- 내부 ----------
+    def _evict(self):
+        while len(self._sessions) > self.max_sessions:
+            output_id, _ = self._sessions.popitem(last=False)
+            self.evicted += 1
+            logger.debug("[Session] LRU 제거: %s", output_id)
+
+    def _path(self, output_id: str) -> Optional[str]:
+        if not self.shared_dir or not _SAFE_ID.match(output_id):
+            return None
+        return os.path.join(self.shared_dir, f"{output_id}.json")
+
+    def _read(self, output_id: str) -> Optional[Dict[str, Any]]:
+        path = self._path(output_id)
+        if not path:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) > self.timeout:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, output_id: str, session: Dict[str, Any]):
+        path = self._path(output_id)
+        if not path:
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(session, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("[Session] 세션 파일 저장 실패: %s", e)
+
+    def _touch(self, output_id: str, now: float):
+        """세션 파일 mtime 갱신 (조회도 사용으로 간주 - 워커 간 만료 기준 일치)"""
+        path = self._path(output_id)
+        if not path:
+            return
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+
+    def _sweep_expired(self):
+        """만료된 세션 파일 정리 (SWEEP_INTERVAL마다 1회, 잠금 밖에서 호출)"""
+        if not self.shared_dir:
+            return
+        now = time.time()
+        with self._lock:
+            if now - self._last_sweep < SWEEP_INTERVAL:
+                return
+            self._last_sweep = now
+        try:
+            for name in os.listdir(self.shared_dir):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.shared_dir, name)
+                if now - os.path.getmtime(path) > self.timeout:
+                    os.remove(path)
+        except OSError:
+            pass
+
+
+# 전역 인스턴스
+session_manager = SessionManager(
+    max_sessions=settings.MAX_SESSIONS,
+    timeout=settings.SESSION_TIMEOUT,
+    shared_dir=settings.SESSION_DIR
+)
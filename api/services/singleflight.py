@@ -0,0 +1,176 @@
+"""
+Singleflight (동일 요청 병합) 서비스
+FE 중복 제출 / Backend 재시도로 같은 요청이 동시에 들어오면
+LangGraph 실행을 1회만 수행하고 결과를 모든 요청에 공유
+
+- 프로세스 내: 키별 asyncio Task 공유
+- 워커 간 (선택, SINGLEFLIGHT_DIR 지정 시): 잠금 파일 + 결과 파일로 병합
+  파일 I/O는 이벤트 루프 밖(스레드 풀)에서 수행, 다른 워커의 결과를 SINGLEFLIGHT_WAIT_TIMEOUT 초까지만 기다리고
+  넘으면 직접 실행 (실행 중이던 워커가 비정상 종료된 경우)
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from api.config import settings
+from langgraph_system.executor import run_in_executor
+from langgraph_system.log import get_logger
+
+logger = get_logger("api.singleflight")
+
+POLL_INTERVAL = 0.2
+
+
+def request_key(*parts: Any) -> str:
+    """요청 구성 요소(step, context, user_input 등)를 정규화하여 병합 키 생성"""
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """동일 키의 동시 실행을 1회로 병합"""
+
+    def __init__(self, enabled: bool = True, shared_dir: str = "",
+                 result_ttl: float = 10, lock_timeout: float = 600, wait_timeout: float = 300):
+        self.enabled = enabled
+        self.shared_dir = shared_dir
+        self.result_ttl = result_ttl
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.wait_timeouts = 0
+
+        if self.shared_dir:
+            os.makedirs(self.shared_dir, exist_ok=True)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key가 같은 요청이 실행 중이면 그 결과를 기다리고, 없으면 func 실행
+
+        실행은 별도 Task로 분리되어, 먼저 들어온 요청의 연결이 끊겨도
+        함께 기다리는 다른 요청에는 영향을 주지 않음
+        """
+        if not self.enabled:
+            return await func()
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.info("[SingleFlight] 동일 요청 실행 중 - 결과 공유 대기 (%s)", key[:12])
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(self._run(key, func))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "shared": bool(self.shared_dir),
+            "inflight": len(self._inflight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "wait_timeouts": self.wait_timeouts
+        }
+
+    # ---------- 워커 간 병합 ----------
+    async def _run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.shared_dir:
+            return await func()
+
+        lock_path = os.path.join(self.shared_dir, f"{key}.lock")
+        result_path = os.path.join(self.shared_dir, f"{key}.json")
+
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            result = await run_in_executor(self._read_result, result_path)
+            if result is not None:
+                self.coalesced += 1
+                logger.info("[SingleFlight] 다른 워커의 실행 결과 공유 (%s)", key[:12])
+                return result
+
+            if await run_in_executor(self._try_lock, lock_path):
+                try:
+                    result = await func()
+                    await run_in_executor(self._write_result, result_path, result)
+                    return result
+                finally:
+                    await run_in_executor(self._unlock, lock_path)
+
+            if time.monotonic() >= deadline:
+                # 실행 중인 워커가 응답하지 않음 → 결과 공유 없이 직접 실행
+                self.wait_timeouts += 1
+                logger.warning("[SingleFlight] 다른 워커 결과 대기 시간 초과 - 직접 실행 (%s)", key[:12])
+                return await func()
+
+            # 다른 워커가 실행 중 → 결과 파일 또는 잠금 해제 대기
+            await asyncio.sleep(POLL_INTERVAL)
+
+    def _try_lock(self, lock_path: str) -> bool:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            return True
+        except FileExistsError:
+            # 비정상 종료된 워커가 남긴 오래된 잠금은 제거 후 재시도
+            try:
+                if time.time() - os.path.getmtime(lock_path) > self.lock_timeout:
+                    os.remove(lock_path)
+            except OSError:
+                pass
+            return False
+
+    def _unlock(self, lock_path: str):
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+    def _read_result(self, result_path: str) -> Optional[Any]:
+        try:
+            if time.time() - os.path.getmtime(result_path) > self.result_ttl:
+                return None
+            with open(result_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_result(self, result_path: str, result: Any):
+        self._sweep_expired()
+        tmp_path = f"{result_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, result_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("[SingleFlight] 결과 공유 파일 저장 실패: %s", e)
+
+    def _sweep_expired(self):
+        """만료된 결과 파일 정리 (실행 주체 워커가 결과 저장 시 수행)"""
+        now = time.time()
+        try:
+            for name in os.listdir(self.shared_dir):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.shared_dir, name)
+                if now - os.path.getmtime(path) > self.result_ttl:
+                    os.remove(path)
+        except OSError:
+            pass
+
+
+# 전역 인스턴스
+singleflight = SingleFlight(
+    enabled=settings.SINGLEFLIGHT_ENABLED,
+    shared_dir=settings.SINGLEFLIGHT_DIR,
+    result_ttl=settings.SINGLEFLIGHT_RESULT_TTL,
+    lock_timeout=settings.SINGLEFLIGHT_LOCK_TIMEOUT,
+    wait_timeout=settings.SINGLEFLIGHT_WAIT_TIMEOUT
+)
@@ -0,0 +1,457 @@
+"""
+5단계 Journey 벤치마크
+answers.json / answers_v2.json으로 Step 1 → 5 전체 흐름을 실행 중인 API에 재생하고
+동시성 단계별로 p50/p95/p99 지연, 처리량, 에러율, 서버 최대 RSS를 측정
+
+실행 예:
+    # 가짜 Provider + API 서버를 직접 띄워서 측정 (API 키 불필요)
+    python -m benchmarks.journey --spawn --fake --concurrency 1,4,16 --journeys 32
+
+    # 이미 실행 중인 서버 대상 (RSS는 --server-pid 지정 시 측정)
+    python -m benchmarks.journey --base-url http://127.0.0.1:8000 --server-pid 12345
+
+    # 이전 결과와 비교 (p95가 허용치 이상 느려지면 종료 코드 1)
+    python -m benchmarks.journey --spawn --fake --baseline benchmarks/results/base.json
+
+결과: benchmarks/results/journey_<시각>.json (--output으로 변경)
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+
+# (단계 이름, API 경로, answers 키)
+STEPS = [
+    ("interview", "/brands/interview", "step_1"),
+    ("naming", "/brands/naming", "step_2"),
+    ("concept", "/brands/concept", "step_3"),
+    ("story", "/brands/story", "step_4"),
+    ("logo", "/brands/logo", "step_5")
+]
+STEP_NAMES = [name for name, _, _ in STEPS]
+
+
+# =================================================================
+# 통계
+# =================================================================
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """선형 보간 백분위수 (values가 비어 있으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(latencies_ms: List[float], errors: int) -> Dict[str, Any]:
+    total = len(latencies_ms) + errors
+
+    def rounded(value):
+        return round(value, 1) if value is not None else None
+
+    return {
+        "count": total,
+        "ok": len(latencies_ms),
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "p50_ms": rounded(percentile(latencies_ms, 50)),
+        "p95_ms": rounded(percentile(latencies_ms, 95)),
+        "p99_ms": rounded(percentile(latencies_ms, 99)),
+        "mean_ms": rounded(sum(latencies_ms) / len(latencies_ms)) if latencies_ms else None,
+        "max_ms": rounded(max(latencies_ms)) if latencies_ms else None
+    }
+
+
+# =================================================================
+# 서버 메모리 (RSS) 측정
+# =================================================================
+def read_rss_bytes(pid: int) -> Optional[int]:
+    """프로세스 RSS (psutil 또는 /proc, 둘 다 없으면 None)"""
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class RssSampler:
+    """동시성 단계 실행 중 서버 RSS를 주기적으로 샘플링하여 최댓값 기록"""
+
+    def __init__(self, pid: Optional[int], interval: float = 0.1):
+        self.pid = pid
+        self.interval = interval
+        self.peak: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            rss = read_rss_bytes(self.pid)
+            if rss is not None:
+                self.peak = max(self.peak or 0, rss)
+            await asyncio.sleep(self.interval)
+
+    def __enter__(self):
+        if self.pid:
+            self._task = asyncio.ensure_future(self._run())
+        return self
+
+    def __exit__(self, *exc):
+        if self._task is not None:
+            self._task.cancel()
+
+    @property
+    def peak_mb(self) -> Optional[float]:
+        return round(self.peak / (1024 * 1024), 1) if self.peak else None
+
+
+# =================================================================
+# Journey 실행
+# =================================================================
+def load_answers(paths: List[str]) -> List[Dict[str, Any]]:
+    answer_sets = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            answer_sets.append(json.load(f))
+    return answer_sets
+
+
+def build_payload(step: str, user_input: Dict[str, Any], context: Dict[str, Any], use_cache: bool) -> Dict[str, Any]:
+    if step == "interview":
+        return {"user_input": user_input, "use_cache": use_cache}
+    return {"user_input": user_input, "context": context}
+
+
+async def run_journey(client: httpx.AsyncClient, journey_id: int, answers: Dict[str, Any],
+                      samples: Dict[str, List[float]], errors: Dict[str, int],
+                      unique: bool, use_cache: bool) -> Optional[float]:
+    """
+    Step 1 → 5 순서대로 실행 (앞 단계 실패 시 중단)
+    후보 선택은 journey_id 기준으로 순환 (0, 1, 2)
+
+    Returns:
+        전체 journey 소요 시간 (ms), 실패 시 None
+    """
+    context: Dict[str, Any] = {}
+    choice = journey_id % 3
+    journey_start = time.perf_counter()
+
+    for step, path, answers_key in STEPS:
+        user_input = dict(answers[answers_key])
+        if unique:
+            # 동일 요청 병합(Singleflight)에 묶이지 않도록 journey마다 입력을 다르게 만듦
+            user_input["bench_journey_id"] = journey_id
+
+        start = time.perf_counter()
+        try:
+            response = await client.post(path, json=build_payload(step, user_input, context, use_cache))
+            ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if not ok:
+            errors[step] += 1
+            return None
+        samples[step].append(elapsed_ms)
+
+        state_context = response.json()["state_context"]
+        if step == "interview":
+            context["interview"] = state_context
+        else:
+            candidates = state_context.get("candidates", [])
+            if candidates:
+                context[step] = candidates[min(choice, len(candidates) - 1)]
+
+    return (time.perf_counter() - journey_start) * 1000
+
+
+async def run_level(base_url: str, concurrency: int, journeys: int, answer_sets: List[Dict[str, Any]],
+                    timeout: float, server_pid: Optional[int], unique: bool, use_cache: bool,
+                    journey_offset: int) -> Dict[str, Any]:
+    """동시성 1단계 실행: concurrency개의 가상 사용자가 journeys개를 나누어 연속 실행"""
+    samples = {step: [] for step in STEP_NAMES}
+    errors = {step: 0 for step in STEP_NAMES}
+    journey_ms: List[float] = []
+    failed = 0
+    next_id = iter(range(journeys))
+
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+
+        async def user():
+            nonlocal failed
+            for i in next_id:
+                journey_id = journey_offset + i
+                answers = answer_sets[journey_id % len(answer_sets)]
+                result = await run_journey(client, journey_id, answers, samples, errors, unique, use_cache)
+                if result is None:
+                    failed += 1
+                else:
+                    journey_ms.append(result)
+
+        with RssSampler(server_pid) as rss:
+            start = time.perf_counter()
+            await asyncio.gather(*(user() for _ in range(concurrency)))
+            duration = time.perf_counter() - start
+
+    requests_ok = sum(len(v) for v in samples.values())
+    requests_total = requests_ok + sum(errors.values())
+    return {
+        "concurrency": concurrency,
+        "journeys": journeys,
+        "completed": len(journey_ms),
+        "failed": failed,
+        "duration_s": round(duration, 3),
+        "throughput": {
+            "journeys_per_s": round(len(journey_ms) / duration, 3),
+            "requests_per_s": round(requests_ok / duration, 3)
+        },
+        "error_rate": round(sum(errors.values()) / requests_total, 4) if requests_total else 0.0,
+        "peak_rss_mb": rss.peak_mb,
+        "journey": summarize(journey_ms, failed),
+        "steps": {step: summarize(samples[step], errors[step]) for step in STEP_NAMES}
+    }
+
+
+# =================================================================
+# 서버 실행 (--spawn)
+# =================================================================
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 시작 중 종료되었습니다: {url} (exit {process.returncode})")
+        try:
+            if httpx.get(url, timeout=1).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"서버 시작 대기 시간 초과: {url}")
+
+
+class SpawnedServers:
+    """벤치마크용 API 서버 (+ 가짜 Provider 서버) 실행 / 종료"""
+
+    def __init__(self, fake: bool, workers: int, log_path: str):
+        self.fake = fake
+        self.workers = workers
+        self.log = open(log_path, "w", encoding="utf-8")
+        self.processes: List[subprocess.Popen] = []
+        self.outputs_dir = tempfile.mkdtemp(prefix="bench_outputs_")
+        self.api_port = free_port()
+        self.fake_port = free_port() if fake else None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.api_port}"
+
+    @property
+    def api_pid(self) -> int:
+        return self.processes[-1].pid
+
+    def _spawn(self, args: List[str], env: Dict[str, str]) -> subprocess.Popen:
+        process = subprocess.Popen(args, cwd=ROOT_DIR, env=env, stdout=self.log, stderr=subprocess.STDOUT)
+        self.processes.append(process)
+        return process
+
+    def __enter__(self):
+        env = dict(os.environ)
+        # 로고 이미지 / output_id 카운터를 저장소 밖 임시 폴더에 기록
+        env["OUTPUTS_DIR"] = self.outputs_dir
+
+        if self.fake:
+            fake_url = f"http://127.0.0.1:{self.fake_port}"
+            process = self._spawn([sys.executable, "-m", "fake_providers", "--port", str(self.fake_port)], env)
+            wait_until_ready(f"{fake_url}/_fake/config", process)
+            env.update(PROVIDER_MODE="fake", FAKE_PROVIDER_URL=fake_url)
+
+        process = self._spawn([
+            sys.executable, "-m", "uvicorn", "api.main:app",
+            "--host", "127.0.0.1", "--port", str(self.api_port),
+            "--workers", str(self.workers), "--log-level", "warning"
+        ], env)
+        wait_until_ready(f"{self.base_url}/", process)
+        return self
+
+    def __exit__(self, *exc):
+        for process in reversed(self.processes):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self.log.close()
+
+
+# =================================================================
+# 결과 저장 / 비교
+# =================================================================
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_with_baseline(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    동시성 / 단계별 p95 비교
+
+    Returns:
+        회귀 항목 설명 리스트 (p95가 baseline * (1 + tolerance) 초과 또는 에러율 증가)
+    """
+    regressions = []
+    base_levels = {level["concurrency"]: level for level in baseline.get("levels", [])}
+    for level in result["levels"]:
+        base = base_levels.get(level["concurrency"])
+        if base is None:
+            continue
+        for step in STEP_NAMES + ["journey"]:
+            current = level["journey"] if step == "journey" else level["steps"][step]
+            previous = base["journey"] if step == "journey" else base["steps"].get(step, {})
+            if current["p95_ms"] and previous.get("p95_ms") and current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"c={level['concurrency']} {step}: p95 {previous['p95_ms']}ms → {current['p95_ms']}ms"
+                )
+        if level["error_rate"] > base.get("error_rate", 0) + 0.01:
+            regressions.append(
+                f"c={level['concurrency']}: error_rate {base.get('error_rate', 0)} → {level['error_rate']}"
+            )
+    return regressions
+
+
+def print_level(level: Dict[str, Any]):
+    print(f"\n[Concurrency {level['concurrency']}] journeys {level['completed']}/{level['journeys']} "
+          f"in {level['duration_s']}s | {level['throughput']['journeys_per_s']} journeys/s, "
+          f"{level['throughput']['requests_per_s']} req/s | error_rate {level['error_rate']} | "
+          f"peak RSS {level['peak_rss_mb']} MB")
+    print(f"  {'step':<10}{'p50':>10}{'p95':>10}{'p99':>10}{'errors':>8}")
+    for step in STEP_NAMES + ["journey"]:
+        stats = level["journey"] if step == "journey" else level["steps"][step]
+        print(f"  {step:<10}{stats['p50_ms'] or '-':>10}{stats['p95_ms'] or '-':>10}"
+              f"{stats['p99_ms'] or '-':>10}{stats['errors']:>8}")
+
+
+# =================================================================
+# main
+# =================================================================
+async def run_benchmark(args, base_url: str, server_pid: Optional[int]) -> Dict[str, Any]:
+    answer_sets = load_answers(args.answers)
+    levels = []
+    journey_offset = 0
+    for concurrency in args.concurrency:
+        journeys = args.journeys or concurrency * 4
+        if args.warmup:
+            await run_level(base_url, 1, args.warmup, answer_sets, args.timeout, None,
+                            args.unique, args.use_cache, journey_offset=10**6 + journey_offset)
+        level = await run_level(base_url, concurrency, journeys, answer_sets, args.timeout, server_pid,
+                                args.unique, args.use_cache, journey_offset)
+        journey_offset += journeys
+        print_level(level)
+        levels.append(level)
+    return {
+        "meta": {
+            "benchmark": "journey",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_commit": git_commit(),
+            "base_url": base_url,
+            "provider_mode": "fake" if args.fake else os.getenv("PROVIDER_MODE", "live"),
+            "answers": [os.path.basename(path) for path in args.answers],
+            "unique_inputs": args.unique,
+            "use_cache": args.use_cache,
+            "workers": args.workers if args.spawn else None,
+            "python": platform.python_version(),
+            "platform": platform.platform()
+        },
+        "levels": levels
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Step 1 → 5 journey benchmark")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="대상 API 주소 (--spawn 시 무시)")
+    parser.add_argument("--answers", nargs="+", default=[os.path.join(ROOT_DIR, "answers.json"),
+                                                         os.path.join(ROOT_DIR, "answers_v2.json")])
+    parser.add_argument("--concurrency", type=lambda v: [int(x) for x in v.split(",")], default=[1, 2, 4, 8],
+                        help="동시 사용자 수 목록 (예: 1,4,16)")
+    parser.add_argument("--journeys", type=int, default=0, help="단계별 journey 수 (기본: 동시성 x 4)")
+    parser.add_argument("--warmup", type=int, default=1, help="각 단계 전 워밍업 journey 수 (측정 제외)")
+    parser.add_argument("--timeout", type=float, default=600, help="요청 제한 시간 (초)")
+    parser.add_argument("--use-cache", action="store_true", help="Step 1 진단 캐시 사용 (기본: 미사용)")
+    parser.add_argument("--no-unique", dest="unique", action="store_false",
+                        help="journey마다 입력을 다르게 하지 않음 (동일 요청 병합 효과 포함 측정)")
+    parser.add_argument("--spawn", action="store_true", help="API 서버를 직접 실행")
+    parser.add_argument("--fake", action="store_true", help="--spawn 시 가짜 Provider 서버 사용")
+    parser.add_argument("--workers", type=int, default=1, help="--spawn 시 uvicorn 워커 수")
+    parser.add_argument("--server-pid", type=int, default=None, help="RSS를 측정할 API 서버 PID")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="p95 회귀 허용 비율 (기본 20%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    output = args.output or os.path.join(RESULTS_DIR, f"journey_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+    if args.spawn:
+        log_path = os.path.splitext(output)[0] + ".server.log"
+        with SpawnedServers(args.fake, args.workers, log_path) as servers:
+            print(f"[Bench] API {servers.base_url} (pid {servers.api_pid}), 서버 로그: {log_path}")
+            result = asyncio.run(run_benchmark(args, servers.base_url, servers.api_pid))
+    else:
+        result = asyncio.run(run_benchmark(args, args.base_url, args.server_pid))
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n[Bench] 결과 저장: {output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_with_baseline(result, json.load(f), args.tolerance)
+        if regressions:
+            print(f"[Bench] ❌ 성능 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%})")
+            for item in regressions:
+                print(f"  - {item}")
+            return 1
+        print("[Bench] ✅ baseline 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Q&A 프롬프트 토큰 리포트
+answers.json / answers_v2.json의 단계별 Q&A를 기존 직렬화(indent=2)와 압축 직렬화(qa_prompt_json)로
+각각 프롬프트에 넣었을 때의 토큰 수를 비교 (입력 토큰이 줄어드는 만큼 첫 토큰 지연도 줄어듦)
+
+실행 예:
+    python -m benchmarks.prompt_tokens
+    python -m benchmarks.prompt_tokens --answers answers.json --output benchmarks/results/prompt_tokens.json
+
+토큰 수: tiktoken(o200k_base) 사용, 인코딩을 불러올 수 없으면 rate limiter와 같은 추정치(estimate_tokens)
+"""
+import argparse
+import json
+import os
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+from langgraph_system.prompts import GenerationPrompts
+from langgraph_system.ratelimit import estimate_tokens
+from langgraph_system.utils import qa_prompt_json
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (단계 이름, answers 키, system 프롬프트, user 프롬프트 템플릿)
+STEPS = [
+    ("diagnosis", "step_1", GenerationPrompts.DIAGNOSIS_SYSTEM, GenerationPrompts.DIAGNOSIS_USER),
+    ("naming", "step_2", GenerationPrompts.NAMING_SYSTEM, GenerationPrompts.NAMING_USER),
+    ("concept", "step_3", GenerationPrompts.CONCEPT_SYSTEM, GenerationPrompts.CONCEPT_USER),
+    ("story", "step_4", GenerationPrompts.STORY_SYSTEM, GenerationPrompts.STORY_USER),
+    ("logo", "step_5", GenerationPrompts.LOGO_SYSTEM, GenerationPrompts.LOGO_USER)
+]
+
+
+def token_counter() -> Callable[[str], int]:
+    """tiktoken 카운터 (오프라인 등으로 인코딩 로드 실패 시 estimate_tokens)"""
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding("o200k_base")
+        return lambda text: len(encoding.encode(text))
+    except Exception:
+        return estimate_tokens
+
+
+def render_prompt(system: str, template: str, qa_json: str) -> str:
+    """Q&A 외 컨텍스트 자리는 비워서 렌더링 (단계 간 비교용, 두 직렬화에 동일 적용)"""
+    fields = defaultdict(str, qa_data_json=qa_json)
+    return system + "\n" + template.format_map(fields)
+
+
+def step_report(qa: Any, system: str, template: str, count: Callable[[str], int]) -> Dict[str, Any]:
+    raw_json = json.dumps(qa, ensure_ascii=False, indent=2)
+    compact_json = qa_prompt_json(qa)
+    raw_qa, compact_qa = count(raw_json), count(compact_json)
+    raw_prompt = count(render_prompt(system, template, raw_json))
+    compact_prompt = count(render_prompt(system, template, compact_json))
+    return {
+        "qa_tokens": {"raw": raw_qa, "compact": compact_qa},
+        "prompt_tokens": {"raw": raw_prompt, "compact": compact_prompt},
+        "saved_tokens": raw_prompt - compact_prompt,
+        "saved_pct": round((raw_prompt - compact_prompt) / raw_prompt * 100, 1) if raw_prompt else 0.0
+    }
+
+
+def build_report(answer_files: List[str]) -> Dict[str, Any]:
+    count = token_counter()
+    report = {"counter": "tiktoken" if count is not estimate_tokens else "estimate", "files": {}}
+    for path in answer_files:
+        with open(path, "r", encoding="utf-8") as f:
+            answers = json.load(f)
+        report["files"][os.path.basename(path)] = {
+            name: step_report(answers[key], system, template, count)
+            for name, key, system, template in STEPS if key in answers
+        }
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"토큰 카운터: {report['counter']}")
+    for file_name, steps in report["files"].items():
+        print(f"\n[{file_name}]")
+        print(f"{'step':<10} {'qa raw':>8} {'qa cmp':>8} {'prompt raw':>11} {'prompt cmp':>11} {'saved':>8}")
+        for name, row in steps.items():
+            print(
+                f"{name:<10} {row['qa_tokens']['raw']:>8} {row['qa_tokens']['compact']:>8} "
+                f"{row['prompt_tokens']['raw']:>11} {row['prompt_tokens']['compact']:>11} {row['saved_pct']:>7}%"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Q&A 프롬프트 토큰 리포트")
+    parser.add_argument(
+        "--answers", nargs="+",
+        default=[os.path.join(ROOT_DIR, "answers.json"), os.path.join(ROOT_DIR, "answers_v2.json")]
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    report = build_report(args.answers)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
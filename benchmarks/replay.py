@@ -0,0 +1,282 @@
+"""
+녹화 트래픽 재생 (api/services/capture.py 가 기록한 JSONL)
+녹화 당시의 요청 간격을 그대로(또는 --speed 배속으로) 재현하여 경로별 지연을 녹화 값과 비교
+
+실행 예:
+    # 1) 서비스 대상: Provider 응답도 녹화본으로 재생하려면 서버를 replay 모드로 실행
+    PROVIDER_MODE=replay REPLAY_CAPTURE=Test/captures uvicorn api.main:app --port 8000
+    python -m benchmarks.replay --capture Test/captures --target http://127.0.0.1:8000 --speed 2
+
+    # 2) 서버 없이 workflow_app 직접 실행 (PROVIDER_MODE=replay 자동 적용, 네트워크 미사용)
+    python -m benchmarks.replay --capture Test/captures --direct --speed 0
+
+결과: benchmarks/results/replay_<시각>.json (--output으로 변경)
+
+여정(journey) 단위 재생:
+    Step 2-5 요청은 output_id(또는 context.interview.output_id)로 세션의 이전 단계 결과를 참조하므로,
+    녹화 당시 output_id를 그대로 보내면 대상 서버에 세션이 없어 404.
+    녹화 레코드의 output_id(Step 1 응답에서 추출)와 재생한 Step 1 응답의 output_id를 대응시켜
+    같은 여정의 Step 2-5 본문을 치환하고, 같은 여정의 요청은 녹화 순서대로 하나씩 실행.
+    - output_id 없이 녹화된 캡처(이전 버전) / --limit으로 Step 1이 잘린 여정은 치환되지 않아
+      세션 참조(후보 id만 보내는 요청)가 404로 집계됨 - 전체 context를 보낸 요청은 그대로 재생 가능
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.journey import RESULTS_DIR, git_commit, summarize
+
+# 응답 본문(JSON / SSE start 이벤트)의 output_id - api/services/capture.py OUTPUT_ID_PATTERN과 동일
+OUTPUT_ID_PATTERN = re.compile(rb'"output_id":\s*"([^"]+)"')
+
+
+def load_records(path: str) -> List[Dict[str, Any]]:
+    from langgraph_system.recording import load_capture
+
+    return [record for record in load_capture(path) if record.get("method") == "POST" and record.get("body")]
+
+
+def journey_id(record: Dict[str, Any]) -> Optional[str]:
+    """녹화 당시 여정의 output_id (Step 2-5: 요청 본문, Step 1: 녹화된 응답의 output_id)"""
+    body = record["body"]
+    interview = (body.get("context") or {}).get("interview") if isinstance(body.get("context"), dict) else None
+    output_id = body.get("output_id") or (interview.get("output_id") if isinstance(interview, dict) else None)
+    return output_id or record.get("output_id")
+
+
+def remap_body(body: Dict[str, Any], output_ids: Dict[str, str]) -> Dict[str, Any]:
+    """녹화된 output_id를 재생 중 발급된 output_id로 치환 (대응이 없으면 원본 그대로)"""
+    if not output_ids:
+        return body
+    body = copy.deepcopy(body)
+    if body.get("output_id") in output_ids:
+        body["output_id"] = output_ids[body["output_id"]]
+    context = body.get("context")
+    interview = context.get("interview") if isinstance(context, dict) else None
+    if isinstance(interview, dict) and interview.get("output_id") in output_ids:
+        interview["output_id"] = output_ids[interview["output_id"]]
+    return body
+
+
+# =================================================================
+# 실행 대상
+# =================================================================
+class HttpTarget:
+    """실행 중인 API 서버로 재전송 (SSE 엔드포인트는 스트림 끝까지 수신 후 error 이벤트 확인)"""
+
+    def __init__(self, base_url: str, timeout: float):
+        import httpx
+
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=timeout)
+
+    async def send(self, record: Dict[str, Any], body: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """Returns: (성공 여부, 응답의 output_id)"""
+        path = record["path"] + (f"?{record['query']}" if record.get("query") else "")
+        response = await self._client.post(path, json=body)
+        ok = response.status_code == 200 and b"event: error" not in response.content
+        match = OUTPUT_ID_PATTERN.search(response.content) if ok else None
+        return ok, match.group(1).decode("utf-8") if match else None
+
+    async def close(self):
+        await self._client.aclose()
+
+
+class DirectTarget:
+    """API 서버 없이 라우터와 같은 방식으로 상태를 만들어 workflow_app 직접 실행"""
+
+    def __init__(self):
+        from api.routers import brand
+        from api.schemas.request import (
+            DiagnosisRequest, NamingRequest, ConceptRequest, StoryRequest, LogoRequest
+        )
+        from langgraph_system.providers import provider_registry
+
+        # 서버 lifespan과 동일하게 클라이언트를 미리 생성 (첫 요청 지연이 측정에 섞이지 않도록)
+        provider_registry.startup()
+        self._providers = provider_registry
+        self._brand = brand
+        # 응답 생성까지 실행해야 세션이 저장되어 다음 단계 요청이 후보 id로 참조 가능
+        self._routes = {
+            "/brands/interview": (DiagnosisRequest, brand.build_diagnosis_state, brand.build_diagnosis_response),
+            "/brands/naming": (NamingRequest, brand.build_naming_state, brand.build_naming_response),
+            "/brands/concept": (ConceptRequest, brand.build_concept_state, brand.build_concept_response),
+            "/brands/story": (StoryRequest, brand.build_story_state, brand.build_story_response),
+            "/brands/logo": (LogoRequest, brand.build_logo_state, brand.build_logo_response)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return self._providers.stats().get("replay", {})
+
+    async def send(self, record: Dict[str, Any], body: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        route = self._routes.get(record["path"].removesuffix("/stream"))
+        if route is None:
+            return False, None
+        request_model, build_state, build_response = route
+        state = await build_state(request_model.model_validate(body))
+        result_state = await self._brand.invoke_workflow(state)
+        if result_state.get("error_occurred"):
+            return False, None
+        await build_response(result_state)
+        return True, result_state.get("output_id")
+
+    async def close(self):
+        await self._providers.shutdown()
+
+
+# =================================================================
+# 재생
+# =================================================================
+async def replay(records: List[Dict[str, Any]], target, speed: float, concurrency: int) -> Dict[str, Any]:
+    """
+    녹화 시각 기준으로 요청 재생 (speed=0이면 간격 없이 concurrency 개씩 연속 실행)
+    같은 여정의 요청은 앞 요청이 끝난 뒤 output_id를 치환하여 실행
+
+    Returns:
+        경로별 재생 지연 / 녹화 지연 통계
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    recorded: Dict[str, List[float]] = {}
+    first_ts = records[0]["ts"] if records else 0
+
+    # 녹화 output_id → 재생 output_id, 같은 여정의 직전 요청 (index)
+    output_ids: Dict[str, str] = {}
+    finished = [asyncio.Event() for _ in records]
+    previous: List[Optional[int]] = []
+    last_index: Dict[str, int] = {}
+    for index, record in enumerate(records):
+        journey = journey_id(record)
+        previous.append(last_index.get(journey) if journey else None)
+        if journey:
+            last_index[journey] = index
+
+    async def run_one(index: int, record: Dict[str, Any], start: float):
+        path = record["path"]
+        try:
+            if speed > 0:
+                await asyncio.sleep(max(0.0, start + (record["ts"] - first_ts) / speed - time.perf_counter()))
+            if previous[index] is not None:
+                await finished[previous[index]].wait()
+            async with semaphore:
+                begin = time.perf_counter()
+                try:
+                    ok, output_id = await target.send(record, remap_body(record["body"], output_ids))
+                except Exception as e:
+                    print(f"[Replay] ⚠️ {path} 실패: {e}")
+                    ok, output_id = False, None
+                elapsed_ms = (time.perf_counter() - begin) * 1000
+            if ok and output_id and record.get("output_id"):
+                output_ids[record["output_id"]] = output_id
+        finally:
+            finished[index].set()
+
+        if ok:
+            samples.setdefault(path, []).append(elapsed_ms)
+        else:
+            errors[path] = errors.get(path, 0) + 1
+        if record.get("status") == 200 and record.get("duration_ms") is not None:
+            recorded.setdefault(path, []).append(record["duration_ms"])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(index, record, start) for index, record in enumerate(records)))
+    duration = time.perf_counter() - start
+
+    paths = sorted(set(samples) | set(errors))
+    return {
+        "requests": len(records),
+        "duration_s": round(duration, 3),
+        "requests_per_s": round(len(records) / duration, 3) if duration else None,
+        "paths": {
+            path: {
+                "replay": summarize(samples.get(path, []), errors.get(path, 0)),
+                "recorded": summarize(recorded.get(path, []), 0)
+            }
+            for path in paths
+        }
+    }
+
+
+def print_result(result: Dict[str, Any]):
+    print(f"\n[Replay] {result['requests']} requests in {result['duration_s']}s ({result['requests_per_s']} req/s)")
+    print(f"  {'path':<26}{'count':>7}{'errors':>8}{'p50':>10}{'p95':>10}{'rec p50':>10}{'rec p95':>10}")
+    for path, stats in result["paths"].items():
+        replayed, recorded = stats["replay"], stats["recorded"]
+        print(f"  {path:<26}{replayed['count']:>7}{replayed['errors']:>8}{replayed['p50_ms'] or '-':>10}"
+              f"{replayed['p95_ms'] or '-':>10}{recorded['p50_ms'] or '-':>10}{recorded['p95_ms'] or '-':>10}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Replay captured /brands/* traffic")
+    parser.add_argument("--capture", default="Test/captures", help="캡처 JSONL 파일 또는 디렉토리")
+    parser.add_argument("--target", default="http://127.0.0.1:8000", help="대상 API 주소")
+    parser.add_argument("--direct", action="store_true", help="서버 없이 workflow_app 직접 실행 (replay 모드)")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (1: 녹화 속도, 0: 간격 없이)")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 실행 요청 수 상한")
+    parser.add_argument("--limit", type=int, default=0, help="앞에서부터 N건만 재생")
+    parser.add_argument("--latency-scale", type=float, default=None,
+                        help="--direct 시 녹화된 Provider 소요 시간 재현 비율 (REPLAY_LATENCY_SCALE)")
+    parser.add_argument("--timeout", type=float, default=600, help="요청 제한 시간 (초)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    return parser.parse_args(argv)
+
+
+async def run(args) -> Optional[Dict[str, Any]]:
+    records = load_records(args.capture)
+    if args.limit:
+        records = records[:args.limit]
+    if not records:
+        print(f"[Replay] ❌ 재생할 요청이 없습니다: {args.capture}")
+        return None
+
+    target = DirectTarget() if args.direct else HttpTarget(args.target, args.timeout)
+    try:
+        result = await replay(records, target, args.speed, args.concurrency)
+        if args.direct:
+            # 녹화 응답 매칭 현황 (exact: 동일 프롬프트, step: 같은 단계 대체, miss: 녹화 없음)
+            result["provider_replay"] = target.stats()
+        return result
+    finally:
+        await target.close()
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.direct:
+        # langgraph_system / api 모듈 import 전에 설정해야 적용됨
+        os.environ["PROVIDER_MODE"] = "replay"
+        os.environ["REPLAY_CAPTURE"] = args.capture
+        os.environ.setdefault("OUTPUTS_DIR", tempfile.mkdtemp(prefix="replay_outputs_"))
+        if args.latency_scale is not None:
+            os.environ["REPLAY_LATENCY_SCALE"] = str(args.latency_scale)
+
+    result = asyncio.run(run(args))
+    if result is None:
+        return 1
+    print_result(result)
+
+    result["meta"] = {
+        "benchmark": "replay",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": git_commit(),
+        "capture": args.capture,
+        "target": "direct" if args.direct else args.target,
+        "speed": args.speed
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"replay_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n[Replay] 결과 저장: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+요청 검증 마이크로벤치마크
+Step 5(로고) 요청 본문 1건의 파싱 + 검증 시간을 이전 방식과 현재 방식으로 비교
+
+- 이전: json.loads + Dict[str, Any] context + v1 root_validator(pre=True) (context 전체 재구성, JSON 문자열 값 json.loads)
+- 현재: orjson 본문 파싱 (api/services/fastjson.py) + v2 model_validator + 타입이 있는 context 모델 + context_dict()
+
+payload: answers.json step_5 + 진단 / 네이밍 / 컨셉 / 스토리 context (후보 목록 전체)
+- object_context: context 값이 JSON 객체 (FE)
+- string_context: 진단 / 컨셉 context가 JSON 문자열 (백엔드)
+
+실행 예:
+    python -m benchmarks.request_validation
+    python -m benchmarks.request_validation --number 2000 --candidates 10
+"""
+import argparse
+import json
+import os
+import statistics
+import timeit
+import warnings
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from api.schemas.request import LogoRequest
+from api.services.fastjson import loads, JSON_BACKEND
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# =================================================================
+# 이전 방식 (비교 기준, 변경 전 api/schemas/request.py와 동일한 처리)
+# =================================================================
+def legacy_parse_context_validator(cls, values):
+    if 'user_input' not in values:
+        if 'qa_answers' in values:
+            values['user_input'] = values['qa_answers']
+        else:
+            input_data = {k: v for k, v in values.items() if k not in ('context', 'use_cache', 'output_id')}
+            if input_data:
+                values['user_input'] = input_data
+    if 'context' in values:
+        ctx = values.get('context', {})
+        new_ctx = {}
+        if isinstance(ctx, dict):
+            for k, v in ctx.items():
+                parsed_v = v
+                if isinstance(v, str):
+                    try:
+                        if v.strip().startswith('{') or v.strip().startswith('['):
+                            parsed_v = json.loads(v)
+                    except (json.JSONDecodeError, TypeError):
+                        pass
+                new_ctx[k.lower()] = parsed_v
+            values['context'] = new_ctx
+    return values
+
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from pydantic import root_validator
+
+    class LegacyLogoRequest(BaseModel):
+        user_input: Dict[str, Any] = Field(...)
+        output_id: Optional[str] = Field(None)
+        context: Dict[str, Any] = Field(default_factory=dict)
+        _validator = root_validator(pre=True, allow_reuse=True)(legacy_parse_context_validator)
+
+
+# =================================================================
+# payload
+# =================================================================
+def _text(label: str, repeat: int) -> str:
+    return " ".join(f"{label} 브랜드 설명 문장 {i}번 - 고객 경험과 가치 제안을 담은 상세 근거입니다." for i in range(repeat))
+
+
+def _candidates(fields: Dict[str, int], count: int) -> list:
+    return [
+        {
+            "id": i,
+            **{field: _text(f"{field} {i}", repeat) for field, repeat in fields.items()},
+            "qa_analysis_summary": _text(f"summary {i}", 4),
+            "qa_keywords": [f"키워드{i}-{k}" for k in range(6)]
+        }
+        for i in range(count)
+    ]
+
+
+def build_payload(candidates: int = 3, string_context: bool = False) -> bytes:
+    """
+    실제 Step 5 요청과 비슷한 크기 / 구조의 본문 (FE가 선택한 후보 + 후보 목록 전체)
+    string_context: 백엔드처럼 진단 / 컨셉 context를 JSON 문자열로 전달
+    """
+    with open(os.path.join(ROOT_DIR, "answers.json"), encoding="utf-8") as f:
+        answers = json.load(f)
+    interview = {
+        "output_id": "output_01", "brand_direction": _text("direction", 1), "tone": "따뜻하고 전문적인",
+        "keywords": ["모빌리티", "자율주행", "지속가능성", "경험"], "brand_essence": _text("essence", 2),
+        "perspectives": {name: _text(name, 3) for name in ("business", "user", "market")},
+        "emotional_core": _text("core", 1), "differentiation_point": _text("diff", 2),
+        "target_persona": _text("persona", 2), "diagnosis_summary": _text("summary", 6)
+    }
+    naming = _candidates({"brand_name": 0, "name_rationale": 5}, candidates)
+    concept = _candidates({"concept_statement": 3, "concept_rationale": 5}, candidates)
+    story = _candidates({"brand_story": 12, "story_rationale": 5, "emotional_arc": 2}, candidates)
+    for candidate in naming:
+        candidate["brand_name"] = f"Nova{candidate['id']}"
+    encode = (lambda value: json.dumps(value, ensure_ascii=False)) if string_context else (lambda value: value)
+    body = {
+        "output_id": "output_01",
+        "user_input": answers["step_5"],
+        "context": {
+            "INTERVIEW": encode(interview),
+            "naming": {**naming[0], "candidates": naming},
+            "concept": encode({**concept[1], "candidates": concept}),
+            "story": {**story[2], "candidates": story}
+        }
+    }
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+# =================================================================
+# 측정
+# =================================================================
+def legacy_path(body: bytes):
+    return LegacyLogoRequest.model_validate(json.loads(body)).context
+
+
+def current_path(body: bytes):
+    return LogoRequest.model_validate(loads(body)).context_dict()
+
+
+def measure(func, body: bytes, number: int, repeat: int) -> Dict[str, float]:
+    """1건당 시간 (μs) - repeat회 반복 측정의 중앙값 / 최소값"""
+    runs = [t / number * 1e6 for t in timeit.repeat(lambda: func(body), number=number, repeat=repeat)]
+    return {"median_us": round(statistics.median(runs), 1), "min_us": round(min(runs), 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Step 5 요청 검증 마이크로벤치마크")
+    parser.add_argument("--number", type=int, default=500, help="측정 1회당 반복 수")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--candidates", type=int, default=3, help="단계별 후보 수")
+    args = parser.parse_args()
+
+    report = {"json_backend": JSON_BACKEND, "payloads": {}}
+    for name, string_context in (("object_context", False), ("string_context", True)):
+        body = build_payload(args.candidates, string_context)
+        assert legacy_path(body).keys() == current_path(body).keys()
+        before = measure(legacy_path, body, args.number, args.repeat)
+        after = measure(current_path, body, args.number, args.repeat)
+        report["payloads"][name] = {
+            "payload_bytes": len(body),
+            "parse": {
+                "before": measure(json.loads, body, args.number, args.repeat),
+                "after": measure(loads, body, args.number, args.repeat)
+            },
+            "parse_and_validate": {"before": before, "after": after},
+            "speedup": round(before["median_us"] / after["median_us"], 2)
+        }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+pytest 공용 설정
+api.config Settings 필수 값 (테스트용 더미) - 테스트 모듈이 api.* 를 import 하기 전에 설정
+스크립트로 직접 실행(python test_*.py)할 때는 .env 또는 환경 변수의 값 사용
+"""
+import os
+
+for _key in ["OPENAI_API_KEY", "GEMINI_API_KEY", "CLOUDINARY_CLOUD_NAME", "CLOUDINARY_API_KEY", "CLOUDINARY_API_SECRET"]:
+    os.environ.setdefault(_key, "test")
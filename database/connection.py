@@ -7,6 +7,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from dotenv import load_dotenv
 from database.models import Base
+from langgraph_system.log import get_logger
+
+logger = get_logger("db")
 
 # 환경 변수 로드
 load_dotenv()
@@ -51,7 +54,7 @@ class DatabaseConnection:
     def create_tables(self):
         """테이블 생성 (개발용, 실제로는 백엔드가 담당)"""
         Base.metadata.create_all(bind=self.engine)
-        print("[DB] 테이블 생성 완료")
+        logger.info("[DB] 테이블 생성 완료")
     
     def get_session(self) -> Session:
         """DB 세션 반환"""
@@ -61,7 +64,7 @@ class DatabaseConnection:
         """연결 종료"""
         if self.engine:
             self.engine.dispose()
-            print("[DB] 연결 종료")
+            logger.info("[DB] 연결 종료")
 
 
 
@@ -72,12 +75,12 @@ DB_ENABLED = os.getenv("ENABLE_DB", "false").lower() == "true"
 try:
     if DB_ENABLED:
         db_connection = DatabaseConnection()
-        print("[DB] 연결 초기화 완료")
+        logger.info("[DB] 연결 초기화 완료")
     else:
-        print("[DB] DB 미사용 모드 (ENABLE_DB=false)")
+        logger.info("[DB] DB 미사용 모드 (ENABLE_DB=false)")
 except Exception as e:
-    print(f"[DB] 연결 초기화 실패: {e}")
-    print("[DB] DB 미사용 모드로 전환")
+    logger.warning("[DB] 연결 초기화 실패: %s", e)
+    logger.warning("[DB] DB 미사용 모드로 전환")
     db_connection = None
 
 
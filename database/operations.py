@@ -6,6 +6,9 @@ from sqlalchemy.orm import Session
 from database.models import Brand, BrandConsulting, MarketingConsulting, FinalReport
 from typing import Dict, Any, Optional
 from datetime import datetime
+from langgraph_system.log import get_logger
+
+logger = get_logger("db")
 
 
 def create_brand(session: Session, brand_id: str, user_id: str) -> Brand:
@@ -24,7 +27,7 @@ def create_brand(session: Session, brand_id: str, user_id: str) -> Brand:
     session.add(consulting)
     session.commit()
     
-    print(f"[DB] 브랜드 생성: {brand_id}")
+    logger.info("[DB] 브랜드 생성: %s", brand_id)
     return brand
 
 
@@ -58,7 +61,7 @@ def save_brand_result(
         consulting.updated_at = datetime.now()
         session.commit()
         session.refresh(consulting)
-        print(f"[DB] 결과물 저장: {brand_id} - {step_name}")
+        logger.info("[DB] 결과물 저장: %s - %s", brand_id, step_name)
     else:
         raise ValueError(f"잘못된 단계 이름: {step_name}")
     
@@ -93,7 +96,7 @@ def save_marketing_result(
         marketing.updated_at = datetime.now()
         session.commit()
         session.refresh(marketing)
-        print(f"[DB] 마케팅 결과 저장: {brand_id} - {step_name}")
+        logger.info("[DB] 마케팅 결과 저장: %s - %s", brand_id, step_name)
     else:
         raise ValueError(f"잘못된 단계 이름: {step_name}")
     
@@ -183,7 +186,7 @@ def save_final_report(
     session.commit()
     session.refresh(report)
     
-    print(f"[DB] 최종 리포트 저장: {brand_id}")
+    logger.info("[DB] 최종 리포트 저장: %s", brand_id)
     return report
 
 
@@ -194,4 +197,4 @@ def update_brand_step(session: Session, brand_id: str, current_step: int):
         brand.current_step = current_step
         brand.updated_at = datetime.now()
         session.commit()
-        print(f"[DB] 진행 단계 업데이트: {brand_id} -> Step {current_step}")
+        logger.info("[DB] 진행 단계 업데이트: %s -> Step %s", brand_id, current_step)
@@ -0,0 +1,8 @@
+"""
+가짜 Provider 서버 패키지
+실행: python -m fake_providers --port 8900
+API 서버 연결: PROVIDER_MODE=fake, FAKE_PROVIDER_URL=http://127.0.0.1:8900
+"""
+from fake_providers.server import create_app
+
+__all__ = ["create_app"]
@@ -0,0 +1,24 @@
+"""
+가짜 Provider 서버 실행
+python -m fake_providers [--host 127.0.0.1] [--port 8900] [--seed 42]
+"""
+import argparse
+
+import uvicorn
+
+from fake_providers.server import create_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI / Gemini / Cloudinary server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (지연/에러 재현용)")
+    args = parser.parse_args()
+
+    print(f"[FakeProviders] http://{args.host}:{args.port} (설정: GET/PUT /_fake/config)")
+    uvicorn.run(create_app(seed=args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
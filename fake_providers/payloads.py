@@ -0,0 +1,121 @@
+"""
+가짜 응답 데이터 생성
+langgraph_system/prompts.py의 Output Format과 동일한 스키마로 응답 생성
+"""
+import random
+import struct
+import zlib
+from typing import Any, Dict, Optional
+
+from langgraph_system.prompts import GenerationPrompts
+
+STEP_BY_SYSTEM_PROMPT = {
+    GenerationPrompts.DIAGNOSIS_SYSTEM: "diagnosis",
+    GenerationPrompts.NAMING_SYSTEM: "naming",
+    GenerationPrompts.CONCEPT_SYSTEM: "concept",
+    GenerationPrompts.STORY_SYSTEM: "story",
+    GenerationPrompts.LOGO_SYSTEM: "logo"
+}
+
+LAYOUTS = ["Horizontal", "Integrated", "Stacked"]
+BENCHMARKS = ["Samsung", "Braun", "Sony", "Tesla", "Uber", "FedEx"]
+KEYWORDS = ["신뢰", "혁신", "간결", "따뜻함", "전문성", "균형", "성장", "연결"]
+
+
+def detect_step(system_prompt: Optional[str]) -> str:
+    """시스템 프롬프트로 어느 단계 호출인지 판별 (알 수 없으면 naming)"""
+    return STEP_BY_SYSTEM_PROMPT.get(system_prompt or "", "naming")
+
+
+def _keywords(rng: random.Random):
+    return rng.sample(KEYWORDS, 3)
+
+
+def diagnosis_payload(rng: random.Random) -> Dict[str, Any]:
+    keywords = _keywords(rng)
+    return {
+        "summary": f"[FAKE] {keywords[0]}과 {keywords[1]}을 중심으로 한 브랜드 방향성 진단 결과입니다.",
+        "keywords": keywords,
+        "persona": "[FAKE] 2030 얼리어답터",
+        "perspectives": {
+            "business_perspective": "[FAKE] 구독 기반 수익 모델로 확장 가능성이 높습니다.",
+            "user_perspective": "[FAKE] 시간 절약과 신뢰를 중요하게 생각하는 사용자입니다.",
+            "market_perspective": "[FAKE] 경쟁사 대비 간결한 경험으로 차별화할 수 있습니다."
+        },
+        "brand_essence": f"[FAKE] {keywords[0]}을 전하는 브랜드",
+        "emotional_core": f"[FAKE] {keywords[2]}",
+        "differentiation_point": "[FAKE] 단순하고 빠른 사용자 경험"
+    }
+
+
+def naming_option(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "brand_name": f"Fake{rng.choice(['ly', 'ora', 'wise', 'io', 'nest'])}{i + 1}",
+        "name_rationale": "[FAKE] 짧고 기억하기 쉬운 이름으로 브랜드의 핵심을 전달합니다.",
+        "qa_analysis_summary": "[FAKE] Q&A에서 강조한 간결함과 신뢰를 반영했습니다.",
+        "qa_keywords": _keywords(rng)
+    }
+
+
+def concept_option(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "concept_statement": f"[FAKE] 일상에 {rng.choice(KEYWORDS)}을 더하는 브랜드 ({i + 1})",
+        "concept_rationale": "[FAKE] 타겟 페르소나의 니즈와 차별화 포인트를 연결한 컨셉입니다.",
+        "brand_values": _keywords(rng),
+        "qa_analysis_summary": "[FAKE] Q&A의 컨셉 방향성 답변을 반영했습니다.",
+        "qa_keywords": _keywords(rng)
+    }
+
+
+def story_option(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "brand_story": f"[FAKE] 바쁜 하루 속에서 {rng.choice(KEYWORDS)}을 찾는 이야기 ({i + 1})",
+        "story_rationale": "[FAKE] 공감에서 시작해 변화로 이어지는 구조가 타겟에게 효과적입니다.",
+        "emotional_arc": "고민 → 발견 → 변화",
+        "qa_analysis_summary": "[FAKE] Q&A의 스토리텔링 선호를 반영했습니다.",
+        "qa_keywords": _keywords(rng)
+    }
+
+
+def logo_option(rng: random.Random, i: int) -> Dict[str, Any]:
+    layout = LAYOUTS[i % len(LAYOUTS)]
+    return {
+        "layout_type": layout,
+        "style_keywords": ["Minimalist", "Clean"],
+        "color_palette": [f"#{rng.randrange(0x1000000):06X}"],
+        "benchmark_brand": rng.choice(BENCHMARKS),
+        "logo_concept": f"[FAKE] {layout} 레이아웃 로고 컨셉",
+        "logo_rationale": "[FAKE] 심볼과 텍스트의 균형으로 신뢰감을 전달합니다.",
+        "qa_analysis_summary": "[FAKE] Q&A의 시각적 선호를 반영했습니다.",
+        "qa_keywords": _keywords(rng),
+        "visual_instruction": f"A {layout.lower()} logo layout with the brand name in bold sans-serif font. White background."
+    }
+
+
+OPTION_BUILDERS = {
+    "naming": naming_option,
+    "concept": concept_option,
+    "story": story_option,
+    "logo": logo_option
+}
+
+
+def chat_payload(step: str, rng: random.Random, option_count: int = 3) -> Dict[str, Any]:
+    """단계별 GPT JSON 응답 본문"""
+    if step == "diagnosis":
+        return diagnosis_payload(rng)
+    builder = OPTION_BUILDERS.get(step, naming_option)
+    return {"options": [builder(rng, i) for i in range(option_count)]}
+
+
+def png_bytes(rng: random.Random, size: int = 64) -> bytes:
+    """단색 PNG 이미지 (Pillow 없이 생성)"""
+    color = bytes(rng.randrange(256) for _ in range(3))
+    row = b"\x00" + color * size  # 필터 타입 0 + RGB 픽셀
+    raw = row * size
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
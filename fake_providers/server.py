@@ -0,0 +1,350 @@
+"""
+가짜 Provider 서버 (OpenAI / Gemini / Cloudinary)
+실제 API 호출 없이 부하 테스트를 하기 위한 로컬 대체 서버
+
+- OpenAI: POST /v1/chat/completions (JSON 모드, stream 지원)
+- Gemini: POST /v1beta/models/{model}:generateContent (PNG inline_data)
+- Cloudinary: POST /v1_1/{cloud_name}/image/upload (가짜 secure_url)
+- 관리: GET/PUT /_fake/config, GET /_fake/stats, POST /_fake/reset
+
+Provider별 동작 설정 (환경 변수 또는 PUT /_fake/config):
+- FAKE_{OPENAI|GEMINI|CLOUDINARY}_LATENCY: 지연 분포 (ms)
+    fixed:800 / uniform:500,1500 / normal:1000,200 / lognormal:1000,0.4 (중앙값, sigma)
+- FAKE_{...}_ERROR_RATE: 5xx 에러 비율 (0~1)
+- FAKE_{...}_RATE_LIMIT_RATE: 429 응답 비율 (0~1)
+- FAKE_{...}_MAX_CONCURRENCY: 동시 처리 한도, 초과 시 429 (0이면 무제한)
+- FAKE_{...}_RETRY_AFTER: 429 응답의 Retry-After (초)
+- FAKE_SEED: 난수 시드 (재현 가능한 부하 테스트용)
+"""
+import asyncio
+import base64
+import json
+import os
+import random
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from fake_providers.payloads import chat_payload, detect_step, png_bytes
+
+PROVIDERS = ("openai", "gemini", "cloudinary")
+
+DEFAULT_LATENCY = {
+    "openai": "lognormal:1500,0.3",
+    "gemini": "lognormal:3000,0.3",
+    "cloudinary": "lognormal:300,0.3"
+}
+
+# 스트리밍 응답 청크 크기 (문자 수)
+STREAM_CHUNK_CHARS = int(os.getenv("FAKE_OPENAI_CHUNK_CHARS", "16"))
+
+
+def parse_latency(spec: str):
+    """지연 분포 문자열 파싱 → (분포명, 파라미터 리스트)"""
+    kind, _, params = spec.partition(":")
+    kind = kind.strip().lower()
+    values = [float(v) for v in params.split(",") if v.strip()]
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+    if kind not in expected or len(values) != expected[kind]:
+        raise ValueError(f"잘못된 지연 분포 설정: {spec!r} (예: fixed:800, uniform:500,1500, lognormal:1000,0.4)")
+    return kind, values
+
+
+class ProviderBehavior:
+    """Provider 1개의 지연/에러/Rate Limit 설정"""
+
+    FIELDS = ("latency", "error_rate", "rate_limit_rate", "max_concurrency", "retry_after")
+
+    def __init__(self, latency: str = "fixed:0", error_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 max_concurrency: int = 0, retry_after: float = 1.0):
+        self.update({
+            "latency": latency,
+            "error_rate": error_rate,
+            "rate_limit_rate": rate_limit_rate,
+            "max_concurrency": max_concurrency,
+            "retry_after": retry_after
+        })
+
+    @classmethod
+    def from_env(cls, name: str) -> "ProviderBehavior":
+        prefix = f"FAKE_{name.upper()}_"
+        return cls(
+            latency=os.getenv(prefix + "LATENCY", DEFAULT_LATENCY[name]),
+            error_rate=float(os.getenv(prefix + "ERROR_RATE", "0")),
+            rate_limit_rate=float(os.getenv(prefix + "RATE_LIMIT_RATE", "0")),
+            max_concurrency=int(os.getenv(prefix + "MAX_CONCURRENCY", "0")),
+            retry_after=float(os.getenv(prefix + "RETRY_AFTER", "1"))
+        )
+
+    def update(self, values: Dict[str, Any]):
+        unknown = set(values) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"알 수 없는 설정 항목: {sorted(unknown)}")
+        if "latency" in values:
+            self._latency = parse_latency(values["latency"])
+            self.latency = values["latency"]
+        for field in ("error_rate", "rate_limit_rate", "retry_after"):
+            if field in values:
+                setattr(self, field, float(values[field]))
+        if "max_concurrency" in values:
+            self.max_concurrency = int(values["max_concurrency"])
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """지연 시간 샘플 (초)"""
+        kind, params = self._latency
+        if kind == "fixed":
+            ms = params[0]
+        elif kind == "uniform":
+            ms = rng.uniform(params[0], params[1])
+        elif kind == "normal":
+            ms = rng.gauss(params[0], params[1])
+        else:  # lognormal: 중앙값 * e^(N(0, sigma))
+            ms = params[0] * rng.lognormvariate(0, params[1])
+        return max(0.0, ms) / 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+class FakeProviderState:
+    """서버 전역 상태 (설정 + 통계)"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+        self.behaviors = {name: ProviderBehavior.from_env(name) for name in PROVIDERS}
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {
+            name: {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0, "inflight": 0, "max_inflight": 0}
+            for name in PROVIDERS
+        }
+
+    def admit(self, name: str) -> Optional[Response]:
+        """요청 수락 여부 결정. 거절 시 429 응답 반환"""
+        behavior, stats = self.behaviors[name], self.stats[name]
+        stats["requests"] += 1
+
+        over_limit = behavior.max_concurrency and stats["inflight"] >= behavior.max_concurrency
+        if over_limit or self.rng.random() < behavior.rate_limit_rate:
+            stats["rate_limited"] += 1
+            return _error_response(name, 429, "Rate limit exceeded (fake)", behavior.retry_after)
+
+        stats["inflight"] += 1
+        stats["max_inflight"] = max(stats["max_inflight"], stats["inflight"])
+        return None
+
+    def release(self, name: str, ok: bool):
+        stats = self.stats[name]
+        stats["inflight"] -= 1
+        stats["ok" if ok else "errors"] += 1
+
+    def should_fail(self, name: str) -> bool:
+        return self.rng.random() < self.behaviors[name].error_rate
+
+
+def _error_response(provider: str, status: int, message: str, retry_after: Optional[float] = None) -> JSONResponse:
+    """Provider별 에러 응답 형식"""
+    headers = {"retry-after": f"{retry_after:g}"} if retry_after is not None else None
+    if provider == "openai":
+        error_type = "rate_limit_exceeded" if status == 429 else "server_error"
+        body = {"error": {"message": message, "type": error_type, "param": None, "code": error_type}}
+    elif provider == "gemini":
+        error_status = "RESOURCE_EXHAUSTED" if status == 429 else "INTERNAL"
+        body = {"error": {"code": status, "message": message, "status": error_status}}
+    else:
+        # Cloudinary는 Rate Limit에 420 사용
+        status = 420 if status == 429 else status
+        body = {"error": {"message": message}}
+    return JSONResponse(body, status_code=status, headers=headers)
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def create_app(seed: Optional[int] = None) -> FastAPI:
+    """가짜 Provider 서버 앱 생성"""
+    if seed is None and os.getenv("FAKE_SEED"):
+        seed = int(os.getenv("FAKE_SEED"))
+    state = FakeProviderState(seed)
+    app = FastAPI(title="Fake Providers (OpenAI / Gemini / Cloudinary)")
+    app.state.fake = state
+
+    # ---------- OpenAI ----------
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        rejected = state.admit("openai")
+        if rejected is not None:
+            return rejected
+
+        body = await request.json()
+        messages = body.get("messages", [])
+        system_prompt = next((m.get("content") for m in messages if m.get("role") == "system"), None)
+        prompt_text = "".join(str(m.get("content", "")) for m in messages)
+        model = body.get("model", "gpt-5.1")
+        content = json.dumps(chat_payload(detect_step(system_prompt), state.rng), ensure_ascii=False)
+        usage = {
+            "prompt_tokens": _estimate_tokens(prompt_text),
+            "completion_tokens": _estimate_tokens(content),
+            "total_tokens": _estimate_tokens(prompt_text) + _estimate_tokens(content)
+        }
+        latency = state.behaviors["openai"].sample_latency(state.rng)
+        fail = state.should_fail("openai")
+        completion_id = f"chatcmpl-fake-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        if not body.get("stream"):
+            await asyncio.sleep(latency)
+            state.release("openai", ok=not fail)
+            if fail:
+                return _error_response("openai", 500, "Internal server error (fake)")
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop"
+                }],
+                "usage": usage
+            }
+
+        if fail:
+            await asyncio.sleep(latency)
+            state.release("openai", ok=False)
+            return _error_response("openai", 500, "Internal server error (fake)")
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+        pieces = [content[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(content), STREAM_CHUNK_CHARS)]
+
+        def chunk(delta: Dict[str, Any], finish_reason=None, **extra) -> str:
+            data = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                **extra
+            }
+            return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+        async def events():
+            ok = False
+            try:
+                # 지연 시간의 30%는 첫 토큰까지, 나머지는 토큰 사이에 분배
+                await asyncio.sleep(latency * 0.3)
+                yield chunk({"role": "assistant", "content": ""})
+                interval = latency * 0.7 / max(1, len(pieces))
+                for piece in pieces:
+                    await asyncio.sleep(interval)
+                    yield chunk({"content": piece})
+                yield chunk({}, finish_reason="stop")
+                if include_usage:
+                    data = {"id": completion_id, "object": "chat.completion.chunk", "created": created,
+                            "model": model, "choices": [], "usage": usage}
+                    yield f"data: {json.dumps(data)}\n\n"
+                yield "data: [DONE]\n\n"
+                ok = True
+            finally:
+                state.release("openai", ok=ok)
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    # ---------- Gemini ----------
+    @app.post("/{api_version}/models/{model_action}")
+    async def generate_content(api_version: str, model_action: str, request: Request):
+        model, _, action = model_action.partition(":")
+        if action != "generateContent":
+            return _error_response("gemini", 404, f"지원하지 않는 Gemini API: {model_action}")
+
+        rejected = state.admit("gemini")
+        if rejected is not None:
+            return rejected
+
+        await request.body()
+        await asyncio.sleep(state.behaviors["gemini"].sample_latency(state.rng))
+        if state.should_fail("gemini"):
+            state.release("gemini", ok=False)
+            return _error_response("gemini", 500, "Internal error (fake)")
+
+        state.release("gemini", ok=True)
+        return {
+            "candidates": [{
+                "content": {
+                    "role": "model",
+                    "parts": [{"inlineData": {"mimeType": "image/png", "data": base64.b64encode(png_bytes(state.rng)).decode()}}]
+                },
+                "finishReason": "STOP",
+                "index": 0
+            }],
+            "usageMetadata": {"promptTokenCount": 300, "candidatesTokenCount": 1290, "totalTokenCount": 1590},
+            "modelVersion": model
+        }
+
+    # ---------- Cloudinary ----------
+    @app.post("/v1_1/{cloud_name}/{resource_type}/upload")
+    async def upload(cloud_name: str, resource_type: str, request: Request):
+        rejected = state.admit("cloudinary")
+        if rejected is not None:
+            return rejected
+
+        form = await request.form()
+        upload_file = form.get("file")
+        size = len(await upload_file.read()) if hasattr(upload_file, "read") else len(str(upload_file or ""))
+        await asyncio.sleep(state.behaviors["cloudinary"].sample_latency(state.rng))
+        if state.should_fail("cloudinary"):
+            state.release("cloudinary", ok=False)
+            return _error_response("cloudinary", 500, "Upload failed (fake)")
+
+        state.release("cloudinary", ok=True)
+        public_id = "/".join(p for p in (form.get("folder"), form.get("public_id") or uuid.uuid4().hex[:20]) if p)
+        base_url = str(request.base_url).rstrip("/")
+        return {
+            "public_id": public_id,
+            "version": int(time.time()),
+            "resource_type": resource_type,
+            "format": "png",
+            "bytes": size,
+            "url": f"{base_url}/fake-cdn/{cloud_name}/{resource_type}/upload/{public_id}.png",
+            "secure_url": f"{base_url}/fake-cdn/{cloud_name}/{resource_type}/upload/{public_id}.png",
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        }
+
+    @app.get("/fake-cdn/{path:path}")
+    async def cdn(path: str):
+        return Response(png_bytes(random.Random(path)), media_type="image/png")
+
+    # ---------- 관리 ----------
+    @app.get("/_fake/config")
+    async def get_config():
+        return {name: behavior.to_dict() for name, behavior in state.behaviors.items()}
+
+    @app.put("/_fake/config")
+    async def put_config(request: Request):
+        """부분 업데이트: {"openai": {"latency": "fixed:100", "error_rate": 0.1}}"""
+        body = await request.json()
+        try:
+            for name, values in body.items():
+                if name not in state.behaviors:
+                    raise ValueError(f"알 수 없는 Provider: {name}")
+                state.behaviors[name].update(values)
+        except ValueError as e:
+            return JSONResponse({"detail": str(e)}, status_code=400)
+        return {name: behavior.to_dict() for name, behavior in state.behaviors.items()}
+
+    @app.get("/_fake/stats")
+    async def get_stats():
+        return state.stats
+
+    @app.post("/_fake/reset")
+    async def reset_stats():
+        state.reset_stats()
+        return state.stats
+
+    return app
@@ -1,4 +1,10 @@
 """
 LangGraph 시스템
 State 정의, 노드 구현, 그래프 구성
+
+실행 설정(LOG_LEVEL, CHECKPOINTER, METRICS_ENABLED, RATE_LIMIT_*, PROVIDER_* 등)은 각 모듈이 환경 변수로 읽음
+.env는 패키지 import 시 여기서 1번 로드 (이미 설정된 환경 변수가 우선) → 어떤 모듈을 먼저 import해도 같은 값
 """
+from dotenv import load_dotenv
+
+load_dotenv()
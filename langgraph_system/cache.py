@@ -0,0 +1,169 @@
+"""
+LLM 응답 캐시
+동일한 Q&A 입력에 대해 GPT-5.1 호출을 반복하지 않도록 결과를 재사용
+
+- 1차: 프로세스 메모리 LRU (TTL)
+- 2차: 디스크 (선택, 워커 간 공유) - 디렉토리 지정 시 활성화
+- 키: 정규화된 Q&A JSON + 프롬프트 버전 + 모델명의 SHA-256
+"""
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from langgraph_system.prompts import GenerationPrompts
+from langgraph_system.llm import TEXT_MODEL
+from langgraph_system.utils import QA_FORMAT_VERSION
+from langgraph_system.metrics import record_cache
+from langgraph_system.log import get_logger
+
+logger = get_logger("cache")
+
+DIAGNOSIS_CACHE_ENABLED = os.getenv("DIAGNOSIS_CACHE_ENABLED", "true").lower() == "true"
+DIAGNOSIS_CACHE_SIZE = int(os.getenv("DIAGNOSIS_CACHE_SIZE", "256"))
+DIAGNOSIS_CACHE_TTL = float(os.getenv("DIAGNOSIS_CACHE_TTL", "3600"))
+DIAGNOSIS_CACHE_DIR = os.getenv("DIAGNOSIS_CACHE_DIR", "")  # 빈 값이면 디스크 캐시 미사용
+
+
+def canonical_json(data: Any) -> str:
+    """키 정렬 + 공백 제거로 입력 순서/포맷에 무관한 JSON 문자열 생성"""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def prompt_version(*templates: str) -> str:
+    """프롬프트 템플릿 해시 (프롬프트 수정 시 캐시 자동 무효화)"""
+    return hashlib.sha256("\x00".join(templates).encode("utf-8")).hexdigest()[:12]
+
+
+class ResponseCache:
+    """메모리 LRU(TTL) + 선택적 디스크 캐시"""
+
+    def __init__(self, name: str, max_size: int = 256, ttl: float = 3600,
+                 disk_dir: str = "", enabled: bool = True):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (메모리 → 디스크 순서). 없거나 만료 시 None"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    record_cache(self.name, "hit")
+                    return copy.deepcopy(value)  # 호출부 수정이 캐시에 반영되지 않도록 복사
+                del self._entries[key]
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                record_cache(self.name, "miss")
+                return None
+            self.disk_hits += 1
+            record_cache(self.name, "disk_hit")
+            self._store(key, value, now)
+        return copy.deepcopy(value)  # 메모리에 저장한 객체와 분리
+
+    def set(self, key: str, value: Any):
+        """캐시 저장 (메모리 + 디스크)"""
+        if not self.enabled:
+            return
+
+        value = copy.deepcopy(value)  # 호출부가 이후 값을 수정해도 캐시에 반영되지 않도록 복사
+        with self._lock:
+            self._store(key, value, time.time())
+        self._disk_set(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "disk": bool(self.disk_dir),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses
+            }
+
+    # ---------- 내부 ----------
+    def _store(self, key: str, value: Any, now: float):
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _disk_get(self, key: str, now: float) -> Optional[Any]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            if os.path.getmtime(path) + self.ttl <= now:
+                os.remove(path)
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _disk_set(self, key: str, value: Any):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)  # 다른 워커가 읽는 중에도 원자적으로 교체
+        except OSError as e:
+            logger.warning("[Cache:%s] 디스크 저장 실패: %s", self.name, e)
+
+
+# ========== Step 1 진단 캐시 ==========
+DIAGNOSIS_PROMPT_VERSION = prompt_version(
+    GenerationPrompts.DIAGNOSIS_SYSTEM, GenerationPrompts.DIAGNOSIS_USER
+)
+
+diagnosis_cache = ResponseCache(
+    "diagnosis",
+    max_size=DIAGNOSIS_CACHE_SIZE,
+    ttl=DIAGNOSIS_CACHE_TTL,
+    disk_dir=DIAGNOSIS_CACHE_DIR,
+    enabled=DIAGNOSIS_CACHE_ENABLED
+)
+
+
+def diagnosis_cache_key(step_1_qa: Dict[str, Any], model: str = TEXT_MODEL) -> str:
+    """Step 1 캐시 키: 정규화된 Q&A + 프롬프트 / Q&A 직렬화 버전 + 모델명"""
+    raw = "|".join([canonical_json(step_1_qa), DIAGNOSIS_PROMPT_VERSION, QA_FORMAT_VERSION, model])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
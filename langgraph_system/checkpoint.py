@@ -0,0 +1,475 @@
+"""
+LangGraph 체크포인터 (output_id = thread_id 단위 State 저장)
+이전 단계 State를 체크포인트에서 불러오므로, 다음 단계 요청은 누적 context 전체를 다시 보내지 않아도 됨
+
+- CHECKPOINTER=memory (기본): 프로세스 메모리 (테스트 / 단일 워커)
+- CHECKPOINTER=sqlite: CHECKPOINT_URL 파일 (기본 Test/checkpoints.sqlite)
+- CHECKPOINTER=postgres: CHECKPOINT_URL DSN (생략 시 DB_HOST / DB_PORT / DB_NAME / DB_USER / DB_PASSWORD)
+- CHECKPOINTER=none: 체크포인트 미사용 (요청 context만 사용)
+
+쓰기 배치: 실행 중 체크포인트는 메모리에 기록하고, CHECKPOINT_FLUSH_INTERVAL마다 변경된 thread의
+  최신 체크포인트만 한 트랜잭션으로 저장 (실행 1회의 중간 체크포인트 3~4개 → 행 1개)
+압축 직렬화: 채널 값(후보 목록, context 등)을 msgpack으로 직렬화하고 CHECKPOINT_COMPRESS_MIN_BYTES 이상이면 zlib 압축
+TTL 정리: CHECKPOINT_TTL 초 동안 갱신되지 않은 thread 삭제 (메모리 / DB)
+메모리 상한: 워커 메모리에 CHECKPOINT_MAX_THREADS개 thread까지만 유지 (초과 시 오래 사용하지 않은 thread부터 제거,
+  DB 백엔드는 다음 요청에서 다시 로드 / memory 백엔드는 해당 thread 상태 소실 - 세션 context로 복원)
+"""
+import atexit
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from langgraph_system.executor import run_in_executor
+from langgraph_system.log import get_logger
+
+logger = get_logger("checkpoint")
+
+CHECKPOINTER = os.getenv("CHECKPOINTER", "memory").lower()
+CHECKPOINT_URL = os.getenv("CHECKPOINT_URL", "")
+CHECKPOINT_TTL = float(os.getenv("CHECKPOINT_TTL", str(24 * 3600)))
+CHECKPOINT_FLUSH_INTERVAL = float(os.getenv("CHECKPOINT_FLUSH_INTERVAL", "1.0"))
+# DB 백엔드 사용 시 메모리에 유지할 시간 (이후 요청은 DB에서 다시 로드)
+CHECKPOINT_CACHE_SECONDS = float(os.getenv("CHECKPOINT_CACHE_SECONDS", "600"))
+CHECKPOINT_COMPRESS_MIN_BYTES = int(os.getenv("CHECKPOINT_COMPRESS_MIN_BYTES", "1024"))
+# 메모리에 유지할 thread 수 상한 (0: 제한 없음) - TTL만으로는 트래픽에 비례해 24시간 동안 계속 증가
+CHECKPOINT_MAX_THREADS = int(os.getenv("CHECKPOINT_MAX_THREADS", "1000"))
+
+CHECKPOINTERS = ("none", "memory", "sqlite", "postgres")
+DEFAULT_SQLITE_PATH = "Test/checkpoints.sqlite"
+
+# TTL 정리 최소 간격 (초)
+PRUNE_INTERVAL = 60
+
+COMPRESSED_SUFFIX = "+zlib"
+
+
+class CompactSerializer(JsonPlusSerializer):
+    """msgpack 직렬화 + 큰 값은 zlib 압축 (type 뒤에 +zlib 표시)"""
+
+    def __init__(self, compress_min_bytes: int = CHECKPOINT_COMPRESS_MIN_BYTES, **kwargs):
+        super().__init__(**kwargs)
+        self.compress_min_bytes = compress_min_bytes
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        type_, data = super().dumps_typed(obj)
+        if type_ == "msgpack" and len(data) >= self.compress_min_bytes:
+            return type_ + COMPRESSED_SUFFIX, zlib.compress(data, 1)
+        return type_, data
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(COMPRESSED_SUFFIX):
+            return super().loads_typed((type_[:-len(COMPRESSED_SUFFIX)], zlib.decompress(payload)))
+        return super().loads_typed(data)
+
+
+# =================================================================
+# 저장소 (thread별 최신 체크포인트 1행)
+# =================================================================
+class SQLCheckpointStore:
+    """
+    thread_id → 최신 체크포인트 스냅샷 저장 (sqlite3 / psycopg2 공용 SQL)
+    연결 1개를 잠금으로 보호 (쓰기는 플러시 스레드가 배치로 수행)
+    """
+
+    BLOB_TYPE = "BLOB"
+    PARAM = "?"
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._lock = threading.Lock()
+        self._execute(
+            f"CREATE TABLE IF NOT EXISTS brand_checkpoints ("
+            f"thread_id TEXT PRIMARY KEY, payload_type TEXT NOT NULL, payload {self.BLOB_TYPE} NOT NULL, "
+            f"updated_at DOUBLE PRECISION NOT NULL)"
+        )
+
+    def _sql(self, sql: str) -> str:
+        return sql.replace("?", self.PARAM)
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()):
+        with self._lock:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute(self._sql(sql), params)
+                rows = cursor.fetchall() if cursor.description else []
+                self.conn.commit()  # 조회도 트랜잭션 종료 (postgres idle in transaction 방지)
+                return rows, cursor.rowcount
+            except Exception:
+                self.conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def load(self, thread_id: str, newer_than: float) -> Optional[Tuple[Tuple[str, bytes], float]]:
+        """newer_than 이후 저장된 스냅샷 ((type, payload), updated_at), 없으면 None (변경 없으면 본문 미전송)"""
+        rows, _ = self._execute(
+            "SELECT payload_type, payload, updated_at FROM brand_checkpoints WHERE thread_id = ? AND updated_at > ?",
+            (thread_id, newer_than)
+        )
+        if not rows:
+            return None
+        payload_type, payload, updated_at = rows[0]
+        return (payload_type, bytes(payload)), updated_at
+
+    def save_many(self, rows: List[Tuple[str, str, bytes, float]]):
+        """(thread_id, payload_type, payload, updated_at) 목록을 한 트랜잭션으로 저장"""
+        sql = self._sql(
+            "INSERT INTO brand_checkpoints (thread_id, payload_type, payload, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (thread_id) DO UPDATE SET payload_type = excluded.payload_type, "
+            "payload = excluded.payload, updated_at = excluded.updated_at"
+        )
+        with self._lock:
+            cursor = self.conn.cursor()
+            try:
+                cursor.executemany(sql, rows)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def delete(self, thread_id: str):
+        self._execute("DELETE FROM brand_checkpoints WHERE thread_id = ?", (thread_id,))
+
+    def delete_expired(self, ttl: float) -> int:
+        _, count = self._execute(
+            "DELETE FROM brand_checkpoints WHERE updated_at < ?", (time.time() - ttl,)
+        )
+        return max(count, 0)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class SQLiteCheckpointStore(SQLCheckpointStore):
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")  # 워커 간 읽기 / 쓰기 동시 진행
+        conn.execute("PRAGMA synchronous=NORMAL")
+        super().__init__(conn)
+
+
+class PostgresCheckpointStore(SQLCheckpointStore):
+    BLOB_TYPE = "BYTEA"
+    PARAM = "%s"
+
+    def __init__(self, dsn: str = ""):
+        import psycopg2
+
+        if not dsn:
+            dsn = "postgresql://{}:{}@{}:{}/{}".format(
+                os.getenv("DB_USER", "postgres"), os.getenv("DB_PASSWORD", ""),
+                os.getenv("DB_HOST", "localhost"), os.getenv("DB_PORT", "5432"),
+                os.getenv("DB_NAME", "brand_consulting")
+            )
+        super().__init__(psycopg2.connect(dsn))
+
+
+# =================================================================
+# 체크포인터
+# =================================================================
+class BatchedCheckpointSaver(InMemorySaver):
+    """
+    메모리 체크포인터 + (선택) DB 배치 저장
+
+    - 실행 중 읽기 / 쓰기는 메모리 (InMemorySaver)
+    - 변경된 thread는 플러시 스레드가 최신 체크포인트만 모아 저장 (이전 체크포인트는 메모리에서도 정리)
+    - 메모리의 thread 수가 max_threads를 넘으면 플러시 때 오래 사용하지 않은 thread부터 제거
+    - 실행 시작 시 DB에 더 새로운 체크포인트가 있으면(다른 워커가 저장) 로드
+    """
+
+    def __init__(self, store: Optional[SQLCheckpointStore] = None, ttl: float = CHECKPOINT_TTL,
+                 flush_interval: float = CHECKPOINT_FLUSH_INTERVAL,
+                 cache_seconds: float = CHECKPOINT_CACHE_SECONDS, max_threads: int = CHECKPOINT_MAX_THREADS,
+                 serde=None):
+        super().__init__(serde=serde or CompactSerializer())
+        self.store = store
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self.cache_seconds = cache_seconds if store is not None else ttl
+        self.max_threads = max_threads
+        self._lock = threading.RLock()
+        self._touched: Dict[str, float] = {}
+        # thread별 마지막으로 DB와 맞춘 시각 (저장 / 로드한 스냅샷의 updated_at)
+        self._synced: Dict[str, float] = {}
+        self._dirty: set = set()
+        self._stats = {"puts": 0, "flushes": 0, "flushed_threads": 0, "loads": 0, "pruned": 0, "evicted": 0,
+                       "flush_errors": 0}
+        self._last_prune = time.time()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        if self.flush_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name="checkpoint-flush", daemon=True)
+            self._flusher.start()
+
+    # ---------- 읽기 ----------
+    def get_tuple(self, config):
+        if self.store is not None and "checkpoint_id" not in config["configurable"]:
+            self._refresh(config["configurable"]["thread_id"])
+        return self._get_tuple(config)
+
+    async def aget_tuple(self, config):
+        if self.store is not None and "checkpoint_id" not in config["configurable"]:
+            # DB 조회는 이벤트 루프 밖에서
+            await run_in_executor(self._refresh, config["configurable"]["thread_id"])
+        return self._get_tuple(config)
+
+    def _get_tuple(self, config):
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            if thread_id not in self.storage:
+                # InMemorySaver는 조회만 해도 빈 thread 항목을 만들므로 먼저 확인
+                return None
+            self._touched[thread_id] = time.time()
+            return super().get_tuple(config)
+
+    def list(self, config, *, filter=None, before=None, limit=None):
+        with self._lock:
+            return iter(list(super().list(config, filter=filter, before=before, limit=limit)))
+
+    # ---------- 쓰기 ----------
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            result = super().put(config, checkpoint, metadata, new_versions)
+            self._touched[thread_id] = time.time()
+            self._dirty.add(thread_id)
+            self._stats["puts"] += 1
+        return result
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            super().put_writes(config, writes, task_id, task_path)
+            self._touched[thread_id] = time.time()
+            self._dirty.add(thread_id)
+
+    def delete_thread(self, thread_id: str):
+        with self._lock:
+            super().delete_thread(thread_id)
+            self._touched.pop(thread_id, None)
+            self._synced.pop(thread_id, None)
+            self._dirty.discard(thread_id)
+        if self.store is not None:
+            self.store.delete(thread_id)
+
+    # ---------- 스냅샷 (thread별 최신 체크포인트) ----------
+    def _latest_ids(self, thread_id: str) -> Dict[str, str]:
+        return {ns: max(checkpoints) for ns, checkpoints in self.storage.get(thread_id, {}).items() if checkpoints}
+
+    def _compact(self, thread_id: str):
+        """thread의 최신 체크포인트만 남기고 이전 체크포인트 / 쓰기 / 채널 값 정리"""
+        latest = self._latest_ids(thread_id)
+        keep_blobs = set()
+        for ns, checkpoint_id in latest.items():
+            checkpoints = self.storage[thread_id][ns]
+            for old_id in [cid for cid in checkpoints if cid != checkpoint_id]:
+                del checkpoints[old_id]
+                self.writes.pop((thread_id, ns, old_id), None)
+            checkpoint = self.serde.loads_typed(checkpoints[checkpoint_id][0])
+            keep_blobs.update((thread_id, ns, ch, ver) for ch, ver in checkpoint["channel_versions"].items())
+        for key in [k for k in self.blobs if k[0] == thread_id and k not in keep_blobs]:
+            del self.blobs[key]
+
+    def _snapshot(self, thread_id: str) -> Tuple[str, bytes]:
+        """최신 체크포인트 + 채널 값 + 대기 쓰기를 저장용 바이트로 변환"""
+        namespaces = []
+        for ns, checkpoint_id in self._latest_ids(thread_id).items():
+            saved_checkpoint, saved_metadata, parent_id = self.storage[thread_id][ns][checkpoint_id]
+            namespaces.append({
+                "ns": ns,
+                "id": checkpoint_id,
+                "parent": parent_id,
+                "checkpoint": list(saved_checkpoint),
+                "metadata": list(saved_metadata),
+                "blobs": [[ch, ver, list(value)] for (tid, bns, ch, ver), value in self.blobs.items()
+                          if tid == thread_id and bns == ns],
+                "writes": [[task_id, idx, list(value[:2]), list(value[2]), value[3]]
+                           for (task_id, idx), value in self.writes.get((thread_id, ns, checkpoint_id), {}).items()]
+            })
+        return self.serde.dumps_typed(namespaces)
+
+    def _restore(self, thread_id: str, payload: Tuple[str, bytes]):
+        for entry in self.serde.loads_typed(payload):
+            ns = entry["ns"]
+            self.storage[thread_id][ns][entry["id"]] = (
+                tuple(entry["checkpoint"]), tuple(entry["metadata"]), entry["parent"]
+            )
+            for channel, version, value in entry["blobs"]:
+                self.blobs[(thread_id, ns, channel, version)] = tuple(value)
+            writes = self.writes[(thread_id, ns, entry["id"])]
+            for task_id, idx, (_, channel), value, task_path in entry["writes"]:
+                writes[(task_id, idx)] = (task_id, channel, tuple(value), task_path)
+
+    def _refresh(self, thread_id: str):
+        """DB에 메모리보다 새로운 체크포인트가 있으면 로드 (메모리에 없거나 다른 워커가 갱신한 경우)"""
+        with self._lock:
+            if thread_id in self._dirty:
+                return  # 아직 저장하지 않은 메모리 값이 최신
+            newer_than = self._synced.get(thread_id, 0.0) if thread_id in self.storage else 0.0
+        try:
+            row = self.store.load(thread_id, max(newer_than, time.time() - self.ttl))
+        except Exception as e:
+            logger.warning("[Checkpoint] 로드 실패 (%s): %s", thread_id, e)
+            return
+        if row is None:
+            return
+        payload, updated_at = row
+        with self._lock:
+            if thread_id in self._dirty:
+                return
+            InMemorySaver.delete_thread(self, thread_id)
+            self._restore(thread_id, payload)
+            self._touched[thread_id] = time.time()
+            self._synced[thread_id] = updated_at
+            self._stats["loads"] += 1
+
+    # ---------- 플러시 / 정리 ----------
+    def flush(self):
+        """변경된 thread의 최신 체크포인트를 한 번에 저장 (메모리 이전 체크포인트 정리 포함)"""
+        with self._lock:
+            dirty = list(self._dirty)
+            self._dirty.clear()
+            rows = []
+            for thread_id in dirty:
+                if thread_id not in self.storage:
+                    continue
+                self._compact(thread_id)
+                if self.store is not None:
+                    payload_type, payload = self._snapshot(thread_id)
+                    rows.append((thread_id, payload_type, payload, self._touched.get(thread_id, time.time())))
+        if rows:
+            try:
+                self.store.save_many(rows)
+                self._stats["flushes"] += 1
+                self._stats["flushed_threads"] += len(rows)
+                with self._lock:
+                    self._synced.update((row[0], row[3]) for row in rows)
+            except Exception as e:
+                self._stats["flush_errors"] += 1
+                logger.error("[Checkpoint] 저장 실패 (%s건, 다음 주기에 재시도): %s", len(rows), e)
+                with self._lock:
+                    self._dirty.update(row[0] for row in rows)
+        self.evict_overflow()
+
+    def evict_overflow(self) -> int:
+        """메모리 thread 수를 max_threads 이하로 (저장하지 않은 변경이 있는 thread는 유지)"""
+        if self.max_threads <= 0:
+            return 0
+        with self._lock:
+            overflow = len(self.storage) - self.max_threads
+            if overflow <= 0:
+                return 0
+            candidates = sorted((ts, tid) for tid, ts in self._touched.items()
+                                if tid in self.storage and tid not in self._dirty)
+            evicted = [tid for _, tid in candidates[:overflow]]
+            for thread_id in evicted:
+                InMemorySaver.delete_thread(self, thread_id)
+                del self._touched[thread_id]
+                self._synced.pop(thread_id, None)
+            self._stats["evicted"] += len(evicted)
+        return len(evicted)
+
+    def prune_expired(self) -> int:
+        """메모리: cache_seconds 동안 미사용 thread 제거 / DB: TTL 지난 thread 삭제"""
+        now = time.time()
+        with self._lock:
+            expired = [tid for tid, ts in self._touched.items()
+                       if now - ts > self.cache_seconds and tid not in self._dirty]
+            for thread_id in expired:
+                InMemorySaver.delete_thread(self, thread_id)
+                del self._touched[thread_id]
+                self._synced.pop(thread_id, None)
+        removed = len(expired)
+        if self.store is not None:
+            try:
+                removed += self.store.delete_expired(self.ttl)
+            except Exception as e:
+                logger.warning("[Checkpoint] TTL 정리 실패: %s", e)
+        self._stats["pruned"] += removed
+        return removed
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+            if time.time() - self._last_prune >= PRUNE_INTERVAL:
+                self._last_prune = time.time()
+                self.prune_expired()
+
+    def close(self):
+        """남은 변경 저장 후 플러시 스레드 / DB 연결 종료"""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+            self._flusher = None
+        self.flush()
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            threads = len(self.storage)
+            dirty = len(self._dirty)
+        return {
+            "backend": type(self.store).__name__ if self.store is not None else "memory",
+            "threads_in_memory": threads,
+            "dirty": dirty,
+            "ttl": self.ttl,
+            "max_threads": self.max_threads,
+            "flush_interval": self.flush_interval,
+            **self._stats
+        }
+
+
+# =================================================================
+# 전역 체크포인터
+# =================================================================
+_checkpointer: Optional[BatchedCheckpointSaver] = None
+
+
+def create_checkpointer(kind: str = CHECKPOINTER, url: str = CHECKPOINT_URL) -> Optional[BatchedCheckpointSaver]:
+    """CHECKPOINTER 설정에 맞는 체크포인터 생성 (none이면 None)"""
+    if kind not in CHECKPOINTERS:
+        raise ValueError(f"지원하지 않는 CHECKPOINTER: {kind} (가능: {', '.join(CHECKPOINTERS)})")
+    if kind == "none":
+        return None
+    if kind == "sqlite":
+        store = SQLiteCheckpointStore(url or DEFAULT_SQLITE_PATH)
+    elif kind == "postgres":
+        store = PostgresCheckpointStore(url)
+    else:
+        store = None
+    logger.info("[Checkpoint] %s 체크포인터 사용", kind)
+    return BatchedCheckpointSaver(store)
+
+
+def get_checkpointer() -> Optional[BatchedCheckpointSaver]:
+    """프로세스 공용 체크포인터 (최초 호출 시 생성)"""
+    global _checkpointer
+    if _checkpointer is None and CHECKPOINTER != "none":
+        _checkpointer = create_checkpointer()
+    return _checkpointer
+
+
+def close_checkpointer():
+    """서버 종료 시 남은 체크포인트 저장"""
+    global _checkpointer
+    if _checkpointer is not None:
+        _checkpointer.close()
+        _checkpointer = None
+
+
+atexit.register(close_checkpointer)
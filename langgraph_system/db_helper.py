@@ -3,6 +3,9 @@ DB 저장 헬퍼 함수
 DB 연결 없이도 동작하도록 안전하게 처리
 """
 from database.connection import db_connection
+from langgraph_system.log import get_logger
+
+logger = get_logger("db")
 
 
 def safe_db_save(save_func, *args, **kwargs):
@@ -17,13 +20,13 @@ def safe_db_save(save_func, *args, **kwargs):
         bool: 저장 성공 여부
     """
     if db_connection is None:
-        print("[DB] ⚠️  DB 미사용 모드 - 저장 생략")
+        logger.debug("[DB] DB 미사용 모드 - 저장 생략")
         return False
     
     try:
         result = save_func(*args, **kwargs)
-        print("[DB] ✅ 저장 완료")
+        logger.info("[DB] 저장 완료")
         return True
     except Exception as e:
-        print(f"[DB] ⚠️  저장 실패: {e} (계속 진행)")
+        logger.warning("[DB] 저장 실패: %s (계속 진행)", e)
         return False
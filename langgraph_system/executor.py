@@ -0,0 +1,93 @@
+"""
+노드 실행용 스레드 풀
+비동기 경로(ainvoke)에서 동기 전용 작업(동기 노드, 파일 저장, Cloudinary 업로드 등)을
+이벤트 루프 밖에서 실행하기 위한 Executor
+
+단계 분류(step class)별로 풀을 분리 (Bulkhead)
+- text: Step 1~4 (진단 / 네이밍 / 컨셉 / 스토리) 및 공용 작업 (체크포인트, 작업 저장소)
+- image: Step 5 (로고 이미지 생성 / 저장 / 업로드)
+로고 요청이 몰려도 이미지 작업은 image 풀에서만 대기하므로 텍스트 단계의 스레드를 점유하지 않음
+"""
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+TEXT_POOL = "text"
+IMAGE_POOL = "image"
+
+NODE_EXECUTOR_WORKERS = int(os.getenv("NODE_EXECUTOR_WORKERS", "32"))
+IMAGE_EXECUTOR_WORKERS = int(os.getenv("IMAGE_EXECUTOR_WORKERS", "8"))
+
+POOL_WORKERS = {
+    TEXT_POOL: NODE_EXECUTOR_WORKERS,
+    IMAGE_POOL: IMAGE_EXECUTOR_WORKERS
+}
+
+# 노드(step) 이름 → 단계 분류
+STEP_POOLS = {
+    "diagnosis": TEXT_POOL,
+    "naming": TEXT_POOL,
+    "concept": TEXT_POOL,
+    "story": TEXT_POOL,
+    "logo": IMAGE_POOL
+}
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+
+
+def pool_for_step(step: str) -> str:
+    """노드 이름의 단계 분류 (알 수 없으면 text)"""
+    return STEP_POOLS.get(step, TEXT_POOL)
+
+
+def get_node_executor(pool: str = TEXT_POOL) -> ThreadPoolExecutor:
+    """단계 분류별 스레드 풀 반환 (최초 호출 시 생성)"""
+    executor = _executors.get(pool)
+    if executor is None:
+        if pool not in POOL_WORKERS:
+            raise ValueError(f"알 수 없는 스레드 풀: {pool}")
+        executor = _executors.setdefault(pool, ThreadPoolExecutor(
+            max_workers=POOL_WORKERS[pool],
+            thread_name_prefix=f"langgraph-{pool}"
+        ))
+    return executor
+
+
+async def run_in_pool(pool: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    동기 함수를 지정한 스레드 풀에서 실행하고 결과를 await
+    호출 측 contextvar(메트릭 step, 녹화 등)를 그대로 전달 (asyncio.to_thread와 동일)
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_node_executor(pool),
+        functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
+async def run_in_executor(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """동기 함수를 text(공용) 스레드 풀에서 실행하고 결과를 await"""
+    return await run_in_pool(TEXT_POOL, func, *args, **kwargs)
+
+
+def executor_stats() -> Dict[str, Dict[str, int]]:
+    """풀별 스레드 수 / 대기 작업 수"""
+    return {
+        pool: {
+            "workers": workers,
+            "threads": len(_executors[pool]._threads) if pool in _executors else 0,
+            "queued": _executors[pool]._work_queue.qsize() if pool in _executors else 0
+        }
+        for pool, workers in POOL_WORKERS.items()
+    }
+
+
+def shutdown_node_executor(wait: bool = True):
+    """모든 스레드 풀 종료 (서버 종료 시 호출)"""
+    while _executors:
+        _, executor = _executors.popitem()
+        executor.shutdown(wait=wait)
@@ -3,31 +3,72 @@ LangGraph Workflow Definition (FE-BE 구조용)
 각 단계가 독립적으로 실행되고 바로 종료
 """
 from langgraph.graph import StateGraph, END
+from langchain_core.runnables import RunnableLambda
 from langgraph_system.state import BrandConsultingState
+from langgraph_system.executor import run_in_pool, pool_for_step
+from langgraph_system.metrics import NODE_LATENCY, step_context, observe, record_error
+from langgraph_system.log import get_logger, log_context
+from langgraph_system.checkpoint import get_checkpointer
+
+logger = get_logger("graph")
 
 # Import Nodes
-from langgraph_system.nodes.diagnosis_node import diagnosis_node
-from langgraph_system.nodes.naming_node import naming_node
-from langgraph_system.nodes.concept_node import concept_node
-from langgraph_system.nodes.story_node import story_node
-from langgraph_system.nodes.logo_node import logo_node
+from langgraph_system.nodes.diagnosis_node import diagnosis_node, adiagnosis_node
+from langgraph_system.nodes.naming_node import naming_node, anaming_node
+from langgraph_system.nodes.concept_node import concept_node, aconcept_node
+from langgraph_system.nodes.story_node import story_node, astory_node
+from langgraph_system.nodes.logo_node import logo_node, alogo_node
+
+
+def _check_node_error(name, result):
+    # 노드는 예외를 error_occurred로 바꿔 반환하므로 결과 상태로 에러 집계
+    if isinstance(result, dict) and result.get("error_occurred"):
+        record_error("node", step=name)
+    return result
+
+
+def as_graph_node(name, func, afunc=None):
+    """
+    동기/비동기 양쪽으로 실행 가능한 노드 생성
+    - invoke: func 실행
+    - ainvoke: afunc 실행 (afunc가 없으면 func를 단계 분류별 스레드 풀에서 실행하여 이벤트 루프 보호)
+    - 실행 시간 / 에러를 step=name 라벨로 기록 (노드 안의 Provider 호출도 같은 step)
+    - 노드 안의 로그에 output_id / step 첨부
+    """
+    if afunc is None:
+        async def afunc(state):
+            return await run_in_pool(pool_for_step(name), func, state)
+
+    def measured(state):
+        with log_context(state.get("output_id")), step_context(name), observe(NODE_LATENCY, "node"):
+            return _check_node_error(name, func(state))
+
+    async def ameasured(state):
+        with log_context(state.get("output_id")), step_context(name), observe(NODE_LATENCY, "node"):
+            return _check_node_error(name, await afunc(state))
+
+    return RunnableLambda(measured, afunc=ameasured, name=name)
+
 
-def create_info_graph():
+def create_info_graph(checkpointer=None):
     """
     FE-BE 구조용 단순화된 LangGraph
     각 API 호출이 독립적으로 실행되므로:
     - current_step에 따라 해당 노드만 실행
     - 실행 후 바로 종료 (END)
     - quality_check, human_review 불필요 (FE가 관리)
+    - invoke(동기) / ainvoke(비동기) 모두 지원
+    - 체크포인터(기본: CHECKPOINTER 설정)로 thread_id(output_id)별 State 저장
+      → 다음 단계 실행 시 이전 단계 State를 불러온 뒤 요청 입력을 덮어씀
     """
     workflow = StateGraph(BrandConsultingState)
     
     # 1. 노드 추가
-    workflow.add_node("diagnosis", diagnosis_node)
-    workflow.add_node("naming", naming_node)
-    workflow.add_node("concept", concept_node)
-    workflow.add_node("story", story_node)
-    workflow.add_node("logo", logo_node)
+    workflow.add_node("diagnosis", as_graph_node("diagnosis", diagnosis_node, adiagnosis_node))
+    workflow.add_node("naming", as_graph_node("naming", naming_node, anaming_node))
+    workflow.add_node("concept", as_graph_node("concept", concept_node, aconcept_node))
+    workflow.add_node("story", as_graph_node("story", story_node, astory_node))
+    workflow.add_node("logo", as_graph_node("logo", logo_node, alogo_node))
     
     # 2. 라우팅 함수: current_step에 따라 실행할 노드 결정
     def route_to_step(state: BrandConsultingState) -> str:
@@ -42,7 +83,8 @@ def create_info_graph():
         }
         
         next_node = step_mapping.get(current_step, "diagnosis")
-        print(f"[Router] ➡️  Step {current_step} 실행: {next_node}")
+        with log_context(state.get("output_id")):
+            logger.info("Step %s 실행: %s", current_step, next_node)
         return next_node
     
     # 3. 시작점 설정 (조건부 엣지로 라우팅)
@@ -56,6 +98,6 @@ def create_info_graph():
     workflow.add_edge("logo", END)
     
     # 5. 컴파일
-    app = workflow.compile()
+    app = workflow.compile(checkpointer=checkpointer or get_checkpointer())
     
     return app
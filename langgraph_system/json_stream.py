@@ -0,0 +1,168 @@
+"""
+스트리밍 JSON 파서
+GPT 응답을 청크 단위로 받으면서 최상위 "options" 배열의 각 원소(후보)를
+닫는 중괄호가 도착하는 즉시 dict로 반환
+
+- 응답 앞뒤의 불필요한 텍스트(```json 등)는 무시
+- 응답이 중간에 끊겨도 그때까지 완성된 후보는 유지
+- parse_options(): 전체 응답 파싱 (실패 시 완성된 후보만 복구)
+- iter_options() / aiter_options(): 청크 스트림 → 후보 스트림
+"""
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List
+from langgraph_system.log import get_logger
+
+logger = get_logger("json_stream")
+
+
+class OptionsStreamParser:
+    """
+    최상위 객체의 options 배열을 점진적으로 파싱
+
+    사용 예:
+        parser = OptionsStreamParser()
+        for chunk in stream:
+            for option in parser.feed(chunk):
+                ...  # 완성된 후보 1개
+        parser.options  # 지금까지 완성된 전체 후보
+    """
+
+    def __init__(self, key: str = "options"):
+        self.key = key
+        self.options: List[Dict[str, Any]] = []
+        self.done = False           # 최상위 객체가 닫힘 (이후 입력은 무시)
+
+        self._depth = 0             # 현재 중첩 깊이 (객체/배열)
+        self._in_string = False
+        self._escape = False
+        self._string_chars: List[str] = []   # 최상위 객체의 키 후보 문자열
+        self._last_string = None
+        self._current_key = None
+        self._array_depth = None    # options 배열 내부 깊이 (배열 밖이면 None)
+        self._capture: List[str] = []        # 파싱 중인 후보 원문
+        self._capturing = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        청크 입력
+
+        Returns:
+            이번 청크로 새로 완성된 후보 리스트
+        """
+        completed: List[Dict[str, Any]] = []
+        if self.done or not chunk:
+            return completed
+
+        for ch in chunk:
+            if self._capturing:
+                self._capture.append(ch)
+
+            if self._in_string:
+                self._consume_string_char(ch)
+                continue
+
+            if self._depth == 0:
+                # 최상위 객체 시작 전의 텍스트는 무시
+                if ch == "{":
+                    self._depth = 1
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_chars = []
+            elif ch == ":":
+                if self._depth == 1:
+                    self._current_key = self._last_string
+            elif ch == ",":
+                if self._depth == 1:
+                    self._current_key = None
+            elif ch in "{[":
+                if ch == "[" and self._depth == 1 and self._current_key == self.key:
+                    self._array_depth = 2
+                elif ch == "{" and self._array_depth is not None and self._depth == self._array_depth:
+                    self._capturing = True
+                    self._capture = ["{"]
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._capturing and self._depth == self._array_depth:
+                    option = self._finish_capture()
+                    if option is not None:
+                        completed.append(option)
+                elif self._array_depth is not None and self._depth == self._array_depth - 1:
+                    self._array_depth = None
+                if self._depth == 0:
+                    self.done = True
+                    break
+
+        return completed
+
+    def _consume_string_char(self, ch: str):
+        if self._escape:
+            self._escape = False
+        elif ch == "\\":
+            self._escape = True
+        elif ch == '"':
+            self._in_string = False
+            if self._depth == 1:
+                self._last_string = "".join(self._string_chars)
+            return
+
+        if self._depth == 1:
+            self._string_chars.append(ch)
+
+    def _finish_capture(self):
+        raw = "".join(self._capture)
+        self._capturing = False
+        self._capture = []
+        try:
+            option = json.loads(raw)
+        except ValueError:
+            return None
+        if not isinstance(option, dict):
+            return None
+        self.options.append(option)
+        return option
+
+
+def parse_options(content: str, key: str = "options") -> List[Dict[str, Any]]:
+    """
+    전체 응답에서 options 배열 추출
+
+    정상 JSON이면 그대로 파싱하고, 잘린 응답/앞뒤 텍스트가 섞인 응답이면
+    완성된 후보만 복구. 복구할 후보가 하나도 없으면 json.JSONDecodeError
+    """
+    try:
+        data = json.loads(content)
+        if isinstance(data, dict):
+            return list(data.get(key) or [])
+    except json.JSONDecodeError as e:
+        error = e
+    else:
+        error = json.JSONDecodeError("최상위 JSON 객체가 아닙니다.", content, 0)
+
+    parser = OptionsStreamParser(key)
+    parser.feed(content)
+    if parser.options:
+        logger.warning("[JSON Stream] 응답 JSON 불완전 - 완성된 후보 %d개 복구", len(parser.options))
+        return parser.options
+    raise error
+
+
+def iter_options(chunks: Iterable[str], key: str = "options") -> Iterator[Dict[str, Any]]:
+    """청크 스트림에서 완성된 후보를 순서대로 yield"""
+    parser = OptionsStreamParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            break
+
+
+async def aiter_options(chunks: AsyncIterable[str], key: str = "options") -> AsyncIterator[Dict[str, Any]]:
+    """청크 스트림에서 완성된 후보를 순서대로 yield (비동기)"""
+    parser = OptionsStreamParser(key)
+    async for chunk in chunks:
+        for option in parser.feed(chunk):
+            yield option
+        if parser.done:
+            break
@@ -0,0 +1,261 @@
+"""
+LLM / 이미지 생성 호출 모듈
+노드에서 사용하는 GPT-5.1, Gemini 호출을 동기/비동기 양쪽으로 제공
+호출 시간 / 토큰 수는 langgraph_system/metrics.py 에 기록
+호출 전 Provider + 모델별 호출 한도(RPM / TPM)를 예약하고 호출 후 실제 사용량으로 정산 (langgraph_system/ratelimit.py)
+일시적 에러 재시도 / 마감 시간 / Hedging / Circuit Breaker는 langgraph_system/resilience.py
+"""
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+import base64
+
+from langgraph_system.metrics import LLM_LATENCY, IMAGE_LATENCY, observe, record_tokens
+from langgraph_system.ratelimit import rate_limiter, estimate_tokens, RATE_LIMIT_COMPLETION_TOKENS, Ticket
+from langgraph_system.resilience import resilience
+
+TEXT_MODEL = "gpt-5.1"
+IMAGE_MODEL = "gemini-3-pro-image-preview"
+
+
+def _build_messages(system_prompt: str, user_prompt: str):
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def _estimate(system_prompt: str, user_prompt: str) -> int:
+    """호출 한도 예약용 예상 토큰 (프롬프트 추정 + 응답 예상)"""
+    return estimate_tokens(system_prompt, user_prompt) + RATE_LIMIT_COMPLETION_TOKENS
+
+
+@contextmanager
+def _release_on_error(ticket: Optional[Ticket]) -> Iterator[None]:
+    """호출 실패 / 타임아웃 / 취소(Hedging에서 진 요청) 시 예약 토큰 반환 - 재시도마다 예약이 쌓이지 않도록"""
+    try:
+        yield
+    except BaseException:
+        rate_limiter.release(ticket)
+        raise
+
+
+def _record_usage(model: str, usage: Any) -> Optional[int]:
+    """
+    OpenAI usage (prompt_tokens / completion_tokens) 기록
+
+    Returns:
+        전체 토큰 수 (usage 없으면 None)
+    """
+    if usage is None:
+        return None
+    record_tokens(model, getattr(usage, "prompt_tokens", None), getattr(usage, "completion_tokens", None))
+    return getattr(usage, "total_tokens", None)
+
+
+def _record_image_usage(model: str, response: Any) -> Optional[int]:
+    """Gemini usage_metadata (입력 / 출력 토큰) 기록, 전체 토큰 수 반환"""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return None
+    record_tokens(model, usage.prompt_token_count, usage.candidates_token_count)
+    return usage.total_token_count
+
+
+def chat_json(client: Any, system_prompt: str, user_prompt: str, model: str = TEXT_MODEL) -> str:
+    """
+    GPT-5.1 JSON 모드 호출 (동기)
+
+    Args:
+        client: OpenAI 클라이언트
+        system_prompt: 시스템 프롬프트
+        user_prompt: 유저 프롬프트
+        model: 모델명
+
+    Returns:
+        응답 본문 (JSON 문자열)
+    """
+    def attempt(timeout: float) -> str:
+        ticket = rate_limiter.acquire("openai", model, _estimate(system_prompt, user_prompt))
+        with _release_on_error(ticket), observe(LLM_LATENCY, "llm", model=model, stream="false"):
+            resp = client.chat.completions.create(
+                model=model,
+                messages=_build_messages(system_prompt, user_prompt),
+                response_format={"type": "json_object"},
+                timeout=timeout
+            )
+        rate_limiter.settle(ticket, _record_usage(model, resp.usage))
+        return resp.choices[0].message.content
+
+    return resilience.call("openai", f"openai:{model}:json", attempt)
+
+
+async def achat_json(client: Any, system_prompt: str, user_prompt: str, model: str = TEXT_MODEL) -> str:
+    """
+    GPT-5.1 JSON 모드 호출 (비동기, AsyncOpenAI 클라이언트 사용)
+    HEDGE_PROVIDERS에 openai가 있으면 p95 지연 초과 시 중복 요청
+    """
+    async def attempt(timeout: float) -> str:
+        ticket = await rate_limiter.aacquire("openai", model, _estimate(system_prompt, user_prompt))
+        with _release_on_error(ticket), observe(LLM_LATENCY, "llm", model=model, stream="false"):
+            resp = await client.chat.completions.create(
+                model=model,
+                messages=_build_messages(system_prompt, user_prompt),
+                response_format={"type": "json_object"},
+                timeout=timeout
+            )
+        rate_limiter.settle(ticket, _record_usage(model, resp.usage))
+        return resp.choices[0].message.content
+
+    return await resilience.acall("openai", f"openai:{model}:json", attempt, hedge=True)
+
+
+def stream_chat_json(client: Any, system_prompt: str, user_prompt: str, model: str = TEXT_MODEL,
+                     on_delta: Optional[Callable[[str], None]] = None) -> str:
+    """
+    GPT-5.1 JSON 모드 스트리밍 호출 (동기)
+    토큰이 도착할 때마다 on_delta(delta) 호출
+
+    Returns:
+        전체 응답 본문 (JSON 문자열)
+    """
+    parts = []
+
+    def attempt(timeout: float) -> str:
+        usage_tokens = None
+        ticket = rate_limiter.acquire("openai", model, _estimate(system_prompt, user_prompt))
+        with _release_on_error(ticket), observe(LLM_LATENCY, "llm", model=model, stream="true"):
+            stream = client.chat.completions.create(
+                model=model,
+                messages=_build_messages(system_prompt, user_prompt),
+                response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True},  # 마지막 chunk에 토큰 사용량 포함
+                timeout=timeout
+            )
+            for chunk in stream:
+                usage_tokens = _record_usage(model, getattr(chunk, "usage", None)) or usage_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if on_delta is not None:
+                        on_delta(delta)
+        rate_limiter.settle(ticket, usage_tokens)
+        return "".join(parts)
+
+    # 토큰이 이미 전달된 뒤의 실패는 재시도하지 않음 (이벤트 / 후보 콜백 중복 방지)
+    return resilience.call("openai", f"openai:{model}:stream", attempt, can_retry=lambda: not parts)
+
+
+async def astream_chat_json(client: Any, system_prompt: str, user_prompt: str, model: str = TEXT_MODEL,
+                            on_delta: Optional[Callable[[str], None]] = None) -> str:
+    """
+    GPT-5.1 JSON 모드 스트리밍 호출 (비동기)
+    토큰이 도착할 때마다 on_delta(delta) 호출
+
+    Returns:
+        전체 응답 본문 (JSON 문자열)
+    """
+    parts = []
+
+    async def attempt(timeout: float) -> str:
+        usage_tokens = None
+        ticket = await rate_limiter.aacquire("openai", model, _estimate(system_prompt, user_prompt))
+        with _release_on_error(ticket), observe(LLM_LATENCY, "llm", model=model, stream="true"):
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=_build_messages(system_prompt, user_prompt),
+                response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True},  # 마지막 chunk에 토큰 사용량 포함
+                timeout=timeout
+            )
+            async for chunk in stream:
+                usage_tokens = _record_usage(model, getattr(chunk, "usage", None)) or usage_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if on_delta is not None:
+                        on_delta(delta)
+        rate_limiter.settle(ticket, usage_tokens)
+        return "".join(parts)
+
+    # 토큰이 이미 전달된 뒤의 실패는 재시도하지 않음 (이벤트 / 후보 콜백 중복 방지)
+    return await resilience.acall("openai", f"openai:{model}:stream", attempt, can_retry=lambda: not parts)
+
+
+def _image_config(timeout: Optional[float] = None):
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        response_modalities=['Image'],  # 이미지만 반환
+        image_config=types.ImageConfig(
+            aspect_ratio="1:1",  # 정사각형 로고
+            image_size="2K"      # 고해상도
+        ),
+        # 요청 단위 타임아웃 (ms)
+        http_options=types.HttpOptions(timeout=int(timeout * 1000)) if timeout else None
+    )
+
+
+def extract_image_bytes(response: Any) -> Optional[bytes]:
+    """
+    Gemini 응답에서 첫 번째 이미지 바이트 추출
+
+    Returns:
+        이미지 바이트 (없으면 None)
+    """
+    if not response.parts:
+        return None
+
+    for part in response.parts:
+        # inline_data 확인 (텍스트 응답은 건너뛰기)
+        if not (hasattr(part, 'inline_data') and part.inline_data):
+            continue
+
+        image_data = part.inline_data.data
+        # 이미지 데이터가 base64 문자열인 경우 디코딩
+        if isinstance(image_data, str):
+            return base64.b64decode(image_data)
+        return image_data
+
+    return None
+
+
+def generate_image(client: Any, prompt: str, model: str = IMAGE_MODEL,
+                   timeout: Optional[float] = None) -> Optional[bytes]:
+    """Gemini 이미지 생성 (동기, timeout: 초 단위)"""
+    def attempt(attempt_timeout: float) -> Optional[bytes]:
+        ticket = rate_limiter.acquire("gemini", model, _estimate("", prompt))
+        with _release_on_error(ticket), observe(IMAGE_LATENCY, "image", model=model):
+            response = client.models.generate_content(
+                model=model,
+                contents=[prompt],
+                config=_image_config(attempt_timeout)
+            )
+        rate_limiter.settle(ticket, _record_image_usage(model, response))
+        return extract_image_bytes(response)
+
+    # timeout: 재시도 포함 전체 제한 시간
+    return resilience.call("gemini", f"gemini:{model}:image", attempt, deadline=timeout)
+
+
+async def agenerate_image(client: Any, prompt: str, model: str = IMAGE_MODEL,
+                          timeout: Optional[float] = None) -> Optional[bytes]:
+    """Gemini 이미지 생성 (비동기, client.aio 사용)"""
+    async def attempt(attempt_timeout: float) -> Optional[bytes]:
+        ticket = await rate_limiter.aacquire("gemini", model, _estimate("", prompt))
+        with _release_on_error(ticket), observe(IMAGE_LATENCY, "image", model=model):
+            response = await client.aio.models.generate_content(
+                model=model,
+                contents=[prompt],
+                config=_image_config(attempt_timeout)
+            )
+        rate_limiter.settle(ticket, _record_image_usage(model, response))
+        return extract_image_bytes(response)
+
+    # timeout: 재시도 포함 전체 제한 시간
+    return await resilience.acall("gemini", f"gemini:{model}:image", attempt, deadline=timeout)
@@ -0,0 +1,159 @@
+"""
+구조화 로깅 (비차단)
+노드 / 라우터 / 서비스의 로그를 QueueHandler로 큐에 넣고, 별도 스레드(QueueListener)에서 출력
+(요청 처리 스레드 / 이벤트 루프가 느린 stdout 파이프에 막히지 않음)
+
+- 레벨: LOG_LEVEL (기본 INFO)
+- 형식: LOG_FORMAT=text (기본) / json (한 줄 JSON, 수집기용)
+- 상관 ID: log_context(output_id=...) 또는 노드 실행 중이면 output_id / step 자동 첨부
+- 상세 페이로드(후보 전문, 프롬프트 등): log_payload() - DEBUG 레벨 + LOG_PAYLOAD_SAMPLE_RATE 비율만 기록
+  (운영 기본값에서는 페이로드 직렬화 자체를 하지 않음)
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterator, Optional
+
+from langgraph_system.metrics import current_step
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", "1.0"))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+ROOT_LOGGER = "brand"
+
+_output_id: ContextVar[Optional[str]] = ContextVar("log_output_id", default=None)
+_listener: Optional[QueueListener] = None
+
+
+class _ContextFilter(logging.Filter):
+    """로그를 남긴 쪽의 컨텍스트(output_id / step)를 레코드에 첨부 (큐에 넣기 전에 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.output_id = _output_id.get() or "-"
+        record.step = current_step()
+        return True
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """큐가 가득 차면 대기하지 않고 버림 (로그 때문에 요청이 막히지 않도록)"""
+
+    dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _DroppingQueueHandler.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "output_id": getattr(record, "output_id", "-"),
+            "step": getattr(record, "step", "unknown"),
+            "msg": record.getMessage()
+        }
+        if hasattr(record, "payload"):
+            entry["payload"] = json.loads(record.payload)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s [%(output_id)s %(step)s] %(message)s", "%H:%M:%S")
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if hasattr(record, "payload"):
+            message += "\n" + json.dumps(json.loads(record.payload), ensure_ascii=False, indent=2)
+        return message
+
+
+def configure_logging(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT, stream=None):
+    """
+    brand 로거에 큐 핸들러 설치 후 출력 스레드 시작 (재호출 시 설정 교체)
+
+    Args:
+        level: 로그 레벨
+        fmt: text / json
+        stream: 출력 대상 (기본 stdout)
+    """
+    global _listener
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(LOG_QUEUE_SIZE)
+    handler = _DroppingQueueHandler(log_queue)
+    handler.addFilter(_ContextFilter())
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    for old in list(logger.handlers):
+        logger.removeHandler(old)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """남은 로그를 모두 출력하고 출력 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """brand.<name> 로거 (최초 사용 시 기본 설정 적용)"""
+    if _listener is None:
+        configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+@contextmanager
+def log_context(output_id: Optional[str]) -> Iterator[None]:
+    """블록 안의 로그에 output_id 첨부"""
+    token = _output_id.set(output_id)
+    try:
+        yield
+    finally:
+        _output_id.reset(token)
+
+
+def log_payload(logger: logging.Logger, message: str, payload: Any, *args):
+    """
+    상세 페이로드 로그 (DEBUG + 샘플링)
+    DEBUG가 꺼져 있거나 샘플링에서 제외되면 payload를 직렬화하지 않음
+    (출력 스레드에서 읽는 시점에 state가 바뀌어 있을 수 있으므로 호출 시점에 직렬화)
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if LOG_PAYLOAD_SAMPLE_RATE < 1.0 and random.random() >= LOG_PAYLOAD_SAMPLE_RATE:
+        return
+    logger.debug(message, *args, extra={"payload": json.dumps(payload, ensure_ascii=False, default=str)})
+
+
+def dropped_count() -> int:
+    """큐 포화로 버려진 로그 수"""
+    return _DroppingQueueHandler.dropped
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,166 @@
+"""
+Prometheus 메트릭
+노드 / Provider 호출 단위로 지연 시간, 토큰 수, 캐시 적중, 에러를 단계(step) 라벨로 기록하고
+api/main.py의 /metrics 에서 노출
+
+- step 라벨: graph.py의 노드 래퍼가 contextvar로 지정 (노드 내부 호출은 자동으로 같은 step)
+- prometheus_client 미설치 또는 METRICS_ENABLED=false: 기록은 무시, /metrics는 503
+- 다중 워커(uvicorn --workers): PROMETHEUS_MULTIPROC_DIR 지정 시 워커 합산 노출
+"""
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Tuple
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+METRICS_AVAILABLE = METRICS_ENABLED and prometheus_client is not None
+
+# 초 단위 (GPT 호출 수 초 ~ 로고 단계 수십 초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+TOKEN_BUCKETS = (16, 64, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+_current_step: ContextVar[str] = ContextVar("metrics_step", default="unknown")
+
+
+class _NoopMetric:
+    """prometheus_client가 없을 때 사용하는 빈 메트릭"""
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def observe(self, value: float):
+        pass
+
+    def inc(self, amount: float = 1):
+        pass
+
+    def dec(self, amount: float = 1):
+        pass
+
+    def set(self, value: float):
+        pass
+
+
+def _histogram(name: str, documentation: str, labels: Tuple[str, ...], buckets=LATENCY_BUCKETS):
+    if not METRICS_AVAILABLE:
+        return _NoopMetric()
+    return prometheus_client.Histogram(name, documentation, labels, buckets=buckets)
+
+
+def _counter(name: str, documentation: str, labels: Tuple[str, ...]):
+    if not METRICS_AVAILABLE:
+        return _NoopMetric()
+    return prometheus_client.Counter(name, documentation, labels)
+
+
+def _gauge(name: str, documentation: str, labels: Tuple[str, ...], multiprocess_mode: str = "livesum"):
+    if not METRICS_AVAILABLE:
+        return _NoopMetric()
+    # 다중 워커: 기본은 살아 있는 워커 값의 합
+    return prometheus_client.Gauge(name, documentation, labels, multiprocess_mode=multiprocess_mode)
+
+
+NODE_LATENCY = _histogram("brand_node_latency_seconds", "LangGraph 노드 실행 시간", ("step",))
+LLM_LATENCY = _histogram("brand_llm_latency_seconds", "GPT 호출 시간 (스트리밍은 마지막 토큰까지)",
+                         ("step", "model", "stream"))
+LLM_TOKENS = _histogram("brand_llm_tokens", "Provider 호출당 토큰 수", ("step", "model", "kind"), TOKEN_BUCKETS)
+IMAGE_LATENCY = _histogram("brand_image_latency_seconds", "Gemini 이미지 생성 시간", ("step", "model"))
+UPLOAD_LATENCY = _histogram("brand_upload_latency_seconds", "Cloudinary 업로드 시간", ("step",))
+CACHE_REQUESTS = _counter("brand_cache_requests_total", "응답 캐시 조회 (hit / disk_hit / miss)", ("cache", "result"))
+ERRORS = _counter("brand_errors_total", "단계별 에러 (node / llm / image / upload)", ("step", "component"))
+RATE_LIMIT_WAIT = _histogram("brand_rate_limit_wait_seconds", "Provider 호출 한도 대기 시간 (Rate Limiter)", ("provider",))
+RATE_LIMIT_THROTTLED = _counter("brand_rate_limit_throttled_total", "Provider 429 응답", ("provider", "model"))
+PROVIDER_RETRIES = _counter("brand_provider_retries_total", "Provider 호출 재시도 (timeout / connection / server / rate_limit)",
+                            ("provider", "reason"))
+PROVIDER_HEDGES = _counter("brand_provider_hedges_total", "p95 초과로 보낸 중복(hedged) 요청", ("key",))
+CIRCUIT_STATE = _gauge("brand_circuit_state", "Provider Circuit 상태 (0 closed / 1 half_open / 2 open)", ("provider",),
+                       multiprocess_mode="max")
+CIRCUIT_REJECTED = _counter("brand_circuit_rejected_total", "Circuit open으로 즉시 실패한 호출", ("provider",))
+BULKHEAD_ACTIVE = _gauge("brand_bulkhead_active", "단계 분류별 실행 중인 요청 수", ("pool",))
+BULKHEAD_QUEUED = _gauge("brand_bulkhead_queued", "단계 분류별 대기 중인 요청 수 (queue depth)", ("pool",))
+BULKHEAD_REJECTED = _counter("brand_bulkhead_rejected_total", "대기열 초과로 거절(429)된 요청", ("pool",))
+CONTEXT_SELECTIONS = _counter("brand_context_selections_total",
+                              "이전 단계 후보 선택 방식 (id / hash / name / single / default / miss)", ("step", "method"))
+
+
+# =================================================================
+# 기록 헬퍼
+# =================================================================
+def current_step() -> str:
+    return _current_step.get()
+
+
+@contextmanager
+def step_context(step: str) -> Iterator[None]:
+    """블록 안에서 기록되는 메트릭의 step 라벨 지정"""
+    token = _current_step.set(step)
+    try:
+        yield
+    finally:
+        _current_step.reset(token)
+
+
+@contextmanager
+def observe(histogram: Any, component: str, **labels) -> Iterator[None]:
+    """
+    블록 실행 시간을 histogram에 기록 (실패 포함), 예외 발생 시 에러 카운터 증가
+
+    Args:
+        histogram: 기록할 Histogram
+        component: 에러 카운터 라벨 (llm / image / upload)
+        labels: step 외 라벨 (step 생략 시 현재 step)
+    """
+    labels.setdefault("step", current_step())
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        ERRORS.labels(step=labels["step"], component=component).inc()
+        raise
+    finally:
+        histogram.labels(**labels).observe(time.perf_counter() - start)
+
+
+def record_error(component: str, step: Optional[str] = None):
+    ERRORS.labels(step=step or current_step(), component=component).inc()
+
+
+def record_tokens(model: str, prompt_tokens: Optional[int], completion_tokens: Optional[int]):
+    step = current_step()
+    if prompt_tokens is not None:
+        LLM_TOKENS.labels(step=step, model=model, kind="prompt").observe(prompt_tokens)
+    if completion_tokens is not None:
+        LLM_TOKENS.labels(step=step, model=model, kind="completion").observe(completion_tokens)
+
+
+def record_cache(cache: str, result: str):
+    CACHE_REQUESTS.labels(cache=cache, result=result).inc()
+
+
+def record_selection(method: str):
+    CONTEXT_SELECTIONS.labels(step=current_step(), method=method).inc()
+
+
+def render_metrics() -> Tuple[Optional[bytes], str]:
+    """
+    Prometheus 텍스트 포맷 출력
+
+    Returns:
+        (본문, Content-Type) - 메트릭 비활성화 시 본문 None
+    """
+    if not METRICS_AVAILABLE:
+        return None, "text/plain; charset=utf-8"
+
+    registry = prometheus_client.REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
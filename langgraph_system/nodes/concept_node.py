@@ -3,64 +3,53 @@ Step 3: Concept Node
 브랜드 컨셉 생성 단계 (Candidates 생성)
 """
 from langgraph_system.state import BrandConsultingState
-from langgraph_system.utils import get_openai_client, validate_step_input, flatten_context
+from langgraph_system.utils import (
+    get_openai_client, get_async_openai_client, validate_step_input, flatten_context, qa_prompt_json
+)
 from langgraph_system.prompts import GenerationPrompts
-import json
+from langgraph_system.streaming import chat_json_streamed, achat_json_streamed
+from langgraph_system.json_stream import parse_options
+from langgraph_system.log import get_logger, log_payload
+from typing import Any, Dict, List, Optional, Tuple
 
+logger = get_logger("nodes.concept")
 
-def concept_node(state: BrandConsultingState) -> BrandConsultingState:
+
+def _prepare_concept(state: BrandConsultingState) -> Optional[Tuple[str, str]]:
     """
-    Step 3: Concept Node
-    
-    [Input]
-    - diagnosis_context: Step 1 진단 Context
-    - naming_context: Step 2에서 선택된 브랜드명 Context
-    - step_3_qa: 사용자 Concept 관련 Q&A
-    
-    [Output]
-    - concept_candidates: 3가지 컨셉 후보
-      (concept_statement, concept_rationale, brand_values)
+    입력 검증, Context 평탄화 및 프롬프트 생성 (동기/비동기 노드 공용)
+
+    Returns:
+        (system_prompt, user_prompt) / 검증 실패 시 None (state에 에러 기록)
     """
-    print(f"\n{'='*60}")
-    print(f"[Step 3: Concept] 실행 시작")
-    print(f"{'='*60}")
-    
+    logger.info("[Step 3: Concept] 실행 시작")
+
     # 1. 입력 검증
     step_3_qa = state.get("step_3_qa")
     if not validate_step_input(3, {"answers": step_3_qa} if step_3_qa else None):
         state["error_occurred"] = True
         state["error_message"] = "Step 3 Q&A 데이터가 없습니다."
-        return state
+        return None
 
     # Context 확인
     diagnosis_context = state.get("diagnosis_context")
     naming_context = state.get("naming_context")
-    
+
     # [수정] Naming Context Flattening (Backend 리스트 대응)
     if naming_context:
-        naming_context = flatten_context(naming_context, step_3_qa)
-    
+        naming_context = flatten_context(naming_context, step_3_qa, "naming")
+
     # 방어 코드: Context가 dict가 아니면 빈 dict로 초기화
     if not isinstance(diagnosis_context, dict):
         diagnosis_context = {}
     if not isinstance(naming_context, dict):
         naming_context = {}
-    
+
     # 필수 데이터 확인 (brand_name 없으면 진행 불가)
     if not diagnosis_context or not naming_context.get("brand_name"):
         state["error_occurred"] = True
         state["error_message"] = "필수 Context (Diagnosis or Brand Name) 누락"
-        return state
-
-    
-    # 3. OpenAI 클라이언트
-    try:
-        client = get_openai_client()
-    except Exception as e:
-        print(f"[ERROR] Client Init Failed: {e}")
-        state["error_occurred"] = True
-        state["error_message"] = f"Client Error: {e}"
-        return state
+        return None
 
     # 4. 프롬프트 구성 (JSON 직접 전달)
     feedback_section = ""  # 재생성 기능 제거됨
@@ -72,44 +61,43 @@ def concept_node(state: BrandConsultingState) -> BrandConsultingState:
             diagnosis_summary=diagnosis_context.get("diagnosis_summary", "No diagnosis summary"),
             brand_name=naming_context.get("brand_name", "Brand"),
             name_rationale=naming_context.get("name_rationale", ""),
-            qa_data_json=json.dumps(step_3_qa, ensure_ascii=False, indent=2),
+            qa_data_json=qa_prompt_json(step_3_qa),
             feedback_section=feedback_section
         )
     except Exception as e:
-        print(f"[ERROR] Prompt Formatting Failed: {e}")
+        logger.error("[Step 3] Prompt Formatting Failed: %s", e)
         state["error_occurred"] = True
         state["error_message"] = f"Prompt Error: {e}"
-        return state
+        return None
 
-    # 5. GPT-5.1생성
-    try:
-        print("[Step 3] GPT-5.1 컨셉 후보 3개 생성 중...")
-        resp = client.chat.completions.create(
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={"type": "json_object"}
-        )
-        result_data = json.loads(resp.choices[0].message.content)
-        concept_options = result_data.get("options", [])
-        
-        if len(concept_options) < 3:
-            print(f"[Step 3] ⚠️ 부족한 후보 수 자동 보완")
-            while len(concept_options) < 3:
-                concept_options.append({
-                    "concept_statement": f"Concept {len(concept_options)+1}",
-                    "concept_rationale": "Generated as filler"
-                })
+    return system_prompt, user_prompt
 
-    except Exception as e:
-        print(f"[Step 3] ❌ 생성 실패: {e}")
-        concept_options = [
-             {"concept_statement": "Error", "concept_rationale": "Failed"} 
-             for _ in range(3)
-        ]
 
+def _parse_concept_options(content: str) -> List[Dict[str, Any]]:
+    """GPT 응답 파싱 및 후보 개수 보정"""
+    concept_options = parse_options(content)  # 잘린 응답/앞뒤 텍스트가 섞인 응답은 완성된 후보만 복구
+
+    if len(concept_options) < 3:
+        logger.warning("[Step 3] 부족한 후보 수 자동 보완 (%d개)", len(concept_options))
+        while len(concept_options) < 3:
+            concept_options.append({
+                "concept_statement": f"Concept {len(concept_options)+1}",
+                "concept_rationale": "Generated as filler"
+            })
+
+    return concept_options
+
+
+def _error_concept_options(e: Exception) -> List[Dict[str, Any]]:
+    logger.error("[Step 3] 생성 실패: %s", e)
+    return [
+         {"concept_statement": "Error", "concept_rationale": "Failed"}
+         for _ in range(3)
+    ]
+
+
+def _apply_concept(state: BrandConsultingState, concept_options: List[Dict[str, Any]]) -> BrandConsultingState:
+    """후보 구조 변환 및 State 반영 (동기/비동기 노드 공용)"""
     # 6. Candidates 구조 변환
     candidates = []
     for i, option in enumerate(concept_options[:3]):
@@ -117,13 +105,77 @@ def concept_node(state: BrandConsultingState) -> BrandConsultingState:
             "candidate_id": i,
             "output": option  # 핵심 데이터
         })
-    
+
     state["concept_candidates"] = candidates
     state["current_step"] = 4
-    
-    print(f"[Step 3] ✅ 후보 생성 완료 ({len(candidates)}개)")
-    for c in candidates:
-        print(f"  - {c['output'].get('concept_statement', '')[:30]}...")
-    print(f"{'='*60}\n")
-    
+
+    logger.info("[Step 3] 후보 생성 완료 (%d개): %s", len(candidates),
+                [c["output"].get("concept_statement", "")[:30] for c in candidates])
+    log_payload(logger, "[Step 3] 후보 상세", candidates)
+
     return state
+
+
+def concept_node(state: BrandConsultingState) -> BrandConsultingState:
+    """
+    Step 3: Concept Node
+
+    [Input]
+    - diagnosis_context: Step 1 진단 Context
+    - naming_context: Step 2에서 선택된 브랜드명 Context
+    - step_3_qa: 사용자 Concept 관련 Q&A
+
+    [Output]
+    - concept_candidates: 3가지 컨셉 후보
+      (concept_statement, concept_rationale, brand_values)
+    """
+    prompts = _prepare_concept(state)
+    if prompts is None:
+        return state
+
+    # 3. OpenAI 클라이언트
+    try:
+        client = get_openai_client()
+    except Exception as e:
+        logger.error("[Step 3] Client Init Failed: %s", e)
+        state["error_occurred"] = True
+        state["error_message"] = f"Client Error: {e}"
+        return state
+
+    # 5. GPT-5.1생성
+    try:
+        logger.info("[Step 3] GPT-5.1 컨셉 후보 3개 생성 중")
+        concept_options = _parse_concept_options(chat_json_streamed(client, *prompts, step=3))
+    except Exception as e:
+        concept_options = _error_concept_options(e)
+
+    return _apply_concept(state, concept_options)
+
+
+async def aconcept_node(state: BrandConsultingState) -> BrandConsultingState:
+    """
+    Step 3: Concept Node (비동기 버전, ainvoke 경로)
+
+    concept_node와 동일한 처리를 AsyncOpenAI 클라이언트로 수행
+    """
+    prompts = _prepare_concept(state)
+    if prompts is None:
+        return state
+
+    # 3. OpenAI 클라이언트
+    try:
+        client = get_async_openai_client()
+    except Exception as e:
+        logger.error("[Step 3] Client Init Failed: %s", e)
+        state["error_occurred"] = True
+        state["error_message"] = f"Client Error: {e}"
+        return state
+
+    # 5. GPT-5.1생성
+    try:
+        logger.info("[Step 3] GPT-5.1 컨셉 후보 3개 생성 중")
+        concept_options = _parse_concept_options(await achat_json_streamed(client, *prompts, step=3))
+    except Exception as e:
+        concept_options = _error_concept_options(e)
+
+    return _apply_concept(state, concept_options)
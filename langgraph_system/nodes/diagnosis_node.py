@@ -3,79 +3,101 @@ Step 1: Diagnosis Node
 초기 진단 단계 - 비즈니스 핵심 파악
 """
 from langgraph_system.state import BrandConsultingState, get_cumulative_key
-from langgraph_system.utils import get_openai_client, validate_step_input
+from langgraph_system.utils import get_openai_client, get_async_openai_client, validate_step_input, qa_prompt_json
 from langgraph_system.prompts import GenerationPrompts
+from langgraph_system.llm import chat_json
+from langgraph_system.streaming import achat_json_streamed, stream_enabled
+from langgraph_system.cache import diagnosis_cache, diagnosis_cache_key
+from langgraph_system.log import get_logger
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import copy
 import json
 
+logger = get_logger("nodes.diagnosis")
 
-def diagnosis_node(state: BrandConsultingState) -> BrandConsultingState:
+# 실행 중인 진단 GPT 호출 (캐시 키 → Task, 같은 이벤트 루프 기준)
+_inflight: Dict[str, "asyncio.Task"] = {}
+
+
+def _prepare_diagnosis(state: BrandConsultingState) -> Optional[Tuple[str, str]]:
     """
-    Step 1: 초기 진단 노드 (Diagnosis)
-    
-    [Input]
-    - step_1_qa: 사용자 응답 데이터
-    
-    [Process]
-    - Business, User, Market 3가지 관점 분석
-    - 종합 진단 요약, 핵심 키워드, 타겟 페르소나 추출
-    
-    [Output]
-    - diagnosis_result: 전체 분석 결과 (JSON)
-    - diagnosis_context: 다음 단계 전달용 핵심 데이터 Subset
+    입력 검증 및 프롬프트 준비 (동기/비동기 노드 공용)
+
+    Returns:
+        (system_prompt, user_prompt) / 검증 실패 시 None (state에 에러 기록)
     """
-    print(f"\n{'='*60}")
-    print(f"[Step 1: Diagnosis] 실행 시작")
-    print(f"{'='*60}")
-    
+    logger.info("[Step 1: Diagnosis] 실행 시작")
+
     # 1. 입력 검증
     step_1_qa = state.get("step_1_qa")
     if not validate_step_input(1, {"answers": step_1_qa} if step_1_qa else None):
         state["error_occurred"] = True
         state["error_message"] = "Step 1 Q&A 데이터가 없습니다."
-        return state
-    
-    
-    # 3. OpenAI 클라이언트 생성
-    try:
-        client = get_openai_client()
-    except Exception as e:
-        state["error_occurred"] = True
-        state["error_message"] = f"OpenAI 클라이언트 생성 실패: {e}"
-        return state
-    
+        return None
+
     # 4. 프롬프트 준비 (JSON 직접 전달)
     system_prompt = GenerationPrompts.DIAGNOSIS_SYSTEM
     user_prompt = GenerationPrompts.DIAGNOSIS_USER.format(
-        qa_data_json=json.dumps(step_1_qa, ensure_ascii=False, indent=2)
+        qa_data_json=qa_prompt_json(step_1_qa)
     )
-    
-    # 5. GPT-5.1 호출
-    try:
-        print("[Step 1] GPT-5.1 비즈니스 진단 분석 중...")
-        resp = client.chat.completions.create(
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={"type": "json_object"}
-        )
-        analysis_data = json.loads(resp.choices[0].message.content)
-        print("[Step 1] 분석 완료: 3가지 관점 및 핵심 요소 추출됨")
-        
-    except Exception as e:
-        print(f"[Step 1] ❌ GPT-5.1 분석 실패: {e}")
-        # 실패 시 기본값 (Fallback)
-        analysis_data = {
-            "summary": "분석 실패 (기본값)",
-            "keywords": ["Error"],
-            "persona": "Unknown",
-            "perspectives": {},
-            "brand_essence": "",
-            "emotional_core": "",
-            "differentiation_point": ""
-        }
-    
+    return system_prompt, user_prompt
+
+
+def _lookup_cache(state: BrandConsultingState) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    진단 캐시 조회 (동일 Q&A + 동일 프롬프트/모델이면 GPT-5.1 호출 생략)
+
+    Returns:
+        (cache_key, cached_analysis) / 캐시 미사용 요청이면 (None, None)
+    """
+    if state.get("use_cache") is False:
+        return None, None
+
+    cache_key = diagnosis_cache_key(state.get("step_1_qa"))
+    cached = diagnosis_cache.get(cache_key)
+    if cached is not None:
+        logger.info("[Step 1] 캐시 적중 - GPT-5.1 호출 생략")
+    return cache_key, cached
+
+
+async def _shared_analysis(cache_key: Optional[str],
+                           call: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    같은 Q&A의 진단 GPT 호출이 실행 중이면 그 결과를 공유 (요청별 output_id / 세션은 그대로 분리)
+    캐시 미사용 요청(cache_key 없음)과 스트리밍 실행(토큰 이벤트 필요)은 병합하지 않음
+    호출은 별도 Task로 실행되어 먼저 들어온 요청이 취소되어도 기다리는 요청에는 영향 없음
+    """
+    if cache_key is None or stream_enabled():
+        return await call()
+
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(call())
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+    else:
+        logger.info("[Step 1] 동일 Q&A 진단 실행 중 - GPT-5.1 결과 공유 대기")
+    return copy.deepcopy(await asyncio.shield(task))  # 요청별 state가 같은 객체를 공유하지 않도록 복사
+
+
+def _fallback_analysis() -> Dict[str, Any]:
+    """GPT-5.1 분석 실패 시 기본값 (Fallback)"""
+    return {
+        "summary": "분석 실패 (기본값)",
+        "keywords": ["Error"],
+        "persona": "Unknown",
+        "perspectives": {},
+        "brand_essence": "",
+        "emotional_core": "",
+        "differentiation_point": ""
+    }
+
+
+def _apply_diagnosis(state: BrandConsultingState, analysis_data: Dict[str, Any]) -> BrandConsultingState:
+    """분석 결과를 State에 반영 (동기/비동기 노드 공용)"""
+    step_1_qa = state.get("step_1_qa")
+
     # 6. 결과 구성
     # 6-1. Diagnosis Result (전체 저장용)
     diagnosis_output = {
@@ -87,13 +109,13 @@ def diagnosis_node(state: BrandConsultingState) -> BrandConsultingState:
         "emotional_core": analysis_data.get("emotional_core", ""),
         "differentiation_point": analysis_data.get("differentiation_point", "")
     }
-    
+
     diagnosis_result = {
         "qa": step_1_qa,
         "analysis": diagnosis_output
     }
     state["diagnosis_result"] = diagnosis_result
-    
+
     # 6-2. Diagnosis Context (다음 단계 전달용 - 강화)
     diagnosis_context = {
         "diagnosis_summary": diagnosis_output["summary"],
@@ -107,18 +129,104 @@ def diagnosis_node(state: BrandConsultingState) -> BrandConsultingState:
     }
     state["diagnosis_context"] = diagnosis_context
     state["step_1_analysis"] = diagnosis_output  # 기존 호환성 유지
-    
-    print(f"[Step 1] Context 설정 완료: {list(diagnosis_context.keys())}")
+
+    logger.debug("[Step 1] Context 설정 완료: %s", list(diagnosis_context.keys()))
 
     # 6. DB 저장 (제거됨 - Pure Logic)
     # Backend에서 처리
-    
+
     # 7. 상태 업데이트
     state["current_step"] = 2
-    
-    print(f"[Step 1] ✅ 완료")
-    print(f"  - 키워드: {diagnosis_output['keywords']}")
-    print(f"  - 페르소나: {diagnosis_output['persona']}")
-    print(f"{'='*60}\n")
-    
+
+    logger.info("[Step 1] 완료 - 키워드: %s, 페르소나: %s", diagnosis_output["keywords"], diagnosis_output["persona"])
+
     return state
+
+
+def diagnosis_node(state: BrandConsultingState) -> BrandConsultingState:
+    """
+    Step 1: 초기 진단 노드 (Diagnosis)
+
+    [Input]
+    - step_1_qa: 사용자 응답 데이터
+    - use_cache: False이면 진단 캐시를 사용하지 않음 (기본: 사용)
+
+    [Process]
+    - Business, User, Market 3가지 관점 분석
+    - 종합 진단 요약, 핵심 키워드, 타겟 페르소나 추출
+
+    [Output]
+    - diagnosis_result: 전체 분석 결과 (JSON)
+    - diagnosis_context: 다음 단계 전달용 핵심 데이터 Subset
+    """
+    prompts = _prepare_diagnosis(state)
+    if prompts is None:
+        return state
+
+    cache_key, cached = _lookup_cache(state)
+    if cached is not None:
+        return _apply_diagnosis(state, cached)
+
+    # 3. OpenAI 클라이언트 생성
+    try:
+        client = get_openai_client()
+    except Exception as e:
+        state["error_occurred"] = True
+        state["error_message"] = f"OpenAI 클라이언트 생성 실패: {e}"
+        return state
+
+    # 5. GPT-5.1 호출
+    try:
+        logger.info("[Step 1] GPT-5.1 비즈니스 진단 분석 중")
+        analysis_data = json.loads(chat_json(client, *prompts))
+        logger.info("[Step 1] 분석 완료: 3가지 관점 및 핵심 요소 추출됨")
+        if cache_key:
+            diagnosis_cache.set(cache_key, analysis_data)  # 실패(Fallback) 결과는 캐시하지 않음
+
+    except Exception as e:
+        logger.error("[Step 1] GPT-5.1 분석 실패: %s", e)
+        analysis_data = _fallback_analysis()
+
+    return _apply_diagnosis(state, analysis_data)
+
+
+async def adiagnosis_node(state: BrandConsultingState) -> BrandConsultingState:
+    """
+    Step 1: 초기 진단 노드 (비동기 버전, ainvoke 경로)
+
+    diagnosis_node와 동일한 처리를 AsyncOpenAI 클라이언트로 수행하여
+    GPT-5.1 응답 대기 중 이벤트 루프를 점유하지 않음
+    """
+    prompts = _prepare_diagnosis(state)
+    if prompts is None:
+        return state
+
+    cache_key, cached = _lookup_cache(state)
+    if cached is not None:
+        return _apply_diagnosis(state, cached)
+
+    # 3. OpenAI 클라이언트 생성
+    try:
+        client = get_async_openai_client()
+    except Exception as e:
+        state["error_occurred"] = True
+        state["error_message"] = f"OpenAI 클라이언트 생성 실패: {e}"
+        return state
+
+    # 5. GPT-5.1 호출 (동일 Q&A 동시 요청은 1회만)
+    async def analyze() -> Dict[str, Any]:
+        logger.info("[Step 1] GPT-5.1 비즈니스 진단 분석 중")
+        analysis_data = json.loads(await achat_json_streamed(client, *prompts, step=1))
+        logger.info("[Step 1] 분석 완료: 3가지 관점 및 핵심 요소 추출됨")
+        if cache_key:
+            diagnosis_cache.set(cache_key, analysis_data)  # 실패(Fallback) 결과는 캐시하지 않음
+        return analysis_data
+
+    try:
+        analysis_data = await _shared_analysis(cache_key, analyze)
+
+    except Exception as e:
+        logger.error("[Step 1] GPT-5.1 분석 실패: %s", e)
+        analysis_data = _fallback_analysis()
+
+    return _apply_diagnosis(state, analysis_data)
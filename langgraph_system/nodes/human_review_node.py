@@ -4,6 +4,9 @@ Human Review Node
 - 선택(0, 1, 2): 3개 후보 중 1개 선택
 """
 from langgraph_system.state import BrandConsultingState
+from langgraph_system.log import get_logger
+
+logger = get_logger("nodes.human_review")
 
 def human_review_node(state: BrandConsultingState) -> BrandConsultingState:
     """
@@ -18,7 +21,7 @@ def human_review_node(state: BrandConsultingState) -> BrandConsultingState:
     user_choice = state.get("user_choice")
     current_step = state.get("current_step")
     
-    print(f"\n[Human Review] 사용자 선택 처리: {user_choice}")
+    logger.info("[Human Review] 사용자 선택 처리: %s", user_choice)
     
     # 후보 선택 (0, 1, 2)
     try:
@@ -26,7 +29,7 @@ def human_review_node(state: BrandConsultingState) -> BrandConsultingState:
         if selected_idx not in [0, 1, 2]:
             raise ValueError("Invalid index")
     except (ValueError, TypeError):
-        print(f"[Human Review] ❌ 잘못된 선택: {user_choice}")
+        logger.error("[Human Review] 잘못된 선택: %s", user_choice)
         state["error_occurred"] = True
         state["error_message"] = f"잘못된 선택값: {user_choice}"
         return state
@@ -42,7 +45,7 @@ def human_review_node(state: BrandConsultingState) -> BrandConsultingState:
     
     # Step 1은 후보가 없으므로 매핑 없음 (Diagnosis는 Node 내부에서 이미 Context 생성함)
     if current_step not in step_mappings:
-        print(f"[Human Review] ⚠️ Step {current_step}은 후보 선택 대상이 아닙니다.")
+        logger.warning("[Human Review] Step %s은 후보 선택 대상이 아닙니다.", current_step)
         return {
             "quality_check_passed": True,
             "quality_check_passed": True,
@@ -54,7 +57,7 @@ def human_review_node(state: BrandConsultingState) -> BrandConsultingState:
     
     # 4. 후보 유효성 검증
     if not candidates or selected_idx >= len(candidates):
-        print(f"[Human Review] ❌ 후보가 없거나 인덱스 초과 (max: {len(candidates)-1})")
+        logger.error("[Human Review] 후보가 없거나 인덱스 초과 (max: %s)", len(candidates)-1)
         state["error_occurred"] = True
         state["error_message"] = "후보 데이터가 없거나 인덱스가 범위를 초과했습니다."
         return state
@@ -94,9 +97,9 @@ def human_review_node(state: BrandConsultingState) -> BrandConsultingState:
             "logo_rationale": output_data.get("logo_rationale")
         }
 
-    print(f"\n[Human Review] ✅ 선택 완료: 후보 {selected_idx}")
-    print(f"[Human Review] Full Result 저장 -> {result_key}")
-    print(f"[Human Review] Core Context 저장 -> {context_key}: {list(core_context.keys())}")
+    logger.info("[Human Review] 선택 완료: 후보 %s", selected_idx)
+    logger.info("[Human Review] Full Result 저장 -> %s", result_key)
+    logger.info("[Human Review] Core Context 저장 -> %s: %s", context_key, list(core_context.keys()))
     
     return {
         result_key: final_result,
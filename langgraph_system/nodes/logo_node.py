@@ -3,34 +3,54 @@ Step 5: Logo Node
 로고 디자인 가이드 생성 + 이미지 자동 생성 + Brand Consulting Report 생성
 """
 from langgraph_system.state import BrandConsultingState
-from langgraph_system.utils import get_openai_client, validate_step_input, flatten_context
+from langgraph_system.utils import (
+    get_openai_client, get_async_openai_client, get_gemini_client, validate_step_input, flatten_context,
+    qa_prompt_json
+)
 from langgraph_system.prompts import GenerationPrompts
-import json
+from langgraph_system.llm import generate_image, agenerate_image
+from langgraph_system.streaming import chat_json_streamed, achat_json_streamed, emit
+from langgraph_system.json_stream import parse_options
+from langgraph_system.executor import run_in_pool, IMAGE_POOL
+from langgraph_system.providers import provider_registry
+from langgraph_system.metrics import UPLOAD_LATENCY, observe, record_error
+from langgraph_system.log import get_logger, log_payload
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import contextvars
+import math
 import os
 
-def logo_node(state: BrandConsultingState) -> BrandConsultingState:
+# 이미지 파이프라인 설정 (생성 → 저장 → 업로드)
+# LOGO_IMAGE_CONCURRENCY: 동시에 처리할 이미지 수
+# LOGO_IMAGE_TIMEOUT: 이미지 1장 파이프라인 제한 시간 (초), 초과 시 해당 후보 URL은 None
+LOGO_IMAGE_CONCURRENCY = max(1, int(os.getenv("LOGO_IMAGE_CONCURRENCY", "3")))
+LOGO_IMAGE_TIMEOUT = float(os.getenv("LOGO_IMAGE_TIMEOUT", "120"))
+LOGO_CANDIDATE_COUNT = 3
+# 로컬 이미지 저장 위치 (api/config.py OUTPUTS_DIR과 동일)
+OUTPUTS_DIR = os.getenv("OUTPUTS_DIR", "Test/outputs")
+
+logger = get_logger("nodes.logo")
+
+
+def _prepare_logo(state: BrandConsultingState) -> Optional[Tuple[str, str, str]]:
     """
-    Step 5: 로고 디자인 가이드 생성 + 이미지 자동 생성 + Report
-    
-    [Process]
-    1. GPT-5.1: 로고 컨셉 및 DALL-E 프롬프트 3가지 생성
-    2. Gemini 3 Pro: 생성된 3가지 프롬프트로 즉시 이미지 생성
-    3. Brand Consulting Report: 최종 리포트 생성
-    
-    [Output]
-    - logo_candidates: logo_concept, logo_image_url
+    입력 검증, Context 평탄화 및 프롬프트 생성 (동기/비동기 노드 공용)
+
+    Returns:
+        (system_prompt, user_prompt, brand_name) / 검증 실패 시 None (state에 에러 기록)
     """
-    print(f"\n{'='*60}")
-    print(f"[Step 5: Logo] 실행 시작")
-    print(f"{'='*60}")
-    
+    logger.info("[Step 5: Logo] 실행 시작")
+
     # 1. 입력 검증
     step_5_qa = state.get("step_5_qa")
     if not validate_step_input(5, {"answers": step_5_qa} if step_5_qa else None):
         state["error_occurred"] = True
         state["error_message"] = "Step 5 Q&A 데이터가 없습니다."
-        return state
-    
+        return None
+
     # 2. Context 확인
     naming_context = state.get("naming_context")
     concept_context = state.get("concept_context")
@@ -39,24 +59,15 @@ def logo_node(state: BrandConsultingState) -> BrandConsultingState:
 
     # [수정] Context Flattening (Backend 리스트 대응)
     if naming_context:
-        naming_context = flatten_context(naming_context, step_5_qa)
+        naming_context = flatten_context(naming_context, step_5_qa, "naming")
     if concept_context:
-        concept_context = flatten_context(concept_context, step_5_qa)
+        concept_context = flatten_context(concept_context, step_5_qa, "concept")
     if story_context:
-        story_context = flatten_context(story_context, step_5_qa)
+        story_context = flatten_context(story_context, step_5_qa, "story")
 
     if not all([naming_context, concept_context, story_context, diagnosis_context]):
-        print("⚠️ [Step 5] 일부 이전 단계 Context가 누락되었습니다.")
+        logger.warning("[Step 5] 일부 이전 단계 Context가 누락되었습니다.")
 
-    
-    # 4. OpenAI 클라이언트
-    try:
-        client = get_openai_client()
-    except Exception as e:
-        state["error_occurred"] = True
-        state["error_message"] = f"Client Error: {e}"
-        return state
-    
     # 5. 프롬프트 구성 (JSON 직접 전달)
     feedback_section = ""  # 재생성 기능 제거됨
 
@@ -67,68 +78,53 @@ def logo_node(state: BrandConsultingState) -> BrandConsultingState:
         concept_statement=concept_context.get("concept_statement", "") if concept_context else "",
         brand_story=story_context.get("brand_story", "") if story_context else "",
         core_keywords=str(diagnosis_context.get("core_keywords", [])) if diagnosis_context else "",
-        qa_data_json=json.dumps(step_5_qa, ensure_ascii=False, indent=2),
+        qa_data_json=qa_prompt_json(step_5_qa),
         feedback_section=feedback_section
     )
-    
-    # 6. GPT-5.1 로고 컨셉 및 프롬프트 생성
-    logo_options = []
-    try:
-        print("[Step 5] 1단계: GPT-5.1 로고 프롬프트 작성 중...")
-        resp = client.chat.completions.create(
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={"type": "json_object"}
-        )
-        logo_response = json.loads(resp.choices[0].message.content)
-        logo_options = logo_response.get("options", [])
-        
-        if len(logo_options) < 3:
-            while len(logo_options) < 3:
-                logo_options.append({
-                    "logo_concept": f"Logo {len(logo_options)+1}",
-                    "dalle_prompt": "Create a modern logo",
-                    "color_palette": []
-                })
-        
-    except Exception as e:
-        print(f"[Step 5] ❌ 컨셉 생성 실패: {e}")
-        state["error_occurred"] = True
-        state["error_message"] = str(e)
-        return state
+    brand_name = naming_context.get("brand_name", "Brand") if naming_context else "Brand"
+    return system_prompt, user_prompt, brand_name
 
-    output_id = state.get("output_id", "unknown")
-    brand_name = naming_context.get("brand_name", "Brand")
-    
-    # 로컬 저장 디렉토리 설정 (각 브랜드 폴더 내부)
-    import requests
-    from pathlib import Path
-    
-    # output_id를 폴더명으로 사용 (예: output_01)
-    logo_images_dir = Path(f"Test/outputs/{output_id}")
-    logo_images_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Wordmark 중심 프롬프트 생성 함수
-    def create_gemini_prompt(brand_name, style_keywords, color_palette,
-                            benchmark_brand, visual_instruction, layout_type):
-        """
-        글로벌 기업 느낌의 로고 프롬프트 생성
-        """
-        colors_str = ", ".join(color_palette) if color_palette else "Black"
-
-        if layout_type == "Horizontal":
-            layout_directive = "LAYOUT: Small geometric symbol on LEFT, brand name text on RIGHT."
-        elif layout_type == "Integrated":
-            layout_directive = "LAYOUT: Text itself becomes symbol by modifying one letter."
-        elif layout_type == "Stacked":
-            layout_directive = "LAYOUT: Small symbol ABOVE, brand name BELOW."
-        else:
-            layout_directive = "LAYOUT: Clean horizontal."
-
-        prompt = f"""
+
+def _parse_logo_options(content: str) -> List[Dict[str, Any]]:
+    """GPT 응답 파싱 및 후보 개수 보정"""
+    logo_options = parse_options(content)  # 잘린 응답/앞뒤 텍스트가 섞인 응답은 완성된 후보만 복구
+
+    if len(logo_options) < LOGO_CANDIDATE_COUNT:
+        while len(logo_options) < LOGO_CANDIDATE_COUNT:
+            logo_options.append({
+                "logo_concept": f"Logo {len(logo_options)+1}",
+                "dalle_prompt": "Create a modern logo",
+                "color_palette": []
+            })
+
+    return logo_options
+
+
+def _concept_failed(state: BrandConsultingState, e: Exception) -> BrandConsultingState:
+    logger.error("[Step 5] 컨셉 생성 실패: %s", e)
+    state["error_occurred"] = True
+    state["error_message"] = str(e)
+    return state
+
+
+# Wordmark 중심 프롬프트 생성 함수
+def create_gemini_prompt(brand_name, style_keywords, color_palette,
+                        benchmark_brand, visual_instruction, layout_type):
+    """
+    글로벌 기업 느낌의 로고 프롬프트 생성
+    """
+    colors_str = ", ".join(color_palette) if color_palette else "Black"
+
+    if layout_type == "Horizontal":
+        layout_directive = "LAYOUT: Small geometric symbol on LEFT, brand name text on RIGHT."
+    elif layout_type == "Integrated":
+        layout_directive = "LAYOUT: Text itself becomes symbol by modifying one letter."
+    elif layout_type == "Stacked":
+        layout_directive = "LAYOUT: Small symbol ABOVE, brand name BELOW."
+    else:
+        layout_directive = "LAYOUT: Clean horizontal."
+
+    prompt = f"""
 {layout_directive}
 
 {visual_instruction}
@@ -170,160 +166,368 @@ FORBIDDEN:
 
 The logo must look like a Fortune 100 brand identity.
 """
-        return prompt.strip()
+    return prompt.strip()
 
-    
-    candidates = []
-    print(f"\n[Step 5] 2단계: DALL-E 3 이미지 생성 시작 (총 {len(logo_options)}장)")
-    
-    for idx, opt in enumerate(logo_options):
-        # GPT에서 받은 변수 추출
-        style_keywords = opt.get("style_keywords", ["Corporate"])
-        color_palette = opt.get("color_palette", ["#000000"])
-        benchmark_brand = opt.get("benchmark_brand", "Apple")
-        layout_type = opt.get("layout_type", "Horizontal") # 기획 단계에서 결정된 레이아웃
-        
-        # [수정] visual_instruction을 가져오되, 없으면 기본값 설정
-        visual_instruction = opt.get("visual_instruction", f"The brand name '{brand_name}' written in bold sans-serif font. A small dot accent in the brand color.")
-        
-        # [수정] create_dalle_prompt 호출 (layout_type 추가)
-        gemini_prompt = create_gemini_prompt(
-            brand_name, 
-            style_keywords, 
-            color_palette, 
-            benchmark_brand, 
-            visual_instruction,
-            layout_type
-        )
-        
-        print(f"  - [Image {idx+1}/{len(logo_options)}] 생성 중...")
-        print(f"    Style: {', '.join(style_keywords)}")
-        print(f"    Colors: {', '.join(color_palette)}")
-        print(f"    Benchmark: {benchmark_brand}")
-        
-        image_url = None
-        local_image_path = None
-        
-        try:
-            # Gemini 3 Pro Image Preview API 호출
-            import base64
-            from io import BytesIO
-            from PIL import Image
-            from dotenv import load_dotenv
-            from langgraph_system.utils import get_gemini_client
-            
-            # .env 로드
-            load_dotenv()
-            
-            # Gemini 클라이언트 생성
-            gemini_client = get_gemini_client()
-            
-            print(f"    🚀 Gemini 3 Pro Image Preview 요청 중...")
-            
-            # Gemini API 호출 (문서 기준)
-            from google.genai import types
-            
-            response = gemini_client.models.generate_content(
-                model="gemini-3-pro-image-preview",
-                contents=[gemini_prompt],
-                config=types.GenerateContentConfig(
-                    response_modalities=['Image'],  # 이미지만 반환
-                    image_config=types.ImageConfig(
-                        aspect_ratio="1:1",  # 정사각형 로고
-                        image_size="2K"      # 고해상도
-                    )
-                )
+
+def _build_image_prompt(idx: int, total: int, opt: Dict[str, Any], brand_name: str) -> str:
+    """후보 옵션에서 Gemini 프롬프트 생성 및 요청 정보 출력"""
+    # GPT에서 받은 변수 추출
+    style_keywords = opt.get("style_keywords", ["Corporate"])
+    color_palette = opt.get("color_palette", ["#000000"])
+    benchmark_brand = opt.get("benchmark_brand", "Apple")
+    layout_type = opt.get("layout_type", "Horizontal") # 기획 단계에서 결정된 레이아웃
+
+    # [수정] visual_instruction을 가져오되, 없으면 기본값 설정
+    visual_instruction = opt.get("visual_instruction", f"The brand name '{brand_name}' written in bold sans-serif font. A small dot accent in the brand color.")
+
+    # [수정] create_dalle_prompt 호출 (layout_type 추가)
+    gemini_prompt = create_gemini_prompt(
+        brand_name,
+        style_keywords,
+        color_palette,
+        benchmark_brand,
+        visual_instruction,
+        layout_type
+    )
+
+    logger.info("[Image %d/%d] 생성 중", idx + 1, total)
+    log_payload(logger, "[Image %d/%d] 스타일", {
+        "style_keywords": style_keywords,
+        "color_palette": color_palette,
+        "benchmark_brand": benchmark_brand,
+        "prompt": gemini_prompt
+    }, idx + 1, total)
+
+    return gemini_prompt
+
+
+def _save_and_upload(image_bytes: bytes, idx: int, logo_images_dir: Path, output_id: str) -> str:
+    """
+    로컬 저장 + Cloudinary 업로드 (동기, 비동기 경로에서는 스레드 풀에서 실행)
+
+    Returns:
+        Public URL (업로드 실패 시 로컬 경로)
+    """
+    # 1. 로컬에 이미지 저장 (base64 확인용)
+    filename = f"logo_{idx+1}.png"
+    filepath = logo_images_dir / filename
+
+    with open(filepath, "wb") as f:
+        f.write(image_bytes)
+
+    logger.debug("[Image %d] 로컬 저장 완료: %s", idx + 1, filepath)
+
+    # 2. Cloudinary 업로드 (Public URL 생성)
+    try:
+        import cloudinary.uploader
+
+        # Cloudinary 설정 (.env에서 로드, 프로세스당 1회)
+        provider_registry.configure_cloudinary()
+
+        # 이미지 업로드
+        with observe(UPLOAD_LATENCY, "upload"):
+            upload_result = cloudinary.uploader.upload(
+                str(filepath),
+                folder=f"logos/{output_id}",
+                public_id=f"logo_{idx+1}",
+                overwrite=True,
+                resource_type="image"
             )
-            
-            # 이미지 추출 및 저장
-            image_saved = False
-            
-            # Gemini 응답에서 이미지 추출
-            if response.parts:
-                for part in response.parts:
-                    # inline_data 또는 file_data 확인
-                    if hasattr(part, 'inline_data') and part.inline_data:
-                        image_data = part.inline_data.data
-                    elif hasattr(part, 'text'):
-                        # 텍스트 응답인 경우 건너뛰기
-                        continue
-                    else:
-                        continue
-                    
-                    # 이미지 데이터가 base64 문자열인 경우 디코딩
-                    if isinstance(image_data, str):
-                        import base64
-                        image_bytes = base64.b64decode(image_data)
-                    else:
-                        image_bytes = image_data
-                    
-                    # 1. 로컬에 이미지 저장 (base64 확인용)
-                    filename = f"logo_{idx+1}.png"
-                    filepath = logo_images_dir / filename
-                    
-                    with open(filepath, "wb") as f:
-                        f.write(image_bytes)
-                    
-                    local_image_path = str(filepath)
-                    print(f"    💾 로컬 저장 완료: {filepath}")
-                    
-                    # 2. Cloudinary 업로드 (Public URL 생성)
-                    try:
-                        import cloudinary
-                        import cloudinary.uploader
-                        
-                        # Cloudinary 설정 (.env에서 로드)
-                        cloudinary.config(
-                            cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-                            api_key=os.getenv("CLOUDINARY_API_KEY"),
-                            api_secret=os.getenv("CLOUDINARY_API_SECRET")
-                        )
-                        
-                        # 이미지 업로드
-                        upload_result = cloudinary.uploader.upload(
-                            str(filepath),
-                            folder=f"logos/{output_id}",
-                            public_id=f"logo_{idx+1}",
-                            overwrite=True,
-                            resource_type="image"
-                        )
-                        
-                        # Public URL 추출
-                        image_url = upload_result.get("secure_url")
-                        print(f"    ☁️ Cloudinary 업로드 완료: {image_url}")
-                        
-                    except Exception as cloudinary_error:
-                        # Cloudinary 업로드 실패 시 로컬 경로로 대체
-                        print(f"    ⚠️ Cloudinary 업로드 실패: {cloudinary_error}")
-                        print(f"    📍 로컬 경로로 대체됩니다.")
-                        image_url = str(filepath).replace("\\", "/")
-                    
-                    image_saved = True
-                    break
-            
-            if not image_saved:
-                raise Exception("Gemini 응답에서 이미지를 찾을 수 없습니다.")
-
-        except Exception as e:
-            print(f"    ❌ 이미지 생성 실패: {e}")
-            image_url = None
-        
-        candidates.append({
-            "candidate_id": idx,
-            "output": {
-                "logo_concept": opt.get("logo_concept", ""),
-                "logo_image_url": image_url,
-                "logo_rationale": opt.get("logo_rationale", ""),
-                "qa_analysis_summary": opt.get("qa_analysis_summary", ""),
-                "qa_keywords": opt.get("qa_keywords", []),
-                "color_palette": opt.get("color_palette", [])
-            }
-        })
-    
+
+        # Public URL 추출
+        image_url = upload_result.get("secure_url")
+        logger.info("[Image %d] Cloudinary 업로드 완료: %s", idx + 1, image_url)
+
+    except Exception as cloudinary_error:
+        # Cloudinary 업로드 실패 시 로컬 경로로 대체
+        logger.warning("[Image %d] Cloudinary 업로드 실패, 로컬 경로로 대체: %s", idx + 1, cloudinary_error)
+        image_url = str(filepath).replace("\\", "/")
+
+    return image_url
+
+
+def _render_logo(gemini_client: Any, gemini_prompt: str, idx: int,
+                 logo_images_dir: Path, output_id: str) -> Optional[str]:
+    """이미지 1장 생성 → 저장 → 업로드 (동기). 실패 시 None"""
+    try:
+        logger.debug("[Image %d] Gemini 3 Pro Image Preview 요청 중", idx + 1)
+        image_bytes = generate_image(gemini_client, gemini_prompt, timeout=LOGO_IMAGE_TIMEOUT)
+        if image_bytes is None:
+            record_error("image")
+            raise Exception("Gemini 응답에서 이미지를 찾을 수 없습니다.")
+        return _save_and_upload(image_bytes, idx, logo_images_dir, output_id)
+
+    except Exception as e:
+        logger.error("[Image %d] 이미지 생성 실패: %s", idx + 1, e)
+        return None
+
+
+async def _arender_logo(gemini_client: Any, gemini_prompt: str, idx: int,
+                        logo_images_dir: Path, output_id: str) -> Optional[str]:
+    """이미지 1장 생성 → 저장 → 업로드 (비동기). 실패 시 None"""
+    try:
+        logger.debug("[Image %d] Gemini 3 Pro Image Preview 요청 중", idx + 1)
+        image_bytes = await agenerate_image(gemini_client, gemini_prompt, timeout=LOGO_IMAGE_TIMEOUT)
+        if image_bytes is None:
+            record_error("image")
+            raise Exception("Gemini 응답에서 이미지를 찾을 수 없습니다.")
+        # 파일 저장/Cloudinary 업로드는 동기 API이므로 image 스레드 풀에서 실행 (텍스트 단계 풀과 분리)
+        return await run_in_pool(IMAGE_POOL, _save_and_upload, image_bytes, idx, logo_images_dir, output_id)
+
+    except Exception as e:
+        logger.error("[Image %d] 이미지 생성 실패: %s", idx + 1, e)
+        return None
+
+
+class _LogoRenderer:
+    """
+    후보 이미지 동시 처리 (동기 경로, 스레드 풀 사용)
+    GPT 응답 스트리밍 중 후보가 완성되는 즉시 start()로 이미지 파이프라인 시작
+    """
+
+    def __init__(self, gemini_client: Any, brand_name: str, output_id: str):
+        self.gemini_client = gemini_client
+        self.brand_name = brand_name
+        self.output_id = output_id
+        self._logo_images_dir: Optional[Path] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[Future, int] = {}
+        self._started = set()
+
+    def start(self, idx: int, opt: Dict[str, Any]):
+        """후보 1개 이미지 생성 시작 (이미 시작된 후보 / Gemini 클라이언트 없음이면 무시)"""
+        if self.gemini_client is None or idx in self._started:
+            return
+        self._started.add(idx)
+        if self._pool is None:
+            self._logo_images_dir = _logo_images_dir(self.output_id)
+            self._pool = ThreadPoolExecutor(max_workers=LOGO_IMAGE_CONCURRENCY, thread_name_prefix="logo-image")
+
+        prompt = _build_image_prompt(idx, LOGO_CANDIDATE_COUNT, opt, self.brand_name)
+        # 노드 컨텍스트(메트릭 step 등)를 작업 스레드로 전달
+        future = self._pool.submit(contextvars.copy_context().run, _render_logo, self.gemini_client, prompt, idx, self._logo_images_dir, self.output_id)
+        self._futures[future] = idx
+
+    def results(self, count: int) -> List[Optional[str]]:
+        """
+        Returns:
+            후보 순서대로 image_url 리스트 (실패/시간 초과/미시작은 None)
+        """
+        image_urls: List[Optional[str]] = [None] * count
+        if not self._futures:
+            return image_urls
+
+        # 동시 처리 수 제한으로 대기열이 생기는 경우를 감안한 전체 제한 시간
+        rounds = math.ceil(len(self._futures) / LOGO_IMAGE_CONCURRENCY)
+        done, not_done = wait(self._futures, timeout=LOGO_IMAGE_TIMEOUT * rounds)
+
+        for future in done:
+            idx = self._futures[future]
+            if idx < count:
+                image_urls[idx] = future.result()
+        for future in not_done:
+            logger.warning("[Image %d] 제한 시간 초과 (%ss)", self._futures[future] + 1, LOGO_IMAGE_TIMEOUT)
+
+        # 시간 초과 작업은 기다리지 않음 (부분 결과 반환)
+        self.cancel()
+        return image_urls
+
+    def cancel(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _AsyncLogoRenderer:
+    """
+    후보 이미지 동시 처리 (비동기 경로)
+    Semaphore로 동시 처리 수를 제한하고, 이미지별로 제한 시간 적용
+    GPT 응답 스트리밍 중 후보가 완성되는 즉시 start()로 이미지 파이프라인 시작
+    """
+
+    def __init__(self, gemini_client: Any, brand_name: str, output_id: str):
+        self.gemini_client = gemini_client
+        self.brand_name = brand_name
+        self.output_id = output_id
+        self._logo_images_dir: Optional[Path] = None
+        self._semaphore = asyncio.Semaphore(LOGO_IMAGE_CONCURRENCY)
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    def start(self, idx: int, opt: Dict[str, Any]):
+        """후보 1개 이미지 생성 시작 (이미 시작된 후보 / Gemini 클라이언트 없음이면 무시)"""
+        if self.gemini_client is None or idx in self._tasks:
+            return
+        if self._logo_images_dir is None:
+            self._logo_images_dir = _logo_images_dir(self.output_id)
+
+        prompt = _build_image_prompt(idx, LOGO_CANDIDATE_COUNT, opt, self.brand_name)
+        self._tasks[idx] = asyncio.ensure_future(self._run_one(idx, prompt))
+
+    async def _run_one(self, idx: int, prompt: str) -> Optional[str]:
+        async with self._semaphore:
+            try:
+                image_url = await asyncio.wait_for(
+                    _arender_logo(self.gemini_client, prompt, idx, self._logo_images_dir, self.output_id),
+                    timeout=LOGO_IMAGE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                logger.warning("[Image %d] 제한 시간 초과 (%ss)", idx + 1, LOGO_IMAGE_TIMEOUT)
+                image_url = None
+        # 스트리밍 모드: 업로드가 끝난 이미지부터 바로 전달 (실패 시 None)
+        emit("logo", {"step": 5, "id": idx, "logo_image_url": image_url})
+        return image_url
+
+    async def results(self, count: int) -> List[Optional[str]]:
+        """
+        Returns:
+            후보 순서대로 image_url 리스트 (실패/시간 초과/미시작은 None)
+        """
+        image_urls: List[Optional[str]] = [None] * count
+        indices = [idx for idx in self._tasks if idx < count]
+        urls = await asyncio.gather(*(self._tasks[idx] for idx in indices))
+        for idx, url in zip(indices, urls):
+            image_urls[idx] = url
+        return image_urls
+
+    def cancel(self):
+        for task in self._tasks.values():
+            task.cancel()
+
+
+def _gemini_client_or_none() -> Optional[Any]:
+    try:
+        return get_gemini_client()
+    except Exception as e:
+        logger.error("Gemini 클라이언트 생성 실패: %s", e)
+        return None
+
+
+def _logo_images_dir(output_id: str) -> Path:
+    # 로컬 저장 디렉토리 설정 (각 브랜드 폴더 내부)
+    # output_id를 폴더명으로 사용 (예: output_01)
+    logo_images_dir = Path(OUTPUTS_DIR) / output_id
+    logo_images_dir.mkdir(parents=True, exist_ok=True)
+    return logo_images_dir
+
+
+def _logo_candidate(idx: int, opt: Dict[str, Any], image_url: Optional[str]) -> Dict[str, Any]:
+    return {
+        "candidate_id": idx,
+        "output": {
+            "logo_concept": opt.get("logo_concept", ""),
+            "logo_image_url": image_url,
+            "logo_rationale": opt.get("logo_rationale", ""),
+            "qa_analysis_summary": opt.get("qa_analysis_summary", ""),
+            "qa_keywords": opt.get("qa_keywords", []),
+            "color_palette": opt.get("color_palette", [])
+        }
+    }
+
+
+def _apply_logo(state: BrandConsultingState, candidates: List[Dict[str, Any]]) -> BrandConsultingState:
     state["logo_candidates"] = candidates
     state["current_step"] = 6 # Human Review로 이동
-    
-    print(f"\n[Step 5] ✅ 로고 후보(이미지 포함) 생성 완료")
-    print(f"{'='*60}\n")
-    
+
+    logger.info("[Step 5] 로고 후보(이미지 포함) 생성 완료: %s", [c["output"]["logo_image_url"] for c in candidates])
+
     return state
+
+
+def logo_node(state: BrandConsultingState) -> BrandConsultingState:
+    """
+    Step 5: 로고 디자인 가이드 생성 + 이미지 자동 생성 + Report
+
+    [Process]
+    1. GPT-5.1: 로고 컨셉 및 DALL-E 프롬프트 3가지 생성
+    2. Gemini 3 Pro: 생성된 3가지 프롬프트로 이미지 동시 생성 (생성 → 저장 → 업로드)
+    3. Brand Consulting Report: 최종 리포트 생성
+
+    [Output]
+    - logo_candidates: logo_concept, logo_image_url
+    """
+    prepared = _prepare_logo(state)
+    if prepared is None:
+        return state
+    system_prompt, user_prompt, brand_name = prepared
+
+    # 4. OpenAI 클라이언트
+    try:
+        client = get_openai_client()
+    except Exception as e:
+        state["error_occurred"] = True
+        state["error_message"] = f"Client Error: {e}"
+        return state
+
+    output_id = state.get("output_id", "unknown")
+    renderer = _LogoRenderer(_gemini_client_or_none(), brand_name, output_id)
+
+    # 6. GPT-5.1 로고 컨셉 및 프롬프트 생성
+    # 응답을 스트리밍으로 받아 후보가 완성되는 즉시 이미지 생성 시작 (나머지 후보 작성과 병렬)
+    try:
+        logger.info("[Step 5] 1단계: GPT-5.1 로고 프롬프트 작성 중 (후보 완성 즉시 이미지 생성 시작)")
+        content = chat_json_streamed(client, system_prompt, user_prompt, step=5, on_option=renderer.start)
+        logo_options = _parse_logo_options(content)
+    except Exception as e:
+        renderer.cancel()
+        return _concept_failed(state, e)
+
+    logger.info("[Step 5] 2단계: 이미지 생성 (총 %d장, 동시 %d장)", len(logo_options), LOGO_IMAGE_CONCURRENCY)
+
+    # 스트리밍 중 시작되지 않은 후보 (개수 보정으로 추가된 후보 등)
+    for idx, opt in enumerate(logo_options):
+        renderer.start(idx, opt)
+    image_urls = renderer.results(len(logo_options))
+
+    candidates = [
+        _logo_candidate(idx, opt, image_urls[idx])
+        for idx, opt in enumerate(logo_options)
+    ]
+
+    return _apply_logo(state, candidates)
+
+
+async def alogo_node(state: BrandConsultingState) -> BrandConsultingState:
+    """
+    Step 5: Logo Node (비동기 버전, ainvoke 경로)
+
+    GPT-5.1 호출은 AsyncOpenAI, 이미지 생성은 Gemini client.aio로 수행하고
+    파일 저장/Cloudinary 업로드는 스레드 풀에서 실행
+    """
+    prepared = _prepare_logo(state)
+    if prepared is None:
+        return state
+    system_prompt, user_prompt, brand_name = prepared
+
+    # 4. OpenAI 클라이언트
+    try:
+        client = get_async_openai_client()
+    except Exception as e:
+        state["error_occurred"] = True
+        state["error_message"] = f"Client Error: {e}"
+        return state
+
+    output_id = state.get("output_id", "unknown")
+    renderer = _AsyncLogoRenderer(_gemini_client_or_none(), brand_name, output_id)
+
+    # 6. GPT-5.1 로고 컨셉 및 프롬프트 생성
+    # 응답을 스트리밍으로 받아 후보가 완성되는 즉시 이미지 생성 시작 (나머지 후보 작성과 병렬)
+    try:
+        logger.info("[Step 5] 1단계: GPT-5.1 로고 프롬프트 작성 중 (후보 완성 즉시 이미지 생성 시작)")
+        content = await achat_json_streamed(client, system_prompt, user_prompt, step=5, on_option=renderer.start)
+        logo_options = _parse_logo_options(content)
+    except Exception as e:
+        renderer.cancel()
+        return _concept_failed(state, e)
+
+    logger.info("[Step 5] 2단계: 이미지 생성 (총 %d장, 동시 %d장)", len(logo_options), LOGO_IMAGE_CONCURRENCY)
+
+    # 스트리밍 중 시작되지 않은 후보 (개수 보정으로 추가된 후보 등)
+    for idx, opt in enumerate(logo_options):
+        renderer.start(idx, opt)
+    image_urls = await renderer.results(len(logo_options))
+
+    candidates = [
+        _logo_candidate(idx, opt, image_urls[idx])
+        for idx, opt in enumerate(logo_options)
+    ]
+
+    return _apply_logo(state, candidates)
@@ -13,7 +13,7 @@ class GenerationPrompts:
     # Step 1: Diagnosis
     DIAGNOSIS_SYSTEM = (
         "You are a Brand Strategy Consultant. "
-        "You will receive Q&A data in JSON format from answers.json. "
+        "You will receive the user's Q&A data as a compact JSON object. "
         "Analyze it from Business, User, and Market perspectives to provide comprehensive brand diagnosis."
     )
     
@@ -23,11 +23,11 @@ class GenerationPrompts:
     
     [JSON Parsing Instructions]
     The above data follows this structure:
-    - "questions" array contains question-answer pairs
-    - Each item has: "id", "question_text" (Korean), "answer"
-    - If "answer" is a dict with "value" field, use the "value" (English key)
-    - If "answer" is plain text, use it as-is (Korean text is acceptable)
-    - If "answer" is a list, it's multiple selections
+    - Each key is a question (Korean), each value is the user's answer
+    - Selected options are given as their "value" (English key)
+    - "value (detail)" means the option plus the user's own free-text detail
+    - Plain text answers are used as-is (Korean text is acceptable)
+    - A list means multiple selections; unanswered questions are omitted
     
     [Task]
     Analyze the business context and provide:
@@ -0,0 +1,408 @@
+"""
+Provider Registry
+OpenAI / Gemini / Cloudinary 클라이언트를 프로세스당 1회 생성하여 재사용
+(노드 호출마다 클라이언트를 새로 만들면 커넥션 풀, TLS 핸드셰이크가 매번 새로 발생)
+
+- sync 클라이언트: invoke 경로 및 스레드 풀 작업용
+- async 클라이언트: ainvoke 경로용 (생성된 이벤트 루프에 귀속, 루프가 바뀌면 이전 클라이언트를 닫고 재생성)
+- startup() / shutdown(): FastAPI 수명주기에서 호출 (api/main.py)
+- stats(): 커넥션 풀 사용 현황
+- PROVIDER_MODE=fake: 로컬 가짜 서버(python -m fake_providers)로 연결, API 키 불필요
+- PROVIDER_MODE=replay: 녹화된 응답 재생 (langgraph_system/recording.py), 네트워크 / API 키 불필요
+- CAPTURE_ENABLED=true: 요청별 Provider 호출 녹화 (api/services/capture.py)
+- 응답의 Rate limit 헤더 / 429를 호출 한도 버킷에 반영 (langgraph_system/ratelimit.py)
+"""
+import asyncio
+import os
+import re
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+from langgraph_system.recording import (
+    CAPTURE_ENABLED, REPLAY_CAPTURE, RecordingTransport, ReplayStore, ReplayTransport
+)
+from langgraph_system.ratelimit import rate_limiter
+from langgraph_system.executor import run_in_executor
+from langgraph_system.log import get_logger
+
+logger = get_logger("providers")
+
+# 커넥션 풀 설정
+PROVIDER_MAX_CONNECTIONS = int(os.getenv("PROVIDER_MAX_CONNECTIONS", "100"))
+PROVIDER_MAX_KEEPALIVE = int(os.getenv("PROVIDER_MAX_KEEPALIVE", "20"))
+PROVIDER_KEEPALIVE_EXPIRY = float(os.getenv("PROVIDER_KEEPALIVE_EXPIRY", "60"))
+PROVIDER_TIMEOUT = float(os.getenv("PROVIDER_TIMEOUT", "600"))
+PROVIDER_CONNECT_TIMEOUT = float(os.getenv("PROVIDER_CONNECT_TIMEOUT", "10"))
+
+# Provider 모드
+# - live: 실제 OpenAI / Gemini / Cloudinary
+# - fake: 가짜 서버 (부하 테스트용, fake_providers 패키지)
+# - replay: 녹화된 응답 재생 (REPLAY_CAPTURE, 결정적 프로파일링용)
+PROVIDER_MODES = ("live", "fake", "replay")
+PROVIDER_MODE = os.getenv("PROVIDER_MODE", "live").lower()
+FAKE_PROVIDER_URL = os.getenv("FAKE_PROVIDER_URL", "http://127.0.0.1:8900").rstrip("/")
+FAKE_API_KEY = "fake-key"
+
+# 응답이 어느 모델 버킷에 해당하는지 (OpenAI: 요청 본문 model, Gemini: URL /models/{model}:)
+OPENAI_MODEL_PATTERN = re.compile(rb'"model"\s*:\s*"([^"]+)"')
+GEMINI_MODEL_PATTERN = re.compile(r"/models/([^/:]+):")
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=PROVIDER_MAX_CONNECTIONS,
+        max_keepalive_connections=PROVIDER_MAX_KEEPALIVE,
+        keepalive_expiry=PROVIDER_KEEPALIVE_EXPIRY
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(PROVIDER_TIMEOUT, connect=PROVIDER_CONNECT_TIMEOUT)
+
+
+def _require_env(name: str) -> str:
+    value = os.getenv(name)
+    if not value:
+        raise ValueError(f"{name} 환경 변수가 설정되지 않았습니다.")
+    return value
+
+
+def _response_model(name: str, request: httpx.Request) -> Optional[str]:
+    try:
+        if name == "gemini":
+            match = GEMINI_MODEL_PATTERN.search(request.url.path)
+            return match.group(1) if match else None
+        match = OPENAI_MODEL_PATTERN.search(request.content)
+        return match.group(1).decode() if match else None
+    except httpx.RequestNotRead:
+        return None
+
+
+def _observe_rate_limit(name: str, response: httpx.Response):
+    """응답 상태 / Rate limit 헤더를 호출 한도 버킷에 반영"""
+    model = _response_model(name, response.request)
+    if model is not None:
+        rate_limiter.observe_response(name, model, response.status_code, response.headers)
+
+
+def _pool_stats(http_client: Optional[Any]) -> Dict[str, Any]:
+    """httpx 클라이언트의 커넥션 풀 현황 (httpcore ConnectionPool 기준)"""
+    if http_client is None:
+        return {"created": False}
+
+    transport = getattr(http_client, "_transport", None)
+    # 녹화 Transport는 내부 Transport의 풀을 사용
+    transport = getattr(transport, "inner", transport)
+    pool = getattr(transport, "_pool", None)
+    connections = list(getattr(pool, "connections", []) or [])
+    idle = sum(1 for conn in connections if conn.is_idle())
+    return {
+        "created": True,
+        "connections": len(connections),
+        "active": len(connections) - idle,
+        "idle": idle,
+        "max_connections": PROVIDER_MAX_CONNECTIONS,
+        "max_keepalive": PROVIDER_MAX_KEEPALIVE
+    }
+
+
+def _close_sockets(http_client: httpx.AsyncClient) -> int:
+    """
+    닫힌 이벤트 루프에 귀속된 async 클라이언트의 커넥션 소켓 직접 종료 (httpcore ConnectionPool 기준)
+    루프가 닫히면 aclose()가 RuntimeError로 끝나 소켓이 GC 전까지 열린 채 남음
+    """
+    transport = getattr(http_client, "_transport", None)
+    transport = getattr(transport, "inner", transport)
+    pool = getattr(transport, "_pool", None)
+    closed = 0
+    for conn in list(getattr(pool, "connections", []) or []):
+        stream = getattr(getattr(conn, "_connection", None), "_network_stream", None)
+        sock = stream.get_extra_info("socket") if stream is not None else None
+        # asyncio TransportSocket → 실제 소켓 (close 후 transport 정리 시에는 무시됨)
+        sock = getattr(sock, "_sock", sock)
+        if sock is not None and hasattr(sock, "close"):
+            sock.close()
+            closed += 1
+    return closed
+
+
+async def _aclose_all(http_clients):
+    for client in http_clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("[Providers] async 클라이언트 종료 실패: %s", e)
+
+
+class ProviderRegistry:
+    """프로세스 전역 Provider 클라이언트 관리"""
+
+    def __init__(self, mode: str = PROVIDER_MODE, fake_url: str = FAKE_PROVIDER_URL,
+                 capture: bool = CAPTURE_ENABLED, replay_capture: str = REPLAY_CAPTURE):
+        if mode not in PROVIDER_MODES:
+            raise ValueError(f"지원하지 않는 PROVIDER_MODE: {mode} (가능: {', '.join(PROVIDER_MODES)})")
+        self.mode = mode
+        self.fake_url = fake_url.rstrip("/")
+        self.capture = capture and mode != "replay"
+        self.replay_capture = replay_capture
+        self._replay_store: Optional[ReplayStore] = None
+        self._lock = threading.Lock()
+        self._http: Dict[str, httpx.Client] = {}
+        self._async_http: Dict[str, httpx.AsyncClient] = {}
+        self._clients: Dict[str, Any] = {}
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_counts: Dict[str, int] = {}
+        self._cloudinary_configured = False
+
+    # ---------- 내부 헬퍼 ----------
+    @property
+    def fake(self) -> bool:
+        return self.mode == "fake"
+
+    @property
+    def replay(self) -> bool:
+        return self.mode == "replay"
+
+    def _api_key(self, name: str) -> str:
+        """live 모드는 필수, fake / replay 모드는 없으면 더미 키 사용"""
+        if self.fake or self.replay:
+            return os.getenv(name) or FAKE_API_KEY
+        return _require_env(name)
+
+    def _openai_base_url(self) -> Optional[str]:
+        # None이면 OpenAI 기본값 (OPENAI_BASE_URL 환경 변수 또는 api.openai.com)
+        return f"{self.fake_url}/v1" if self.fake else None
+
+    def _count_hook(self, name: str):
+        def hook(request: httpx.Request):
+            self._request_counts[name] = self._request_counts.get(name, 0) + 1
+        return hook
+
+    def _acount_hook(self, name: str):
+        async def hook(request: httpx.Request):
+            self._request_counts[name] = self._request_counts.get(name, 0) + 1
+        return hook
+
+    def _rate_limit_hook(self, name: str):
+        def hook(response: httpx.Response):
+            _observe_rate_limit(name, response)
+        return hook
+
+    def _arate_limit_hook(self, name: str):
+        async def hook(response: httpx.Response):
+            if rate_limiter.store.shared:
+                # 공유 버킷(SQLite) 갱신은 이벤트 루프 밖에서
+                await run_in_executor(_observe_rate_limit, name, response)
+            else:
+                _observe_rate_limit(name, response)
+        return hook
+
+    def _transport(self, name: str, is_async: bool) -> Optional[Any]:
+        """replay: 녹화 재생 / 녹화 중: 녹화 Transport / 그 외: httpx 기본 Transport (None)"""
+        if self.replay:
+            if self._replay_store is None:
+                self._replay_store = ReplayStore(self.replay_capture)
+            return ReplayTransport(name, self._replay_store)
+        if self.capture:
+            inner = httpx.AsyncHTTPTransport(limits=_limits()) if is_async else httpx.HTTPTransport(limits=_limits())
+            return RecordingTransport(name, inner)
+        return None
+
+    def _sync_http(self, name: str) -> httpx.Client:
+        if name not in self._http:
+            self._http[name] = httpx.Client(
+                limits=_limits(),
+                timeout=_timeout(),
+                transport=self._transport(name, is_async=False),
+                event_hooks={"request": [self._count_hook(name)], "response": [self._rate_limit_hook(name)]}
+            )
+        return self._http[name]
+
+    def _async_http_client(self, name: str) -> httpx.AsyncClient:
+        if name not in self._async_http:
+            self._async_http[name] = httpx.AsyncClient(
+                limits=_limits(),
+                timeout=_timeout(),
+                transport=self._transport(name, is_async=True),
+                event_hooks={"request": [self._acount_hook(name)], "response": [self._arate_limit_hook(name)]}
+            )
+        return self._async_http[name]
+
+    def _check_loop(self):
+        """async 클라이언트는 생성된 이벤트 루프에 귀속되므로 루프가 바뀌면 이전 클라이언트를 닫고 재생성"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._async_loop is not loop:
+            self._close_async_clients(self._async_loop, list(self._async_http.values()))
+            self._async_http.clear()
+            for key in ("async_openai", "async_gemini"):
+                self._clients.pop(key, None)
+            self._async_loop = loop
+
+    @staticmethod
+    def _close_async_clients(old_loop: Optional[asyncio.AbstractEventLoop], http_clients):
+        """
+        이전 루프의 async 클라이언트 종료
+        - 이전 루프가 (다른 스레드에서) 실행 중: 그 루프에서 aclose() 예약
+        - 이전 루프가 닫혔거나 멈춤: aclose() 불가 → 커넥션 소켓 직접 종료
+        """
+        if not http_clients:
+            return
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(_aclose_all(http_clients), old_loop)
+            return
+        closed = sum(_close_sockets(client) for client in http_clients)
+        logger.debug("[Providers] 이전 이벤트 루프의 커넥션 %s개 종료", closed)
+
+    # ---------- 클라이언트 ----------
+    def openai(self) -> OpenAI:
+        """OpenAI 동기 클라이언트 (프로세스 공용)"""
+        with self._lock:
+            if "openai" not in self._clients:
+                self._clients["openai"] = OpenAI(
+                    api_key=self._api_key("OPENAI_API_KEY"),
+                    base_url=self._openai_base_url(),
+                    http_client=self._sync_http("openai"),
+                    max_retries=0  # 재시도는 langgraph_system/resilience.py에서 (SDK 재시도와 중복 방지)
+                )
+            return self._clients["openai"]
+
+    def async_openai(self) -> AsyncOpenAI:
+        """OpenAI 비동기 클라이언트 (현재 이벤트 루프 공용)"""
+        with self._lock:
+            self._check_loop()
+            if "async_openai" not in self._clients:
+                self._clients["async_openai"] = AsyncOpenAI(
+                    api_key=self._api_key("OPENAI_API_KEY"),
+                    base_url=self._openai_base_url(),
+                    http_client=self._async_http_client("openai"),
+                    max_retries=0
+                )
+            return self._clients["async_openai"]
+
+    def gemini(self):
+        """
+        Gemini 클라이언트 (프로세스 공용)
+        client.models (sync) / client.aio.models (async) 모두 공용 커넥션 풀 사용
+        """
+        with self._lock:
+            self._check_loop()
+            if "gemini" not in self._clients or "async_gemini" not in self._clients:
+                from google import genai
+                from google.genai import types
+
+                if "httpx_client" in types.HttpOptions.model_fields:
+                    http_options = types.HttpOptions(
+                        base_url=self.fake_url if self.fake else None,
+                        httpx_client=self._sync_http("gemini"),
+                        httpx_async_client=self._async_http_client("gemini")
+                    )
+                else:
+                    # 구버전 google-genai: 풀 설정만 전달
+                    http_options = types.HttpOptions(
+                        base_url=self.fake_url if self.fake else None,
+                        client_args={"limits": _limits()},
+                        async_client_args={"limits": _limits()}
+                    )
+
+                self._clients["gemini"] = genai.Client(
+                    api_key=self._api_key("GEMINI_API_KEY"),
+                    http_options=http_options
+                )
+                self._clients["async_gemini"] = self._clients["gemini"]
+            return self._clients["gemini"]
+
+    def configure_cloudinary(self):
+        """Cloudinary 설정 (프로세스당 1회)"""
+        if self._cloudinary_configured:
+            return
+
+        if self.replay:
+            # 업로드는 녹화 대상이 아니므로 네트워크 없이 로컬 경로로 대체
+            raise RuntimeError("replay 모드에서는 Cloudinary 업로드를 생략합니다")
+
+        import cloudinary
+
+        with self._lock:
+            if self.fake:
+                # 가짜 서버로 업로드 (업로드 API 주소만 교체)
+                cloudinary.config(
+                    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME") or "fake-cloud",
+                    api_key=os.getenv("CLOUDINARY_API_KEY") or FAKE_API_KEY,
+                    api_secret=os.getenv("CLOUDINARY_API_SECRET") or FAKE_API_KEY,
+                    upload_prefix=self.fake_url
+                )
+            else:
+                cloudinary.config(
+                    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+                    api_key=os.getenv("CLOUDINARY_API_KEY"),
+                    api_secret=os.getenv("CLOUDINARY_API_SECRET")
+                )
+            self._cloudinary_configured = True
+
+    # ---------- 수명주기 ----------
+    def startup(self):
+        """
+        서버 시작 시 클라이언트 미리 생성 (첫 요청 지연 방지)
+        키가 없는 Provider는 건너뛰고 실제 호출 시점에 에러 처리
+        """
+        if self.fake:
+            logger.info("[Providers] fake 모드 - %s 로 연결", self.fake_url)
+        if self.replay:
+            logger.info("[Providers] replay 모드 - %s 녹화 재생", self.replay_capture)
+        if self.capture:
+            logger.info("[Providers] Provider 호출 녹화 활성화")
+        for name, factory in (("openai", self.openai), ("gemini", self.gemini)):
+            try:
+                factory()
+                logger.info("[Providers] %s 클라이언트 준비 완료", name)
+            except Exception as e:
+                logger.warning("[Providers] %s 클라이언트 생성 생략: %s", name, e)
+        try:
+            self.configure_cloudinary()
+        except Exception as e:
+            logger.warning("[Providers] Cloudinary 설정 생략: %s", e)
+
+    async def shutdown(self):
+        """서버 종료 시 커넥션 풀 정리"""
+        with self._lock:
+            sync_clients = list(self._http.values())
+            async_clients = list(self._async_http.values())
+            self._http.clear()
+            self._async_http.clear()
+            self._clients.clear()
+            self._async_loop = None
+
+        for client in sync_clients:
+            client.close()
+        for client in async_clients:
+            try:
+                await client.aclose()
+            except RuntimeError:
+                # 다른 이벤트 루프에서 생성된 클라이언트
+                pass
+        logger.info("[Providers] 커넥션 풀 종료")
+
+    def stats(self) -> Dict[str, Any]:
+        """Provider별 커넥션 풀 사용 현황"""
+        stats = {"mode": self.mode}
+        if self._replay_store is not None:
+            stats["replay"] = self._replay_store.stats()
+        stats.update({
+            name: {
+                "sync_pool": _pool_stats(self._http.get(name)),
+                "async_pool": _pool_stats(self._async_http.get(name)),
+                "requests": self._request_counts.get(name, 0)
+            }
+            for name in ("openai", "gemini")
+        })
+        return stats
+
+
+# 전역 Registry 인스턴스
+provider_registry = ProviderRegistry()
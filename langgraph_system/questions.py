@@ -0,0 +1,188 @@
+"""
+질문 카탈로그
+questions.json (1~5단계) / marketing.json (6~9단계)을 한 번만 읽어 메모리에 보관
+
+- 인덱스: 단계 번호, 질문 id, context_key
+- 버전: 파일 내용 해시 (카탈로그 전체 / 단계별 ETag)
+- 파일이 바뀌면 (mtime / 크기 변경) 다음 조회 때 다시 로드, 로드 실패 시 이전 버전 유지
+- API 응답용 단계별 JSON과 답변 검증기(langgraph_system/validation.py)는 로드 시 미리 생성
+"""
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from langgraph_system.validation import StepValidator, compile_validators
+from langgraph_system.log import get_logger
+
+logger = get_logger("questions")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUESTION_CATALOG_DIR = os.getenv("QUESTION_CATALOG_DIR", ROOT_DIR)
+QUESTION_CATALOG_CHECK_INTERVAL = float(os.getenv("QUESTION_CATALOG_CHECK_INTERVAL", "2"))  # 파일 변경 확인 간격 (초)
+
+# 파일 이름 → 담당 단계 번호
+CATALOG_FILES = {
+    "questions.json": range(1, 6),
+    "marketing.json": range(6, 10)
+}
+
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _step_questions(entry: Any) -> List[Dict[str, Any]]:
+    """단계 항목의 질문 리스트 ({"title", "description", "questions"} 형식 / 리스트 형식 모두 지원)"""
+    if isinstance(entry, dict):
+        return entry.get("questions", [])
+    return entry if isinstance(entry, list) else []
+
+
+class QuestionCatalog:
+    """질문 카탈로그 (프로세스 공용, 파일 변경 시 자동 재로드)"""
+
+    def __init__(self, base_dir: str = QUESTION_CATALOG_DIR,
+                 check_interval: float = QUESTION_CATALOG_CHECK_INTERVAL):
+        self.base_dir = base_dir
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None   # 파일별 (mtime_ns, size)
+        self._checked_at = 0.0
+        self._steps: Dict[int, Any] = {}            # 단계 번호 → 원본 단계 항목
+        self._payloads: Dict[int, Tuple[bytes, str]] = {}  # 단계 번호 → (직렬화된 JSON, ETag)
+        self._by_id: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._by_context_key: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._validators: Dict[int, StepValidator] = {}
+        self.version = ""
+        self.loads = 0
+        self.load_errors = 0
+
+    # -----------------------------------------------------------------
+    # 로드 / 재로드
+    # -----------------------------------------------------------------
+    def _file_signature(self) -> Tuple:
+        signature = []
+        for file_name in CATALOG_FILES:
+            try:
+                stat = os.stat(os.path.join(self.base_dir, file_name))
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _load(self, signature: Tuple) -> None:
+        """두 파일을 읽어 인덱스를 새로 만든 뒤 한 번에 교체"""
+        steps, payloads, by_id, by_context_key = {}, {}, {}, {}
+        digest = hashlib.sha256()
+        for file_name, step_range in CATALOG_FILES.items():
+            path = os.path.join(self.base_dir, file_name)
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                raw = f.read()
+            digest.update(raw)
+            data = json.loads(raw)
+
+            for step_num in step_range:
+                entry = data.get(f"step_{step_num}")
+                if entry is None:
+                    continue
+                steps[step_num] = entry
+                body = json.dumps(
+                    {"step": step_num, "data": entry}, ensure_ascii=False, separators=(",", ":")
+                ).encode("utf-8")
+                payloads[step_num] = (body, f'"{_content_hash(body)}"')
+                for question in _step_questions(entry):
+                    if question.get("id"):
+                        by_id[question["id"]] = (step_num, question)
+                    if question.get("context_key"):
+                        by_context_key[question["context_key"]] = (step_num, question)
+
+        self._steps, self._payloads = steps, payloads
+        self._by_id, self._by_context_key = by_id, by_context_key
+        self._validators = compile_validators({step_num: _step_questions(entry) for step_num, entry in steps.items()})
+        self._signature = signature
+        self.version = digest.hexdigest()[:16]
+        self.loads += 1
+        logger.info("[Questions] 카탈로그 로드 (단계 %s개, 질문 %s개, version=%s)",
+                    len(steps), len(by_id), self.version)
+
+    def refresh(self) -> None:
+        """카탈로그 로드 (최초 1번, 서버 시작 시 미리 호출) / 이후에는 check_interval마다 파일 변경 확인"""
+        now = time.monotonic()
+        if self._signature is not None and now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if self._signature is not None and now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            signature = self._file_signature()
+            if signature == self._signature:
+                return
+            try:
+                self._load(signature)
+            except (OSError, ValueError) as e:
+                self.load_errors += 1
+                if self._signature is None and not self._steps:
+                    raise
+                # 편집 중인 파일 등: 이전 버전 유지, 다음 확인 때 다시 시도
+                logger.error("[Questions] 카탈로그 재로드 실패 (이전 버전 유지): %s", e)
+
+    # -----------------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------------
+    def step(self, step_num: int) -> Optional[Any]:
+        """단계 항목 (복사본) / 없는 단계면 None"""
+        self.refresh()
+        entry = self._steps.get(step_num)
+        return copy.deepcopy(entry) if entry is not None else None
+
+    def questions(self, step_num: int) -> List[Dict[str, Any]]:
+        """단계의 질문 리스트 (복사본)"""
+        self.refresh()
+        return copy.deepcopy(_step_questions(self._steps.get(step_num)))
+
+    def question(self, question_id: str) -> Optional[Dict[str, Any]]:
+        """질문 id로 조회 (복사본, step 필드 포함)"""
+        self.refresh()
+        found = self._by_id.get(question_id)
+        return {"step": found[0], **copy.deepcopy(found[1])} if found else None
+
+    def by_context_key(self, context_key: str) -> Optional[Dict[str, Any]]:
+        """context_key로 질문 조회 (복사본, step 필드 포함)"""
+        self.refresh()
+        found = self._by_context_key.get(context_key)
+        return {"step": found[0], **copy.deepcopy(found[1])} if found else None
+
+    def payload(self, step_num: int) -> Optional[Tuple[bytes, str]]:
+        """API 응답용 (미리 직렬화된 JSON, ETag) / 없는 단계면 None"""
+        self.refresh()
+        return self._payloads.get(step_num)
+
+    def validate(self, step_num: int, user_input: Any) -> List[Dict[str, Any]]:
+        """
+        단계 답변 검증 (LLM 호출 전)
+
+        Returns:
+            오류 리스트 ({"type", "loc", "msg"}) / 비어 있으면 통과, 카탈로그에 없는 단계는 검사 생략
+        """
+        self.refresh()
+        validator = self._validators.get(step_num)
+        return validator.validate(user_input) if validator else []
+
+    def stats(self) -> Dict[str, Any]:
+        self.refresh()
+        return {
+            "version": self.version,
+            "steps": sorted(self._steps),
+            "questions": len(self._by_id),
+            "loads": self.loads,
+            "load_errors": self.load_errors
+        }
+
+
+question_catalog = QuestionCatalog()
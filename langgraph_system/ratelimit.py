@@ -0,0 +1,361 @@
+"""
+Provider 호출 속도 제한 (Rate Limiter)
+OpenAI / Gemini 할당량(RPM / TPM)을 넘으면 진행 중인 상담이 한꺼번에 429로 실패하므로
+호출 전에 Provider + 모델별 토큰 버킷에서 요청 1건 + 예상 토큰을 예약하고, 부족하면 차례를 기다림
+
+- 버킷: 분당 요청 수(RPM) / 분당 토큰 수(TPM), 0이면 제한 없음 (RATE_LIMIT_<PROVIDER>_RPM / _TPM)
+- 예약 방식: 잔량이 음수가 될 수 있고 부족분 / 충전 속도만큼 대기 → 도착 순서대로(FIFO) 처리, 실패 대신 대기
+- 예상 토큰: 프롬프트 길이로 추정 + 응답 예상 토큰 (RATE_LIMIT_COMPLETION_TOKENS), 호출 후 실제 usage로 정산
+- Provider 응답 헤더 반영 (providers.py의 httpx response hook)
+  x-ratelimit-limit-* → 한도 갱신, x-ratelimit-remaining-* → 잔량 하향 보정, 429 + Retry-After → 일시 정지
+- RATE_LIMIT_BACKEND=sqlite: 버킷 상태를 RATE_LIMIT_DB(SQLite)에 저장하여 같은 호스트의 워커 간 한도 공유
+"""
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from langgraph_system.executor import run_in_executor
+from langgraph_system.metrics import RATE_LIMIT_WAIT, RATE_LIMIT_THROTTLED
+from langgraph_system.log import get_logger
+
+logger = get_logger("ratelimit")
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()  # memory | sqlite
+RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB", "Test/ratelimit.sqlite")
+RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "300"))
+RATE_LIMIT_COMPLETION_TOKENS = int(os.getenv("RATE_LIMIT_COMPLETION_TOKENS", "2000"))
+
+# Provider별 기본 한도 (RPM, TPM) - 모델별 버킷은 이 값으로 시작하고 응답 헤더로 갱신
+DEFAULT_LIMITS = {
+    "openai": (float(os.getenv("RATE_LIMIT_OPENAI_RPM", "500")), float(os.getenv("RATE_LIMIT_OPENAI_TPM", "500000"))),
+    "gemini": (float(os.getenv("RATE_LIMIT_GEMINI_RPM", "60")), float(os.getenv("RATE_LIMIT_GEMINI_TPM", "0")))
+}
+
+# 429 응답에 Retry-After / reset 헤더가 없을 때 일시 정지 시간 (초)
+DEFAULT_THROTTLE_PAUSE = 1.0
+
+DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class RateLimitTimeout(RuntimeError):
+    """예상 대기 시간이 RATE_LIMIT_MAX_WAIT를 넘음"""
+
+
+@dataclass
+class Ticket:
+    """예약 정보 (settle()에 전달)"""
+    key: str
+    provider: str
+    tokens: int
+
+
+def estimate_tokens(*texts: str) -> int:
+    """
+    프롬프트 토큰 수 추정 (tokenizer 없이)
+    ASCII 약 4글자당 1토큰, 한글 등 비 ASCII 글자는 글자당 1토큰으로 계산 (보수적)
+    """
+    total = 0
+    for text in texts:
+        if not text:
+            continue
+        non_ascii = len(text) - len(text.encode("ascii", "ignore"))
+        total += (len(text) - non_ascii) // 4 + non_ascii
+    return total
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Rate limit 헤더의 시간 값 (초) - "20", "1.5", "6m0s", "120ms" 형식"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = DURATION_PATTERN.findall(value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class MemoryStore:
+    """프로세스 내 버킷 상태"""
+
+    shared = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: Dict[str, Dict[str, Any]] = {}
+
+    def update(self, key: str, func: Callable[[Dict[str, Any]], Any]) -> Any:
+        with self._lock:
+            return func(self._states.setdefault(key, {}))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {key: dict(state) for key, state in self._states.items()}
+
+
+class SQLiteStore:
+    """
+    워커 간 공유 버킷 상태 (SQLite, 버킷 1개 = 1행)
+    BEGIN IMMEDIATE로 읽기-수정-쓰기를 직렬화하므로 여러 프로세스가 같은 버킷을 안전하게 예약
+    """
+
+    shared = True
+
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        # 스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def update(self, key: str, func: Callable[[Dict[str, Any]], Any]) -> Any:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT data FROM rate_limits WHERE key = ?", (key,)).fetchone()
+            state = json.loads(row[0]) if row else {}
+            result = func(state)
+            conn.execute("INSERT OR REPLACE INTO rate_limits (key, data) VALUES (?, ?)", (key, json.dumps(state)))
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._conn().execute("SELECT key, data FROM rate_limits").fetchall()
+        return {key: json.loads(data) for key, data in rows}
+
+
+class RateLimiter:
+    """Provider + 모델별 RPM / TPM 토큰 버킷"""
+
+    def __init__(self, enabled: bool = RATE_LIMIT_ENABLED, backend: str = RATE_LIMIT_BACKEND,
+                 db_path: str = RATE_LIMIT_DB, max_wait: float = RATE_LIMIT_MAX_WAIT,
+                 limits: Optional[Dict[str, tuple]] = None):
+        if backend not in ("memory", "sqlite"):
+            raise ValueError(f"지원하지 않는 RATE_LIMIT_BACKEND: {backend}")
+        self.enabled = enabled
+        self.backend = backend
+        self.db_path = db_path
+        self.max_wait = max_wait
+        self.limits = limits or DEFAULT_LIMITS
+        self._store = None
+        self._store_lock = threading.Lock()
+        self.acquired = 0
+        self.delayed = 0
+        self.throttled = 0
+
+    @property
+    def store(self):
+        if self._store is None:
+            with self._store_lock:
+                if self._store is None:
+                    self._store = SQLiteStore(self.db_path) if self.backend == "sqlite" else MemoryStore()
+        return self._store
+
+    # ---------- 예약 / 정산 ----------
+    def acquire(self, provider: str, model: str, tokens: int = 0) -> Optional[Ticket]:
+        """요청 1건 + tokens 예약 후 차례가 될 때까지 대기 (동기)"""
+        if not self.enabled:
+            return None
+        ticket = Ticket(f"{provider}:{model}", provider, tokens)
+        wait = self.store.update(ticket.key, lambda state: self._reserve(state, ticket))
+        self._record_wait(ticket, wait)
+        if wait > 0:
+            time.sleep(wait)
+        return ticket
+
+    async def aacquire(self, provider: str, model: str, tokens: int = 0) -> Optional[Ticket]:
+        """요청 1건 + tokens 예약 후 차례가 될 때까지 대기 (비동기, 대기 중 취소되면 예약 반환)"""
+        if not self.enabled:
+            return None
+        ticket = Ticket(f"{provider}:{model}", provider, tokens)
+        reserve = lambda state: self._reserve(state, ticket)  # noqa: E731
+        if self.store.shared:
+            wait = await run_in_executor(self.store.update, ticket.key, reserve)
+        else:
+            wait = self.store.update(ticket.key, reserve)
+        self._record_wait(ticket, wait)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                refund = lambda state: self._refund(state, ticket)  # noqa: E731
+                if self.store.shared:
+                    # 공유 버킷(SQLite) 갱신은 이벤트 루프 밖에서 (다시 취소되어도 반환은 끝까지 수행)
+                    await asyncio.shield(run_in_executor(self.store.update, ticket.key, refund))
+                else:
+                    self.store.update(ticket.key, refund)
+                raise
+        return ticket
+
+    def settle(self, ticket: Optional[Ticket], actual_tokens: Optional[int]):
+        """예상 토큰과 실제 사용량(usage)의 차이를 버킷에 반영"""
+        if ticket is None or actual_tokens is None or actual_tokens == ticket.tokens:
+            return
+
+        def apply(state: Dict[str, Any]):
+            self._refill(state, ticket.provider, time.time())
+            if self._tpm(state, ticket.provider):
+                state["tokens"] -= actual_tokens - ticket.tokens
+
+        self.store.update(ticket.key, apply)
+
+    def release(self, ticket: Optional[Ticket]):
+        """
+        실패한 호출(에러 / 타임아웃 / Hedging에서 취소된 요청)의 예약 토큰 반환
+        요청 수(RPM)는 Provider에 도달했을 수 있으므로 반환하지 않음
+        """
+        self.settle(ticket, 0)
+
+    def observe_response(self, provider: str, model: str, status: int, headers: Mapping[str, str]):
+        """
+        Provider 응답의 Rate limit 정보 반영
+        - x-ratelimit-limit-requests / -tokens: 분당 한도 갱신
+        - x-ratelimit-remaining-requests / -tokens: 버킷 잔량이 더 많으면 서버 값으로 낮춤
+        - 429: Retry-After(또는 reset 헤더) 동안 새 예약 대기
+        """
+        if not self.enabled:
+            return
+        limit_requests = _number(headers.get("x-ratelimit-limit-requests"))
+        limit_tokens = _number(headers.get("x-ratelimit-limit-tokens"))
+        remaining_requests = _number(headers.get("x-ratelimit-remaining-requests"))
+        remaining_tokens = _number(headers.get("x-ratelimit-remaining-tokens"))
+        throttled = status == 429
+        if not throttled and limit_requests is None and limit_tokens is None \
+                and remaining_requests is None and remaining_tokens is None:
+            return
+
+        pause = None
+        if throttled:
+            self.throttled += 1
+            RATE_LIMIT_THROTTLED.labels(provider=provider, model=model).inc()
+            pause = parse_duration(headers.get("retry-after")) or max(
+                parse_duration(headers.get("x-ratelimit-reset-requests")) or 0,
+                parse_duration(headers.get("x-ratelimit-reset-tokens")) or 0
+            ) or DEFAULT_THROTTLE_PAUSE
+            logger.warning("[RateLimit] %s:%s 429 응답 - %.1f초 동안 대기", provider, model, pause)
+
+        def apply(state: Dict[str, Any]):
+            now = time.time()
+            if limit_requests:
+                state["rpm"] = limit_requests
+            if limit_tokens:
+                state["tpm"] = limit_tokens
+            self._refill(state, provider, now)
+            if remaining_requests is not None and "requests" in state:
+                state["requests"] = min(state["requests"], remaining_requests)
+            if remaining_tokens is not None and "tokens" in state:
+                state["tokens"] = min(state["tokens"], remaining_tokens)
+            if pause is not None:
+                state["paused_until"] = max(state.get("paused_until", 0), now + pause)
+
+        self.store.update(f"{provider}:{model}", apply)
+
+    def stats(self) -> Dict[str, Any]:
+        buckets = {}
+        if self.enabled:
+            now = time.time()
+            for key, state in self.store.snapshot().items():
+                provider = key.split(":", 1)[0]
+                self._refill(state, provider, now)
+                buckets[key] = {
+                    "rpm": self._rpm(state, provider),
+                    "tpm": self._tpm(state, provider),
+                    "requests_available": round(state.get("requests", 0), 2),
+                    "tokens_available": round(state.get("tokens", 0)),
+                    "paused_for": round(max(0.0, state.get("paused_until", 0) - now), 2)
+                }
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "throttled": self.throttled,
+            "buckets": buckets
+        }
+
+    # ---------- 내부 ----------
+    def _rpm(self, state: Dict[str, Any], provider: str) -> float:
+        return state.get("rpm") or self.limits.get(provider, (0, 0))[0]
+
+    def _tpm(self, state: Dict[str, Any], provider: str) -> float:
+        return state.get("tpm") or self.limits.get(provider, (0, 0))[1]
+
+    def _refill(self, state: Dict[str, Any], provider: str, now: float):
+        """마지막 갱신 이후 경과 시간만큼 충전 (분당 한도가 버킷 크기)"""
+        rpm, tpm = self._rpm(state, provider), self._tpm(state, provider)
+        elapsed = max(0.0, now - state.get("updated", now))
+        if rpm:
+            state["requests"] = min(rpm, state.get("requests", rpm) + elapsed * rpm / 60)
+        if tpm:
+            state["tokens"] = min(tpm, state.get("tokens", tpm) + elapsed * tpm / 60)
+        state["updated"] = now
+
+    def _reserve(self, state: Dict[str, Any], ticket: Ticket) -> float:
+        """버킷에서 차감하고 대기 시간 반환 (부족분 / 충전 속도)"""
+        now = time.time()
+        self._refill(state, ticket.provider, now)
+        rpm, tpm = self._rpm(state, ticket.provider), self._tpm(state, ticket.provider)
+        ticket.tokens = int(min(ticket.tokens, tpm)) if tpm else ticket.tokens  # 한도보다 큰 요청도 언젠가 실행
+
+        waits = [state.get("paused_until", 0) - now]
+        if rpm:
+            state["requests"] -= 1
+            waits.append(-state["requests"] / (rpm / 60))
+        if tpm:
+            state["tokens"] -= ticket.tokens
+            waits.append(-state["tokens"] / (tpm / 60))
+        wait = max(0.0, *waits)
+
+        if wait > self.max_wait:
+            self._refund(state, ticket)
+            raise RateLimitTimeout(
+                f"{ticket.key} 호출 한도 초과: 예상 대기 {wait:.0f}초 (최대 {self.max_wait:.0f}초)"
+            )
+        return wait
+
+    def _refund(self, state: Dict[str, Any], ticket: Ticket):
+        if self._rpm(state, ticket.provider):
+            state["requests"] = state.get("requests", 0) + 1
+        if self._tpm(state, ticket.provider):
+            state["tokens"] = state.get("tokens", 0) + ticket.tokens
+
+    def _record_wait(self, ticket: Ticket, wait: float):
+        self.acquired += 1
+        if wait > 0:
+            self.delayed += 1
+        RATE_LIMIT_WAIT.labels(provider=ticket.provider).observe(wait)
+
+
+# 전역 인스턴스 (모든 노드 공용)
+rate_limiter = RateLimiter()
@@ -0,0 +1,304 @@
+"""
+Provider 호출 녹화 / 재생
+- 녹화 (CAPTURE_ENABLED=true): Provider httpx 클라이언트의 transport를 감싸
+  요청 요약(단계, 모델, 본문 해시) + 응답(상태, 본문, 소요 시간)을 현재 캡처에 기록
+  캡처는 api/services/capture.py 미들웨어가 요청마다 열고 JSONL로 저장
+  (프롬프트 원문은 저장하지 않고 sha256 해시만 기록)
+- 재생 (PROVIDER_MODE=replay): 녹화된 응답을 네트워크 없이 반환 (REPLAY_CAPTURE 경로)
+  1) 요청 본문 해시가 같은 녹화 응답 → 2) 같은 단계 / 스트리밍 여부의 녹화 응답 순서대로 사용
+"""
+import asyncio
+import base64
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from langgraph_system.prompts import GenerationPrompts
+from langgraph_system.log import get_logger
+
+logger = get_logger("recording")
+
+# 녹화 설정
+CAPTURE_ENABLED = os.getenv("CAPTURE_ENABLED", "false").lower() in ("1", "true", "yes")
+CAPTURE_MAX_BODY_BYTES = int(os.getenv("CAPTURE_MAX_BODY_BYTES", str(8 * 1024 * 1024)))
+
+# 재생 설정
+REPLAY_CAPTURE = os.getenv("REPLAY_CAPTURE", "Test/captures")
+# 녹화된 Provider 소요 시간 재현 비율 (0: 즉시 응답, 1: 녹화 당시 속도)
+REPLAY_LATENCY_SCALE = float(os.getenv("REPLAY_LATENCY_SCALE", "0"))
+
+# 응답 재생에 필요한 헤더만 보관
+KEPT_RESPONSE_HEADERS = ("content-type", "content-encoding", "retry-after")
+
+STEP_BY_SYSTEM_PROMPT = {
+    GenerationPrompts.DIAGNOSIS_SYSTEM: "diagnosis",
+    GenerationPrompts.NAMING_SYSTEM: "naming",
+    GenerationPrompts.CONCEPT_SYSTEM: "concept",
+    GenerationPrompts.STORY_SYSTEM: "story",
+    GenerationPrompts.LOGO_SYSTEM: "logo"
+}
+
+# 현재 요청의 Provider 호출 기록 (None이면 녹화하지 않음)
+_provider_calls: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("provider_calls", default=None)
+_capture_started: ContextVar[float] = ContextVar("capture_started", default=0.0)
+
+
+def start_recording() -> Token:
+    """현재 컨텍스트(요청)의 Provider 호출 녹화 시작"""
+    _capture_started.set(time.perf_counter())
+    return _provider_calls.set([])
+
+
+def stop_recording(token: Token) -> List[Dict[str, Any]]:
+    """녹화 종료 후 기록된 Provider 호출 목록 반환"""
+    calls = _provider_calls.get() or []
+    _provider_calls.reset(token)
+    return calls
+
+
+# =================================================================
+# 요청 요약 / 본문 인코딩
+# =================================================================
+def describe_request(provider: str, request: httpx.Request) -> Dict[str, Any]:
+    """
+    Provider 요청 요약 (재생 시 매칭 키)
+
+    Returns:
+        provider, method, path, step, model, stream, body_sha256
+    """
+    body = request.content or b""
+    step, model, stream = None, None, False
+
+    if provider == "openai":
+        try:
+            payload = json.loads(body)
+            messages = payload.get("messages") or [{}]
+            step = STEP_BY_SYSTEM_PROMPT.get(messages[0].get("content"), "unknown")
+            model = payload.get("model")
+            stream = bool(payload.get("stream"))
+        except (ValueError, AttributeError):
+            step = "unknown"
+    elif provider == "gemini":
+        step = "logo_image"
+        # /v1beta/models/{model}:generateContent
+        model = request.url.path.rsplit("/", 1)[-1].split(":", 1)[0]
+
+    return {
+        "provider": provider,
+        "method": request.method,
+        "path": request.url.path,
+        "step": step,
+        "model": model,
+        "stream": stream,
+        "body_sha256": hashlib.sha256(body).hexdigest()
+    }
+
+
+def encode_body(body: bytes) -> Dict[str, Any]:
+    """응답 본문을 JSONL에 저장 가능한 형태로 변환 (UTF-8 텍스트가 아니면 base64)"""
+    if len(body) > CAPTURE_MAX_BODY_BYTES:
+        return {"body": None, "body_encoding": None, "omitted_bytes": len(body)}
+    try:
+        return {"body": body.decode("utf-8"), "body_encoding": "utf-8"}
+    except UnicodeDecodeError:
+        return {"body": base64.b64encode(body).decode("ascii"), "body_encoding": "base64"}
+
+
+def decode_body(call: Dict[str, Any]) -> Optional[bytes]:
+    if call.get("body") is None:
+        return None
+    if call.get("body_encoding") == "base64":
+        return base64.b64decode(call["body"])
+    return call["body"].encode("utf-8")
+
+
+# =================================================================
+# 녹화 Transport
+# =================================================================
+class _RecordingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """응답 본문을 그대로 흘려보내면서 복사본을 모아 스트림 종료 시 기록 (스트리밍 응답 지연 없음)"""
+
+    def __init__(self, stream: Any, on_close):
+        self._stream = stream
+        self._on_close = on_close
+        self._parts: List[bytes] = []
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._parts.append(chunk)
+            yield chunk
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._parts.append(chunk)
+            yield chunk
+
+    def _finish(self):
+        if not self._closed:
+            self._closed = True
+            self._on_close(b"".join(self._parts))
+
+    def close(self):
+        self._stream.close()
+        self._finish()
+
+    async def aclose(self):
+        await self._stream.aclose()
+        self._finish()
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Provider 호출 녹화 Transport
+    녹화 중인 요청(start_recording 이후)에서만 기록하고, 그 외에는 그대로 전달
+    """
+
+    def __init__(self, provider: str, inner: Any):
+        self.provider = provider
+        self.inner = inner
+
+    def _wrap(self, request: httpx.Request, response: httpx.Response, started: float,
+              calls: List[Dict[str, Any]]) -> httpx.Response:
+        call = describe_request(self.provider, request)
+        call.update({
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in KEPT_RESPONSE_HEADERS},
+            "started_ms": round((started - _capture_started.get()) * 1000, 1)
+        })
+
+        def on_close(body: bytes):
+            call["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            call.update(encode_body(body))
+            calls.append(call)
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_RecordingStream(response.stream, on_close),
+            extensions=response.extensions,
+            request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        calls = _provider_calls.get()
+        started = time.perf_counter()
+        response = self.inner.handle_request(request)
+        if calls is None:
+            return response
+        return self._wrap(request, response, started, calls)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        calls = _provider_calls.get()
+        started = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        if calls is None:
+            return response
+        return self._wrap(request, response, started, calls)
+
+    def close(self):
+        self.inner.close()
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+
+# =================================================================
+# 재생
+# =================================================================
+def capture_files(path: str) -> List[str]:
+    """캡처 경로(파일 또는 디렉토리)의 JSONL 파일 목록 (회전된 파일 포함)"""
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, "*.jsonl*")))
+    return [path] if os.path.exists(path) else []
+
+
+def load_capture(path: str) -> List[Dict[str, Any]]:
+    """캡처 레코드 전체를 시간순으로 로드 (깨진 줄은 건너뜀)"""
+    records = []
+    for filename in capture_files(path):
+        with open(filename, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    records.sort(key=lambda record: record.get("ts", 0))
+    return records
+
+
+class ReplayStore:
+    """녹화된 Provider 응답 저장소 (매칭된 응답은 순환하며 재사용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._by_body: Dict[tuple, deque] = {}
+        self._by_step: Dict[tuple, deque] = {}
+        self._hits = {"exact": 0, "step": 0, "miss": 0}
+
+        for record in load_capture(path):
+            for call in record.get("provider_calls", []):
+                self._by_body.setdefault((call["provider"], call["body_sha256"]), deque()).append(call)
+                self._by_step.setdefault((call["provider"], call["step"], call["stream"]), deque()).append(call)
+
+        logger.info("[Replay] %s - Provider 응답 %s건 로드", path, sum(len(q) for q in self._by_body.values()))
+
+    def match(self, desc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for kind, key, index in (
+                ("exact", (desc["provider"], desc["body_sha256"]), self._by_body),
+                ("step", (desc["provider"], desc["step"], desc["stream"]), self._by_step)
+            ):
+                queue = index.get(key)
+                if queue:
+                    call = queue[0]
+                    queue.rotate(-1)
+                    self._hits[kind] += 1
+                    return call
+            self._hits["miss"] += 1
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"capture": self.path, **self._hits}
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """녹화된 응답을 반환하는 Transport (네트워크 미사용, 녹화가 없으면 404)"""
+
+    def __init__(self, provider: str, store: ReplayStore, latency_scale: float = REPLAY_LATENCY_SCALE):
+        self.provider = provider
+        self.store = store
+        self.latency_scale = latency_scale
+
+    def _lookup(self, request: httpx.Request):
+        call = self.store.match(describe_request(self.provider, request))
+        body = decode_body(call) if call else None
+        if body is None:
+            reason = "본문 미저장 (CAPTURE_MAX_BODY_BYTES 초과)" if call else "일치하는 녹화 없음"
+            response = httpx.Response(404, json={"error": {"message": f"replay: {reason}", "type": "replay_miss"}})
+            return response, 0.0
+        delay = call.get("elapsed_ms", 0) / 1000 * self.latency_scale
+        return httpx.Response(call["status"], headers=call.get("headers", {}), content=body), delay
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        response, delay = self._lookup(request)
+        if delay:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        response, delay = self._lookup(request)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
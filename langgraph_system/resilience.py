@@ -0,0 +1,360 @@
+"""
+Provider 호출 복원력 (재시도 / 마감 시간 / Hedging / Circuit Breaker)
+일시적인 에러(연결 끊김, 타임아웃, 5xx, 429) 1번으로 노드가 기본값 후보를 반환하거나
+이미지가 빠지지 않도록 llm.py의 모든 Provider 호출을 이 모듈로 감쌈
+
+- 재시도: 일시적 에러만 (4xx 요청 오류 / 응답 파싱 실패는 즉시 실패), 지수 백오프 + Full Jitter,
+  Retry-After 헤더가 있으면 그 이상 대기, PROVIDER_MAX_RETRIES회까지
+- 마감 시간: 재시도 포함 호출 1건의 전체 제한 시간 (<PROVIDER>_CALL_DEADLINE), 시도별 타임아웃 = 남은 시간
+- 스트리밍: 첫 토큰 전달 전 실패만 재시도 (이미 전달된 토큰 / 후보 이벤트 중복 방지)
+- Hedging (선택, HEDGE_PROVIDERS): 비스트리밍 비동기 호출이 최근 p95 지연을 넘으면 같은 요청을 1번 더 보내고
+  먼저 끝난 응답 사용 (나머지 취소)
+- Circuit Breaker: Provider별 연속 일시적 실패 CIRCUIT_FAILURE_THRESHOLD회 → CIRCUIT_RESET_TIMEOUT초 동안 즉시 실패,
+  이후 시험 호출 1건 성공 시 복구
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+import httpx
+
+from langgraph_system.metrics import PROVIDER_RETRIES, PROVIDER_HEDGES, CIRCUIT_STATE, CIRCUIT_REJECTED
+from langgraph_system.ratelimit import parse_duration
+from langgraph_system.log import get_logger
+
+logger = get_logger("resilience")
+
+T = TypeVar("T")
+
+PROVIDER_MAX_RETRIES = int(os.getenv("PROVIDER_MAX_RETRIES", "3"))
+PROVIDER_BACKOFF_BASE = float(os.getenv("PROVIDER_BACKOFF_BASE", "0.5"))
+PROVIDER_BACKOFF_MAX = float(os.getenv("PROVIDER_BACKOFF_MAX", "20"))
+CALL_DEADLINES = {
+    "openai": float(os.getenv("OPENAI_CALL_DEADLINE", "180")),
+    "gemini": float(os.getenv("GEMINI_CALL_DEADLINE", "180"))
+}
+
+HEDGE_PROVIDERS = {name.strip() for name in os.getenv("HEDGE_PROVIDERS", "").split(",") if name.strip()}
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+LATENCY_WINDOW = 200
+
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+CIRCUIT_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# 일시적 에러 분류 (재시도 / Circuit Breaker 집계 대상)
+TIMEOUT = "timeout"
+CONNECTION = "connection"
+SERVER = "server"
+RATE_LIMIT = "rate_limit"
+PROVIDER_DOWN_REASONS = (TIMEOUT, CONNECTION, SERVER)
+
+
+class CircuitOpenError(RuntimeError):
+    """Provider 장애로 Circuit이 열려 호출하지 않음"""
+
+
+class DeadlineExceededError(TimeoutError):
+    """재시도 포함 호출 제한 시간 초과"""
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    # openai: status_code, google-genai: code
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    return None
+
+
+def classify_error(exc: BaseException) -> Optional[str]:
+    """
+    재시도 가능한 일시적 에러 분류
+
+    Returns:
+        timeout / connection / server / rate_limit (재시도 불가 에러는 None)
+    """
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError, httpx.TimeoutException)) \
+            or type(exc).__name__ == "APITimeoutError":
+        return TIMEOUT
+    if isinstance(exc, httpx.TransportError) or type(exc).__name__ == "APIConnectionError":
+        return CONNECTION
+    status = _status_code(exc)
+    if status == 429:
+        return RATE_LIMIT
+    if status in (408, 409) or (status is not None and status >= 500):
+        return SERVER
+    return None
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """에러 응답의 Retry-After (초)"""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    return parse_duration(headers.get("retry-after"))
+
+
+def backoff_delay(attempt: int, exc: BaseException, base: float = PROVIDER_BACKOFF_BASE,
+                  cap: float = PROVIDER_BACKOFF_MAX) -> float:
+    """지수 백오프 + Full Jitter (Retry-After가 더 길면 그 값)"""
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    return max(delay, retry_after(exc) or 0)
+
+
+class CircuitBreaker:
+    """Provider 1개의 Circuit (closed → open → half_open → closed)"""
+
+    def __init__(self, name: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        호출 허용 여부 확인
+
+        Raises:
+            CircuitOpenError: open 상태, 또는 half_open 상태에서 이미 시험 호출 중
+        """
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self._set_state(HALF_OPEN)
+            if self.state == CLOSED or (self.state == HALF_OPEN and not self._probing):
+                self._probing = self.state == HALF_OPEN
+                return
+            self.rejected += 1
+        CIRCUIT_REJECTED.labels(provider=self.name).inc()
+        raise CircuitOpenError(f"{self.name} Provider 장애로 호출을 중단했습니다 (잠시 후 다시 시도해주세요)")
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            if self.state != CLOSED:
+                logger.info("[Circuit] %s 복구", self.name)
+                self._set_state(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                logger.warning("[Circuit] %s 연속 실패 %d회 - %.0f초 동안 호출 중단",
+                               self.name, self.failures, self.reset_timeout)
+                self.opened_at = time.monotonic()
+                self._set_state(OPEN)
+
+    def release(self):
+        """결과 없이 끝난 시도 (취소 등) - 시험 호출 슬롯만 반환"""
+        with self._lock:
+            self._probing = False
+
+    def _set_state(self, state: str):
+        self.state = state
+        CIRCUIT_STATE.labels(provider=self.name).set(CIRCUIT_STATE_VALUES[state])
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+
+class LatencyTracker:
+    """호출 종류별 최근 성공 지연 시간 (Hedging 기준 p95)"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def p95(self, key: str, min_samples: int = HEDGE_MIN_SAMPLES) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < max(1, min_samples):
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+class ResiliencePolicy:
+    """Provider 호출 재시도 / 마감 시간 / Hedging / Circuit Breaker"""
+
+    def __init__(self, max_retries: int = PROVIDER_MAX_RETRIES, deadlines: Optional[Dict[str, float]] = None,
+                 hedge_providers=HEDGE_PROVIDERS, backoff_base: float = PROVIDER_BACKOFF_BASE,
+                 backoff_max: float = PROVIDER_BACKOFF_MAX):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadlines = deadlines or CALL_DEADLINES
+        self.hedge_providers = set(hedge_providers)
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latency = LatencyTracker()
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        if provider not in self.breakers:
+            self.breakers.setdefault(provider, CircuitBreaker(provider))
+        return self.breakers[provider]
+
+    # ---------- 호출 ----------
+    def call(self, provider: str, key: str, attempt: Callable[[float], T], deadline: Optional[float] = None,
+             can_retry: Optional[Callable[[], bool]] = None) -> T:
+        """
+        동기 호출
+
+        Args:
+            provider: openai / gemini (Circuit / 마감 시간 기준)
+            key: 호출 종류 (지연 통계 / 로그용, 예: openai:gpt-5.1:json)
+            attempt: 시도 1회 (인자: 이번 시도의 타임아웃 초)
+            deadline: 전체 제한 시간 (기본: Provider별 CALL_DEADLINE)
+            can_retry: 실패 후 재시도해도 되는지 (스트리밍: 전달된 토큰이 없을 때만)
+        """
+        expires = time.monotonic() + (deadline or self.deadlines.get(provider, 180))
+        attempt_no = 0
+        while True:
+            remaining = self._remaining(key, expires)
+            breaker = self.breaker(provider)
+            breaker.allow()
+            started = time.monotonic()
+            try:
+                result = attempt(remaining)
+            except Exception as exc:
+                delay = self._on_failure(provider, key, breaker, exc, attempt_no, expires, can_retry)
+                time.sleep(delay)
+                attempt_no += 1
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_success()
+            self.latency.record(key, time.monotonic() - started)
+            return result
+
+    async def acall(self, provider: str, key: str, attempt: Callable[[float], Awaitable[T]],
+                    deadline: Optional[float] = None, can_retry: Optional[Callable[[], bool]] = None,
+                    hedge: bool = False) -> T:
+        """
+        비동기 호출 (call()과 동일, 시도마다 남은 시간으로 asyncio.wait_for 적용)
+
+        Args:
+            hedge: True이고 Provider가 HEDGE_PROVIDERS에 있으면 p95 초과 시 중복 요청
+        """
+        expires = time.monotonic() + (deadline or self.deadlines.get(provider, 180))
+        hedge = hedge and provider in self.hedge_providers
+        attempt_no = 0
+        while True:
+            remaining = self._remaining(key, expires)
+            breaker = self.breaker(provider)
+            breaker.allow()
+            started = time.monotonic()
+            try:
+                if hedge:
+                    result = await self._hedged(key, attempt, remaining)
+                else:
+                    result = await asyncio.wait_for(attempt(remaining), timeout=remaining)
+            except Exception as exc:
+                delay = self._on_failure(provider, key, breaker, exc, attempt_no, expires, can_retry)
+                await asyncio.sleep(delay)
+                attempt_no += 1
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.record_success()
+            self.latency.record(key, time.monotonic() - started)
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "circuits": {name: breaker.stats() for name, breaker in self.breakers.items()},
+            "p95_seconds": {key: self.latency.p95(key, min_samples=1) for key in list(self.latency._samples)}
+        }
+
+    # ---------- 내부 ----------
+    def _remaining(self, key: str, expires: float) -> float:
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"{key} 호출 제한 시간 초과")
+        return remaining
+
+    def _on_failure(self, provider: str, key: str, breaker: CircuitBreaker, exc: Exception, attempt_no: int,
+                    expires: float, can_retry: Optional[Callable[[], bool]]) -> float:
+        """
+        실패 기록 후 재시도 대기 시간 반환 (재시도하지 않으면 예외를 그대로 전파)
+        """
+        reason = classify_error(exc)
+        if reason in PROVIDER_DOWN_REASONS:
+            breaker.record_failure()
+        else:
+            breaker.record_success()  # 응답은 받음 (429 / 요청 오류) → Provider 장애 아님
+
+        if reason is None or attempt_no >= self.max_retries or (can_retry is not None and not can_retry()):
+            raise exc
+        delay = backoff_delay(attempt_no, exc, self.backoff_base, self.backoff_max)
+        if time.monotonic() + delay >= expires:
+            raise exc
+
+        self.retries += 1
+        PROVIDER_RETRIES.labels(provider=provider, reason=reason).inc()
+        logger.warning("[Retry] %s %s (%s) - %.2f초 후 재시도 %d/%d",
+                       key, reason, exc, delay, attempt_no + 1, self.max_retries)
+        return delay
+
+    async def _hedged(self, key: str, attempt: Callable[[float], Awaitable[T]], remaining: float) -> T:
+        """첫 요청이 p95 안에 끝나지 않으면 중복 요청을 보내고 먼저 성공한 결과 사용"""
+        started = time.monotonic()
+        first = asyncio.ensure_future(attempt(remaining))
+        tasks = {first}
+        try:
+            delay = self.latency.p95(key)
+            if delay is not None and delay < remaining:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    self.hedges += 1
+                    PROVIDER_HEDGES.labels(key=key).inc()
+                    tasks.add(asyncio.ensure_future(attempt(remaining - delay)))
+
+            error: Optional[BaseException] = None
+            expires = started + remaining
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, timeout=max(0.0, expires - time.monotonic()),
+                                                 return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise asyncio.TimeoutError()
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+# 전역 인스턴스 (모든 노드 공용)
+resilience = ResiliencePolicy()
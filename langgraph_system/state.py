@@ -92,6 +92,7 @@ class BrandConsultingState(TypedDict, total=False):
     # ========== 실행 제어 ==========
     error_occurred: bool
     error_message: Optional[str]
+    use_cache: Optional[bool]  # False: LLM 응답 캐시 미사용 (기본: 사용)
 
 
 def create_initial_state(output_id: str, user_id: str) -> BrandConsultingState:
@@ -0,0 +1,84 @@
+"""
+노드 진행 이벤트 스트리밍
+GPT 응답을 스트리밍으로 받아 완성된 후보를 즉시 노드에 전달(on_option)하고,
+SSE 엔드포인트(/brands/{step}/stream)에서 실행 중이면 이벤트로도 전송
+
+이벤트 (LangGraph custom stream으로 전달, SSE 실행일 때만):
+- token: GPT 응답 토큰
+- candidate: 완성된 후보 1개 (응답 전체를 기다리지 않고 즉시)
+- logo: 로고 이미지 1장 업로드 완료
+"""
+from typing import Any, Callable, Dict, Optional
+
+from langgraph.config import get_config, get_stream_writer
+
+from langgraph_system.json_stream import OptionsStreamParser
+from langgraph_system.llm import TEXT_MODEL, chat_json, achat_json, stream_chat_json, astream_chat_json
+
+# RunnableConfig["configurable"]에 이 키가 True이면 이벤트 전송
+STREAM_CONFIG_KEY = "stream_events"
+
+# 완성된 후보 콜백: on_option(candidate_id, option)
+OptionCallback = Callable[[int, Dict[str, Any]], None]
+
+
+def stream_enabled() -> bool:
+    """현재 그래프 실행이 이벤트 스트리밍 모드인지 여부"""
+    try:
+        return bool(get_config().get("configurable", {}).get(STREAM_CONFIG_KEY))
+    except RuntimeError:
+        # 그래프 밖에서 노드 함수를 직접 호출한 경우
+        return False
+
+
+def emit(event: str, data: Dict[str, Any]):
+    """스트리밍 모드일 때만 이벤트 전송"""
+    if stream_enabled():
+        get_stream_writer()({"event": event, "data": data})
+
+
+def _delta_handler(step: int, on_option: Optional[OptionCallback]) -> Callable[[str], None]:
+    """토큰 콜백 생성: 토큰/후보 이벤트 전송 + on_option 호출"""
+    writer = get_stream_writer() if stream_enabled() else None
+    parser = OptionsStreamParser()
+
+    def on_delta(delta: str):
+        if writer is not None:
+            writer({"event": "token", "data": {"step": step, "delta": delta}})
+        completed = parser.feed(delta)
+        first_id = len(parser.options) - len(completed)
+        for candidate_id, option in enumerate(completed, start=first_id):
+            if writer is not None:
+                writer({"event": "candidate", "data": {"step": step, "id": candidate_id, "candidate": option}})
+            if on_option is not None:
+                on_option(candidate_id, option)
+
+    return on_delta
+
+
+def chat_json_streamed(client: Any, system_prompt: str, user_prompt: str, step: int,
+                       model: str = TEXT_MODEL, on_option: Optional[OptionCallback] = None) -> str:
+    """
+    GPT-5.1 JSON 호출 (동기)
+    on_option이 있거나 스트리밍 모드이면 응답을 스트리밍으로 받아 완성된 후보마다
+    on_option 호출 / 이벤트 전송. 둘 다 아니면 chat_json과 동일
+
+    Returns:
+        전체 응답 본문 (JSON 문자열)
+    """
+    if on_option is None and not stream_enabled():
+        return chat_json(client, system_prompt, user_prompt, model)
+    return stream_chat_json(client, system_prompt, user_prompt, model, _delta_handler(step, on_option))
+
+
+async def achat_json_streamed(client: Any, system_prompt: str, user_prompt: str, step: int,
+                              model: str = TEXT_MODEL, on_option: Optional[OptionCallback] = None) -> str:
+    """
+    GPT-5.1 JSON 호출 (비동기, chat_json_streamed와 동일한 동작)
+
+    Returns:
+        전체 응답 본문 (JSON 문자열)
+    """
+    if on_option is None and not stream_enabled():
+        return await achat_json(client, system_prompt, user_prompt, model)
+    return await astream_chat_json(client, system_prompt, user_prompt, model, _delta_handler(step, on_option))
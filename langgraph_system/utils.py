@@ -2,61 +2,56 @@
 유틸리티 함수
 JSON 로드, 프롬프트 관리, 컨텍스트 처리 등
 """
+import hashlib
 import json
 import os
-from typing import Dict, Any, List, Optional
-from openai import OpenAI
-from dotenv import load_dotenv
-load_dotenv()
+from typing import Dict, Any, List, Optional, Tuple
+from openai import OpenAI, AsyncOpenAI
+from langgraph_system.providers import provider_registry
+from langgraph_system.questions import question_catalog
+from langgraph_system.log import get_logger
+from langgraph_system.metrics import record_selection
 
+logger = get_logger("utils")
 
-def load_questions(step_num: int) -> List[Dict[str, Any]]:
+
+def load_questions(step_num: int) -> Any:
     """
-    질문 데이터 로드
+    질문 데이터 로드 (질문 카탈로그에서 조회, 파일은 프로세스당 1번만 읽음)
     
     Args:
         step_num: 단계 번호 (1~9)
     
     Returns:
-        해당 단계의 질문 리스트
+        해당 단계의 질문 데이터 (questions.json: {"title", "description", "questions"}, marketing.json: 질문 리스트)
     """
     # 1~5단계: questions.json
     # 6~9단계: marketing.json
-    if 1 <= step_num <= 5:
-        file_path = "questions.json"
-        step_key = f"step_{step_num}"
-    elif 6 <= step_num <= 9:
-        file_path = "marketing.json"
-        step_key = f"step_{step_num}"
-    else:
+    if not 1 <= step_num <= 9:
         raise ValueError(f"잘못된 단계 번호: {step_num}")
-    
-    # 파일 로드
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"질문 파일을 찾을 수 없습니다: {file_path}")
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    return data.get(step_key, [])
+
+    entry = question_catalog.step(step_num)
+    if entry is None:
+        file_name = "questions.json" if step_num <= 5 else "marketing.json"
+        if not os.path.exists(os.path.join(question_catalog.base_dir, file_name)):
+            raise FileNotFoundError(f"질문 파일을 찾을 수 없습니다: {file_name}")
+        return []
+    return entry
 
 
 def get_openai_client() -> OpenAI:
-    """OpenAI 클라이언트 생성"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
-    return OpenAI(api_key=api_key)
+    """OpenAI 클라이언트 반환 (프로세스 공용, Provider Registry에서 관리)"""
+    return provider_registry.openai()
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """OpenAI 비동기 클라이언트 반환 (ainvoke 경로용, Provider Registry에서 관리)"""
+    return provider_registry.async_openai()
 
 
 def get_gemini_client():
-    from google import genai
-    api_key = os.getenv("GEMINI_API_KEY")
-    
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
-    
-    return genai.Client(api_key=api_key)
+    """Gemini 클라이언트 반환 (프로세스 공용, Provider Registry에서 관리)"""
+    return provider_registry.gemini()
 
 
 def extract_answer_value(answers: Dict[str, Any], key: str, default: Any = None) -> Any:
@@ -83,6 +78,88 @@ def extract_answer_value(answers: Dict[str, Any], key: str, default: Any = None)
     return item
 
 
+# Q&A 프롬프트 직렬화 형식 버전 (compact_qa 규칙을 바꾸면 올려서 진단 캐시 무효화)
+QA_FORMAT_VERSION = "compact-1"
+
+# 프롬프트에 필요 없는 화면 표시용 필드 (answers.json / questions.json)
+QA_PRESENTATION_KEYS = {
+    "id", "text", "title", "description", "placeholder", "category",
+    "question_type", "options", "required", "context_key"
+}
+
+
+def _is_empty_answer(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _compact_answer(answer: Any) -> Any:
+    """
+    답변 1개 압축
+    - {"id", "text", "value"} 선택지 → value (extract_answer_value와 동일)
+    - 기타 직접 입력(text_input_value) → "value (직접 입력)"
+    - 리스트(복수 선택) → 값 리스트, 빈 답변 제거
+    """
+    if isinstance(answer, dict):
+        if "value" in answer:
+            value = _compact_answer(answer["value"])
+            detail = answer.get("text_input_value")
+            return f"{value} ({detail.strip()})" if isinstance(detail, str) and detail.strip() else value
+        compact = {
+            key: _compact_answer(value) for key, value in answer.items()
+            if key not in QA_PRESENTATION_KEYS
+        }
+        return {key: value for key, value in compact.items() if not _is_empty_answer(value)}
+    if isinstance(answer, list):
+        values = [_compact_answer(item) for item in answer]
+        return [value for value in values if not _is_empty_answer(value)]
+    if isinstance(answer, str):
+        return answer.strip()
+    return answer
+
+
+def compact_qa(qa: Any) -> Any:
+    """
+    프롬프트용 Q&A 압축 ({질문 문구: 답변})
+    - answers.json 형식 ({"title", "description", "questions": [...]}): 제목 / 설명 / 질문 id 제거
+    - 평면 형식 ({질문 id: 답변}): 답변만 압축
+    - 빈 답변은 질문째 제거, 같은 질문 문구가 반복되면 1번만 쓰고 답변을 합침
+
+    Args:
+        qa: 단계 Q&A (user_input)
+
+    Returns:
+        압축된 Q&A (알 수 없는 형식은 그대로)
+    """
+    if isinstance(qa, dict) and isinstance(qa.get("questions"), list):
+        items = [
+            (question.get("question_text") or question.get("id"), question.get("answer"))
+            for question in qa["questions"] if isinstance(question, dict)
+        ]
+    elif isinstance(qa, dict):
+        items = list(qa.items())
+    else:
+        return qa
+
+    compact: Dict[str, Any] = {}
+    for question, answer in items:
+        value = _compact_answer(answer)
+        if question is None or _is_empty_answer(value):
+            continue
+        question = " ".join(str(question).split())
+        if question in compact:
+            previous = compact[question]
+            compact[question] = (previous if isinstance(previous, list) else [previous]) + \
+                (value if isinstance(value, list) else [value])
+        else:
+            compact[question] = value
+    return compact
+
+
+def qa_prompt_json(qa: Any) -> str:
+    """프롬프트에 넣을 Q&A JSON (압축 + 공백 없는 구분자)"""
+    return json.dumps(compact_qa(qa), ensure_ascii=False, separators=(",", ":"))
+
+
 def format_context_for_prompt(context: Dict[str, Any]) -> str:
     """
     누적 컨텍스트를 프롬프트용 문자열로 변환
@@ -131,13 +208,13 @@ def download_image(url: str, save_path: str) -> bool:
             with open(save_path, 'wb') as f:
                 for chunk in response.iter_content(1024):
                     f.write(chunk)
-            print(f"[Image] 다운로드 완료: {save_path}")
+            logger.info("[Image] 다운로드 완료: %s", save_path)
             return True
         else:
-            print(f"[Image] 다운로드 실패 (Status: {response.status_code})")
+            logger.warning("[Image] 다운로드 실패 (Status: %s)", response.status_code)
             return False
     except Exception as e:
-        print(f"[Image] 다운로드 오류: {e}")
+        logger.error("[Image] 다운로드 오류: %s", e)
         return False
 
 
@@ -153,7 +230,7 @@ def validate_step_input(step_num: int, user_input: Dict[str, Any]) -> bool:
         검증 성공 여부
     """
     if not user_input or "answers" not in user_input:
-        print(f"[Validation] Step {step_num} 입력 데이터가 없습니다.")
+        logger.warning("[Validation] Step %s 입력 데이터가 없습니다.", step_num)
         return False
     
     # 추가 검증 로직 (필요 시)
@@ -161,13 +238,161 @@ def validate_step_input(step_num: int, user_input: Dict[str, Any]) -> bool:
     
     return True
 
-def flatten_context(context: Dict[str, Any], step_qa: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+# 후보 내용 키 (단계별 대표 값 - 이름 / 컨셉 문장 / 스토리 / 로고 URL)
+CANDIDATE_CONTENT_KEYS = ("brand_name", "concept_statement", "brand_story", "logo_image_url")
+# 후보 식별 키 (평탄화 결과에서 제외)
+CANDIDATE_ID_KEYS = ("id", "candidate_id", "content_hash")
+# 선택 정보 키 (context 최상위 / 평면 step_qa) - 평탄화 결과에서 제외
+SELECTION_KEYS = ("candidates", "id", "candidate_id", "selected_id", "content_hash", "selected_hash")
+
+
+def content_hash(content: Any) -> Optional[str]:
+    """후보 내용 → 짧은 해시 (FE가 긴 스토리 대신 보낼 수 있는 선택 키)"""
+    if content is None or content == "":
+        return None
+    text = content if isinstance(content, str) else json.dumps(content, ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _id_key(value: Any) -> Any:
+    """후보 id 정규화 (1, "1" → 1)"""
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None if isinstance(value, bool) else value
+
+
+def _candidate_output(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """구조 1: {"output": {...}} (Internal State) / 구조 2: {...} (API Response)"""
+    output = candidate.get("output")
+    return output if isinstance(output, dict) else candidate
+
+
+def _candidate_content(candidate: Dict[str, Any]) -> Any:
+    output = _candidate_output(candidate)
+    for key in CANDIDATE_CONTENT_KEYS:
+        if output.get(key):
+            return output[key]
+    return None
+
+
+class CandidateIndex:
+    """
+    후보 목록 색인 (id → 후보, 내용 해시 → 후보)
+    id 색인은 생성 시 1번 순회로 만들고, 해시 색인은 해시 / 이름으로 찾을 때만 생성
+    (후보에 content_hash가 있으면 그대로 사용)
+    """
+
+    def __init__(self, candidates: List[Any]):
+        self.candidates = [c for c in candidates if isinstance(c, dict)]
+        self.by_id: Dict[Any, Dict[str, Any]] = {}
+        for position, candidate in enumerate(self.candidates):
+            ref = candidate.get("id", candidate.get("candidate_id", position))
+            self.by_id.setdefault(_id_key(ref), candidate)
+        self._by_hash: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def get(self, candidate_id: Any) -> Optional[Dict[str, Any]]:
+        try:
+            return self.by_id.get(_id_key(candidate_id))
+        except TypeError:  # dict / list 등 해시 불가 값
+            return None
+
+    def by_hash(self, digest: str) -> Optional[Dict[str, Any]]:
+        if self._by_hash is None:
+            self._by_hash = {}
+            for candidate in self.candidates:
+                digest_ = candidate.get("content_hash") or content_hash(_candidate_content(candidate))
+                if digest_:
+                    self._by_hash.setdefault(digest_, candidate)
+        return self._by_hash.get(digest)
+
+    def by_content(self, content: Any) -> Optional[Dict[str, Any]]:
+        digest = content_hash(content)
+        return self.by_hash(digest) if digest else None
+
+
+def _selection_refs(context: Dict[str, Any], step_qa: Optional[Dict[str, Any]],
+                    step: Optional[str] = None) -> List[Tuple[str, Any]]:
+    """
+    이 context를 대상으로 한 선택 정보 (우선순위 순)
+    1. context 자체의 선택 id / 해시 (id, selected_id / content_hash, selected_hash)
+    2. step_qa의 단계 지정 키 (예: naming_selected_id, concept_selected_hash) - step이 있을 때만
+    3. 레거시: step_qa의 ~current_name / selected_name (브랜드 이름 → naming context만 대상, step이 없으면 모든 context)
+    한 step_qa로 여러 context를 평탄화하므로 단계를 지정하지 않은 step_qa 선택 값은 사용하지 않음
+
+    Returns: [(방식, 값)] - 방식: id / hash / name
+    """
+    step_qa = step_qa if isinstance(step_qa, dict) else {}
+    sources = [(context, ("selected_id", "id", "candidate_id"), ("selected_hash", "content_hash"))]
+    if step:
+        sources.append((step_qa, (f"{step}_selected_id",), (f"{step}_selected_hash",)))
+
+    refs = []
+    for source, id_keys, hash_keys in sources:
+        id_key = next((key for key in id_keys if source.get(key) not in (None, "")), None)
+        if id_key:
+            refs.append(("id", source[id_key]))
+        hash_key = next((key for key in hash_keys if source.get(key)), None)
+        if hash_key:
+            refs.append(("hash", source[hash_key]))
+    if step in (None, "naming"):
+        # 레거시: QA 데이터의 ~current_name 또는 selected_name (예: s3_current_name)
+        for key, value in step_qa.items():
+            if isinstance(key, str) and (key.endswith("current_name") or key == "selected_name") and value:
+                refs.append(("name", value))
+                break
+    return refs
+
+
+def select_candidate(context: Dict[str, Any], step_qa: Optional[Dict[str, Any]] = None,
+                     step: Optional[str] = None,
+                     index: Optional[CandidateIndex] = None) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    context["candidates"]에서 선택된 후보 찾기 (step: context 이름 - naming / concept / story)
+
+    Returns:
+        (후보, 방식) - 방식: id / hash / name (선택 정보로 찾음), single (후보 1개),
+        default (선택 정보 없음 → 첫 번째 후보), miss (선택 정보와 맞는 후보 없음 → 첫 번째 후보)
+    """
+    index = index or CandidateIndex(context.get("candidates") or [])
+    if not index.candidates:
+        return None, "miss"
+
+    refs = _selection_refs(context, step_qa, step)
+    for method, value in refs:
+        if method == "id":
+            candidate = index.get(value)
+        elif method == "hash":
+            candidate = index.by_hash(value) if isinstance(value, str) else None
+        else:
+            candidate = index.by_content(value)
+        if candidate is not None:
+            return candidate, method
+
+    if refs:
+        logger.warning(
+            "[flatten_context] %s 선택 정보와 맞는 후보가 없어 첫 번째 후보를 사용합니다 (선택: %s, 후보 id: %s)",
+            step or "context",
+            [(method, str(value)[:40]) for method, value in refs],
+            list(index.by_id)
+        )
+        return index.candidates[0], "miss"
+    return index.candidates[0], "single" if len(index.candidates) == 1 else "default"
+
+
+def flatten_context(context: Dict[str, Any], step_qa: Optional[Dict[str, Any]] = None,
+                    step: Optional[str] = None) -> Dict[str, Any]:
     """
     Backend에서 candidates 리스트로 들어오는 Context를 단일 선택된 Context로 변환
+
+    선택: context의 후보 id / 내용 해시 → step_qa의 단계 지정 키 (<step>_selected_id / <step>_selected_hash)
+    → 레거시 이름 (step_qa의 ~current_name, naming만) 순서로 색인 조회
+    이 context를 대상으로 한 선택 정보와 맞는 후보가 없으면 첫 번째 후보를 쓰되
+    경고 로그 + brand_context_selections_total{method="miss"} 기록
     
     Args:
         context: 원본 Context (dict)
-        step_qa: 현재 단계의 사용자 입력 (선택된 이름 정보가 있을 수 있음)
+        step_qa: 현재 단계의 사용자 입력 (선택된 후보 id / 이름 정보가 있을 수 있음)
+        step: context 이름 (naming / concept / story) - step_qa 선택 키의 대상 구분
     
     Returns:
         Flatten된 단일 Context (brand_name, rationale 등 포함)
@@ -177,75 +402,22 @@ def flatten_context(context: Dict[str, Any], step_qa: Optional[Dict[str, Any]] =
         
     try:
         # 이미 평탄화된 경우 (candidates가 없음)
-        if "candidates" not in context:
-            return context
-            
-        candidates = context.get("candidates", [])
+        candidates = context.get("candidates")
         if not candidates or not isinstance(candidates, list):
             return context
-            
-        selected_candidate = None
-        
-        # 1. QA 데이터에서 선택된 값 찾기 (예: s3_current_name)
-        if step_qa:
-            selected_name = None
-            # QA 데이터에서 ~current_name 또는 selected_name 찾기
-            for k, v in step_qa.items():
-                if isinstance(k, str) and (k.endswith("current_name") or k == "selected_name"):
-                    if v: # 빈 문자열 제외
-                        selected_name = v
-                        break
-            
-            if selected_name:
-                # 이름으로 후보 찾기
-                for cand in candidates:
-                    if not isinstance(cand, dict): continue
-                    
-                    # Naming/Concept/Story/Logo 각 단계별 키 확인
-                    # 구조 1: { "output": { "brand_name": ... } } (Internal State)
-                    # 구조 2: { "brand_name": ... } (API Response)
-                    output = cand.get("output", cand) 
-                    
-                    cand_content = (
-                        output.get("brand_name") or 
-                        output.get("concept_statement") or 
-                        output.get("brand_story") or
-                        output.get("logo_image_url")
-                    )
-                    if cand_content == selected_name:
-                        selected_candidate = cand
-                        break
-        
-        # 2. 못 찾았으면 첫 번째 후보 사용 (Fallback)
-        if not selected_candidate:
-            if len(candidates) > 0 and isinstance(candidates[0], dict):
-                selected_candidate = candidates[0]
-                # print(f"[Context] ⚠️ 선택된 후보 정보를 찾을 수 없어 첫 번째 후보를 사용합니다. (ID: {selected_candidate.get('id', 'unknown')})")
-            else:
-                 return context # 후보가 없거나 이상함
-
-        # 3. 평탄화
-        # candidates 내부의 output을 최상위로 올림
-        # 구조 1: { "output": { ... } } -> output 추출
-        # 구조 2: { ... } -> 그대로 사용
-        if "output" in selected_candidate and isinstance(selected_candidate["output"], dict):
-            output = selected_candidate["output"]
-        else:
-            output = selected_candidate.copy()
-            # 내부 관리용 ID 제거
-            for key in ["id", "candidate_id"]:
-                if key in output:
-                    del output[key]
-
-        flattened = context.copy()
-        flattened.update(output) # 덮어쓰기
-        
-        # candidates 제거 (혼동 방지)
-        if "candidates" in flattened:
-            del flattened["candidates"]
-            
+
+        selected_candidate, method = select_candidate(context, step_qa, step)
+        if selected_candidate is None:
+            return context # 후보가 없거나 이상함
+        record_selection(method)
+
+        # 평탄화: context(선택 정보 제외) + 선택된 후보의 output을 최상위로 (내부 관리용 ID 제외) - 새 dict 1개
+        flattened = {key: value for key, value in context.items() if key not in SELECTION_KEYS}
+        for key, value in _candidate_output(selected_candidate).items():
+            if key not in CANDIDATE_ID_KEYS:
+                flattened[key] = value
         return flattened
         
     except Exception as e:
-        print(f"[flatten_context] ❌ Error: {e}")
+        logger.error("[flatten_context] Error: %s", e)
         return context
@@ -0,0 +1,164 @@
+"""
+답변 검증
+질문 카탈로그(questions.json / marketing.json)의 required / question_type / options / max_selections로
+단계별 검증기를 미리 만들어 두고, user_input을 LLM 호출 전에 검사
+
+지원 형식
+- answers.json 형식: {"questions": [{"id", "question_text", "answer"}, ...]} → 엄격 검사 (필수 답변, 모르는 질문 포함)
+- 평면 형식: {질문 id: 답변} → 카탈로그 질문 id가 하나라도 있으면 같은 규칙으로 검사
+- 카탈로그 질문 id가 없는 자유 형식 (레거시 q1, q2 ... ) → 검사하지 않음
+
+오류 형식은 FastAPI 422 응답과 같은 {"type", "loc", "msg"} (loc은 user_input 기준)
+"""
+from typing import Any, Callable, Dict, List
+
+CHOICE_TYPES = {"single_choice", "multiple_choice"}
+
+# 답변 1개 검사 함수: (answer, loc) → 오류 리스트
+AnswerCheck = Callable[[Any, List[Any]], List[Dict[str, Any]]]
+
+
+def _error(error_type: str, loc: List[Any], msg: str) -> Dict[str, Any]:
+    return {"type": error_type, "loc": list(loc), "msg": msg}
+
+
+def _is_empty(answer: Any) -> bool:
+    if isinstance(answer, str):
+        return not answer.strip()
+    return answer is None or answer == [] or answer == {}
+
+
+def _compile_option_check(question: Dict[str, Any]) -> AnswerCheck:
+    """선택지 1개 검사 (option dict의 value / id, 또는 value / id / text 문자열)"""
+    options = question.get("options") or []
+    values = frozenset(option.get("value") for option in options)
+    ids = frozenset(option.get("id") for option in options)
+    texts = frozenset(option.get("text") for option in options)
+    question_id = question.get("id")
+
+    def check(option: Any, loc: List[Any]) -> List[Dict[str, Any]]:
+        if isinstance(option, dict):
+            if option.get("value") in values or (option.get("value") is None and option.get("id") in ids):
+                detail = option.get("text_input_value")
+                if detail is not None and not isinstance(detail, str):
+                    return [_error("string_type", loc + ["text_input_value"], "직접 입력 값은 문자열이어야 합니다")]
+                return []
+            shown = option.get("value", option.get("id"))
+        elif isinstance(option, str):
+            if option in values or option in ids or option in texts:
+                return []
+            shown = option
+        else:
+            return [_error("choice_type", loc, f"선택지 형식이 아닙니다 ({question_id})")]
+        return [_error("invalid_option", loc, f"{question_id}에 없는 선택지입니다: {shown}")]
+
+    return check
+
+
+def compile_answer_check(question: Dict[str, Any]) -> AnswerCheck:
+    """질문 1개의 답변 검사 함수 생성 (question_type이 없으면 options 유무로 판단)"""
+    question_id = question.get("id")
+    question_type = question.get("question_type") or ("single_choice" if question.get("options") else "short_answer")
+
+    if question_type in CHOICE_TYPES:
+        check_option = _compile_option_check(question)
+        multiple = question_type == "multiple_choice"
+        max_selections = question.get("max_selections")
+
+        def check_choice(answer: Any, loc: List[Any]) -> List[Dict[str, Any]]:
+            if not isinstance(answer, list):
+                return check_option(answer, loc)
+            if not multiple and len(answer) > 1:
+                return [_error("too_many_selections", loc, f"{question_id}는 하나만 선택할 수 있습니다")]
+            if max_selections and len(answer) > max_selections:
+                return [_error("too_many_selections", loc,
+                               f"{question_id}는 최대 {max_selections}개까지 선택할 수 있습니다 ({len(answer)}개 선택)")]
+            errors = []
+            for index, option in enumerate(answer):
+                errors.extend(check_option(option, loc + [index]))
+            return errors
+
+        return check_choice
+
+    def check_text(answer: Any, loc: List[Any]) -> List[Dict[str, Any]]:
+        if isinstance(answer, dict) and "value" in answer:  # {"value": ...} 래핑 (extract_answer_value와 동일)
+            answer = answer["value"]
+        if isinstance(answer, (str, int, float)) and not isinstance(answer, bool):
+            return []
+        return [_error("string_type", loc, f"{question_id}의 답변은 문자열이어야 합니다")]
+
+    return check_text
+
+
+class StepValidator:
+    """단계 1개의 답변 검증기 (질문 카탈로그 로드 시 생성)"""
+
+    def __init__(self, step_num: int, questions: List[Dict[str, Any]]):
+        self.step_num = step_num
+        self.checks: Dict[str, AnswerCheck] = {}
+        self.by_text: Dict[str, str] = {}  # question_text → id (id 없이 온 답변용)
+        self.required: List[str] = []
+        for question in questions:
+            question_id = question.get("id")
+            if not question_id:
+                continue
+            self.checks[question_id] = compile_answer_check(question)
+            if question.get("question_text"):
+                self.by_text[question["question_text"]] = question_id
+            if question.get("required"):
+                self.required.append(question_id)
+
+    def validate(self, user_input: Any) -> List[Dict[str, Any]]:
+        """
+        user_input 검사
+
+        Returns:
+            오류 리스트 (비어 있으면 통과)
+        """
+        if not isinstance(user_input, dict) or not user_input:
+            return [_error("missing", [], f"Step {self.step_num} 답변이 없습니다")]
+
+        if "questions" in user_input:
+            return self._validate_questions(user_input["questions"])
+
+        if not any(key in self.checks for key in user_input):
+            return []  # 레거시 자유 형식
+        return self._validate_answers(
+            [(key, answer, [key]) for key, answer in user_input.items() if key in self.checks], []
+        )
+
+    def _validate_questions(self, questions: Any) -> List[Dict[str, Any]]:
+        if not isinstance(questions, list):
+            return [_error("list_type", ["questions"], "questions는 리스트여야 합니다")]
+
+        errors, answers = [], []
+        for index, item in enumerate(questions):
+            loc = ["questions", index]
+            if not isinstance(item, dict):
+                errors.append(_error("dict_type", loc, "질문 항목은 객체여야 합니다"))
+                continue
+            question_id = item.get("id") or self.by_text.get(item.get("question_text"))
+            if question_id not in self.checks:
+                errors.append(_error("unknown_question", loc + ["id"],
+                                     f"Step {self.step_num}에 없는 질문입니다: {item.get('id') or item.get('question_text')}"))
+                continue
+            answers.append((question_id, item.get("answer"), loc + ["answer"]))
+        return errors + self._validate_answers(answers, ["questions"])
+
+    def _validate_answers(self, answers: List[tuple], missing_loc: List[Any]) -> List[Dict[str, Any]]:
+        errors, answered = [], set()
+        for question_id, answer, loc in answers:
+            if _is_empty(answer):
+                continue
+            answered.add(question_id)
+            errors.extend(self.checks[question_id](answer, loc))
+        for question_id in self.required:
+            if question_id not in answered:
+                errors.append(_error("missing", missing_loc + [question_id], f"필수 질문에 답변이 없습니다: {question_id}"))
+        return errors
+
+
+def compile_validators(steps: Dict[int, List[Dict[str, Any]]]) -> Dict[int, StepValidator]:
+    """단계별 질문 리스트 → 단계별 검증기"""
+    return {step_num: StepValidator(step_num, questions) for step_num, questions in steps.items()}
+
@@ -0,0 +1,86 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.services.bulkhead import Bulkhead, BulkheadFullError, BulkheadMiddleware
+from langgraph_system.executor import TEXT_POOL, IMAGE_POOL
+
+
+def test_bulkhead_queue_and_reject():
+    async def scenario():
+        bulkhead = Bulkhead("image", max_concurrent=1, max_queue=1, expected_seconds=30)
+        release = asyncio.Event()
+        order = []
+
+        async def work(name, reject=True):
+            async with bulkhead.acquire(reject):
+                order.append(name)
+                await release.wait()
+
+        first = asyncio.ensure_future(work("first"))
+        second = asyncio.ensure_future(work("second"))
+        await asyncio.sleep(0)
+        assert (bulkhead.active, bulkhead.queued) == (1, 1)
+
+        # 실행 1 + 대기 1 → 세 번째는 즉시 거절, 백그라운드 작업(reject=False)은 대기
+        try:
+            await bulkhead.enter()
+            assert False, "대기열 초과 시 거절해야 함"
+        except BulkheadFullError as e:
+            assert e.retry_after == 30
+        background = asyncio.ensure_future(work("background", reject=False))
+        await asyncio.sleep(0)
+        assert bulkhead.queued == 2
+
+        release.set()
+        await asyncio.gather(first, second, background)
+        assert order == ["first", "second", "background"]
+        assert bulkhead.stats()["active"] == 0 and bulkhead.stats()["rejected"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_logo_burst_does_not_block_text_steps():
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.post("/brands/logo")
+    async def logo():
+        await release.wait()
+        return {"step": 5}
+
+    @app.post("/brands/naming")
+    async def naming():
+        return {"step": 2}
+
+    bulkheads = {
+        TEXT_POOL: Bulkhead(TEXT_POOL, max_concurrent=4, max_queue=4),
+        IMAGE_POOL: Bulkhead(IMAGE_POOL, max_concurrent=1, max_queue=0, expected_seconds=20)
+    }
+    app.add_middleware(BulkheadMiddleware, bulkheads=bulkheads)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            running = asyncio.ensure_future(client.post("/brands/logo"))
+            while bulkheads[IMAGE_POOL].active == 0:
+                await asyncio.sleep(0.01)
+
+            rejected = await client.post("/brands/logo")
+            assert rejected.status_code == 429 and rejected.headers["Retry-After"] == "20"
+            assert (await client.post("/brands/naming")).json() == {"step": 2}
+
+            release.set()
+            assert (await running).status_code == 200
+
+    asyncio.run(scenario())
+    assert bulkheads[TEXT_POOL].stats()["admitted"] == 1
+    assert TestClient(app).post("/brands/logo").status_code == 200
+
+
+if __name__ == "__main__":
+    test_bulkhead_queue_and_reject()
+    test_logo_burst_does_not_block_text_steps()
+    print("✅ bulkhead 테스트 통과")
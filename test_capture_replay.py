@@ -0,0 +1,107 @@
+import asyncio
+import json
+import os
+import tempfile
+
+import openai
+
+from api.services.capture import redact, REDACTED
+from benchmarks.replay import replay
+from langgraph_system.providers import ProviderRegistry
+from langgraph_system.prompts import GenerationPrompts
+from langgraph_system.llm import chat_json, astream_chat_json, generate_image
+from langgraph_system.recording import start_recording, stop_recording
+from test_fake_providers import _start_fake_server, _configure
+
+
+def test_redact():
+    body = {
+        "user_input": {"questions": [{"answer": "연락처는 010-1234-5678, a.b@example.com 입니다"}]},
+        "context": {"API_KEY": "sk-123", "Email": {"nested": "x"}},
+        "use_cache": False
+    }
+    redacted = redact(body)
+    assert redacted["user_input"]["questions"][0]["answer"] == f"연락처는 {REDACTED}, {REDACTED} 입니다"
+    assert redacted["context"] == {"API_KEY": REDACTED, "Email": REDACTED}
+    assert redacted["use_cache"] is False
+
+
+def test_record_then_replay_without_network():
+    server, url = _start_fake_server()
+    try:
+        _configure(url, **{name: {"latency": "fixed:0"} for name in ("openai", "gemini", "cloudinary")})
+        recorder = ProviderRegistry(mode="fake", fake_url=url, capture=True)
+
+        token = start_recording()
+        chat_json(recorder.openai(), GenerationPrompts.NAMING_SYSTEM, "q")
+        image = generate_image(recorder.gemini(), "logo prompt")
+        streamed = asyncio.run(astream_chat_json(recorder.async_openai(), GenerationPrompts.LOGO_SYSTEM, "q"))
+        calls = stop_recording(token)
+        # 녹화 중이 아닐 때는 기록하지 않음
+        chat_json(recorder.openai(), GenerationPrompts.NAMING_SYSTEM, "q")
+    finally:
+        server.should_exit = True
+
+    assert [(c["provider"], c["step"], c["stream"]) for c in calls] == [
+        ("openai", "naming", False), ("gemini", "logo_image", False), ("openai", "logo", True)
+    ]
+
+    with tempfile.TemporaryDirectory() as capture_dir:
+        with open(os.path.join(capture_dir, "capture-1.jsonl"), "w", encoding="utf-8") as f:
+            f.write(json.dumps({"ts": 1, "path": "/brands/logo", "provider_calls": calls}) + "\n")
+
+        # 가짜 서버 종료 후에도 녹화된 응답 그대로 재생
+        player = ProviderRegistry(mode="replay", replay_capture=capture_dir)
+        replayed = chat_json(player.openai(), GenerationPrompts.NAMING_SYSTEM, "q")
+        assert replayed == json.loads(calls[0]["body"])["choices"][0]["message"]["content"]
+        assert generate_image(player.gemini(), "logo prompt") == image
+        assert asyncio.run(astream_chat_json(player.async_openai(), GenerationPrompts.LOGO_SYSTEM, "q")) == streamed
+
+        # 프롬프트가 달라도 같은 단계 녹화로 대체, 녹화가 없는 단계는 404
+        assert chat_json(player.openai(), GenerationPrompts.NAMING_SYSTEM, "other") == replayed
+        try:
+            chat_json(player.openai().with_options(max_retries=0), GenerationPrompts.STORY_SYSTEM, "q")
+            assert False, "녹화 없는 단계는 실패해야 함"
+        except openai.NotFoundError:
+            pass
+        assert player.stats()["replay"] == {"capture": capture_dir, "exact": 3, "step": 1, "miss": 1}
+
+
+def test_replay_remaps_journey_output_id():
+    class RecordingTarget:
+        def __init__(self):
+            self.bodies = []
+
+        async def send(self, record, body):
+            self.bodies.append((record["path"], body))
+            await asyncio.sleep(0.01)
+            if record["path"] == "/brands/interview":
+                return True, f"output_new_{record['output_id']}"
+            return True, None
+
+    # 두 여정이 섞여 녹화됨 - Step 2는 세션 참조(후보 id만), Step 3은 context.interview.output_id로 참조
+    records = [
+        {"ts": 1, "path": "/brands/interview", "body": {"user_input": "a"}, "output_id": "output_1"},
+        {"ts": 2, "path": "/brands/interview", "body": {"user_input": "b"}, "output_id": "output_2"},
+        {"ts": 3, "path": "/brands/naming", "body": {"output_id": "output_2"}},
+        {"ts": 4, "path": "/brands/concept", "body": {"context": {"interview": {"output_id": "output_1"}}}},
+        {"ts": 5, "path": "/brands/naming", "body": {"output_id": "output_9"}}
+    ]
+    target = RecordingTarget()
+    result = asyncio.run(replay(records, target, speed=0, concurrency=8))
+
+    sent = {json.dumps(body, sort_keys=True) for _, body in target.bodies}
+    concept = next(body for path, body in target.bodies if path == "/brands/concept")
+    assert json.dumps({"output_id": "output_new_output_2"}) in sent
+    assert concept["context"]["interview"]["output_id"] == "output_new_output_1"
+    # Step 1이 녹화되지 않은 여정은 그대로, 녹화 원본은 변경하지 않음
+    assert json.dumps({"output_id": "output_9"}) in sent
+    assert records[2]["body"] == {"output_id": "output_2"}
+    assert result["requests"] == 5
+
+
+if __name__ == "__main__":
+    test_redact()
+    test_record_then_replay_without_network()
+    test_replay_remaps_journey_output_id()
+    print("✅ capture / replay 테스트 통과")
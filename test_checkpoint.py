@@ -0,0 +1,90 @@
+import os
+import tempfile
+import time
+from typing import TypedDict
+
+from langgraph.graph import StateGraph, END
+
+from langgraph_system.checkpoint import BatchedCheckpointSaver, CompactSerializer, SQLiteCheckpointStore
+
+
+class _State(TypedDict, total=False):
+    step: int
+    history: list
+    context: dict
+
+
+def _graph(checkpointer):
+    workflow = StateGraph(_State)
+    workflow.add_node("run", lambda state: {"history": (state.get("history") or []) + [state["step"]]})
+    workflow.set_entry_point("run")
+    workflow.add_edge("run", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def test_compact_serializer():
+    serde = CompactSerializer(compress_min_bytes=64)
+    small, large = {"a": 1}, {"candidates": ["브랜드 스토리 " * 20] * 3}
+    assert serde.dumps_typed(small)[0] == "msgpack"
+    type_, data = serde.dumps_typed(large)
+    assert type_ == "msgpack+zlib" and len(data) < len(CompactSerializer(10 ** 9).dumps_typed(large)[1])
+    assert serde.loads_typed((type_, data)) == large
+
+
+def test_state_resumes_from_sqlite_after_restart():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "checkpoints.sqlite")
+        config = {"configurable": {"thread_id": "output_01"}}
+
+        saver = BatchedCheckpointSaver(SQLiteCheckpointStore(path), flush_interval=0)
+        graph = _graph(saver)
+        graph.invoke({"step": 1, "context": {"brand": "A"}}, config)
+        graph.invoke({"step": 2}, config)  # context는 체크포인트에서 유지
+        saver.close()  # 변경된 thread의 최신 체크포인트만 1행으로 저장
+
+        restarted = BatchedCheckpointSaver(SQLiteCheckpointStore(path), flush_interval=0)
+        result = _graph(restarted).invoke({"step": 3}, config)
+        assert result == {"step": 3, "history": [1, 2, 3], "context": {"brand": "A"}}
+        assert restarted.stats()["loads"] == 1
+        assert _graph(restarted).get_state({"configurable": {"thread_id": "unknown"}}).values == {}
+
+        # TTL 정리: 메모리 / DB 모두 삭제
+        restarted.flush()
+        restarted.ttl = restarted.cache_seconds = 0
+        time.sleep(0.01)
+        assert restarted.prune_expired() == 2
+        restarted.close()
+        assert BatchedCheckpointSaver(SQLiteCheckpointStore(path), flush_interval=0).get_tuple(config) is None
+
+
+def test_memory_saver_keeps_only_latest_checkpoint():
+    saver = BatchedCheckpointSaver(flush_interval=0)
+    graph = _graph(saver)
+    config = {"configurable": {"thread_id": "t"}}
+    for step in range(5):
+        graph.invoke({"step": step}, config)
+    saver.flush()
+    assert len(saver.storage["t"][""]) == 1
+    assert graph.get_state(config).values["history"] == [0, 1, 2, 3, 4]
+
+
+def test_memory_saver_bounds_thread_count():
+    saver = BatchedCheckpointSaver(flush_interval=0, max_threads=2)
+    graph = _graph(saver)
+    for index in range(5):
+        graph.invoke({"step": index}, {"configurable": {"thread_id": f"output_{index}"}})
+        time.sleep(0.001)
+    saver.flush()
+    # 오래 사용하지 않은 thread부터 제거, 최근 thread는 그대로 이어서 실행
+    assert sorted(saver.storage) == ["output_3", "output_4"]
+    assert saver.stats()["evicted"] == 3
+    result = graph.invoke({"step": 9}, {"configurable": {"thread_id": "output_4"}})
+    assert result["history"] == [4, 9]
+
+
+if __name__ == "__main__":
+    test_compact_serializer()
+    test_state_resumes_from_sqlite_after_restart()
+    test_memory_saver_keeps_only_latest_checkpoint()
+    test_memory_saver_bounds_thread_count()
+    print("✅ checkpoint 테스트 통과")
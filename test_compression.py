@@ -0,0 +1,117 @@
+import asyncio
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from api.routers.brand import build_logo_response
+from api.schemas.response import NamingResponse, DiagnosisStateContext, LogoCandidate
+from api.services.session_manager import session_manager
+from api.services.compression import CompressionMiddleware, negotiate_encoding
+from api.services.fastjson import OrjsonResponse, model_response
+
+
+def build_app() -> FastAPI:
+    app = FastAPI(default_response_class=OrjsonResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return {"candidates": [{"id": i, "brand_story": "브랜드 스토리 " * 50} for i in range(3)]}
+
+    @app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter(["data: " + "x" * 2000 + "\n\n"]), media_type="text/event-stream")
+
+    return app
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip, deflate, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("gzip, deflate, br", ("gzip",)) == "gzip"
+    assert negotiate_encoding("gzip;q=0", ("gzip",)) is None
+    assert negotiate_encoding("*", ("gzip",)) == "gzip"
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+
+
+def test_compression_middleware():
+    client = TestClient(build_app())
+
+    # 기준 크기 이상 → gzip (TestClient가 자동 해제한 본문은 원본과 같음)
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(json.dumps(response.json(), ensure_ascii=False).encode())
+    assert response.json()["candidates"][2]["id"] == 2
+
+    raw = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert gzip.decompress(gzip.compress(raw.content)) == raw.content
+
+    # 작은 응답 / 스트리밍 응답은 그대로
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers and small.json() == {"status": "ok"}
+    stream = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in stream.headers and stream.text.startswith("data: ")
+
+
+def test_typed_response_shape():
+    # 후보 2개 → result에는 name1, name2만 (이전 dict 응답과 같은 형태)
+    candidates = [
+        {"id": i, "brand_name": f"Nova{i}", "name_rationale": "근거", "qa_analysis_summary": "요약", "qa_keywords": ["a"]}
+        for i in range(2)
+    ]
+    model = NamingResponse(result={"name1": "Nova0", "name2": "Nova1"}, state_context={"candidates": candidates})
+    body = json.loads(model_response(model).body)
+    assert body == {"result": {"name1": "Nova0", "name2": "Nova1"}, "state_context": {"candidates": candidates}}
+
+    # LLM 출력이 None / 숫자인 필드는 문자열로 보정
+    coerced = NamingResponse(result={"name1": 2024}, state_context={"candidates": [{"id": 0, "brand_name": None}]})
+    assert coerced.result.name1 == "2024" and coerced.state_context.candidates[0].brand_name == ""
+
+
+def test_off_schema_llm_output():
+    # 스키마와 다른 LLM 출력도 검증 오류(500) 없이 응답 - 목록 / 구조 필드는 그대로, 문자열 필드는 JSON 문자열
+    persona = {"age": "30대", "job": "개발자"}
+    context = DiagnosisStateContext(target_persona=persona, keywords="모빌리티", tone={"main": "따뜻함"})
+    assert context.target_persona == persona and context.keywords == ["모빌리티"]
+    assert json.loads(context.tone) == {"main": "따뜻함"}
+    # perspectives가 객체가 아니면 빈 객체로
+    for perspectives in (None, ["Business"], "Business 관점"):
+        assert DiagnosisStateContext(perspectives=perspectives).perspectives == {}
+    assert DiagnosisStateContext(perspectives={"business": "B2C"}).perspectives == {"business": "B2C"}
+
+    palette = [{"hex": "#1A2B3C", "name": "Navy"}, "#FFFFFF"]
+    logo = LogoCandidate(id=0, color_palette=palette, logo_concept=["심볼", "워드마크"], qa_keywords=None)
+    assert logo.color_palette == palette and logo.qa_keywords == []
+    assert json.loads(logo.model_dump_json())["color_palette"][0]["hex"] == "#1A2B3C"
+
+
+def test_failed_logo_render_is_null():
+    # 이미지 생성 실패 → result / state_context 모두 null, 세션에도 검증된 응답과 같은 값 저장
+    result_state = {"output_id": "output_test_logo", "logo_candidates": [
+        {"output": {"logo_image_url": None, "logo_concept": "심볼", "color_palette": [{"hex": "#000000"}]}},
+        {"output": {"logo_image_url": "https://cdn.example.com/logo_2.png", "logo_concept": "워드마크"}}
+    ]}
+    body = json.loads(model_response(asyncio.run(build_logo_response(result_state))).body)
+    assert body["result"] == {"logo1_url": None, "logo2_url": "https://cdn.example.com/logo_2.png"}
+    assert [c["logo_image_url"] for c in body["state_context"]["candidates"]] == [None, "https://cdn.example.com/logo_2.png"]
+    saved = session_manager.get_session("output_test_logo")["logo"]["candidates"]
+    assert saved == body["state_context"]["candidates"]
+    session_manager.delete_session("output_test_logo")
+
+
+if __name__ == "__main__":
+    test_negotiate_encoding()
+    test_compression_middleware()
+    test_typed_response_shape()
+    test_off_schema_llm_output()
+    test_failed_logo_render_is_null()
+    print("✅ 응답 직렬화 / 압축 테스트 통과")
@@ -0,0 +1,120 @@
+import asyncio
+import socket
+import threading
+import time
+
+import httpx
+import openai
+import uvicorn
+
+from fake_providers import create_app
+from langgraph_system.providers import ProviderRegistry
+from langgraph_system.prompts import GenerationPrompts
+from langgraph_system.llm import chat_json, astream_chat_json, generate_image
+from langgraph_system.json_stream import parse_options
+
+
+def _start_fake_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(create_app(seed=1), host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def _configure(url, **providers):
+    httpx.put(f"{url}/_fake/config", json=providers).raise_for_status()
+
+
+def test_fake_providers_roundtrip():
+    server, url = _start_fake_server()
+    try:
+        _configure(url, **{name: {"latency": "fixed:0"} for name in ("openai", "gemini", "cloudinary")})
+        registry = ProviderRegistry(mode="fake", fake_url=url)
+
+        # OpenAI: 단계별 스키마 (동기 / 스트리밍)
+        content = chat_json(registry.openai(), GenerationPrompts.NAMING_SYSTEM, "q")
+        assert [set(o) for o in parse_options(content)] == [{"brand_name", "name_rationale", "qa_analysis_summary", "qa_keywords"}] * 3
+
+        deltas = []
+        content = asyncio.run(astream_chat_json(
+            registry.async_openai(), GenerationPrompts.LOGO_SYSTEM, "q", on_delta=deltas.append
+        ))
+        assert len(deltas) > 1
+        assert [o["layout_type"] for o in parse_options(content)] == ["Horizontal", "Integrated", "Stacked"]
+
+        # Gemini: PNG 이미지
+        image = generate_image(registry.gemini(), "logo prompt")
+        assert image.startswith(b"\x89PNG")
+
+        # Cloudinary: 가짜 secure_url
+        import cloudinary.uploader
+        registry.configure_cloudinary()
+        result = cloudinary.uploader.upload(image, folder="logos/output_test", public_id="logo_1")
+        assert result["secure_url"].startswith(f"{url}/fake-cdn/")
+        assert result["secure_url"].endswith("/image/upload/logos/output_test/logo_1.png")
+
+        # Rate Limit: 429 + Retry-After
+        _configure(url, openai={"rate_limit_rate": 1, "retry_after": 3})
+        # chat_json은 429를 재시도하므로 SDK로 1회만 호출
+        client = registry.openai().with_options(max_retries=0)
+        try:
+            client.chat.completions.create(model="gpt-5.1", messages=[{"role": "user", "content": "q"}])
+            assert False, "429 응답이 와야 함"
+        except openai.RateLimitError as e:
+            assert e.response.headers["retry-after"] == "3"
+
+        stats = httpx.get(f"{url}/_fake/stats").json()
+        assert stats["openai"]["rate_limited"] == 1
+        assert stats["gemini"]["ok"] == 1 and stats["cloudinary"]["ok"] == 1
+    finally:
+        server.should_exit = True
+
+
+def test_async_clients_closed_on_loop_change():
+    server, url = _start_fake_server()
+    try:
+        _configure(url, openai={"latency": "fixed:0"})
+        registry = ProviderRegistry(mode="fake", fake_url=url)
+
+        async def call():
+            client = registry.async_openai()
+            await client.chat.completions.create(model="gpt-5.1", messages=[{"role": "user", "content": "q"}])
+
+        # 이전 루프가 닫힘 → 커넥션 소켓 직접 종료
+        asyncio.run(call())
+        closed_loop_client = registry._async_http["openai"]
+        conn = closed_loop_client._transport._pool.connections[0]
+        sock = conn._connection._network_stream.get_extra_info("socket")
+        asyncio.run(call())
+        assert sock.fileno() == -1
+        assert registry._async_http["openai"] is not closed_loop_client
+
+        # 이전 루프가 다른 스레드에서 실행 중 → 그 루프에서 aclose()
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(call(), other_loop).result(timeout=10)
+            running_loop_client = registry._async_http["openai"]
+            asyncio.run(call())
+            deadline = time.time() + 5
+            while not running_loop_client.is_closed and time.time() < deadline:
+                time.sleep(0.01)
+            assert running_loop_client.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    test_fake_providers_roundtrip()
+    test_async_clients_closed_on_loop_change()
+    print("✅ fake_providers 테스트 통과")
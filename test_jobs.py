@@ -0,0 +1,70 @@
+import asyncio
+import os
+import tempfile
+
+from api.services.jobs import JobManager, JobQueueFullError, SUCCEEDED, FAILED, RUNNING
+
+
+def test_jobs_run_in_background_and_survive_restart():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "jobs.sqlite")
+
+        async def scenario():
+            manager = JobManager(db_path, workers=1, max_pending=2)
+            release = asyncio.Event()
+
+            async def logo_job(progress):
+                await progress.update("rendering", logos={0: "url-0"})
+                await release.wait()
+                await progress.update(logos={1: "url-1"})
+                return {"result": {"logo1_url": "url-0"}}
+
+            async def failing_job(progress):
+                raise RuntimeError("로고 생성 실패")
+
+            first = await manager.submit("logo", "output_01", logo_job)
+            second = await manager.submit("logo", "output_02", failing_job)
+            try:
+                await manager.submit("logo", "output_03", failing_job)
+                assert False, "대기 작업 초과 시 거절해야 함"
+            except JobQueueFullError:
+                pass
+
+            # 실행 중 부분 결과 조회, 워커 1개이므로 두 번째 작업은 대기
+            await asyncio.sleep(0.05)
+            running = await manager.get(first["job_id"])
+            assert running["status"] == RUNNING and running["partial"] == {"logos": {"0": "url-0"}}
+            assert (await manager.get(second["job_id"]))["status"] == "queued"
+
+            release.set()
+            while manager.stats()["running"] or manager.stats()["queued"]:
+                await asyncio.sleep(0.01)
+            await manager.shutdown()
+            return first["job_id"], second["job_id"]
+
+        first_id, second_id = asyncio.run(scenario())
+
+        # 재시작 후에도 완료된 결과 조회
+        restarted = JobManager(db_path)
+        restarted.startup()
+        done = asyncio.run(restarted.get(first_id))
+        assert done["status"] == SUCCEEDED
+        assert done["partial"]["logos"] == {"0": "url-0", "1": "url-1"}
+        assert done["result"] == {"result": {"logo1_url": "url-0"}}
+        failed = asyncio.run(restarted.get(second_id))
+        assert failed["status"] == FAILED and failed["error"] == "로고 생성 실패"
+
+
+def test_interrupted_jobs_marked_failed_on_startup():
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = JobManager(os.path.join(tmp, "jobs.sqlite"))
+        manager.store.save({"job_id": "stale", "status": RUNNING, "updated_at": 0})
+        manager.startup()
+        job = manager.store.load("stale")
+        assert job["status"] == FAILED and "재시작" in job["error"]
+
+
+if __name__ == "__main__":
+    test_jobs_run_in_background_and_survive_restart()
+    test_interrupted_jobs_marked_failed_on_startup()
+    print("✅ jobs 테스트 통과")
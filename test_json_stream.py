@@ -0,0 +1,65 @@
+import json
+
+from langgraph_system.json_stream import OptionsStreamParser, parse_options, iter_options
+
+OPTIONS = [
+    {"brand_name": "Wander{ly}", "name_rationale": "따옴표 \"와 괄호 ] 포함", "qa_keywords": ["여행", {"k": [1, 2]}]},
+    {"brand_name": "Voyara", "name_rationale": "escape \\ 처리"},
+    {"brand_name": "Tripwise", "name_rationale": "세 번째 후보"}
+]
+DOC = json.dumps({"meta": {"options": ["중첩된 options 키는 무시"]}, "options": OPTIONS, "tail": 1}, ensure_ascii=False, indent=2)
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _check_chunk_size(size):
+    parser = OptionsStreamParser()
+    completed_at = []
+    received = ""
+    for chunk in _chunks(DOC, size):
+        received += chunk
+        for option in parser.feed(chunk):
+            completed_at.append((option, len(received)))
+
+    assert [option for option, _ in completed_at] == OPTIONS
+    assert parser.done
+
+    # 각 후보는 응답 전체가 아니라 자기 닫는 중괄호까지만 받고 완성되어야 함
+    first_option_end = DOC.index("Voyara")
+    assert completed_at[0][1] < first_option_end + size
+
+
+def test_options_complete_as_soon_as_closed():
+    for size in [1, 2, 7, 64, len(DOC)]:
+        _check_chunk_size(size)
+
+
+def test_truncated_response_keeps_completed_options():
+    truncated = DOC[:DOC.index("Tripwise")]
+    assert list(iter_options(_chunks(truncated, 5))) == OPTIONS[:2]
+    assert parse_options(truncated) == OPTIONS[:2]
+
+
+def test_surrounding_garbage_is_ignored():
+    wrapped = "```json\n" + DOC + "\n```\n{\"options\": [{\"brand_name\": \"무시\"}]}"
+    assert list(iter_options(_chunks(wrapped, 3))) == OPTIONS
+    assert parse_options(wrapped) == OPTIONS
+
+
+def test_unrecoverable_response_raises():
+    assert parse_options(json.dumps({"options": []})) == []
+    try:
+        parse_options('{"options": [{"brand_name": "잘림')
+        assert False, "복구할 후보가 없으면 JSONDecodeError"
+    except json.JSONDecodeError:
+        pass
+
+
+if __name__ == "__main__":
+    test_options_complete_as_soon_as_closed()
+    test_truncated_response_keeps_completed_options()
+    test_surrounding_garbage_is_ignored()
+    test_unrecoverable_response_raises()
+    print("✅ json_stream 테스트 통과")
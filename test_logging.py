@@ -0,0 +1,77 @@
+import io
+import json
+import os
+import tempfile
+
+from langgraph_system.graph import as_graph_node
+from langgraph_system.log import configure_logging, shutdown_logging, get_logger, log_context, log_payload
+
+
+def _capture_logs(level, run):
+    stream = io.StringIO()
+    configure_logging(level=level, fmt="json", stream=stream)
+    try:
+        run()
+    finally:
+        shutdown_logging()
+        configure_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_logs_carry_output_id_and_step():
+    logger = get_logger("test")
+
+    def node(state):
+        logger.info("노드 실행 %s", state["output_id"])
+        log_payload(logger, "상세", {"candidates": [1, 2]})
+        return {}
+
+    def run():
+        as_graph_node("test_step", node).invoke({"output_id": "42"})
+        with log_context("7"):
+            logger.warning("라우터")
+        logger.info("컨텍스트 없음")
+
+    entries = _capture_logs("INFO", run)
+    assert [(e["msg"], e["output_id"], e["step"]) for e in entries] == [
+        ("노드 실행 42", "42", "test_step"),
+        ("라우터", "7", "unknown"),
+        ("컨텍스트 없음", "-", "unknown")
+    ]
+
+
+def test_payload_only_at_debug():
+    logger = get_logger("test")
+    serialized = []
+
+    class Payload:
+        def __str__(self):
+            serialized.append(True)
+            return "payload"
+
+    # INFO에서는 payload 직렬화 자체를 하지 않음
+    assert _capture_logs("INFO", lambda: log_payload(logger, "상세", Payload())) == []
+    assert serialized == []
+
+    entries = _capture_logs("DEBUG", lambda: log_payload(logger, "상세 %s", {"a": 1}, "후보"))
+    assert entries[0]["msg"] == "상세 후보"
+    assert entries[0]["payload"] == {"a": 1}
+
+
+def test_env_file_with_runtime_settings():
+    # .env에 langgraph_system 실행 설정이 있어도 API Settings 로드 실패 없음
+    from api.config import Settings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, ".env")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("PROVIDER_MODE=fake\nLOG_LEVEL=DEBUG\nCHECKPOINTER=none\nMETRICS_ENABLED=false\nSESSION_TIMEOUT=60\n")
+        settings = Settings(_env_file=path)
+    assert settings.SESSION_TIMEOUT == 60
+
+
+if __name__ == "__main__":
+    test_logs_carry_output_id_and_step()
+    test_payload_only_at_debug()
+    test_env_file_with_runtime_settings()
+    print("✅ logging 테스트 통과")
@@ -0,0 +1,43 @@
+import asyncio
+
+from langgraph_system.graph import as_graph_node
+from langgraph_system.metrics import METRICS_AVAILABLE, LLM_LATENCY, observe, current_step
+
+
+def _sample(name, **labels):
+    from prometheus_client import REGISTRY
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_node_metrics_labelled_by_step():
+    if not METRICS_AVAILABLE:
+        print("prometheus_client 미설치 - 건너뜀")
+        return
+
+    seen_steps = []
+
+    def node(state):
+        seen_steps.append(current_step())
+        # 노드 안의 Provider 호출은 노드 step 라벨로 기록
+        with observe(LLM_LATENCY, "llm", model="test-model", stream="false"):
+            pass
+        return {"error_occurred": state.get("fail", False)}
+
+    before_count = _sample("brand_node_latency_seconds_count", step="test_step")
+    before_llm = _sample("brand_llm_latency_seconds_count", step="test_step", model="test-model", stream="false")
+    before_errors = _sample("brand_errors_total", step="test_step", component="node")
+
+    runnable = as_graph_node("test_step", node)
+    runnable.invoke({})
+    asyncio.run(runnable.ainvoke({"fail": True}))  # afunc 없음 → 스레드 풀 실행에도 step 전달
+
+    assert seen_steps == ["test_step", "test_step"]
+    assert current_step() == "unknown"
+    assert _sample("brand_node_latency_seconds_count", step="test_step") == before_count + 2
+    assert _sample("brand_llm_latency_seconds_count", step="test_step", model="test-model", stream="false") == before_llm + 2
+    assert _sample("brand_errors_total", step="test_step", component="node") == before_errors + 1
+
+
+if __name__ == "__main__":
+    test_node_metrics_labelled_by_step()
+    print("✅ metrics 테스트 통과")
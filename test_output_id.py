@@ -0,0 +1,60 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
+
+from api.services.output_id import OutputIdAllocator
+
+PROCESSES = 4
+THREADS = 4
+PER_THREAD = 250
+
+
+def _allocate_many(args):
+    outputs_dir, mode = args
+    allocator = OutputIdAllocator(outputs_dir, mode)
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        batches = pool.map(lambda _: [allocator.allocate() for _ in range(PER_THREAD)], range(THREADS))
+    return [output_id for batch in batches for output_id in batch]
+
+
+def _run(mode):
+    with tempfile.TemporaryDirectory() as outputs_dir:
+        # 기존 output 폴더가 있으면 그 다음 번호부터 발급
+        os.makedirs(os.path.join(outputs_dir, "output_07"))
+
+        start = time.perf_counter()
+        with get_context("spawn").Pool(PROCESSES) as pool:
+            results = pool.map(_allocate_many, [(outputs_dir, mode)] * PROCESSES)
+        elapsed = time.perf_counter() - start
+
+    ids = [output_id for result in results for output_id in result]
+    return ids, elapsed
+
+
+def test_counter_allocator_no_collisions():
+    ids, elapsed = _run("counter")
+    total = PROCESSES * THREADS * PER_THREAD
+
+    print(f"\n[counter] {total} allocations in {elapsed:.2f}s ({total / elapsed:.0f}/s)")
+    assert len(ids) == total
+    assert len(set(ids)) == total
+    assert all(output_id.startswith("output_") for output_id in ids)
+
+    numbers = sorted(int(output_id.split("_")[1]) for output_id in ids)
+    assert numbers == list(range(8, 8 + total))
+
+
+def test_time_allocator_no_collisions():
+    ids, elapsed = _run("time")
+    total = PROCESSES * THREADS * PER_THREAD
+
+    print(f"\n[time] {total} allocations in {elapsed:.2f}s ({total / elapsed:.0f}/s)")
+    assert len(set(ids)) == total
+    assert all(output_id.startswith("output_") for output_id in ids)
+
+
+if __name__ == "__main__":
+    test_counter_allocator_no_collisions()
+    test_time_allocator_no_collisions()
@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+import tempfile
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from langgraph_system.questions import QuestionCatalog, question_catalog, ROOT_DIR
+from api.routers import questions
+
+
+def test_catalog_index_and_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        for file_name in ["questions.json", "marketing.json"]:
+            shutil.copy(os.path.join(ROOT_DIR, file_name), tmp)
+        catalog = QuestionCatalog(base_dir=tmp, check_interval=0)
+
+        assert catalog.step(1)["questions"][0]["id"] == "s1_one_line_definition"
+        assert catalog.question("s6_icon_style")["step"] == 6
+        assert catalog.by_context_key("service_definition")["id"] == "s1_one_line_definition"
+        version, (_, etag) = catalog.version, catalog.payload(2)
+
+        # 반환값 수정이 카탈로그에 반영되지 않음
+        catalog.step(1)["title"] = "changed"
+        assert catalog.step(1)["title"] != "changed"
+
+        # 파일 변경 → 재로드, 바뀐 단계의 ETag만 변경
+        path = os.path.join(tmp, "questions.json")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["step_1"]["title"] = "Identity"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        assert catalog.step(1)["title"] == "Identity"
+        assert catalog.version != version and catalog.payload(2)[1] == etag and catalog.loads == 2
+
+        # 깨진 파일 → 이전 버전 유지
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{")
+        assert catalog.step(1)["title"] == "Identity" and catalog.load_errors == 1
+
+
+def test_questions_endpoint_etag():
+    app = FastAPI()
+    app.include_router(questions.router)
+    client = TestClient(app)
+
+    response = client.get("/questions/3")
+    assert response.status_code == 200 and response.json()["step"] == 3
+    etag = response.headers["etag"]
+
+    cached = client.get("/questions/3", headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b"" and cached.headers["etag"] == etag
+    assert client.get("/questions/4", headers={"If-None-Match": etag}).status_code == 200
+    assert client.get("/questions/10").status_code == 404
+
+
+def test_answer_validation():
+    with open(os.path.join(ROOT_DIR, "answers.json"), encoding="utf-8") as f:
+        answers = json.load(f)
+    for step_num in range(1, 6):
+        assert question_catalog.validate(step_num, answers[f"step_{step_num}"]) == []
+
+    step_2 = answers["step_2"]
+    questions = [dict(item) for item in step_2["questions"]]
+    questions[0]["answer"] = {"id": "style_x", "value": "Unknown Style"}   # 없는 선택지
+    questions[3]["answer"] = questions[3]["answer"] * 2                    # 최대 선택 수 초과
+    questions[1]["answer"] = ""                                            # 필수 답변 누락
+    questions.append({"id": "s1_core_problem", "answer": "다른 단계 질문"})
+    errors = question_catalog.validate(2, {**step_2, "questions": questions})
+    assert {(error["type"], tuple(error["loc"])) for error in errors} == {
+        ("invalid_option", ("questions", 0, "answer")),
+        ("too_many_selections", ("questions", 3, "answer")),
+        ("unknown_question", ("questions", len(questions) - 1, "id")),
+        ("missing", ("questions", questions[1]["id"]))
+    }
+
+    # 평면 형식: 카탈로그 질문 id가 있으면 검사, 레거시 자유 형식은 통과
+    assert question_catalog.validate(1, {"s1_one_line_definition": ["a"]})[0]["type"] == "string_type"
+    assert question_catalog.validate(1, {"q1": {"value": "IT 스타트업"}}) == []
+    assert question_catalog.validate(1, {})[0]["type"] == "missing"
+
+
+if __name__ == "__main__":
+    test_catalog_index_and_reload()
+    test_questions_endpoint_etag()
+    test_answer_validation()
+    print("✅ 질문 카탈로그 테스트 통과")
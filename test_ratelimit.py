@@ -0,0 +1,111 @@
+import asyncio
+import os
+import tempfile
+
+from langgraph_system.ratelimit import RateLimiter, RateLimitTimeout, Ticket, estimate_tokens, parse_duration
+
+
+def _limiter(**kwargs) -> RateLimiter:
+    kwargs.setdefault("limits", {"openai": (2, 1000)})
+    return RateLimiter(enabled=True, **kwargs)
+
+
+def _reserve_wait(limiter: RateLimiter, tokens: int = 0) -> float:
+    ticket = Ticket("openai:gpt", "openai", tokens)
+    return limiter.store.update(ticket.key, lambda state: limiter._reserve(state, ticket))
+
+
+def test_helpers():
+    assert estimate_tokens("abcdefgh", "브랜드") == 2 + 3
+    assert parse_duration("6m0s") == 360 and parse_duration("120ms") == 0.12 and parse_duration("20") == 20
+    assert parse_duration("") is None
+
+
+def test_reservations_queue_in_arrival_order():
+    limiter = _limiter()
+    # RPM 2: 버킷이 가득 찬 상태로 시작 → 2건 즉시, 이후는 30초(60/2) 간격으로 차례 대기
+    waits = [_reserve_wait(limiter) for _ in range(4)]
+    assert waits[:2] == [0, 0]
+    assert 29 < waits[2] < 30.1 and 59 < waits[3] < 60.1
+
+    # TPM: 예상 토큰이 잔량보다 많으면 대기, 실제 사용량으로 정산하면 반환
+    limiter = _limiter(limits={"openai": (0, 1000)})
+    assert limiter.acquire("openai", "gpt", 800) is not None
+    ticket = limiter.acquire("openai", "gpt", 200)
+    limiter.settle(ticket, 50)
+    assert 140 < limiter.stats()["buckets"]["openai:gpt"]["tokens_available"] < 160
+
+    # 최대 대기 초과 시 예약 취소 후 실패
+    limiter = _limiter(max_wait=10)
+    limiter.acquire("openai", "gpt")
+    limiter.acquire("openai", "gpt")
+    try:
+        limiter.acquire("openai", "gpt")
+        assert False, "최대 대기 시간을 넘으면 실패해야 함"
+    except RateLimitTimeout:
+        pass
+    assert limiter.stats()["buckets"]["openai:gpt"]["requests_available"] < 0.1
+
+
+def test_provider_headers_adjust_buckets():
+    limiter = _limiter(limits={"openai": (500, 100000)})
+    limiter.observe_response("openai", "gpt", 200, {
+        "x-ratelimit-limit-requests": "60", "x-ratelimit-remaining-requests": "3",
+        "x-ratelimit-limit-tokens": "30000", "x-ratelimit-remaining-tokens": "1000"
+    })
+    bucket = limiter.stats()["buckets"]["openai:gpt"]
+    assert (bucket["rpm"], bucket["tpm"]) == (60, 30000)
+    assert 3 <= bucket["requests_available"] < 3.1 and 1000 <= bucket["tokens_available"] < 1010
+
+    limiter.observe_response("openai", "gpt", 429, {"retry-after": "20"})
+    assert 19 < limiter.stats()["buckets"]["openai:gpt"]["paused_for"] <= 20
+    assert _reserve_wait(limiter) > 19
+
+
+def test_failed_call_releases_tokens():
+    from langgraph_system import llm
+
+    limiter, original = _limiter(limits={"openai": (0, 1000)}), llm.rate_limiter
+    llm.rate_limiter = limiter
+    try:
+        # 실패한 호출 3번 (재시도 / Hedging 취소) → 예약 토큰 반환, 버킷이 줄지 않음
+        for _ in range(3):
+            ticket = limiter.acquire("openai", "gpt", 600)
+            try:
+                with llm._release_on_error(ticket):
+                    raise TimeoutError("provider timeout")
+            except TimeoutError:
+                pass
+        assert limiter.stats()["buckets"]["openai:gpt"]["tokens_available"] > 990
+    finally:
+        llm.rate_limiter = original
+
+
+def test_sqlite_backend_shared_between_workers():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ratelimit.sqlite")
+        first, second = _limiter(backend="sqlite", db_path=path), _limiter(backend="sqlite", db_path=path)
+        assert _reserve_wait(first) == 0 and _reserve_wait(second) == 0
+        # 두 워커가 같은 버킷을 사용하므로 세 번째 요청은 대기
+        assert _reserve_wait(first) > 29
+        assert second.stats()["buckets"]["openai:gpt"]["requests_available"] < -0.9
+
+        # 대기 중 취소된 비동기 예약은 공유 버킷에 반환
+        async def cancel_waiting():
+            task = asyncio.ensure_future(second.aacquire("openai", "gpt"))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        asyncio.run(cancel_waiting())
+        assert first.stats()["buckets"]["openai:gpt"]["requests_available"] < -0.9
+        assert first.stats()["buckets"]["openai:gpt"]["requests_available"] > -1.1
+
+
+if __name__ == "__main__":
+    test_helpers()
+    test_reservations_queue_in_arrival_order()
+    test_provider_headers_adjust_buckets()
+    test_failed_call_releases_tokens()
+    test_sqlite_backend_shared_between_workers()
+    print("✅ rate limit 테스트 통과")
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from api.schemas.request import DiagnosisRequest, LogoRequest, NamingRequest
+from api.services.fastjson import OrjsonRoute
+
+
+def test_legacy_payloads():
+    # user_input 없는 레거시 요청 → qa_answers / 나머지 필드가 user_input
+    assert DiagnosisRequest.model_validate({"brand_id": "b1", "qa_answers": {"q1": {"value": "AI"}}}).user_input == {"q1": {"value": "AI"}}
+    assert DiagnosisRequest.model_validate({"q1": "AI", "use_cache": False}).user_input == {"q1": "AI"}
+
+    # context: 키 소문자 변환, JSON 문자열 파싱, 후보 id 참조, 모르는 필드 보존
+    request = LogoRequest.model_validate({
+        "user_input": {"q1": "A"},
+        "context": {"INTERVIEW": '{"output_id": "output_07", "tone": "따뜻한", "custom": 1}', "story": "2", "concept": ""}
+    })
+    assert request.context.interview.output_id == "output_07"
+    assert request.context_dict() == {
+        "interview": {"output_id": "output_07", "tone": "따뜻한", "custom": 1}, "story": 2, "concept": None
+    }
+    assert LogoRequest.model_validate({"user_input": {"q1": "A"}, "context": None}).context_dict() == {}
+
+
+def test_typed_context_and_orjson_route():
+    async def logo(request: LogoRequest):
+        return request.context_dict()
+
+    app, router = FastAPI(), APIRouter(route_class=OrjsonRoute)
+    app.add_api_route("/logo", logo, methods=["POST"])
+    router.add_api_route("/fast", logo, methods=["POST"])
+    app.include_router(router)
+    client = TestClient(app)
+
+    body = {"user_input": {"q1": "A"}, "context": {"naming": {"id": 1, "brand_name": "Nova", "qa_keywords": ["a"]}}}
+    assert client.post("/fast", json=body).json() == client.post("/logo", json=body).json() == body["context"]
+
+    # 이전 응답의 LLM 출력을 되돌려 보낸 값은 형식과 무관하게 허용
+    echoed = {"user_input": {"q1": "A"}, "context": {
+        "interview": {"keywords": "모빌리티", "target_persona": {"age": "30대"}, "tone": None},
+        "concept": {"id": 0, "brand_values": "신뢰", "qa_keywords": [{"k": 1}]}
+    }}
+    assert client.post("/fast", json=echoed).json() == echoed["context"]
+
+    # API가 정하는 필드의 타입 오류 / 깨진 JSON은 422
+    bad = {"user_input": {"q1": "A"}, "context": {"interview": {"output_id": 7}}}
+    assert client.post("/fast", json=bad).json()["detail"][0]["loc"] == ["body", "context", "interview", "output_id"]
+    response = client.post("/fast", content=b'{"user_input": ', headers={"Content-Type": "application/json"})
+    assert response.status_code == 422 and response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_context_documented_in_schema():
+    # OpenAPI 문서: 단계별 context 형태 설명 유지
+    for model, key in ((NamingRequest, '"interview"'), (LogoRequest, '"story"')):
+        schema = model.model_json_schema()
+        assert key in schema["properties"]["context"]["description"]
+        assert "후보 id" in schema["$defs"]["StepContext"]["properties"]["naming"]["description"]
+
+
+if __name__ == "__main__":
+    test_legacy_payloads()
+    test_typed_context_and_orjson_route()
+    test_context_documented_in_schema()
+    print("✅ 요청 스키마 테스트 통과")
@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+import httpx
+
+from langgraph_system.resilience import (
+    ResiliencePolicy, CircuitBreaker, CircuitOpenError, DeadlineExceededError, classify_error, OPEN, CLOSED
+)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _policy(**kwargs) -> ResiliencePolicy:
+    kwargs.setdefault("backoff_base", 0.001)
+    return ResiliencePolicy(max_retries=kwargs.pop("max_retries", 3), **kwargs)
+
+
+def _flaky(errors):
+    """errors를 순서대로 발생시킨 뒤 성공하는 시도 함수"""
+    calls = []
+
+    def attempt(timeout):
+        calls.append(timeout)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return attempt, calls
+
+
+def test_classify_error():
+    assert classify_error(httpx.ConnectError("down")) == "connection"
+    assert classify_error(httpx.ReadTimeout("slow")) == "timeout"
+    assert classify_error(_StatusError(503)) == "server"
+    assert classify_error(_StatusError(429)) == "rate_limit"
+    assert classify_error(_StatusError(400)) is None
+    assert classify_error(ValueError("bad json")) is None
+
+
+def test_retries_transient_errors_only():
+    attempt, calls = _flaky([httpx.ConnectError("down"), _StatusError(502)])
+    policy = _policy()
+    assert policy.call("openai", "openai:m:json", attempt) == "ok"
+    assert len(calls) == 3 and policy.retries == 2
+    assert calls[1] < calls[0]  # 시도별 타임아웃 = 남은 마감 시간
+
+    attempt, calls = _flaky([_StatusError(400)])
+    try:
+        policy.call("openai", "openai:m:json", attempt)
+        assert False, "요청 오류는 재시도하지 않아야 함"
+    except _StatusError:
+        assert len(calls) == 1
+
+    # 스트리밍: 토큰이 전달된 뒤의 실패는 재시도하지 않음
+    attempt, calls = _flaky([httpx.ReadError("reset")])
+    try:
+        policy.call("openai", "openai:m:stream", attempt, can_retry=lambda: False)
+        assert False
+    except httpx.ReadError:
+        assert len(calls) == 1
+
+
+def test_deadline_bounds_async_attempts():
+    async def slow(timeout):
+        await asyncio.sleep(1)
+
+    policy = _policy()
+    started = time.monotonic()
+    try:
+        asyncio.run(policy.acall("gemini", "gemini:m:image", slow, deadline=0.1))
+        assert False, "마감 시간을 넘으면 실패해야 함"
+    except (TimeoutError, DeadlineExceededError):
+        assert time.monotonic() - started < 0.5
+
+
+def test_circuit_breaker_fails_fast_and_recovers():
+    policy = _policy(max_retries=0)
+    policy.breakers["gemini"] = CircuitBreaker("gemini", failure_threshold=2, reset_timeout=0.05)
+    for _ in range(2):
+        try:
+            policy.call("gemini", "gemini:m:image", _flaky([httpx.ConnectError("down")])[0])
+        except httpx.ConnectError:
+            pass
+    assert policy.breakers["gemini"].state == OPEN
+
+    attempt, calls = _flaky([])
+    try:
+        policy.call("gemini", "gemini:m:image", attempt)
+        assert False, "open 상태에서는 호출하지 않아야 함"
+    except CircuitOpenError:
+        assert calls == []
+
+    time.sleep(0.06)  # half_open: 시험 호출 성공 → closed
+    assert policy.call("gemini", "gemini:m:image", attempt) == "ok"
+    assert policy.breakers["gemini"].state == CLOSED
+
+
+def test_hedged_request_wins_over_slow_first_attempt():
+    policy = _policy(hedge_providers={"openai"})
+    for _ in range(20):
+        policy.latency.record("openai:m:json", 0.01)
+    started = []
+
+    async def attempt(timeout):
+        started.append(time.monotonic())
+        await asyncio.sleep(1 if len(started) == 1 else 0.01)
+        return len(started)
+
+    began = time.monotonic()
+    assert asyncio.run(policy.acall("openai", "openai:m:json", attempt, hedge=True)) == 2
+    assert time.monotonic() - began < 0.5
+    assert (policy.hedges, policy.hedge_wins) == (1, 1)
+
+
+if __name__ == "__main__":
+    test_classify_error()
+    test_retries_transient_errors_only()
+    test_deadline_bounds_async_attempts()
+    test_circuit_breaker_fails_fast_and_recovers()
+    test_hedged_request_wins_over_slow_first_attempt()
+    print("✅ resilience 테스트 통과")
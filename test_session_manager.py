@@ -0,0 +1,87 @@
+import os
+import tempfile
+import time
+
+from api.services.session_manager import SessionManager, SessionNotFoundError
+
+INTERVIEW = {"output_id": "output_01", "brand_essence": "연결", "keywords": ["균형"]}
+NAMING = [{"id": 0, "brand_name": "Alpha"}, {"id": 1, "brand_name": "Beta"}, {"id": 2, "brand_name": "Gamma"}]
+CONCEPT = [{"id": 0, "concept_statement": "A"}, {"id": 1, "concept_statement": "B"}]
+
+
+def test_lru_and_ttl():
+    manager = SessionManager(max_sessions=2, timeout=3600)
+    for output_id in ("a", "b"):
+        manager.save_context(output_id, {"n": output_id})
+    manager.get_session("a")  # a 사용 → b가 가장 오래됨
+    manager.save_context("c", {"n": "c"})
+    assert manager.get_session("b") is None
+    assert manager.get_session("a")["interview"] == {"n": "a"}
+    assert manager.get_session_count() == 2
+
+    manager.timeout = 0.01
+    time.sleep(0.02)
+    assert manager.get_session("a") is None
+    assert manager.get_session_count() == 0
+    assert manager.stats()["evicted"] == 1
+
+
+def test_resolve_context_from_candidate_ids():
+    manager = SessionManager()
+    manager.save_context("output_01", INTERVIEW)
+    manager.save_candidates("output_01", "naming", NAMING)
+    manager.save_candidates("output_01", "concept", CONCEPT)
+
+    # Step 4: output_id + 후보 id만으로 이전 단계 복원, 선택은 세션에 기록
+    context = manager.resolve_context("output_01", {"naming": 1, "concept": {"id": "0"}},
+                                      ("interview", "naming", "concept"))
+    assert context == {"interview": INTERVIEW, "naming": NAMING[1], "concept": CONCEPT[0]}
+
+    # Step 5: 선택을 다시 보내지 않아도 기록된 선택 사용, 후보 상세 정보를 직접 보내면 그대로 사용
+    context = manager.resolve_context("output_01", {"concept": {"id": 1, "concept_statement": "직접"}},
+                                      ("interview", "naming", "concept"))
+    assert context["naming"] == NAMING[1]
+    assert context["concept"] == {"id": 1, "concept_statement": "직접"}
+    assert manager.get_session("output_01")["concept"]["selected"] == 1
+
+    for bad in ({"naming": 7}, {}):
+        try:
+            manager.resolve_context("output_01" if bad else "expired", bad, ("interview", "naming"))
+            assert False, "복원할 수 없는 context는 실패해야 함"
+        except SessionNotFoundError:
+            pass
+
+    # output_id가 없으면 기존 방식 그대로
+    assert manager.resolve_context(None, {"naming": 1}, ("naming",)) == {"naming": 1}
+
+
+def test_durable_sessions_shared_across_managers():
+    with tempfile.TemporaryDirectory() as session_dir:
+        SessionManager(shared_dir=session_dir).save_candidates("output_02", "naming", NAMING)
+        other = SessionManager(shared_dir=session_dir)
+        assert other.resolve_context("output_02", {"naming": 2}, ("naming",)) == {"naming": NAMING[2]}
+        # 파일명으로 쓸 수 없는 output_id는 메모리에만 저장
+        other.save_context("../x", {})
+        assert os.listdir(session_dir) == ["output_02.json"]
+
+
+def test_memory_hit_refreshes_file_mtime():
+    with tempfile.TemporaryDirectory() as session_dir:
+        active = SessionManager(timeout=100, shared_dir=session_dir)
+        active.save_context("output_03", {"brand": "A"})
+        path = os.path.join(session_dir, "output_03.json")
+        os.utime(path, (time.time() - 150, time.time() - 150))
+
+        # 이 워커에서는 메모리 조회로 계속 사용 중 → 파일 mtime 갱신, 다른 워커도 만료로 보지 않음
+        active._sessions["output_03"]["updated_at"] = time.time()
+        assert active.get_session("output_03") is not None
+        assert time.time() - os.path.getmtime(path) < 5
+        assert SessionManager(timeout=100, shared_dir=session_dir).get_session("output_03")["interview"] == {"brand": "A"}
+
+
+if __name__ == "__main__":
+    test_lru_and_ttl()
+    test_resolve_context_from_candidate_ids()
+    test_durable_sessions_shared_across_managers()
+    test_memory_hit_refreshes_file_mtime()
+    print("✅ session manager 테스트 통과")
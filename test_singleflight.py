@@ -0,0 +1,45 @@
+import asyncio
+import os
+import tempfile
+
+from api.services.singleflight import SingleFlight, request_key
+
+
+def test_shared_dir_coalesces_across_workers():
+    with tempfile.TemporaryDirectory() as shared_dir:
+        # 워커 2개 (인스턴스별 in-process 병합은 분리, 공유 디렉토리로만 병합)
+        workers = [SingleFlight(shared_dir=shared_dir) for _ in range(2)]
+        calls = []
+
+        async def run():
+            calls.append(1)
+            await asyncio.sleep(0.3)
+            return {"output_id": "output_01"}
+
+        async def main():
+            key = request_key("naming", {"output_id": "output_01"})
+            return await asyncio.gather(*(worker.do(key, run) for worker in workers))
+
+        assert asyncio.run(main()) == [{"output_id": "output_01"}] * 2
+        assert len(calls) == 1
+        assert sum(worker.coalesced for worker in workers) == 1
+
+
+def test_wait_timeout_runs_locally():
+    with tempfile.TemporaryDirectory() as shared_dir:
+        worker = SingleFlight(shared_dir=shared_dir, wait_timeout=0.3)
+        key = request_key("logo", {"output_id": "output_02"})
+        # 잠금을 잡은 워커가 비정상 종료 (잠금은 아직 lock_timeout 전)
+        open(os.path.join(shared_dir, f"{key}.lock"), "w").close()
+
+        async def run():
+            return "local"
+
+        assert asyncio.run(worker.do(key, run)) == "local"
+        assert worker.stats()["wait_timeouts"] == 1
+
+
+if __name__ == "__main__":
+    test_shared_dir_coalesces_across_workers()
+    test_wait_timeout_runs_locally()
+    print("✅ singleflight 테스트 통과")
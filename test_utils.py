@@ -1,4 +1,4 @@
-from langgraph_system.utils import flatten_context
+from langgraph_system.utils import flatten_context, compact_qa, qa_prompt_json, select_candidate, content_hash
 import json
 
 def test_flatten_context():
@@ -54,5 +54,71 @@ def test_flatten_context():
     # Case 4: Fallback (No QA Selection)
     print("\nTest 4 (Fallback - No QA):", flatten_context(context_2))
 
+def test_compact_qa():
+    step_qa = {
+        "title": "Logo & Visual Identity",
+        "description": "브랜드의 시각적 정체성을 설계합니다",
+        "questions": [
+            {"id": "s5_shape", "question_text": "어떤 형태의 로고를 원하시나요?",
+             "answer": {"id": "shape_symbol", "text": "심볼형", "value": "Symbol Only"}},
+            {"id": "s5_motif", "question_text": "로고에 담고 싶은 이미지는?",
+             "answer": {"id": "motif_etc", "text": "기타", "value": "Other", "text_input_value": " 번개 "}},
+            {"id": "s5_color", "question_text": "대표 색상은?",
+             "answer": [{"id": "col_bw", "text": "블랙", "value": "Black"}, {"id": "col_blue", "text": "블루", "value": "Blue"}]},
+            {"id": "s5_color_extra", "question_text": "대표 색상은?", "answer": {"id": "col_gold", "text": "골드", "value": "Gold"}},
+            {"id": "s5_avoid", "question_text": "피하고 싶은 방향은?", "answer": ""}
+        ]
+    }
+    compact = compact_qa(step_qa)
+    print("Test 5 (Compact Q&A):", compact)
+    assert compact == {
+        "어떤 형태의 로고를 원하시나요?": "Symbol Only",
+        "로고에 담고 싶은 이미지는?": "Other (번개)",
+        "대표 색상은?": ["Black", "Blue", "Gold"]
+    }
+    assert json.loads(qa_prompt_json(step_qa)) == compact
+    assert len(qa_prompt_json(step_qa)) < len(json.dumps(step_qa, ensure_ascii=False, indent=2)) / 2
+
+    # 평면 형식 ({질문 id: 답변})
+    assert compact_qa({"s1_name": {"value": "Nova"}, "s1_memo": None}) == {"s1_name": "Nova"}
+
+def test_select_candidate():
+    stories = [{"id": i, "brand_story": f"스토리 {i} " * 200, "story_rationale": f"근거 {i}"} for i in range(3)]
+    context = {"candidates": stories, "output_id": "out_3"}
+
+    # 명시적 id (context의 id / step_qa의 selected_id, "1" 같은 문자열도 허용)
+    flat = flatten_context({**context, "id": 2})
+    print("Test 6 (Select by id):", flat["story_rationale"])
+    assert flat == {"output_id": "out_3", "brand_story": stories[2]["brand_story"], "story_rationale": "근거 2"}
+    assert flatten_context(context, {"story_selected_id": "1"}, "story")["story_rationale"] == "근거 1"
+    assert "candidates" in context and "id" not in context  # 원본 context는 그대로
+
+    # 내용 해시 / 레거시 이름
+    assert select_candidate({**context, "content_hash": content_hash(stories[1]["brand_story"])}) == (stories[1], "hash")
+    assert select_candidate(context, {"s4_current_name": stories[2]["brand_story"]}) == (stories[2], "name")
+
+    # 선택 정보가 맞지 않으면 첫 번째 후보 + miss (경고 로그), 선택 정보가 없으면 default
+    assert select_candidate({**context, "id": 7}) == (stories[0], "miss")
+    assert select_candidate(context, {"s3_current_name": "없는 이름"}) == (stories[0], "miss")
+    assert select_candidate(context) == (stories[0], "default")
+
+
+def test_select_candidate_per_context():
+    # 한 step_qa로 여러 context 평탄화 (Step 5: naming / concept / story) - 선택 값은 대상 context에만 적용
+    names = {"candidates": [{"id": i, "brand_name": f"Nova{i}"} for i in range(3)]}
+    concepts = {"candidates": [{"id": i, "concept_statement": f"컨셉 {i}"} for i in range(3)]}
+    step_qa = {"concept_selected_id": 2, "s5_current_name": "Nova1", "selected_id": 2}
+
+    assert select_candidate(names, step_qa, "naming") == (names["candidates"][1], "name")
+    assert select_candidate(concepts, step_qa, "concept") == (concepts["candidates"][2], "id")
+    # 단계 지정 없는 selected_id / 이름은 다른 context에 적용되지 않음 (miss 아님)
+    assert select_candidate(concepts, {"selected_id": 2, "s5_current_name": "Nova1"}, "concept") == (concepts["candidates"][0], "default")
+    # 대상 context에서만 miss
+    assert select_candidate(names, {"naming_selected_id": 9, "concept_selected_id": 1}, "naming") == (names["candidates"][0], "miss")
+    assert select_candidate(concepts, {"naming_selected_id": 9, "concept_selected_id": 1}, "concept") == (concepts["candidates"][1], "id")
+
 if __name__ == "__main__":
     test_flatten_context()
+    test_compact_qa()
+    test_select_candidate()
+    test_select_candidate_per_context()